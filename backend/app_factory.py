@@ -48,6 +48,7 @@ from backend.models import ServerInfo
 from backend.security import setup_security_middleware
 from backend.server_client import ServerClient
 from backend.skill_evaluation_service import SkillEvaluationService
+from backend.skill_observatory_scoring import ObservatoryDiskCache
 from backend.startup_manager import StartupManager
 from backend.world_manager import WorldManager
 from core.config.server import DEFAULT_API_PORT
@@ -85,6 +86,14 @@ class AppContext:
     allowed_origins: list = field(
         default_factory=lambda: os.getenv("ALLOWED_ORIGINS", "*").split(",")
     )
+    # Worker processes for skill observatory evaluations (0 = worker thread)
+    skill_evaluation_workers: int = field(
+        default_factory=lambda: int(os.getenv("TANK_SKILL_EVAL_WORKERS", "0"))
+    )
+    # Latest skill observatory results and the evaluation disk cache
+    skill_evaluation_dir: Path = field(
+        default_factory=lambda: Path(os.getenv("TANK_SKILL_EVAL_DIR", "data/skill_evaluations"))
+    )
 
     # Runtime state (initialized during lifespan)
     startup_manager: StartupManager | None = None
@@ -316,6 +325,7 @@ def _setup_routers(app: FastAPI, ctx: AppContext) -> None:
         connections,
         discovery,
         metrics,
+        remote_transfers,
         servers,
         skill,
         transfers,
@@ -357,6 +367,10 @@ def _setup_routers(app: FastAPI, ctx: AppContext) -> None:
     transfers_router = transfers.setup_router()
     app.include_router(transfers_router)
 
+    # Setup remote transfer router (batches posted by peer servers)
+    remote_transfers_router = remote_transfers.setup_router(ctx.world_manager)
+    app.include_router(remote_transfers_router)
+
     # Setup worlds router (world-agnostic API)
     worlds_router = setup_worlds_router(ctx.world_manager)
     app.include_router(worlds_router)
@@ -373,11 +387,13 @@ def _setup_routers(app: FastAPI, ctx: AppContext) -> None:
     if ctx.skill_evaluation_service is None:
         ctx.skill_evaluation_service = SkillEvaluationService(
             ctx.world_manager,
-            storage_path=Path("data/skill_evaluations/latest.json"),
+            storage_path=ctx.skill_evaluation_dir / "latest.json",
+            process_workers=ctx.skill_evaluation_workers,
         )
     skill_router = skill.setup_router(
         world_manager=ctx.world_manager,
         evaluation_service=ctx.skill_evaluation_service,
+        evaluation_cache=ObservatoryDiskCache(ctx.skill_evaluation_dir / "cache"),
     )
     app.include_router(skill_router)
 
@@ -14,6 +14,7 @@ import time
 from contextlib import suppress
 from typing import TYPE_CHECKING, Union
 
+from backend.broadcast_fanout import BroadcastFanout, EncodedFrame, encode_frame
 from backend.runner.runner_protocol import RunnerProtocol
 from core.config.display import FRAME_RATE
 
@@ -67,6 +68,25 @@ def _env_flag(name: str) -> bool:
 # =============================================================================
 
 
+async def _resync_frame(
+    adapter: "WorldBroadcastAdapter", frame: EncodedFrame, world_id: str, binary: bool
+) -> EncodedFrame | None:
+    """Build the shared full frame for clients that cannot apply ``frame``."""
+    if frame.is_full:
+        return frame
+    try:
+        state = await adapter.get_state_async(force_full=True, allow_delta=False)
+        return encode_frame(state, adapter.serialize_state(state), None, binary=binary)
+    except Exception as e:
+        logger.error(
+            "broadcast_updates[%s]: Error building resync frame: %s",
+            world_id[:8],
+            e,
+            exc_info=True,
+        )
+        return None
+
+
 async def broadcast_updates_for_world(
     adapter: "WorldBroadcastAdapter",
     world_id: str | None = None,
@@ -75,6 +95,8 @@ async def broadcast_updates_for_world(
     """Broadcast simulation updates to all clients connected to a world.
 
     This is the unified broadcast function that works with any broadcast adapter.
+    Each tick's state is serialized once and handed to every client's send
+    channel (see ``backend.broadcast_fanout``); the loop never waits on a send.
 
     Args:
         adapter: The broadcast adapter to send updates for
@@ -92,10 +114,7 @@ async def broadcast_updates_for_world(
     last_sent_frame = -1
     next_send_at = 0.0
     last_debug_log = time.perf_counter()
-    slow_send_windows: dict[object, tuple[int, float]] = {}
-    send_time_total_ms = 0.0
-    send_time_count = 0
-    timeout_count = 0
+    resync_count = 0
     dropped_frames = 0
 
     broadcast_hz = _get_env_float("BROADCAST_HZ", 15.0)
@@ -103,9 +122,12 @@ async def broadcast_updates_for_world(
         broadcast_hz = 15.0
     broadcast_interval = 1.0 / broadcast_hz
     idle_sleep = max(0.05, _get_env_float("BROADCAST_IDLE_SLEEP", 0.35))
-    send_timeout = max(0.05, _get_env_float("BROADCAST_SEND_TIMEOUT", 0.15))
-    slow_send_strikes = max(1, _get_env_int("BROADCAST_SLOW_SEND_STRIKES", 10))
-    slow_send_window = max(1.0, _get_env_float("BROADCAST_SLOW_SEND_WINDOW_SECONDS", 30.0))
+    fanout = BroadcastFanout(
+        broadcast_hz=broadcast_hz,
+        send_timeout=max(0.05, _get_env_float("BROADCAST_SEND_TIMEOUT", 0.15)),
+        slow_send_strikes=max(1, _get_env_int("BROADCAST_SLOW_SEND_STRIKES", 10)),
+        slow_send_window=max(1.0, _get_env_float("BROADCAST_SLOW_SEND_WINDOW_SECONDS", 30.0)),
+    )
     debug_enabled = _env_flag("BROADCAST_DEBUG")
     # Poll interval used only when the simulation has not produced a new frame
     # yet. Deliberately much finer than a frame: sleeping a whole 1/FRAME_RATE
@@ -117,14 +139,11 @@ async def broadcast_updates_for_world(
             try:
                 frame_count += 1
                 clients = adapter.connected_clients
+                fanout.sync(clients)
                 if not clients:
                     await asyncio.sleep(idle_sleep)
                     continue
 
-                for client in list(slow_send_windows):
-                    if client not in clients:
-                        slow_send_windows.pop(client, None)
-
                 now = time.perf_counter()
                 if now < next_send_at:
                     dropped_frames += 1
@@ -161,11 +180,18 @@ async def broadcast_updates_for_world(
                     await asyncio.sleep(frame_wait_poll)
                     continue
 
+                previous_frame = last_sent_frame if last_sent_frame >= 0 else None
                 last_sent_frame = state.frame
+                due = fanout.due_channels(time.perf_counter())
 
                 try:
                     serialize_start = time.perf_counter()
-                    state_payload = adapter.serialize_state(state)
+                    frame = encode_frame(
+                        state,
+                        adapter.serialize_state(state),
+                        previous_frame,
+                        binary=any(channel.binary for channel in due),
+                    )
                     serialize_ms = (time.perf_counter() - serialize_start) * 1000
                 except Exception as e:
                     logger.error(
@@ -177,32 +203,27 @@ async def broadcast_updates_for_world(
                     await asyncio.sleep(1 / FRAME_RATE)
                     continue
 
-                async def _send_with_timeout(client):
-                    try:
-                        await asyncio.wait_for(
-                            client.send_bytes(state_payload),  # noqa: B023
-                            timeout=send_timeout,
-                        )
-                        return None
-                    except asyncio.TimeoutError:
-                        return "timeout"
-                    except RuntimeError as exc:
-                        # Starlette raises RuntimeError if sending to a closed socket
-                        if 'Cannot call "send" once a close message has been sent' in str(exc):
-                            return "disconnected"
-                        return exc
-                    except Exception as exc:
-                        return exc
-
-                disconnected = set()
-                send_start = time.perf_counter()
-                clients_snapshot = list(clients)
-                send_results = await asyncio.gather(
-                    *(_send_with_timeout(client) for client in clients_snapshot),
-                    return_exceptions=False,
-                )
+                # Clients that cannot apply this frame (new, reconnecting,
+                # behind or on a reduced rate) share one full frame instead.
+                fanout_start = time.perf_counter()
+                stale = {channel for channel in due if not channel.accepts(frame)}
+                resync = None
+                if stale:
+                    resync = await _resync_frame(
+                        adapter,
+                        frame,
+                        resolved_world_id,
+                        binary=any(channel.binary for channel in stale),
+                    )
+                for channel in due:
+                    if channel in stale:
+                        if resync is not None:
+                            channel.offer(resync, fanout_start)
+                            resync_count += 1
+                    else:
+                        channel.offer(frame, fanout_start)
                 now = time.perf_counter()
-                send_ms = (now - send_start) * 1000
+                fanout_ms = (now - fanout_start) * 1000
 
                 # Fixed-cadence deadline with drift correction. Advancing by a
                 # whole interval keeps the average rate at broadcast_hz; if we
@@ -212,77 +233,51 @@ async def broadcast_updates_for_world(
                 if next_send_at < now:
                     next_send_at = now + broadcast_interval
 
-                for client, result in zip(clients_snapshot, send_results, strict=False):
-                    if result is None:
-                        if client in slow_send_windows:
-                            strikes, window_start = slow_send_windows[client]
-                            if (now - window_start) > slow_send_window:
-                                slow_send_windows.pop(client, None)
-                        continue
-
-                    if result == "timeout":
-                        timeout_count += 1
-                        strikes, window_start = slow_send_windows.get(client, (0, now))
-                        if (now - window_start) > slow_send_window:
-                            window_start = now
-                            strikes = 0
-                        strikes += 1
-                        slow_send_windows[client] = (strikes, window_start)
-                        if strikes >= slow_send_strikes:
-                            disconnected.add(client)
-                        continue
-
-                    if result == "disconnected":
-                        disconnected.add(client)
-                        continue
-
-                    logger.warning(
-                        "broadcast_updates[%s]: Error sending to client, marking for removal: %s",
-                        resolved_world_id[:8],
-                        result,
-                    )
-                    disconnected.add(client)
-
-                send_time_total_ms += send_ms
-                send_time_count += 1
-
-                total_ms = get_ms + serialize_ms + send_ms
+                total_ms = get_ms + serialize_ms + fanout_ms
                 if total_ms > 50:
                     logger.warning(
-                        "broadcast_updates[%s]: SLOW get=%.0fms ser=%.0fms send=%.0fms (payload: %d bytes, clients: %d)",
+                        "broadcast_updates[%s]: SLOW get=%.0fms ser=%.0fms fanout=%.0fms (payload: %d bytes, clients: %d)",
                         resolved_world_id[:8],
                         get_ms,
                         serialize_ms,
-                        send_ms,
-                        len(state_payload),
+                        fanout_ms,
+                        len(frame.payload),
                         len(clients),
                     )
 
                 if debug_enabled and (now - last_debug_log) >= 5.0:
-                    avg_send_ms = send_time_total_ms / send_time_count if send_time_count else 0.0
+                    latency = fanout.latency_percentiles()
                     logger.info(
-                        "broadcast_updates[%s]: perf avg_send=%.1fms timeouts=%d dropped_frames=%d clients=%d",
+                        "broadcast_updates[%s]: perf latency p50=%.1fms p95=%.1fms p99=%.1fms "
+                        "resyncs=%d dropped_frames=%d clients=%d",
                         resolved_world_id[:8],
-                        avg_send_ms,
-                        timeout_count,
+                        latency.get(50, 0.0),
+                        latency.get(95, 0.0),
+                        latency.get(99, 0.0),
+                        resync_count,
                         dropped_frames,
                         len(clients),
                     )
                     last_debug_log = now
-                    send_time_total_ms = 0.0
-                    send_time_count = 0
-                    timeout_count = 0
+                    fanout.latencies.clear()
+                    resync_count = 0
                     dropped_frames = 0
 
-                if disconnected:
+                failed = fanout.pop_failed()
+                if failed:
                     logger.info(
                         "broadcast_updates[%s]: Removing %d disconnected clients",
                         resolved_world_id[:8],
-                        len(disconnected),
+                        len(failed),
                     )
-                    for client in disconnected:
+                    for client, reason in failed:
+                        if reason not in ("slow", "disconnected"):
+                            logger.warning(
+                                "broadcast_updates[%s]: Error sending to client, removed: %s",
+                                resolved_world_id[:8],
+                                reason,
+                            )
                         adapter.remove_client(client)
-                        slow_send_windows.pop(client, None)
                         close_task = asyncio.create_task(client.close())
                         close_task.add_done_callback(_handle_task_exception)
 
@@ -315,6 +310,7 @@ async def broadcast_updates_for_world(
         )
         raise
     finally:
+        fanout.close()
         logger.info("broadcast_updates[%s]: Task ended", resolved_world_id[:8])
 
 
@@ -0,0 +1,307 @@
+"""Per-client send queues for the broadcast loop.
+
+The broadcast loop builds and serializes one state per tick. Each connected
+client then gets a ``ClientChannel``: a one-slot send queue drained by its
+own sender task, so a slow socket only ever delays itself. A frame offered
+while the previous one is still waiting replaces it (drop-stale): a client
+that falls behind skips straight to the newest frame instead of working
+through a backlog.
+
+Skipping a frame breaks a delta chain, so every channel tracks the frame it
+will hold once its queue drains. A delta is only offered to channels whose
+frame matches the delta's base; the others (new or reconnecting clients,
+clients that dropped a frame or timed out, clients on a reduced rate) are
+resynchronised with one shared full frame instead. Payloads are encoded once
+per tick and the same ``bytes`` object is handed to every channel.
+
+A client can ask for a lower rate than ``BROADCAST_HZ`` with the
+``broadcast_hz`` query parameter on its websocket URL, and for binary frames
+(``backend.state_payloads.binary``) with ``encoding=binary``. The binary
+encoding is only built on ticks where some due client asked for it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from backend.state_payloads.binary import BINARY_ENCODING, encode_binary_state
+
+logger = logging.getLogger("backend.broadcast")
+
+# Send-latency samples kept for percentile reporting (across all clients)
+LATENCY_SAMPLES = 4096
+CLIENT_HZ_QUERY_PARAM = "broadcast_hz"
+CLIENT_ENCODING_QUERY_PARAM = "encoding"
+
+
+@dataclass(frozen=True)
+class EncodedFrame:
+    """One serialized state, shared by every channel it is offered to."""
+
+    frame: int
+    payload: bytes
+    is_full: bool
+    # Frame a delta was diffed against; None for full frames
+    base_frame: int | None
+    published_at: float
+    binary_payload: bytes | None = None
+
+    def payload_for(self, binary: bool) -> bytes:
+        if binary and self.binary_payload is not None:
+            return self.binary_payload
+        return self.payload
+
+
+def state_is_delta(state: Any) -> bool:
+    """Whether a state payload is a delta (needs the previous frame to apply)."""
+    is_delta = getattr(state, "is_delta", None)
+    if is_delta is not None:
+        return bool(is_delta)
+    return getattr(state, "type", None) == "delta"
+
+
+def encode_frame(
+    state: Any, payload: bytes, previous_frame: int | None, *, binary: bool = False
+) -> EncodedFrame:
+    """Wrap a serialized state, resolving the base frame of deltas.
+
+    Payloads that don't record their base (e.g. worker-encoded states) are
+    assumed to chain from the previous frame the loop published. With
+    ``binary``, the binary encoding is built too; if that fails, binary
+    clients get the JSON payload for this frame.
+    """
+    is_full = not state_is_delta(state)
+    base_frame = None
+    if not is_full:
+        base_frame = getattr(state, "base_frame", None)
+        if base_frame is None:
+            base_frame = previous_frame
+    return EncodedFrame(
+        frame=state.frame,
+        payload=payload,
+        is_full=is_full,
+        base_frame=base_frame,
+        published_at=time.perf_counter(),
+        binary_payload=binary_state_payload(state) if binary else None,
+    )
+
+
+def binary_state_payload(state: Any) -> bytes | None:
+    """Binary encoding of ``state``, or None (send JSON) if it can't be encoded."""
+    try:
+        return encode_binary_state(state)
+    except Exception as e:
+        logger.warning("Binary frame encoding failed, sending JSON: %s", e)
+        return None
+
+
+def client_wants_binary(client: Any) -> bool:
+    """Whether a client negotiated binary frames on its websocket URL."""
+    query_params = getattr(client, "query_params", None)
+    if query_params is None:
+        return False
+    return bool(query_params.get(CLIENT_ENCODING_QUERY_PARAM) == BINARY_ENCODING)
+
+
+def client_broadcast_hz(client: Any, default_hz: float) -> float:
+    """Rate requested by a client, capped at the loop's own rate."""
+    query_params = getattr(client, "query_params", None)
+    raw = query_params.get(CLIENT_HZ_QUERY_PARAM) if query_params is not None else None
+    if raw is None:
+        return default_hz
+    try:
+        hz = float(raw)
+    except (TypeError, ValueError):
+        return default_hz
+    if not hz > 0:
+        return default_hz
+    return min(hz, default_hz)
+
+
+class ClientChannel:
+    """Latest-frame-only send queue for one websocket client."""
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        interval: float,
+        send_timeout: float,
+        slow_send_strikes: int,
+        slow_send_window: float,
+        latencies: deque[float],
+        binary: bool = False,
+    ) -> None:
+        self.client = client
+        self.binary = binary
+        # 0.0 means "every tick"; otherwise the client's own send period
+        self.interval = interval
+        self.send_timeout = send_timeout
+        self.slow_send_strikes = slow_send_strikes
+        self.slow_send_window = slow_send_window
+        self._latencies = latencies
+
+        # Frame the client will hold once the queue drains; None = needs full
+        self.synced_frame: int | None = None
+        self.next_due = 0.0
+        self.failure: str | None = None
+        self.sent = 0
+        self.dropped = 0
+        self.timeouts = 0
+        self._strikes = 0
+        self._strike_window_start = 0.0
+        self._pending: EncodedFrame | None = None
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="broadcast_client_sender")
+
+    def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    def is_due(self, now: float, slack: float) -> bool:
+        return self.interval <= 0.0 or now + slack >= self.next_due
+
+    def accepts(self, frame: EncodedFrame) -> bool:
+        """Whether ``frame`` can be queued without first resynchronising."""
+        if frame.is_full:
+            return True
+        return (
+            self._pending is None
+            and self.synced_frame is not None
+            and self.synced_frame == frame.base_frame
+        )
+
+    def offer(self, frame: EncodedFrame, now: float) -> None:
+        """Queue ``frame``, replacing any frame still waiting to be sent."""
+        if self._pending is not None:
+            self.dropped += 1
+        self._pending = frame
+        self.synced_frame = frame.frame
+        if self.interval > 0.0:
+            # Same drift-corrected cadence as the loop itself
+            self.next_due += self.interval
+            if self.next_due < now:
+                self.next_due = now + self.interval
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while self.failure is None:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            frame = self._pending
+            if frame is None:
+                continue
+            self._pending = None
+            result = await self._send(frame.payload_for(self.binary))
+            if result is None:
+                self.sent += 1
+                self._latencies.append(time.perf_counter() - frame.published_at)
+            elif result == "timeout":
+                self._record_timeout()
+            else:
+                self.failure = result
+
+    async def _send(self, payload: bytes) -> str | None:
+        try:
+            await asyncio.wait_for(self.client.send_bytes(payload), timeout=self.send_timeout)
+            return None
+        except asyncio.TimeoutError:
+            return "timeout"
+        except RuntimeError as exc:
+            # Starlette raises RuntimeError if sending to a closed socket
+            if 'Cannot call "send" once a close message has been sent' in str(exc):
+                return "disconnected"
+            return f"send failed: {exc}"
+        except Exception as exc:
+            return f"send failed: {exc}"
+
+    def _record_timeout(self) -> None:
+        self.timeouts += 1
+        now = time.perf_counter()
+        if self._strikes == 0 or (now - self._strike_window_start) > self.slow_send_window:
+            self._strikes = 0
+            self._strike_window_start = now
+        self._strikes += 1
+        if self._strikes >= self.slow_send_strikes:
+            self.failure = "slow"
+            return
+        # The cancelled frame may not have arrived; anything chained to it
+        # can't be applied either, so the next frame must be a full one.
+        if self._pending is None or not self._pending.is_full:
+            self._pending = None
+            self.synced_frame = None
+
+
+class BroadcastFanout:
+    """The send channels of every client of one broadcast stream."""
+
+    def __init__(
+        self,
+        *,
+        broadcast_hz: float,
+        send_timeout: float,
+        slow_send_strikes: int,
+        slow_send_window: float,
+    ) -> None:
+        self.broadcast_hz = broadcast_hz
+        self.send_timeout = send_timeout
+        self.slow_send_strikes = slow_send_strikes
+        self.slow_send_window = slow_send_window
+        self.channels: dict[Any, ClientChannel] = {}
+        self.latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def sync(self, clients: Iterable[Any]) -> None:
+        """Open channels for new clients and close those of departed ones."""
+        current = set(clients)
+        for client in [c for c in self.channels if c not in current]:
+            self.channels.pop(client).stop()
+        for client in current:
+            if client not in self.channels:
+                hz = client_broadcast_hz(client, self.broadcast_hz)
+                channel = ClientChannel(
+                    client,
+                    interval=0.0 if hz >= self.broadcast_hz else 1.0 / hz,
+                    send_timeout=self.send_timeout,
+                    slow_send_strikes=self.slow_send_strikes,
+                    slow_send_window=self.slow_send_window,
+                    latencies=self.latencies,
+                    binary=client_wants_binary(client),
+                )
+                channel.start()
+                self.channels[client] = channel
+
+    def due_channels(self, now: float) -> list[ClientChannel]:
+        """Channels that should receive this tick's frame."""
+        slack = 0.5 / self.broadcast_hz
+        return [ch for ch in self.channels.values() if ch.failure is None and ch.is_due(now, slack)]
+
+    def pop_failed(self) -> list[tuple[Any, str]]:
+        """Remove and return ``(client, reason)`` for channels whose sends failed."""
+        failed = [(c, ch.failure) for c, ch in self.channels.items() if ch.failure is not None]
+        for client, _ in failed:
+            self.channels.pop(client).stop()
+        return [(client, str(reason)) for client, reason in failed]
+
+    def latency_percentiles(
+        self, percentiles: Iterable[float] = (50, 95, 99)
+    ) -> dict[float, float]:
+        """Publish-to-sent latency percentiles in milliseconds (empty if no sends)."""
+        samples = sorted(self.latencies)
+        if not samples:
+            return {}
+        last = len(samples) - 1
+        return {p: samples[min(last, round(p / 100 * last))] * 1000 for p in percentiles}
+
+    def close(self) -> None:
+        for channel in self.channels.values():
+            channel.stop()
+        self.channels.clear()
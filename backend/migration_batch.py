@@ -0,0 +1,346 @@
+"""Per-tick migration batches for the migration scheduler.
+
+Every scheduler tick rolls each connection once; the connections that fire
+are migrated together instead of one entity (and one round trip) at a time:
+
+1. each source world hands out one ticket per fired connection in a single
+   ``take_migrants`` call (nothing is removed yet);
+2. tickets are grouped by destination, and each destination admits its whole
+   batch at once - ``accept_migrants`` on a local port, or one request to a
+   peer's ``/api/remote-transfer/batch`` endpoint;
+3. each source commits its admitted tickets and releases the rest, again one
+   call per source;
+4. tickets a source could not commit - the entity died or left the source
+   while the batch was in flight - have their admitted copies revoked, one
+   call per destination.
+
+Entities therefore leave their source only once the destination took them,
+so a failed transfer needs no restore step, and an entity is never both
+kept and admitted. Transfer records go through
+``backend.transfer_history``, whose log writer is buffered.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from backend.migration_port import (
+    MigrantAdmission,
+    MigrantTicket,
+    migration_port_for,
+)
+
+if TYPE_CHECKING:
+    from backend.discovery_service import DiscoveryService
+    from backend.server_client import ServerClient
+    from backend.world_manager import WorldInstance, WorldManager
+
+logger = logging.getLogger(__name__)
+
+# Admission error codes that are expected and not worth a failed-transfer
+# record (the first two also come back from peers' batch endpoint).
+SILENT_ERRORS = frozenset({"no_root_spots", "world_paused", "remote_unavailable"})
+
+
+@dataclass
+class _Migrant:
+    """A fired connection and the ticket its source handed out."""
+
+    connection: Any
+    source: WorldInstance
+    ticket: MigrantTicket
+    admission: MigrantAdmission | None = None
+
+
+@dataclass
+class MigrationTickResult:
+    """Counts for one tick of batched migrations."""
+
+    migrated: int = 0
+    failed: int = 0
+    round_trips: int = 0
+
+
+def _is_paused(instance: WorldInstance) -> bool:
+    return bool(getattr(instance.runner, "paused", False))
+
+
+async def run_migration_tick(
+    connections: Sequence[Any],
+    world_manager: WorldManager,
+    *,
+    discovery_service: DiscoveryService | None = None,
+    server_client: ServerClient | None = None,
+    local_server_id: str = "local-server",
+) -> MigrationTickResult:
+    """Migrate one entity along each fired connection, batched per destination.
+
+    Args:
+        connections: Connections whose migration roll succeeded this tick
+        world_manager: Manager for this server's worlds
+        discovery_service: Resolves destination servers of remote connections
+        server_client: Sends remote batches
+        local_server_id: This server's ID
+
+    Returns:
+        Counts of migrated and failed entities and of port/HTTP round trips
+    """
+    result = MigrationTickResult()
+    migrants = await _take_migrants(connections, world_manager, result)
+
+    batches: dict[tuple[str | None, str], list[_Migrant]] = {}
+    for migrant in migrants:
+        connection = migrant.connection
+        server_id = connection.destination_server_id if connection.is_remote() else None
+        batches.setdefault((server_id, connection.destination_world_id), []).append(migrant)
+
+    for (server_id, world_id), batch in batches.items():
+        try:
+            if server_id is None:
+                admissions = await _admit_local(world_id, batch, world_manager, result)
+            else:
+                admissions = await _admit_remote(
+                    server_id,
+                    world_id,
+                    batch,
+                    discovery_service,
+                    server_client,
+                    local_server_id,
+                    result,
+                )
+        except Exception as e:
+            logger.error(f"Batched migration to {world_id[:8]} failed: {e}", exc_info=True)
+            admissions = [MigrantAdmission(ok=False, error=str(e))] * len(batch)
+        for migrant, admission in zip(batch, admissions, strict=True):
+            migrant.admission = admission
+
+    stale = await _settle(migrants, result)
+    if stale:
+        await _revoke(stale, world_manager, discovery_service, server_client, result)
+    _log_transfers(migrants, world_manager)
+    return result
+
+
+async def _take_migrants(
+    connections: Sequence[Any], world_manager: WorldManager, result: MigrationTickResult
+) -> list[_Migrant]:
+    """Reserve one entity per usable connection, one call per source world."""
+    by_source: dict[str, list[Any]] = {}
+    for connection in connections:
+        source = world_manager.get_world(connection.source_world_id)
+        if source is None:
+            logger.warning(
+                f"Migration failed: source world not found: {connection.source_world_id[:8]}"
+            )
+            continue
+        if _is_paused(source):
+            continue
+        if not connection.is_remote():
+            dest = world_manager.get_world(connection.destination_world_id)
+            if dest is None:
+                logger.warning(
+                    f"Migration failed: destination world not found: "
+                    f"{connection.destination_world_id[:8]}"
+                )
+                continue
+            if _is_paused(dest):
+                continue
+        by_source.setdefault(connection.source_world_id, []).append(connection)
+
+    migrants: list[_Migrant] = []
+    for source_world_id, source_connections in by_source.items():
+        source = world_manager.get_world(source_world_id)
+        if source is None:
+            continue
+        port = migration_port_for(source.runner)
+        tickets = await asyncio.to_thread(port.take_migrants, len(source_connections))
+        result.round_trips += 1
+        migrants.extend(
+            _Migrant(connection, source, ticket)
+            for connection, ticket in zip(source_connections, tickets, strict=False)
+        )
+    return migrants
+
+
+async def _admit_local(
+    world_id: str,
+    batch: list[_Migrant],
+    world_manager: WorldManager,
+    result: MigrationTickResult,
+) -> list[MigrantAdmission]:
+    dest = world_manager.get_world(world_id)
+    if dest is None:
+        return [MigrantAdmission(ok=False, error="Destination world not found")] * len(batch)
+    port = migration_port_for(dest.runner)
+    entity_data = [migrant.ticket.entity_data for migrant in batch]
+    admissions = await asyncio.to_thread(port.accept_migrants, entity_data, "migration_in")
+    result.round_trips += 1
+    return admissions
+
+
+async def _admit_remote(
+    server_id: str,
+    world_id: str,
+    batch: list[_Migrant],
+    discovery_service: DiscoveryService | None,
+    server_client: ServerClient | None,
+    local_server_id: str,
+    result: MigrationTickResult,
+) -> list[MigrantAdmission]:
+    if not discovery_service or not server_client:
+        logger.warning(
+            "Cannot perform remote migration: discovery service or server client not available"
+        )
+        return [MigrantAdmission(ok=False, error_code="remote_unavailable")] * len(batch)
+
+    dest_server = await discovery_service.get_server(server_id)
+    if not dest_server:
+        logger.warning(f"Remote migration failed: destination server not found: {server_id}")
+        return [MigrantAdmission(ok=False, error_code="remote_unavailable")] * len(batch)
+
+    responses = await server_client.remote_transfer_entities(
+        server=dest_server,
+        destination_world_id=world_id,
+        transfers=[
+            {
+                "source_world_id": migrant.connection.source_world_id,
+                "entity_old_id": migrant.ticket.token,
+                "entity_type": migrant.ticket.entity_type,
+                "entity_data": migrant.ticket.entity_data,
+            }
+            for migrant in batch
+        ],
+        source_server_id=local_server_id,
+    )
+    result.round_trips += 1
+    if responses is None:
+        return [MigrantAdmission(ok=False, error="No response from remote server")] * len(batch)
+
+    admissions = []
+    for response in responses:
+        if response.get("success"):
+            new_id = response.get("entity", {}).get("new_id", -1)
+            admissions.append(MigrantAdmission(ok=True, new_id=new_id))
+        else:
+            error = response.get("error", "Unknown error")
+            admissions.append(MigrantAdmission(ok=False, error_code=error, error=error))
+    return admissions
+
+
+async def _settle(migrants: list[_Migrant], result: MigrationTickResult) -> list[_Migrant]:
+    """Commit admitted tickets and release the rest, one call per source and outcome.
+
+    Returns the admitted migrants whose source could not commit them; they
+    are marked failed here and their admitted copies still need revoking.
+    """
+    commits: dict[tuple[str, str], list[_Migrant]] = {}
+    releases: dict[str, list[_Migrant]] = {}
+    for migrant in migrants:
+        source_world_id = migrant.connection.source_world_id
+        if migrant.admission is not None and migrant.admission.ok:
+            reason = "remote_migration_out" if migrant.connection.is_remote() else "migration_out"
+            commits.setdefault((source_world_id, reason), []).append(migrant)
+            result.migrated += 1
+        else:
+            releases.setdefault(source_world_id, []).append(migrant)
+            result.failed += 1
+
+    stale: list[_Migrant] = []
+    for (_, reason), committed in commits.items():
+        port = migration_port_for(committed[0].source.runner)
+        tokens = [migrant.ticket.token for migrant in committed]
+        failed = set(await asyncio.to_thread(port.commit_migrants, tokens, reason))
+        result.round_trips += 1
+        for migrant in committed:
+            if migrant.ticket.token in failed:
+                stale.append(migrant)
+                result.migrated -= 1
+                result.failed += 1
+    for released in releases.values():
+        port = migration_port_for(released[0].source.runner)
+        await asyncio.to_thread(port.release_migrants, [m.ticket.token for m in released])
+        result.round_trips += 1
+    return stale
+
+
+async def _revoke(
+    stale: list[_Migrant],
+    world_manager: WorldManager,
+    discovery_service: DiscoveryService | None,
+    server_client: ServerClient | None,
+    result: MigrationTickResult,
+) -> None:
+    """Remove the admitted copies of migrants their source could not commit."""
+    by_destination: dict[tuple[str | None, str], list[int]] = {}
+    for migrant in stale:
+        connection = migrant.connection
+        admission = migrant.admission
+        if admission is not None and admission.new_id is not None:
+            server_id = connection.destination_server_id if connection.is_remote() else None
+            key = (server_id, connection.destination_world_id)
+            by_destination.setdefault(key, []).append(admission.new_id)
+        migrant.admission = MigrantAdmission(
+            ok=False,
+            error_code="source_changed",
+            error="Entity left its source world before the migration was committed",
+        )
+
+    for (server_id, world_id), new_ids in by_destination.items():
+        revoked: int | None = None
+        if server_id is None:
+            dest = world_manager.get_world(world_id)
+            if dest is not None:
+                port = migration_port_for(dest.runner)
+                revoked = await asyncio.to_thread(
+                    port.revoke_migrants, new_ids, "migration_revoked"
+                )
+        elif discovery_service and server_client:
+            dest_server = await discovery_service.get_server(server_id)
+            if dest_server:
+                revoked = await server_client.revoke_remote_transfers(
+                    dest_server, world_id, new_ids
+                )
+        result.round_trips += 1
+        if revoked != len(new_ids):
+            logger.warning(
+                f"Revoked {revoked or 0} of {len(new_ids)} migrants admitted to "
+                f"{world_id[:8]} whose source could not commit them"
+            )
+
+
+def _log_transfers(migrants: list[_Migrant], world_manager: WorldManager) -> None:
+    from backend.transfer_history import log_transfer
+
+    for migrant in migrants:
+        admission = migrant.admission
+        connection = migrant.connection
+        if admission is None or (not admission.ok and admission.error_code in SILENT_ERRORS):
+            continue
+        if connection.is_remote():
+            server_id = connection.destination_server_id
+            destination_world_id = f"{server_id}:{connection.destination_world_id}"
+            destination_world_name = f"Remote tank on {server_id}"
+            if not admission.ok:
+                logger.warning(f"Remote migration failed: {admission.error}")
+        else:
+            destination_world_id = connection.destination_world_id
+            dest = world_manager.get_world(destination_world_id)
+            destination_world_name = dest.name if dest else destination_world_id
+        log_transfer(
+            entity_type=migrant.ticket.entity_type,
+            entity_old_id=migrant.ticket.token,
+            entity_new_id=admission.new_id if admission.ok else None,
+            source_world_id=connection.source_world_id,
+            source_world_name=migrant.source.name,
+            destination_world_id=destination_world_id,
+            destination_world_name=destination_world_name,
+            success=admission.ok,
+            error=None if admission.ok else admission.error,
+        )
+
+
+__all__ = ["SILENT_ERRORS", "MigrationTickResult", "run_migration_tick"]
@@ -0,0 +1,285 @@
+"""Check/commit migration API that works across process boundaries.
+
+Migrations cannot touch both worlds' engines directly when a world runs in a
+worker process (see ``backend.runner.process_runner``), so every migration
+goes through a small port API instead:
+
+- ``take_migrant()`` picks and serializes an eligible entity (nothing is
+  removed yet) and returns a ``MigrantTicket``;
+- ``accept_migrant(entity_data)`` deserializes into the destination and
+  spawns it, reporting a ``MigrantAdmission``;
+- ``commit_migrant(token)`` removes the reserved entity from the source, or
+  ``release_migrant(token)`` forgets the reservation;
+- ``revoke_migrant(new_id)`` removes an admitted copy again when its source
+  could not commit (the original died or left the source in the meantime).
+
+Each call has a plural form (``take_migrants(count)``, ``accept_migrants``,
+``commit_migrants``, ``release_migrants``, ``revoke_migrants``) that handles
+a whole batch under
+one lock acquisition - one pipe round trip for a process runner - which is
+what the scheduler's per-tick batches (``backend.migration_batch``) use.
+
+``LocalMigrationPort`` implements the port against an in-process
+``SimulationRunner``; ``ProcessSimulationRunner`` forwards the same calls to
+a ``LocalMigrationPort`` inside its worker.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import weakref
+from dataclasses import dataclass
+from typing import Any, Protocol, cast
+
+logger = logging.getLogger(__name__)
+
+# Entity types eligible for migration (checked via snapshot_type property)
+_MIGRATABLE_TYPES = frozenset({"fish", "plant"})
+
+
+@dataclass
+class MigrantTicket:
+    """An entity reserved for migration, already serialized for transfer."""
+
+    token: int
+    entity_type: str
+    entity_data: dict[str, Any]
+
+
+@dataclass
+class MigrantAdmission:
+    """Outcome of spawning a migrant in its destination world."""
+
+    ok: bool
+    new_id: int | None = None
+    error_code: str | None = None
+    error: str | None = None
+
+
+class MigrationPort(Protocol):
+    """Check/commit migration surface shared by local and process runners."""
+
+    def take_migrant(self) -> MigrantTicket | None: ...
+
+    def commit_migrant(self, token: int, reason: str) -> bool: ...
+
+    def release_migrant(self, token: int) -> None: ...
+
+    def accept_migrant(self, entity_data: dict[str, Any], reason: str) -> MigrantAdmission: ...
+
+    def take_migrants(self, count: int) -> list[MigrantTicket]: ...
+
+    def commit_migrants(self, tokens: list[int], reason: str) -> int: ...
+
+    def release_migrants(self, tokens: list[int]) -> None: ...
+
+    def accept_migrants(
+        self, entity_data: list[dict[str, Any]], reason: str
+    ) -> list[MigrantAdmission]: ...
+
+    def revoke_migrant(self, new_id: int, reason: str) -> bool: ...
+
+    def revoke_migrants(self, new_ids: list[int], reason: str) -> int: ...
+
+
+class LocalMigrationPort:
+    """Migration port for a runner whose world lives in this process."""
+
+    def __init__(self, runner: Any) -> None:
+        self._runner = runner
+        # token -> (entity, the payload serialized for it at take time)
+        self._reserved: dict[int, tuple[Any, dict[str, Any]]] = {}
+        # Admitted entities by new_id, for revoke_migrants; entries vanish
+        # once the entity is garbage collected
+        self._admitted: weakref.WeakValueDictionary[int, Any] = weakref.WeakValueDictionary()
+        # Entities committed this frame stay in entities_list until the engine
+        # applies their removal on the next step; keep them out of take_migrants.
+        self._departed: set[int] = set()
+        self._departed_frame: int | None = None
+
+    def take_migrant(self) -> MigrantTicket | None:
+        """Reserve and serialize a random migratable entity, if any."""
+        tickets = self.take_migrants(1)
+        return tickets[0] if tickets else None
+
+    def take_migrants(self, count: int) -> list[MigrantTicket]:
+        """Reserve and serialize up to ``count`` distinct random migratable entities.
+
+        Entities already reserved (or committed earlier in the same frame, whose
+        removal is still pending) are never handed out twice.
+        """
+        from core.transfer.entity_transfer import serialize_entity_for_transfer
+
+        tickets: list[MigrantTicket] = []
+        with self._runner.lock:
+            departed = self._departed_this_frame()
+            entities = getattr(self._runner.world, "entities_list", [])
+            eligible = [
+                e
+                for e in entities
+                if getattr(e, "snapshot_type", None) in _MIGRATABLE_TYPES
+                and id(e) not in self._reserved
+                and id(e) not in departed
+            ]
+            for entity in random.sample(eligible, min(count, len(eligible))):
+                entity_data = serialize_entity_for_transfer(entity)
+                if entity_data is None:
+                    continue
+                token = id(entity)
+                self._reserved[token] = (entity, entity_data)
+                tickets.append(MigrantTicket(token, entity.snapshot_type, entity_data))
+        return tickets
+
+    def commit_migrant(self, token: int, reason: str) -> bool:
+        """Remove a reserved entity from its world."""
+        return not self.commit_migrants([token], reason)
+
+    def commit_migrants(self, tokens: list[int], reason: str) -> list[int]:
+        """Remove reserved entities from their world.
+
+        The world keeps stepping between ``take_migrants`` and this call, so
+        each entity is checked again first: one that died, is already being
+        removed or left ``entities_list`` is not committed. Energy leaving the
+        world is the energy serialized at take time, which is what the
+        destination received.
+
+        Returns:
+            The tokens that were not committed (unknown, released or stale);
+            their admitted copies are the caller's to revoke
+        """
+        failed: list[int] = []
+        committed = 0
+        with self._runner.lock:
+            departed = self._departed_this_frame()
+            engine = self._runner.world.engine
+            present = {id(e) for e in getattr(self._runner.world, "entities_list", [])}
+            for token in tokens:
+                reservation = self._reserved.pop(token, None)
+                if reservation is None:
+                    failed.append(token)
+                    continue
+                entity, entity_data = reservation
+                if (
+                    id(entity) not in present
+                    or entity.is_dead()
+                    or engine.is_pending_removal(entity)
+                ):
+                    failed.append(token)
+                    continue
+                ecosystem = getattr(entity, "ecosystem", None)
+                energy = entity_data.get("energy")
+                if (
+                    entity.snapshot_type == "fish"
+                    and ecosystem is not None
+                    and isinstance(energy, (int, float))
+                ):
+                    ecosystem.record_energy_burn("migration", float(energy))
+                engine.request_remove(entity, reason=reason)
+                departed.add(id(entity))
+                committed += 1
+        if committed:
+            self._runner.invalidate_state_cache()
+        return failed
+
+    def _departed_this_frame(self) -> set[int]:
+        frame = getattr(self._runner.world, "frame_count", None)
+        if frame != self._departed_frame:
+            self._departed.clear()
+            self._departed_frame = frame
+        return self._departed
+
+    def release_migrant(self, token: int) -> None:
+        """Drop a reservation without touching the world."""
+        self._reserved.pop(token, None)
+
+    def release_migrants(self, tokens: list[int]) -> None:
+        for token in tokens:
+            self._reserved.pop(token, None)
+
+    def accept_migrant(self, entity_data: dict[str, Any], reason: str) -> MigrantAdmission:
+        """Deserialize ``entity_data`` into this world and spawn it."""
+        return self.accept_migrants([entity_data], reason)[0]
+
+    def accept_migrants(
+        self, entity_data: list[dict[str, Any]], reason: str
+    ) -> list[MigrantAdmission]:
+        """Deserialize and spawn each payload in order, reporting one admission apiece."""
+        from core.transfer.entity_transfer import try_deserialize_entity
+
+        admissions: list[MigrantAdmission] = []
+        with self._runner.lock:
+            for data in entity_data:
+                outcome = try_deserialize_entity(data, self._runner.world)
+                if not outcome.ok or outcome.value is None:
+                    error = outcome.error
+                    admissions.append(
+                        MigrantAdmission(
+                            ok=False,
+                            error_code=error.code if error else None,
+                            error=(
+                                error.message if error else "Failed to deserialize in destination"
+                            ),
+                        )
+                    )
+                    continue
+                new_entity = outcome.value
+                self._runner.world.engine.request_spawn(new_entity, reason=reason)
+                if getattr(new_entity, "snapshot_type", None) == "fish":
+                    ecosystem = getattr(new_entity, "ecosystem", None)
+                    energy = getattr(new_entity, "energy", None)
+                    if ecosystem is not None and isinstance(energy, (int, float)):
+                        ecosystem.record_energy_gain("migration_in", float(energy))
+                self._admitted[id(new_entity)] = new_entity
+                admissions.append(MigrantAdmission(ok=True, new_id=id(new_entity)))
+        if any(admission.ok for admission in admissions):
+            self._runner.invalidate_state_cache()
+        return admissions
+
+    def revoke_migrant(self, new_id: int, reason: str) -> bool:
+        """Remove an entity admitted by ``accept_migrants`` again."""
+        return self.revoke_migrants([new_id], reason) == 1
+
+    def revoke_migrants(self, new_ids: list[int], reason: str) -> int:
+        """Remove admitted entities whose source could not commit them.
+
+        A copy that is still waiting to spawn is dropped from the spawn
+        queue; one already spawned is removed. Its energy is booked out of the
+        world again. Returns how many copies were revoked.
+        """
+        revoked = 0
+        with self._runner.lock:
+            engine = self._runner.world.engine
+            for new_id in new_ids:
+                entity = self._admitted.pop(new_id, None)
+                if entity is None or entity.is_dead() or engine.is_pending_removal(entity):
+                    continue
+                ecosystem = getattr(entity, "ecosystem", None)
+                energy = getattr(entity, "energy", None)
+                if (
+                    entity.snapshot_type == "fish"
+                    and ecosystem is not None
+                    and isinstance(energy, (int, float))
+                ):
+                    ecosystem.record_energy_burn(reason, float(energy))
+                engine.request_remove(entity, reason=reason)
+                revoked += 1
+        if revoked:
+            self._runner.invalidate_state_cache()
+        return revoked
+
+
+def runs_in_subprocess(runner: Any) -> bool:
+    """Whether a runner's world lives in a worker process."""
+    return bool(getattr(runner, "runs_in_subprocess", False))
+
+
+def migration_port_for(runner: Any) -> MigrationPort:
+    """Return the migration port for a runner (process runners are their own port)."""
+    if runs_in_subprocess(runner):
+        return cast(MigrationPort, runner)
+    port = getattr(runner, "_migration_port", None)
+    if port is None:
+        port = LocalMigrationPort(runner)
+        runner._migration_port = port
+    return port
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
 import importlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, cast
 
 from core.replay.fingerprint import SnapshotFingerprinter
-from core.replay.jsonl import JsonlReplayReader, JsonlReplayWriter, ReplayFormatError
+from core.replay.fingerprint_stream import (
+    diff_entity_fingerprints,
+    entity_fingerprints,
+    entity_type_fingerprints,
+)
+from core.replay.jsonl import (
+    JsonlReplayReader,
+    JsonlReplayWriter,
+    ReplayFormatError,
+    ReplayHeader,
+)
 
 
 class ReplayMismatchError(AssertionError):
@@ -35,6 +45,22 @@ class ReplayPlan:
     switch_at_frame: dict[int, str]
 
 
+@dataclass(frozen=True)
+class ReplayDivergence:
+    """Where a replay first stopped matching its recording (see diff_replay)."""
+
+    # First recorded op whose frame or fingerprint differs
+    frame: int
+    op: str
+    # Last recorded frame that still matched, if any
+    last_verified_frame: int | None
+    # First checkpoint at or after the divergence; the entity details below
+    # are from that frame (None if the recording ends before one)
+    checkpoint_frame: int | None = None
+    differing_entity_types: tuple[str, ...] = ()
+    differing_entities: dict[str, list[object]] = field(default_factory=dict)
+
+
 def record_file(
     path: str | Path,
     *,
@@ -46,11 +72,22 @@ def record_file(
     plan: ReplayPlan | None = None,
     digest_size: int = 16,
     float_precision: int = 6,
+    checkpoint_every: int | None = None,
 ) -> Path:
+    """Record a replay of ``steps`` world steps.
+
+    With ``checkpoint_every``, a ``checkpoint`` record follows the step op at
+    every multiple of that many frames. It carries per-entity-type and
+    per-entity fingerprints, which ``diff_replay`` uses to name the entities
+    that drifted. Checkpoint frames are always recorded, whatever
+    ``record_every`` is.
+    """
     if seed is None:
         raise ValueError("seed is required for replay recording")
     if record_every < 1:
         raise ValueError("record_every must be >= 1")
+    if checkpoint_every is not None and checkpoint_every < 1:
+        raise ValueError("checkpoint_every must be >= 1")
 
     fingerprinter = SnapshotFingerprinter(digest_size=digest_size, float_precision=float_precision)
     runner = _create_runner(world_type=initial_mode, seed=seed, config=config)
@@ -85,8 +122,9 @@ def record_file(
             runner.world.step()
             frame = int(getattr(runner.world, "frame_count", 0))
 
+            is_checkpoint = checkpoint_every is not None and frame % checkpoint_every == 0
             should_record_step = (frame % record_every == 0) or (frame in switch_at)
-            if should_record_step:
+            if should_record_step or is_checkpoint:
                 snapshot = _get_snapshot_for_fingerprint(runner.world)
                 delta = int(snapshot.get("frame", frame)) - last_record_frame
                 if delta < 1:
@@ -101,6 +139,15 @@ def record_file(
                     }
                 )
                 last_record_frame = int(snapshot.get("frame", frame))
+                if is_checkpoint:
+                    writer.write_event(
+                        {
+                            "type": "checkpoint",
+                            "frame": last_record_frame,
+                            "entity_types": entity_type_fingerprints(snapshot, fingerprinter),
+                            "entities": entity_fingerprints(snapshot, fingerprinter),
+                        }
+                    )
 
             target_mode = switch_at.get(frame)
             if target_mode:
@@ -119,14 +166,11 @@ def record_file(
     return Path(path)
 
 
-def replay_file(path: str | Path) -> None:
+def _open_replay(path: str | Path) -> tuple[JsonlReplayReader, ReplayHeader, SnapshotFingerprinter]:
     reader = JsonlReplayReader(path)
     header = reader.read_header()
     if header.version != 1:
         raise ReplayFormatError(f"Unsupported replay version: {header.version}")
-    seed = int(header.seed)
-    initial_mode = str(header.initial_mode)
-    config = dict(header.config or {})
 
     fp_cfg = dict(header.fingerprint or {})
     digest_size = int(cast(int | str, fp_cfg.get("digest_size", 16)))
@@ -141,52 +185,144 @@ def replay_file(path: str | Path) -> None:
     fingerprinter = SnapshotFingerprinter(
         digest_size=digest_size, algorithm=algorithm, float_precision=float_precision
     )
+    return reader, header, fingerprinter
 
-    runner = _create_runner(world_type=initial_mode, seed=seed, config=config)
+
+def _runner_for(header: ReplayHeader) -> Any:
+    return _create_runner(
+        world_type=str(header.initial_mode),
+        seed=int(header.seed),
+        config=dict(header.config or {}),
+    )
+
+
+def _apply_op(runner: Any, event: dict[str, object]) -> bool:
+    """Apply one op record to ``runner``; False for records that aren't ops."""
+    if event.get("type") != "op":
+        return False
+    op = event.get("op")
+    if op == "init":
+        return True
+    if op == "step":
+        n = int(cast(int | str, event.get("n", 1)))
+        if n < 1:
+            raise ReplayFormatError("step op requires n >= 1")
+        for _ in range(n):
+            runner.world.step()
+        return True
+    if op == "switch_mode":
+        mode = event.get("mode")
+        if not mode:
+            raise ReplayFormatError("switch_mode op requires mode")
+        runner.switch_world_type(str(mode))
+        return True
+    return False
+
+
+def _check_op(
+    runner: Any, event: dict[str, object], fingerprinter: SnapshotFingerprinter
+) -> str | None:
+    """Describe how the world after an op differs from its record, if it does."""
+    op = event.get("op")
+    expected_fp = event.get("fingerprint")
+    expected_frame = event.get("frame")
+    snapshot = _get_snapshot_for_fingerprint(runner.world)
+    actual_fp = fingerprinter.fingerprint(snapshot)
+    actual_frame = int(
+        cast(int | str, snapshot.get("frame", getattr(runner.world, "frame_count", 0)))
+    )
+
+    if expected_frame is not None and int(cast(int | str, expected_frame)) != actual_frame:
+        return f"Frame mismatch for op={op}: expected={int(cast(int | str, expected_frame))} actual={actual_frame}"
+
+    if expected_fp != actual_fp:
+        return f"Fingerprint mismatch at frame={actual_frame} op={op}: expected={expected_fp} actual={actual_fp}"
+    return None
+
+
+def replay_file(path: str | Path) -> None:
+    reader, header, fingerprinter = _open_replay(path)
+    runner = _runner_for(header)
 
     first_event_seen = False
     for event in reader.iter_events():
-        if event.get("type") != "op":
+        if not _apply_op(runner, event):
             continue
-        op = event.get("op")
-        expected_fp = event.get("fingerprint")
-        expected_frame = event.get("frame")
+        first_event_seen = True
+        mismatch = _check_op(runner, event, fingerprinter)
+        if mismatch is not None:
+            raise ReplayMismatchError(mismatch)
 
-        if op == "init":
-            first_event_seen = True
-            snapshot = _get_snapshot_for_fingerprint(runner.world)
-        elif op == "step":
-            first_event_seen = True
-            n = int(cast(int | str, event.get("n", 1)))
-            if n < 1:
-                raise ReplayFormatError("step op requires n >= 1")
-            for _ in range(n):
-                runner.world.step()
-            snapshot = _get_snapshot_for_fingerprint(runner.world)
-        elif op == "switch_mode":
-            first_event_seen = True
-            mode = event.get("mode")
-            if not mode:
-                raise ReplayFormatError("switch_mode op requires mode")
-            runner.switch_world_type(str(mode))
-            snapshot = _get_snapshot_for_fingerprint(runner.world)
-        else:
-            continue
+    if not first_event_seen:
+        raise ReplayFormatError("Replay contained no events")
 
-        actual_fp = fingerprinter.fingerprint(snapshot)
-        actual_frame = int(
-            cast(int | str, snapshot.get("frame", getattr(runner.world, "frame_count", 0)))
-        )
 
-        if expected_frame is not None and int(cast(int | str, expected_frame)) != actual_frame:
-            raise ReplayMismatchError(
-                f"Frame mismatch for op={op}: expected={int(cast(int | str, expected_frame))} actual={actual_frame}"
-            )
+def diff_replay(path: str | Path) -> ReplayDivergence | None:
+    """Find the first recorded op a replay diverges at, or None if none does.
 
-        if expected_fp != actual_fp:
-            raise ReplayMismatchError(
-                f"Fingerprint mismatch at frame={actual_frame} op={op}: expected={expected_fp} actual={actual_fp}"
+    Replays the recording from the start in a single pass and checks every
+    recorded op like ``replay_file``, but returns a ``ReplayDivergence``
+    instead of raising. After the first mismatch it keeps stepping to the
+    next checkpoint record and compares per-entity fingerprints there, to
+    report which entities drifted. Checkpoints are only compared against,
+    never restored from.
+    """
+    reader, header, fingerprinter = _open_replay(path)
+    runner = _runner_for(header)
+
+    first_event_seen = False
+    last_verified_frame: int | None = None
+    divergence: dict[str, Any] | None = None
+    for event in reader.iter_events():
+        if event.get("type") == "checkpoint":
+            if divergence is None:
+                continue
+            snapshot = _get_snapshot_for_fingerprint(runner.world)
+            return ReplayDivergence(
+                **divergence, **_checkpoint_differences(snapshot, event, fingerprinter)
             )
+        if not _apply_op(runner, event):
+            continue
+        first_event_seen = True
+        if divergence is not None:
+            continue
+        mismatch = _check_op(runner, event, fingerprinter)
+        frame = int(cast(int | str, event.get("frame", 0)))
+        if mismatch is None:
+            last_verified_frame = frame
+            continue
+        divergence = {
+            "frame": frame,
+            "op": str(event.get("op")),
+            "last_verified_frame": last_verified_frame,
+        }
 
     if not first_event_seen:
         raise ReplayFormatError("Replay contained no events")
+    return None if divergence is None else ReplayDivergence(**divergence)
+
+
+def _checkpoint_differences(
+    snapshot: dict[str, Any],
+    checkpoint: dict[str, object],
+    fingerprinter: SnapshotFingerprinter,
+) -> dict[str, Any]:
+    recorded_types = checkpoint.get("entity_types")
+    recorded_types = recorded_types if isinstance(recorded_types, dict) else {}
+    actual_types = entity_type_fingerprints(snapshot, fingerprinter)
+    differing_types = sorted(
+        name
+        for name in set(recorded_types) | set(actual_types)
+        if recorded_types.get(name) != actual_types.get(name)
+    )
+    recorded_entities = checkpoint.get("entities")
+    differing_entities: dict[str, list[object]] = {}
+    if isinstance(recorded_entities, dict):
+        differing_entities = diff_entity_fingerprints(
+            recorded_entities, entity_fingerprints(snapshot, fingerprinter)
+        )
+    return {
+        "checkpoint_frame": int(cast(int | str, checkpoint.get("frame", 0))),
+        "differing_entity_types": tuple(differing_types),
+        "differing_entities": differing_entities,
+    }
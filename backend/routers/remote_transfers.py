@@ -0,0 +1,123 @@
+"""Cross-server entity transfer endpoint (receiving side).
+
+A peer's migration scheduler posts one batch per destination world per tick
+(see ``backend.migration_batch``). The whole batch is admitted through the
+destination world's migration port in one call, and the per-entity results
+come back in request order so the sender can commit or release each entity.
+Admitted entities whose source could not commit them are revoked again
+through ``/revoke``.
+"""
+
+import asyncio
+import logging
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Body, HTTPException
+from fastapi.responses import JSONResponse
+
+from backend.migration_port import migration_port_for
+from backend.world_manager import WorldManager
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on entities per request, so one peer cannot stall a world
+MAX_TRANSFERS_PER_BATCH = 256
+
+
+def setup_router(world_manager: WorldManager) -> APIRouter:
+    """Create and configure the remote transfer router."""
+    router = APIRouter(prefix="/api/remote-transfer", tags=["transfers"])
+
+    @router.post("/batch")
+    async def remote_transfer_batch(
+        payload: Annotated[dict[str, Any], Body(...)],
+    ) -> JSONResponse:
+        """Admit a batch of serialized entities into one local world."""
+        from backend.transfer_history import log_transfer
+
+        destination_world_id = payload.get("destination_world_id")
+        transfers = payload.get("transfers")
+        if not isinstance(destination_world_id, str) or not isinstance(transfers, list):
+            raise HTTPException(
+                status_code=400, detail="destination_world_id and transfers are required"
+            )
+        if len(transfers) > MAX_TRANSFERS_PER_BATCH:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {MAX_TRANSFERS_PER_BATCH} transfers per batch",
+            )
+        if not all(
+            isinstance(item, dict) and isinstance(item.get("entity_data"), dict)
+            for item in transfers
+        ):
+            raise HTTPException(status_code=400, detail="Every transfer needs entity_data")
+
+        instance = world_manager.get_world(destination_world_id)
+        if instance is None:
+            raise HTTPException(status_code=404, detail=f"World not found: {destination_world_id}")
+
+        if getattr(instance.runner, "paused", False):
+            paused = [{"success": False, "error": "world_paused"} for _ in transfers]
+            return JSONResponse({"success": True, "results": paused})
+
+        port = migration_port_for(instance.runner)
+        admissions = await asyncio.to_thread(
+            port.accept_migrants,
+            [item["entity_data"] for item in transfers],
+            "remote_migration_in",
+        )
+
+        source_server_id = str(payload.get("source_server_id", "unknown"))
+        results: list[dict[str, Any]] = []
+        for item, admission in zip(transfers, admissions, strict=True):
+            if admission.ok:
+                results.append({"success": True, "entity": {"new_id": admission.new_id}})
+                log_transfer(
+                    entity_type=str(item.get("entity_type", "unknown")),
+                    entity_old_id=(
+                        item["entity_old_id"] if isinstance(item.get("entity_old_id"), int) else -1
+                    ),
+                    entity_new_id=admission.new_id,
+                    source_world_id=f"{source_server_id}:{item.get('source_world_id')}",
+                    source_world_name=f"Remote tank on {source_server_id}",
+                    destination_world_id=destination_world_id,
+                    destination_world_name=instance.name,
+                    success=True,
+                )
+            else:
+                results.append({"success": False, "error": admission.error_code or admission.error})
+
+        return JSONResponse({"success": True, "results": results})
+
+    @router.post("/revoke")
+    async def remote_transfer_revoke(
+        payload: Annotated[dict[str, Any], Body(...)],
+    ) -> JSONResponse:
+        """Remove admitted entities whose source world could not commit them."""
+        destination_world_id = payload.get("destination_world_id")
+        entity_ids = payload.get("entity_ids")
+        if (
+            not isinstance(destination_world_id, str)
+            or not isinstance(entity_ids, list)
+            or not all(isinstance(entity_id, int) for entity_id in entity_ids)
+        ):
+            raise HTTPException(
+                status_code=400, detail="destination_world_id and integer entity_ids are required"
+            )
+        if len(entity_ids) > MAX_TRANSFERS_PER_BATCH:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {MAX_TRANSFERS_PER_BATCH} entities per revoke",
+            )
+
+        instance = world_manager.get_world(destination_world_id)
+        if instance is None:
+            raise HTTPException(status_code=404, detail=f"World not found: {destination_world_id}")
+
+        port = migration_port_for(instance.runner)
+        revoked = await asyncio.to_thread(
+            port.revoke_migrants, entity_ids, "remote_migration_revoked"
+        )
+        return JSONResponse({"success": True, "revoked": revoked})
+
+    return router
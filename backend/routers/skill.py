@@ -20,7 +20,7 @@ from fastapi.responses import JSONResponse
 
 from backend.skill_evaluation_service import SkillEvaluationService
 from backend.skill_observatory import build_observatory_snapshot, evaluate_observatory_snapshot
-from backend.skill_observatory_scoring import compute_foraging_gym_summary
+from backend.skill_observatory_scoring import ObservatoryDiskCache, compute_foraging_gym_summary
 from core.skill import load_ladder_summaries
 
 logger = logging.getLogger(__name__)
@@ -35,8 +35,14 @@ def setup_router(
     champions_dir: Path | None = None,
     world_manager: Any | None = None,
     evaluation_service: SkillEvaluationService | None = None,
+    evaluation_cache: ObservatoryDiskCache | None = None,
 ) -> APIRouter:
-    """Create the skill-ladder standings router."""
+    """Create the skill-ladder standings router.
+
+    ``evaluation_cache`` persists observatory genome scores and the baseline
+    summary across restarts and worker processes; without it they are only
+    memoized in memory.
+    """
     router = APIRouter(tags=["skill"])
     resolved_dir = champions_dir or _CHAMPIONS_DIR
     if evaluation_service is None:
@@ -74,9 +80,9 @@ def setup_router(
         world_id: str | None = Query(default=None),
     ) -> JSONResponse:
         """Return the aggregated foraging gym summary across versioned seeds."""
-        return JSONResponse(compute_foraging_gym_summary())
+        return JSONResponse(compute_foraging_gym_summary(evaluation_cache))
 
-    # The background worker (asyncio.to_thread) must never touch live
+    # The background worker (thread or process) must never touch live
     # simulation state - build_observatory_snapshot captures everything it
     # needs synchronously first, on this coroutine's own thread, and
     # evaluate_observatory_snapshot then runs as a pure function of that
@@ -84,7 +90,11 @@ def setup_router(
     evaluation_service.set_snapshot_builder(
         functools.partial(build_observatory_snapshot, world_manager)
     )
-    evaluation_service.set_evaluator(evaluate_observatory_snapshot)
+    # functools.partial of a module-level function stays picklable for the
+    # service's process pool
+    evaluation_service.set_evaluator(
+        functools.partial(evaluate_observatory_snapshot, disk_cache=evaluation_cache)
+    )
 
     @router.get("/api/skill/foraging-gym/observatory")
     def get_foraging_gym_observatory(world_id: str | None = Query(default=None)) -> JSONResponse:
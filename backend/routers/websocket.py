@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from backend.broadcast_fanout import binary_state_payload, client_wants_binary
 from backend.security import resolve_client_ip, websocket_limiter, websocket_message_limiter
 
 if TYPE_CHECKING:
@@ -55,7 +56,11 @@ async def _handle_websocket_for_adapter(
         try:
             state = await adapter.get_state_async(force_full=True, allow_delta=False)
             if state is not None:
-                serialized = adapter.serialize_state(state)
+                serialized = None
+                if client_wants_binary(websocket):
+                    serialized = binary_state_payload(state)
+                if serialized is None:
+                    serialized = adapter.serialize_state(state)
                 await websocket.send_bytes(serialized)
         except Exception as e:
             logger.error(
@@ -31,14 +31,19 @@ def register(router: APIRouter, world_manager: WorldManager) -> None:
         return JSONResponse(data)
 
     @router.get("/{world_id}/lineage")
-    async def get_world_lineage(world_id: str):
+    async def get_world_lineage(world_id: str, since: int | None = None, epoch: str | None = None):
         """Get lineage data for phylogenetic tree visualization.
 
         Args:
             world_id: The world ID
+            since: ``version`` from a previous delta response; when given, only
+                records changed after it are returned
+            epoch: ``epoch`` from the same previous delta response
 
         Returns:
-            List of lineage records with parent-child relationships
+            List of lineage records with parent-child relationships, or with
+            ``since`` a delta dict (``epoch``, ``version``, ``full``,
+            ``records``, ``removed``)
         """
         instance = world_manager.get_world(world_id)
         if instance is None:
@@ -60,10 +65,17 @@ def register(router: APIRouter, world_manager: WorldManager) -> None:
                             for e in runner.world.entities_list
                             if getattr(e, "snapshot_type", None) == "fish"
                         }
+                    if since is not None:
+                        delta = ecosystem.get_lineage_delta(since, epoch, alive_fish_ids)
+                        return JSONResponse(delta)
                     lineage_data = ecosystem.get_lineage_data(alive_fish_ids)
                     return JSONResponse(lineage_data)
 
             # Fallback: lineage not available for this world type
+            if since is not None:
+                return JSONResponse(
+                    {"epoch": None, "version": 0, "full": True, "records": [], "removed": []}
+                )
             return JSONResponse([])
         except Exception as e:
             logger.error(f"Error getting lineage data: {e}", exc_info=True)
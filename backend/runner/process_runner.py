@@ -0,0 +1,391 @@
+"""Process-per-world runner proxy.
+
+Threaded ``SimulationRunner`` instances share one interpreter, so with several
+tanks every simulation loop is serialized on the GIL. ``ProcessSimulationRunner``
+runs the real ``SimulationRunner`` in a dedicated worker process (see
+``backend.runner.process_worker``) and satisfies ``RunnerProtocol`` by
+forwarding calls over a pipe, so WorldManager, the broadcast loop, autosave
+and the REST routers can use it unchanged.
+
+State frames are built *and encoded* in the worker; ``get_state`` returns an
+``EncodedState`` whose ``to_json()`` is the ready-to-send JSON bytes, so only
+one bytes object crosses the boundary per published frame.
+
+Objects that are not plain data (``runner.world``, ``runner.commentary``,
+``runner.metrics_history``, engines, stores) are exposed as ``RemoteHandle``
+paths: attribute reads of plain values and method calls are forwarded, and
+anything else yields a nested handle. Entities never leave the worker;
+migration uses the check/commit API in ``backend.migration_port``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+
+from backend.migration_port import MigrantAdmission, MigrantTicket
+from backend.runner.process_worker import CALLABLE, HANDLE, run_world_worker
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the worker to build its world / shut down
+_STARTUP_TIMEOUT = 120.0
+_SHUTDOWN_TIMEOUT = 5.0
+
+
+class WorkerError(RuntimeError):
+    """Raised in the parent when a request failed inside the world worker."""
+
+
+# Worker exceptions re-raised as themselves so hasattr()/getattr(default) and
+# lookups behave exactly as they do against an in-process runner.
+_PASSTHROUGH_ERRORS: dict[str, type[Exception]] = {
+    "AttributeError": AttributeError,
+    "IndexError": IndexError,
+    "KeyError": KeyError,
+    "TypeError": TypeError,
+    "ValueError": ValueError,
+}
+
+
+def _raise_worker_error(error: tuple[str, str]) -> None:
+    type_name, message = error
+    raise _PASSTHROUGH_ERRORS.get(type_name, WorkerError)(message)
+
+
+@dataclass
+class EncodedState:
+    """A state frame already serialized to JSON by the worker."""
+
+    frame: int
+    is_delta: bool
+    data: bytes
+
+    def to_json(self) -> bytes:
+        return self.data
+
+    def to_dict(self) -> dict[str, Any]:
+        payload = orjson.loads(self.data)
+        return payload if isinstance(payload, dict) else {}
+
+
+class RemoteHandle:
+    """Live reference to an object inside the worker, addressed by path."""
+
+    def __init__(self, client: ProcessSimulationRunner, path: tuple[Any, ...]) -> None:
+        object.__setattr__(self, "_client", client)
+        object.__setattr__(self, "_path", path)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self._client._resolve((*self._path, name))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._client._request("set", (*self._path, name), value)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._client._resolve((*self._path, ("item", key)))
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __len__(self) -> int:
+        return int(self._client._request("len", self._path))
+
+    def __iter__(self) -> Iterator[Any]:
+        # The worker iterates the real object once; plain items come back as
+        # a list, anything else as a held list addressed by index.
+        value = self._client._request("iter", self._path)
+        if isinstance(value, list):
+            return iter(value)
+        path, count = value
+        items = RemoteHandle(self._client, path)
+        return (items[index] for index in range(count))
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._client._request_call(self._path, *args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"RemoteHandle({'.'.join(map(str, self._path))})"
+
+
+class ProcessSimulationRunner:
+    """RunnerProtocol implementation backed by a SimulationRunner in a worker process."""
+
+    runs_in_subprocess = True
+
+    def __init__(
+        self,
+        seed: int | None = None,
+        world_id: str | None = None,
+        world_name: str | None = None,
+        world_type: str = "tank",
+        config: dict[str, Any] | None = None,
+        start_method: str = "spawn",
+    ) -> None:
+        import uuid
+
+        self.world_id = world_id or str(uuid.uuid4())
+        self.world_name = world_name or f"World {self.world_id[:8]}"
+        self.world_type = world_type
+        self._seed = seed
+        # Local stand-ins for attributes callers set on in-process runners
+        self.lock = threading.Lock()
+        self.world_manager: Any = None
+        self.connection_manager: Any = None
+
+        ctx = multiprocessing.get_context(start_method)
+        self._conn, child_conn = ctx.Pipe()
+        self._pipe_lock = threading.Lock()
+        self._process = ctx.Process(  # type: ignore[attr-defined]
+            target=run_world_worker,
+            args=(
+                child_conn,
+                {
+                    "seed": seed,
+                    "world_id": self.world_id,
+                    "world_name": self.world_name,
+                    "world_type": world_type,
+                    "config": config,
+                },
+            ),
+            name=f"world-{self.world_id[:8]}",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+
+        if not self._conn.poll(_STARTUP_TIMEOUT):
+            self._process.kill()
+            raise WorkerError(f"World worker {self.world_id[:8]} did not start")
+        ok, info = self._conn.recv()
+        if not ok:
+            self._process.join(_SHUTDOWN_TIMEOUT)
+            _raise_worker_error(info)
+        self.mode_id: str = info["mode_id"]
+        self.view_mode: str = info["view_mode"]
+        self._stopped = False
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    def _request(self, op: str, path: tuple[Any, ...], *args: Any, **kwargs: Any) -> Any:
+        with self._pipe_lock:
+            if self._stopped:
+                raise WorkerError(f"World worker {self.world_id[:8]} is stopped")
+            self._conn.send((op, path, args, kwargs))
+            ok, value = self._conn.recv()
+        if not ok:
+            _raise_worker_error(value)
+        return value
+
+    def _resolve(self, path: tuple[Any, ...]) -> Any:
+        value = self._request("get", path)
+        if value in (CALLABLE, HANDLE):
+            return RemoteHandle(self, path)
+        return value
+
+    def _request_call(self, path: tuple[Any, ...], *args: Any, **kwargs: Any) -> Any:
+        value = self._request("call", path, *args, **kwargs)
+        # Results that are not plain data stay in the worker behind a handle
+        if isinstance(value, tuple) and len(value) == 2 and value[0] == HANDLE:
+            return RemoteHandle(self, value[1])
+        return value
+
+    def _call(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        return self._request_call((name,), *args, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return not self._stopped and bool(self._request("get", ("running",)))
+
+    @running.setter
+    def running(self, value: bool) -> None:
+        self._request("set", ("running",), value)
+
+    def start(self, start_paused: bool = False) -> None:
+        self._call("start", start_paused=start_paused)
+
+    def stop(self) -> None:
+        """Stop the simulation and shut the worker process down."""
+        with self._pipe_lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            try:
+                self._conn.send(("stop", (), (), {}))
+                if self._conn.poll(_SHUTDOWN_TIMEOUT):
+                    self._conn.recv()
+            except (EOFError, OSError):
+                pass
+            self._conn.close()
+        self._process.join(_SHUTDOWN_TIMEOUT)
+        if self._process.is_alive():
+            logger.warning("World worker %s did not exit; terminating", self.world_id[:8])
+            self._process.terminate()
+
+    # ------------------------------------------------------------------
+    # RunnerProtocol
+    # ------------------------------------------------------------------
+
+    @property
+    def world(self) -> RemoteHandle:
+        return RemoteHandle(self, ("world",))
+
+    @property
+    def engine(self) -> RemoteHandle:
+        return RemoteHandle(self, ("world", "engine"))
+
+    @property
+    def commentary(self) -> RemoteHandle:
+        return RemoteHandle(self, ("commentary",))
+
+    @property
+    def metrics_history(self) -> RemoteHandle:
+        return RemoteHandle(self, ("metrics_history",))
+
+    @property
+    def frame_count(self) -> int:
+        return int(self._request("get", ("frame_count",)))
+
+    @property
+    def paused(self) -> bool:
+        return bool(self._request("get", ("paused",)))
+
+    @paused.setter
+    def paused(self, value: bool) -> None:
+        self._request("set", ("paused",), value)
+
+    @property
+    def fast_forward(self) -> bool:
+        return bool(self._request("get", ("fast_forward",)))
+
+    @fast_forward.setter
+    def fast_forward(self, value: bool) -> None:
+        self._request("set", ("fast_forward",), value)
+
+    def get_state(self, force_full: bool = False, allow_delta: bool = True) -> EncodedState:
+        frame, is_delta, data = self._request("state", (), force_full, allow_delta)
+        return EncodedState(frame=frame, is_delta=is_delta, data=data)
+
+    async def get_state_async(
+        self, force_full: bool = False, allow_delta: bool = True
+    ) -> EncodedState:
+        return await asyncio.to_thread(self.get_state, force_full, allow_delta)
+
+    def serialize_state(self, state: EncodedState) -> bytes:
+        return state.to_json()
+
+    def get_entities_snapshot(self) -> list[Any]:
+        return list(self._call("get_entities_snapshot"))
+
+    def get_stats(self) -> dict[str, Any]:
+        return dict(self._call("get_stats"))
+
+    def get_world_info(self) -> dict[str, str]:
+        return {"mode_id": self.mode_id, "world_type": self.world_type, "view_mode": self.view_mode}
+
+    def step(self, actions_by_agent: dict[str, Any] | None = None) -> None:
+        self._call("step", actions_by_agent=actions_by_agent)
+
+    def reset(self, seed: int | None = None, config: dict[str, Any] | None = None) -> None:
+        self._call("reset", seed=seed, config=config)
+
+    def switch_world_type(self, new_world_type: str) -> None:
+        self._call("switch_world_type", new_world_type)
+        self.world_type = self._request("get", ("world_type",))
+        self.mode_id = self._request("get", ("mode_id",))
+        self.view_mode = self._request("get", ("view_mode",))
+
+    def get_evolution_benchmark_data(self) -> dict[str, Any]:
+        return dict(self._call("get_evolution_benchmark_data"))
+
+    def get_full_evaluation_history(self) -> list[dict[str, Any]]:
+        return list(self._call("get_full_evaluation_history"))
+
+    # ------------------------------------------------------------------
+    # SimulationRunner extras used by routers and services
+    # ------------------------------------------------------------------
+
+    def handle_command(self, command: str, data: dict[str, Any] | None = None) -> Any:
+        return self._call("handle_command", command, data)
+
+    async def handle_command_async(self, command: str, data: dict[str, Any] | None = None) -> Any:
+        return await asyncio.to_thread(self.handle_command, command, data)
+
+    def add_commentary(self, text: str, **kwargs: Any) -> dict[str, Any]:
+        return dict(self._call("add_commentary", text, **kwargs))
+
+    def invalidate_state_cache(self) -> None:
+        self._call("invalidate_state_cache")
+
+    def set_world_identity(self, world_id: str, world_name: str | None = None) -> None:
+        self._call("set_world_identity", world_id, world_name)
+        self.world_id = world_id
+        if world_name is not None:
+            self.world_name = world_name
+
+    def _update_environment_migration_context(self) -> None:
+        """No-op: fish-initiated migration needs in-process world access."""
+
+    def restore_from_snapshot(self, snapshot: dict[str, Any]) -> bool:
+        """Run ``restore_world_from_snapshot`` inside the worker."""
+        return bool(self._request("restore", (), snapshot))
+
+    # ------------------------------------------------------------------
+    # MigrationPort (see backend.migration_port)
+    # ------------------------------------------------------------------
+
+    def take_migrant(self) -> MigrantTicket | None:
+        ticket: MigrantTicket | None = self._request("migration", (), "take_migrant")
+        return ticket
+
+    def commit_migrant(self, token: int, reason: str) -> bool:
+        return bool(self._request("migration", (), "commit_migrant", token, reason))
+
+    def release_migrant(self, token: int) -> None:
+        self._request("migration", (), "release_migrant", token)
+
+    def accept_migrant(self, entity_data: dict[str, Any], reason: str) -> MigrantAdmission:
+        admission: MigrantAdmission = self._request(
+            "migration", (), "accept_migrant", entity_data, reason
+        )
+        return admission
+
+    def take_migrants(self, count: int) -> list[MigrantTicket]:
+        tickets: list[MigrantTicket] = self._request("migration", (), "take_migrants", count)
+        return tickets
+
+    def commit_migrants(self, tokens: list[int], reason: str) -> list[int]:
+        failed: list[int] = self._request("migration", (), "commit_migrants", tokens, reason)
+        return failed
+
+    def release_migrants(self, tokens: list[int]) -> None:
+        self._request("migration", (), "release_migrants", tokens)
+
+    def accept_migrants(
+        self, entity_data: list[dict[str, Any]], reason: str
+    ) -> list[MigrantAdmission]:
+        admissions: list[MigrantAdmission] = self._request(
+            "migration", (), "accept_migrants", entity_data, reason
+        )
+        return admissions
+
+    def revoke_migrant(self, new_id: int, reason: str) -> bool:
+        return bool(self._request("migration", (), "revoke_migrant", new_id, reason))
+
+    def revoke_migrants(self, new_ids: list[int], reason: str) -> int:
+        return int(self._request("migration", (), "revoke_migrants", new_ids, reason))
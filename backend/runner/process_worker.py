@@ -0,0 +1,198 @@
+"""Worker-process side of process-per-world execution.
+
+``run_world_worker`` is the target of the process spawned by
+``ProcessSimulationRunner``. It builds an ordinary ``SimulationRunner``
+(so the simulation loop, lock discipline and hooks are exactly the threaded
+ones) and then serves requests from the parent over a ``multiprocessing``
+pipe until told to stop.
+
+Wire protocol: the parent sends ``(op, path, args, kwargs)`` tuples and
+receives ``(True, value)`` or ``(False, (exception_type_name, message))``. ``path`` is a tuple
+of attribute names / item keys resolved from the runner, so
+``("world", "engine", "skill_snapshot_store")`` addresses the same object
+``runner.world.engine.skill_snapshot_store`` does in-process.
+
+Only plain data crosses the pipe. Anything else (entities, engines, stores)
+is answered with a marker and the parent hands out a ``RemoteHandle`` for the
+path instead of a copy.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+    from backend.simulation_runner import SimulationRunner
+
+logger = logging.getLogger(__name__)
+
+# Markers returned instead of values that must stay in the worker
+CALLABLE = "__tank_remote_callable__"
+HANDLE = "__tank_remote_handle__"
+
+# First path step of a non-plain call result kept in the worker; the parent
+# receives (HANDLE, (RESULT_ROOT, key)) and wraps it in a RemoteHandle.
+RESULT_ROOT = "__tank_remote_result__"
+# Oldest kept results are dropped past this many
+_MAX_RESULTS = 256
+
+_PLAIN_SCALARS = (type(None), bool, int, float, str, bytes)
+
+
+def is_shippable(value: Any) -> bool:
+    """Whether a value is plain data that should be copied to the parent."""
+    if isinstance(value, _PLAIN_SCALARS):
+        return True
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(is_shippable(item) for item in value)
+    if isinstance(value, dict):
+        return all(is_shippable(k) and is_shippable(v) for k, v in value.items())
+    # Payload DTOs (StatsPayload, MigrantTicket, ...) are plain dataclasses
+    return dataclasses.is_dataclass(value) and not isinstance(value, type)
+
+
+def resolve_path(root: Any, path: tuple[Any, ...]) -> Any:
+    """Follow attribute names (str) and item keys (("item", key)) from root."""
+    obj = root
+    for step in path:
+        if isinstance(step, tuple):
+            obj = obj[step[1]]
+        else:
+            obj = getattr(obj, step)
+    return obj
+
+
+class WorldWorker:
+    """Serves pipe requests against one in-process SimulationRunner."""
+
+    def __init__(self, runner: SimulationRunner) -> None:
+        from backend.migration_port import LocalMigrationPort
+
+        self.runner = runner
+        self.migration_port = LocalMigrationPort(runner)
+        self._encoded_state: tuple[Any, bytes] | None = None
+        self._results: OrderedDict[int, Any] = OrderedDict()
+        self._next_result = 0
+        self._ops: dict[str, Callable[..., Any]] = {
+            "get": self._get,
+            "set": self._set,
+            "call": self._call,
+            "len": lambda path: len(self._resolve(path)),
+            "iter": self._iter,
+            "state": self._state,
+            "restore": self._restore,
+            "migration": self._migration,
+        }
+
+    def handle(self, op: str, path: tuple[Any, ...], args: tuple, kwargs: dict) -> Any:
+        return self._ops[op](path, *args, **kwargs)
+
+    def _resolve(self, path: tuple[Any, ...]) -> Any:
+        if path[:1] != (RESULT_ROOT,):
+            return resolve_path(self.runner, path)
+        key = path[1]
+        if key not in self._results:
+            raise KeyError(f"Call result {key} is no longer held by the worker")
+        self._results.move_to_end(key)
+        return resolve_path(self._results[key], path[2:])
+
+    def _get(self, path: tuple[Any, ...]) -> Any:
+        value = self._resolve(path)
+        if callable(value) and not isinstance(value, type):
+            return CALLABLE
+        return value if is_shippable(value) else HANDLE
+
+    def _set(self, path: tuple[Any, ...], value: Any) -> None:
+        setattr(self._resolve(path[:-1]), path[-1], value)
+
+    def _call(self, path: tuple[Any, ...], *args: Any, **kwargs: Any) -> Any:
+        result = self._resolve(path)(*args, **kwargs)
+        if is_shippable(result):
+            return result
+        return HANDLE, self._keep(result)
+
+    def _iter(self, path: tuple[Any, ...]) -> Any:
+        """Iterate in the worker; non-plain items stay behind as a held list."""
+        items = list(self._resolve(path))
+        if is_shippable(items):
+            return items
+        return self._keep(items), len(items)
+
+    def _keep(self, result: Any) -> tuple[Any, ...]:
+        """Hold a result in the worker and return the path that addresses it."""
+        key = self._next_result
+        self._next_result += 1
+        self._results[key] = result
+        if len(self._results) > _MAX_RESULTS:
+            self._results.popitem(last=False)
+        return RESULT_ROOT, key
+
+    def _state(self, path: tuple[Any, ...], force_full: bool, allow_delta: bool) -> Any:
+        """Build and encode a frame; returns (frame, is_delta, json_bytes)."""
+        from backend.state_payloads import DeltaStatePayload
+
+        state = self.runner.get_state(force_full=force_full, allow_delta=allow_delta)
+        # The publisher hands back its cached payload between frames, so
+        # encode each payload object once no matter how many callers ask.
+        cached = self._encoded_state
+        if cached is not None and cached[0] is state:
+            data = cached[1]
+        else:
+            data = self.runner.serialize_state(state)
+            self._encoded_state = (state, data)
+        return state.frame, isinstance(state, DeltaStatePayload), data
+
+    def _restore(self, path: tuple[Any, ...], snapshot: dict[str, Any]) -> bool:
+        from backend.world_persistence import restore_world_from_snapshot
+
+        with self.runner.lock:
+            restored = restore_world_from_snapshot(snapshot, self.runner.world)
+        self.runner.invalidate_state_cache()
+        return restored
+
+    def _migration(self, path: tuple[Any, ...], method: str, *args: Any) -> Any:
+        return getattr(self.migration_port, method)(*args)
+
+
+def run_world_worker(conn: Connection, runner_kwargs: dict[str, Any]) -> None:
+    """Process entry point: build the runner, then serve requests until "stop"."""
+    from backend.logging_config import configure_logging
+    from backend.simulation_runner import SimulationRunner
+
+    configure_logging(include_uvicorn=False)
+    try:
+        runner = SimulationRunner(**runner_kwargs)
+    except Exception as e:
+        conn.send((False, (type(e).__name__, str(e))))
+        conn.close()
+        return
+    conn.send((True, {"mode_id": runner.mode_id, "view_mode": runner.view_mode}))
+
+    worker = WorldWorker(runner)
+    try:
+        while True:
+            try:
+                op, path, args, kwargs = conn.recv()
+            except (EOFError, OSError):
+                break  # Parent went away
+            if op == "stop":
+                runner.stop()
+                conn.send((True, None))
+                break
+            try:
+                reply = (True, worker.handle(op, path, args, kwargs))
+            except Exception as e:
+                reply = (False, (type(e).__name__, str(e)))
+            try:
+                conn.send(reply)
+            except Exception as e:  # e.g. an unpicklable dataclass field
+                conn.send((False, (type(e).__name__, str(e))))
+    finally:
+        runner.stop()
+        conn.close()
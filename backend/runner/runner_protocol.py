@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
+    from backend.runner.process_runner import EncodedState
     from backend.state_payloads import DeltaStatePayload, EntitySnapshot, FullStatePayload
 
 
@@ -118,8 +119,9 @@ class RunnerProtocol(Protocol):
 
     def get_state(
         self, force_full: bool = False, allow_delta: bool = True
-    ) -> FullStatePayload | DeltaStatePayload:
-        # returns FullStatePayload | DeltaStatePayload
+    ) -> FullStatePayload | DeltaStatePayload | EncodedState:
+        # returns FullStatePayload | DeltaStatePayload (EncodedState for
+        # process-mode runners, which serialize in their worker)
         ...
 
     def step(self, actions_by_agent: dict[str, Any] | None = None) -> None:
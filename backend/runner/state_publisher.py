@@ -28,10 +28,17 @@ class StatePublisher:
         self._cached_state: FullStatePayload | DeltaStatePayload | None = None
         self._cached_state_frame: int | None = None
         self._frames_since_update = 0
+        # Full states built on request (client connect/resync, snapshot API)
+        # once a delta baseline exists. Kept apart from _cached_state so they
+        # never move the baseline that broadcast deltas are computed against.
+        self._forced_full_state: FullStatePayload | None = None
+        self._forced_full_frame: int | None = None
 
         # Delta sync state
         self._last_full_frame: int | None = None
         self._last_entities: dict[int, EntitySnapshot] = {}
+        # Frame that _last_entities was captured on; the next delta's base.
+        self._baseline_frame: int | None = None
         # Cache of last frame's to_delta_dict() output, keyed by entity id, so
         # _build_delta_state doesn't have to re-derive it from the stored
         # EntitySnapshot every frame - see _build_delta_state's comment.
@@ -53,8 +60,11 @@ class StatePublisher:
         self._cached_state = None
         self._cached_state_frame = None
         self._frames_since_update = 0
+        self._forced_full_state = None
+        self._forced_full_frame = None
         self._last_full_frame = None
         self._last_entities.clear()
+        self._baseline_frame = None
         self._last_delta_dicts.clear()
         self._reported_duplicate_ids.clear()
         for key in self._delta_metrics:
@@ -90,6 +100,9 @@ class StatePublisher:
             and not (wants_full and isinstance(cached, DeltaStatePayload))
         ):
             return cached
+        forced = self._forced_full_state
+        if wants_full and forced is not None and current_frame == self._forced_full_frame:
+            return forced
 
         # 2. Throttling: Skip updates if not enough time passed (unless forced or stopped)
         self._frames_since_update += 1
@@ -147,14 +160,25 @@ class StatePublisher:
                 entity_snapshots,
                 include_metrics_history=force_full or not allow_delta,
             )
+            if wants_full and self._last_full_frame is not None:
+                # Requested by one client: leave the delta chain that every
+                # other client is following untouched (see broadcast_fanout).
+                self._forced_full_state = state
+                self._forced_full_frame = current_frame
+                return state
             self._last_full_frame = current_frame
-            self._last_entities = {e.id: e for e in entity_snapshots}
         else:
             state = self._build_delta_state(
-                runner, current_frame, elapsed_time, stats, entity_snapshots
+                runner,
+                current_frame,
+                elapsed_time,
+                stats,
+                entity_snapshots,
+                base_frame=self._baseline_frame,
             )
-            # Update entity usage tracking for next delta
-            self._last_entities = {e.id: e for e in entity_snapshots}
+        # Update entity usage tracking for next delta
+        self._last_entities = {e.id: e for e in entity_snapshots}
+        self._baseline_frame = current_frame
 
         # Cache it
         self._cached_state = state
@@ -297,7 +321,13 @@ class StatePublisher:
             )
 
     def _build_delta_state(
-        self, runner: Any, frame: int, elapsed_time: Any, stats: Any, entities: list[EntitySnapshot]
+        self,
+        runner: Any,
+        frame: int,
+        elapsed_time: Any,
+        stats: Any,
+        entities: list[EntitySnapshot],
+        base_frame: int | None = None,
     ) -> DeltaStatePayload:
         """Construct a DeltaStatePayload."""
 
@@ -420,6 +450,7 @@ class StatePublisher:
             view_mode=runner.view_mode,
             tank_soccer_enabled=tank_soccer_enabled,
             new_metrics_sample=new_metrics_sample_payload,
+            base_frame=base_frame,
         )
 
     def _get_tank_soccer_enabled(self, runner: Any) -> bool | None:
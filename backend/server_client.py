@@ -417,47 +417,75 @@ class ServerClient:
 
         return response is not None
 
-    async def remote_transfer_entity(
+    async def remote_transfer_entities(
         self,
         server: ServerInfo,
         destination_world_id: str,
-        entity_data: dict[str, Any],
+        transfers: list[dict[str, Any]],
         source_server_id: str,
-        source_world_id: str,
-    ) -> dict[str, Any] | None:
-        """Transfer an entity to a remote server.
+    ) -> list[dict[str, Any]] | None:
+        """Transfer a batch of entities to one world on a remote server.
 
-        This sends a serialized entity to a remote server for cross-server migration.
+        Every entity is checked and spawned by the destination in a single
+        request; the caller commits or releases each one from the response.
 
         Args:
             server: Destination server
             destination_world_id: Destination tank ID
-            entity_data: Serialized entity data
+            transfers: One dict per entity with ``entity_data`` (serialized
+                entity), ``source_world_id``, ``entity_old_id`` and ``entity_type``
             source_server_id: Source server ID (for logging)
-            source_world_id: Source tank ID (for logging)
 
         Returns:
-            Transfer result dictionary if successful, None otherwise
+            One result dict per transfer, in order, or None if the request failed
         """
-        url = self._build_url(server, "/api/remote-transfer")
+        url = self._build_url(server, "/api/remote-transfer/batch")
 
         payload = {
             "destination_world_id": destination_world_id,
-            "entity_data": entity_data,
             "source_server_id": source_server_id,
-            "source_world_id": source_world_id,
+            "transfers": transfers,
         }
 
         response = await self._request("POST", url, json=payload)
 
         if response:
             try:
-                data = response.json()
-                if isinstance(data, dict):
-                    return cast(dict[str, Any], data)
-                logger.error("Unexpected remote transfer result response format: %s", type(data))
+                results = response.json().get("results")
+                if isinstance(results, list) and len(results) == len(transfers):
+                    return cast(list[dict[str, Any]], results)
+                logger.error("Unexpected remote transfer batch response format")
                 return None
             except Exception as e:
-                logger.error("Failed to parse remote transfer result: %s", e)
+                logger.error("Failed to parse remote transfer batch result: %s", e)
+
+        return None
+
+    async def revoke_remote_transfers(
+        self,
+        server: ServerInfo,
+        destination_world_id: str,
+        entity_ids: list[int],
+    ) -> int | None:
+        """Remove entities a remote world admitted whose source could not commit them.
+
+        Args:
+            server: Destination server
+            destination_world_id: Destination tank ID
+            entity_ids: ``new_id`` values from ``remote_transfer_entities`` results
+
+        Returns:
+            How many entities the destination removed, or None if the request failed
+        """
+        url = self._build_url(server, "/api/remote-transfer/revoke")
+        payload = {"destination_world_id": destination_world_id, "entity_ids": entity_ids}
+
+        response = await self._request("POST", url, json=payload)
+
+        if response:
+            try:
+                return int(response.json()["revoked"])
+            except Exception as e:
+                logger.error("Failed to parse remote transfer revoke result: %s", e)
 
         return None
@@ -3,6 +3,12 @@
 The observatory is intentionally asynchronous with respect to HTTP requests.
 Evaluating a tank can take seconds, so the API serves the last completed result
 while this service refreshes worlds in the background.
+
+Evaluations run on a worker thread by default. That thread still competes for
+the GIL with every in-process simulation loop, so the service can instead
+send evaluations to a persistent pool of worker processes
+(``process_workers``). The evaluator and its snapshot are pickled for the
+trip; anything that doesn't pickle is evaluated on a thread as before.
 """
 
 from __future__ import annotations
@@ -10,8 +16,12 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import multiprocessing
+import pickle
 from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from copy import deepcopy
 from pathlib import Path
 from typing import Any
@@ -22,6 +32,13 @@ DEFAULT_EVALUATION_INTERVAL = 300.0
 MAX_LATEST_RESULTS = 64
 
 
+def _evaluate_pickled(payload: bytes) -> dict[str, Any]:
+    """Worker-process entry point: unpickle ``(evaluator, argument)`` and run it."""
+    evaluator, argument = pickle.loads(payload)
+    result: dict[str, Any] = evaluator(argument)
+    return result
+
+
 class SkillEvaluationService:
     """Evaluate worlds outside request handlers and retain bounded latest results."""
 
@@ -34,7 +51,14 @@ class SkillEvaluationService:
         interval_seconds: float = DEFAULT_EVALUATION_INTERVAL,
         max_results: int = MAX_LATEST_RESULTS,
         storage_path: Path | None = None,
+        process_workers: int = 0,
     ) -> None:
+        """Create the service.
+
+        ``process_workers`` > 0 evaluates in a pool of that many worker
+        processes (started with ``spawn`` on first use, kept until ``stop``)
+        instead of a worker thread.
+        """
         if max_results < 1:
             raise ValueError("max_results must be positive")
         self._world_manager = world_manager
@@ -47,6 +71,8 @@ class SkillEvaluationService:
         self._running = False
         self._in_flight: set[str] = set()
         self._storage_path = storage_path
+        self._process_workers = process_workers
+        self._executor: ProcessPoolExecutor | None = None
         self._load_latest()
 
     def set_evaluator(self, evaluator: Callable[[Any], dict[str, Any]]) -> None:
@@ -54,8 +80,10 @@ class SkillEvaluationService:
 
         When a snapshot builder is also set (see ``set_snapshot_builder``), the
         evaluator receives that builder's snapshot object instead of a world_id
-        string, and runs in a worker thread only after the snapshot has already
-        been captured synchronously - it must not read live simulation state.
+        string, and runs in a worker thread (or process) only after the snapshot
+        has already been captured synchronously - it must not read live
+        simulation state. To run in worker processes, the evaluator must be
+        picklable (a module-level function or a ``functools.partial`` of one).
         """
         self._evaluator = evaluator
 
@@ -84,11 +112,11 @@ class SkillEvaluationService:
         self._persist_latest()
 
     async def refresh_world(self, world_id: str) -> dict[str, Any] | None:
-        """Evaluate one world in a worker thread and store its completed result.
+        """Evaluate one world in a worker and store its completed result.
 
         When a snapshot builder is configured, it runs synchronously first, on
-        this coroutine's own thread, so the worker thread never reads live
-        simulation state - only the immutable snapshot it was handed.
+        this coroutine's own thread, so the worker never reads live simulation
+        state - only the immutable snapshot it was handed.
         """
         if self._evaluator is None or world_id in self._in_flight:
             return self.get_latest(world_id)
@@ -100,9 +128,9 @@ class SkillEvaluationService:
                 if isinstance(snapshot, dict):
                     result = snapshot
                 else:
-                    result = await asyncio.to_thread(self._evaluator, snapshot)
+                    result = await self._evaluate(snapshot)
             else:
-                result = await asyncio.to_thread(self._evaluator, world_id)
+                result = await self._evaluate(world_id)
             self.store_result(world_id, result)
             return deepcopy(result)
         except Exception:
@@ -111,6 +139,49 @@ class SkillEvaluationService:
         finally:
             self._in_flight.discard(world_id)
 
+    async def _evaluate(self, argument: Any) -> dict[str, Any]:
+        """Run the evaluator in the process pool if configured, else a worker thread."""
+        evaluator = self._evaluator
+        if evaluator is None:
+            raise RuntimeError("no evaluator configured")
+        payload = self._pool_payload(evaluator, argument)
+        if payload is None:
+            return await asyncio.to_thread(evaluator, argument)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._pool(), _evaluate_pickled, payload)
+        except BrokenProcessPool:
+            # A worker died mid-evaluation; the next refresh starts a new pool
+            self._shutdown_pool()
+            raise
+
+    def _pool_payload(
+        self, evaluator: Callable[[Any], dict[str, Any]], argument: Any
+    ) -> bytes | None:
+        if self._process_workers < 1:
+            return None
+        try:
+            return pickle.dumps((evaluator, argument), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            logger.warning(
+                "Skill evaluation input does not pickle (%s); using a worker thread", exc
+            )
+            return None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._process_workers,
+                # Forking a process that runs simulation threads is unsafe
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _shutdown_pool(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
     async def start(self) -> None:
         """Start periodic world evaluation, including an initial refresh."""
         if self._running:
@@ -119,8 +190,9 @@ class SkillEvaluationService:
         self._task = asyncio.create_task(self._run_loop(), name="skill_evaluation")
 
     async def stop(self) -> None:
-        """Stop periodic evaluation and wait for the task to exit."""
+        """Stop periodic evaluation, wait for the task to exit, and close the pool."""
         self._running = False
+        self._shutdown_pool()
         if self._task is None:
             return
         self._task.cancel()
@@ -134,7 +206,7 @@ class SkillEvaluationService:
         try:
             while self._running:
                 # Refresh worlds one at a time rather than via asyncio.gather:
-                # each refresh_world call spawns a worker thread, and evaluators
+                # each refresh_world call may use a worker thread, and evaluators
                 # (e.g. the Observatory's genome-fingerprint cache) may share
                 # process-wide mutable state that isn't safe to touch from
                 # multiple worker threads at once. Evaluation already runs on
@@ -6,7 +6,8 @@ cache, and the foraging-gym baseline live in ``backend.skill_observatory_scoring
 This module owns the two-phase evaluation boundary itself: capturing a
 point-in-time snapshot of live simulation state (``build_observatory_snapshot``,
 must run on the caller's own thread) and scoring it (``evaluate_observatory_snapshot``,
-safe to run on a background worker thread since it touches only the snapshot).
+safe to run on a background worker thread or in a worker process since it
+touches only the snapshot, which pickles).
 """
 
 from __future__ import annotations
@@ -16,6 +17,7 @@ from typing import Any
 
 from backend.skill_observatory_scoring import (
     FORAGING_GYM_SUMMARY_SEEDS,
+    ObservatoryDiskCache,
     compute_foraging_gym_summary,
     evaluate_genome_with_cache,
     legacy_prediction_skill_of,
@@ -60,8 +62,9 @@ class WorldSkillSnapshot:
 
     Built synchronously on the caller's thread under the simulation runner's
     lock from live simulation state, then handed to a worker thread (via
-    ``asyncio.to_thread``) that must not touch the live world - the simulation
-    keeps mutating fish, species records, and the genome code pool concurrently.
+    ``asyncio.to_thread``) or pickled to a worker process. Either way the
+    evaluation must not touch the live world - the simulation keeps mutating
+    fish, species records, and the genome code pool concurrently.
     """
 
     world_id: str
@@ -185,18 +188,21 @@ def build_observatory_snapshot(
     )
 
 
-def evaluate_observatory_snapshot(snapshot: WorldSkillSnapshot) -> dict[str, Any]:
+def evaluate_observatory_snapshot(
+    snapshot: WorldSkillSnapshot, disk_cache: ObservatoryDiskCache | None = None
+) -> dict[str, Any]:
     """Score one isolated evaluation snapshot against the production controller.
 
-    Runs on a background worker thread (via ``asyncio.to_thread``) - must
-    never touch live simulation state, only the ``snapshot`` it was given.
+    Runs on a background worker thread or in a worker process - must never
+    touch live simulation state, only the ``snapshot`` it was given. Scores
+    are memoized in-process and, with ``disk_cache``, on disk.
     """
     from core.behavior.pursuit_nodes import pursuit_module_parameters
 
     living_fish = snapshot.living_fish
     species_by_taxon_id = snapshot.species_by_taxon_id
 
-    baseline = compute_foraging_gym_summary()
+    baseline = compute_foraging_gym_summary(disk_cache)
     config_hash = baseline["config_hash"]
 
     # Each living_fish entry's genome is already an isolated deep copy (see
@@ -209,6 +215,7 @@ def evaluate_observatory_snapshot(snapshot: WorldSkillSnapshot) -> dict[str, Any
             FORAGING_GYM_SUMMARY_SEEDS,
             snapshot.simulation_config,
             snapshot.genome_code_pool,
+            disk_cache,
         )
         fish_evals.append(
             {
@@ -4,19 +4,101 @@ Two independent caches live here, both keyed by a config hash so a changed
 benchmark config invalidates stale entries rather than silently reusing them:
 a bounded LRU of per-genome multi-seed scores (``evaluate_genome_with_cache``),
 and an unbounded memo of the engine's own default-controller baseline
-(``compute_foraging_gym_summary``).
+(``compute_foraging_gym_summary``). Both can be backed by an
+``ObservatoryDiskCache``, which keeps results across restarts and shares them
+between the evaluation service's worker processes.
 """
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import json
+import logging
 import math
+import os
+import tempfile
 from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 from backend.skill_observatory_policies import evaluate_custom_genome
 
+logger = logging.getLogger(__name__)
+
+# Disk-cache key of the engine-baseline summary (genome entries use fingerprints)
+_BASELINE_CACHE_KEY = "engine_baseline"
+# Entries kept on disk across all config hashes before the least recently used go
+DEFAULT_DISK_CACHE_ENTRIES = 4096
+
+
+@dataclass(frozen=True)
+class ObservatoryDiskCache:
+    """Observatory results on disk, shared by every process using ``root``.
+
+    One JSON file per entry at ``root/<config_hash>/<key>.json``. Entries are
+    written to a temporary file and renamed into place, so readers in other
+    processes never see a partial entry; two processes that score the same
+    controller at once just write the same result twice. Unreadable entries
+    count as misses.
+
+    A hit refreshes the entry's mtime. Each write then drops the least
+    recently used entries beyond ``max_entries`` and removes config-hash
+    directories it emptied, so entries of retired configs age out.
+    """
+
+    root: Path
+    max_entries: int = DEFAULT_DISK_CACHE_ENTRIES
+
+    def _path(self, key: str, config_hash: str) -> Path:
+        return self.root / config_hash / f"{key}.json"
+
+    def get(self, key: str, config_hash: str) -> dict[str, Any] | None:
+        path = self._path(key, config_hash)
+        try:
+            cached = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict):
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return cached
+
+    def put(self, key: str, config_hash: str, result: dict[str, Any]) -> None:
+        path = self._path(key, config_hash)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(result, handle, sort_keys=True, separators=(",", ":"))
+                os.replace(temporary, path)
+            except BaseException:
+                Path(temporary).unlink(missing_ok=True)
+                raise
+            self._evict()
+        except (OSError, TypeError, ValueError):
+            logger.warning("Could not write observatory cache entry %s", path)
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, Path]] = []
+        for path in self.root.glob("*/*.json"):
+            with contextlib.suppress(OSError):  # removed by another process
+                entries.append((path.stat().st_mtime, path))
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+        entries.sort()
+        emptied: set[Path] = set()
+        for _, path in entries[:excess]:
+            path.unlink(missing_ok=True)
+            emptied.add(path.parent)
+        for directory in emptied:
+            with contextlib.suppress(OSError):  # still holds entries
+                directory.rmdir()
+
 
 def controller_fingerprint(genome: Any) -> str:
     """Stable identity hash for a genome's movement-controller-relevant genes.
@@ -106,12 +188,22 @@ def evaluate_genome_with_cache(
     seeds: tuple[int, ...],
     simulation_config: Any,
     genome_code_pool: Any,
+    disk_cache: ObservatoryDiskCache | None = None,
 ) -> dict[str, Any]:
-    """Score one genome across ``seeds``, cached by (controller fingerprint, config_hash)."""
-    cache_key = (controller_fingerprint(genome), config_hash)
+    """Score one genome across ``seeds``, cached by (controller fingerprint, config_hash).
+
+    With ``disk_cache``, entries missing from the in-process LRU are looked
+    up on disk before scoring, and new scores are written there too.
+    """
+    fingerprint = controller_fingerprint(genome)
+    cache_key = (fingerprint, config_hash)
     if cache_key in _OBSERVATORY_EVALUATION_CACHE:
         _OBSERVATORY_EVALUATION_CACHE.move_to_end(cache_key)
         return _OBSERVATORY_EVALUATION_CACHE[cache_key]
+    cached = disk_cache.get(fingerprint, config_hash) if disk_cache is not None else None
+    if cached is not None:
+        _remember_genome_result(cache_key, cached)
+        return cached
 
     scores = []
     food_collected_list = []
@@ -140,11 +232,17 @@ def evaluate_genome_with_cache(
         "uncertainty": sem,
         "sample_size": n_trials,
     }
+    _remember_genome_result(cache_key, result)
+    if disk_cache is not None:
+        disk_cache.put(fingerprint, config_hash, result)
+    return result
+
+
+def _remember_genome_result(cache_key: tuple[str, str], result: dict[str, Any]) -> None:
     _OBSERVATORY_EVALUATION_CACHE[cache_key] = result
     _OBSERVATORY_EVALUATION_CACHE.move_to_end(cache_key)
     while len(_OBSERVATORY_EVALUATION_CACHE) > _MAX_OBSERVATORY_CACHE_ENTRIES:
         _OBSERVATORY_EVALUATION_CACHE.popitem(last=False)
-    return result
 
 
 # The versioned seed cohort every foraging-gym summary/observatory result is
@@ -155,13 +253,16 @@ FORAGING_GYM_SUMMARY_SEEDS = (42, 7, 31, 38, 1, 5, 0, 41)
 _FORAGING_GYM_SUMMARY_CACHE: dict[str, dict[str, Any]] = {}
 
 
-def compute_foraging_gym_summary() -> dict[str, Any]:
+def compute_foraging_gym_summary(
+    disk_cache: ObservatoryDiskCache | None = None,
+) -> dict[str, Any]:
     """Aggregate the engine's default foraging-gym baseline across the fixed
     seed cohort, cached by config hash.
 
     Both the ``/foraging-gym/summary`` endpoint and ``evaluate_observatory_snapshot``
     (which compares a tank's best forager against this same baseline) call
-    this, so the 8-seed run only ever happens once per config.
+    this, so the 8-seed run only ever happens once per config - once per
+    ``disk_cache`` rather than once per process, when one is given.
     """
     from benchmarks.tank.foraging_gym import BENCHMARK_ID as FORAGING_GYM_ID
     from benchmarks.tank.foraging_gym import CONFIG as FORAGING_GYM_CONFIG
@@ -179,6 +280,10 @@ def compute_foraging_gym_summary() -> dict[str, Any]:
     )
     if config_hash in _FORAGING_GYM_SUMMARY_CACHE:
         return _FORAGING_GYM_SUMMARY_CACHE[config_hash]
+    cached = disk_cache.get(_BASELINE_CACHE_KEY, config_hash) if disk_cache is not None else None
+    if cached is not None:
+        _FORAGING_GYM_SUMMARY_CACHE[config_hash] = cached
+        return cached
 
     per_seed_results = {}
     scores = []
@@ -231,4 +336,6 @@ def compute_foraging_gym_summary() -> dict[str, Any]:
         },
     }
     _FORAGING_GYM_SUMMARY_CACHE[config_hash] = summary
+    if disk_cache is not None:
+        disk_cache.put(_BASELINE_CACHE_KEY, config_hash, summary)
     return summary
@@ -0,0 +1,476 @@
+"""On-disk encodings for world snapshots.
+
+Two formats are supported, selected per save (see ``save_snapshot_data``):
+
+- ``json``: the original pretty-printed ``snapshot_*.json`` file.
+- ``binary``: a versioned ``snapshot_*.tsnap`` file with columnar entities.
+
+Binary layout::
+
+    b"TANKSNAP" | u16 format version | u8 compression | u8 reserved
+    compressed stream of records, each ``u32 length | payload``:
+        header   orjson: {"snapshot": <everything but entities>,
+                          "entity_count", "groups", "order"}
+        per group: float64 values | int64 values | orjson list of other
+                   columns | u32 rows of the columns some entities lack
+
+Entities are grouped by ``type``. Nested dicts are flattened into one column
+per key path, so a fish's ``genome_data.behavior.parameters.flee_speed`` is a
+single array across all fish instead of a repeated key in every record.
+Columns whose values are all floats (or all ints) are packed into one raw
+float64/int64 array per group and round-trip bit-exactly; anything else goes
+into the group's orjson list of columns. ``order`` run-length-encodes the original entity order by group.
+
+Loading decodes the header eagerly and returns the entities as a
+``ColumnarEntities`` sequence, which rebuilds one entity type's dicts at a
+time as ``restore_world_from_snapshot`` iterates over it.
+``read_snapshot_metadata`` stops after the header, so listing snapshots does
+not decode any entities.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import struct
+from array import array
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, BinaryIO, cast, overload
+
+import orjson
+
+from core.exceptions import PersistenceError
+
+zstandard: Any = None
+try:  # Optional: better ratio/speed than gzip when installed
+    import zstandard as _zstandard  # type: ignore[import-not-found]
+
+    zstandard = _zstandard
+except ImportError:
+    pass
+
+SNAPSHOT_FORMATS = ("json", "binary")
+SNAPSHOT_SUFFIXES = {"json": ".json", "binary": ".tsnap"}
+COMPRESSIONS = ("none", "gzip", "zstd")
+BINARY_FORMAT_VERSION = 1
+
+_MAGIC = b"TANKSNAP"
+_PREAMBLE = struct.Struct("<8sHBB")
+_LENGTH = struct.Struct("<I")
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+_GROUP_BLOBS = 4  # float64 values, int64 values, orjson columns, presence rows
+
+
+def snapshot_format_for(path: str | Path) -> str:
+    """``"binary"`` if ``path`` starts with the binary magic, else ``"json"``."""
+    with open(path, "rb") as f:
+        return "binary" if f.read(len(_MAGIC)) == _MAGIC else "json"
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+
+def _flatten(
+    record: dict[str, Any], prefix: tuple[str, ...], out: dict[tuple[str, ...], Any]
+) -> None:
+    for key, value in record.items():
+        if type(value) is dict and value:
+            _flatten(value, prefix + (key,), out)
+        else:
+            out[prefix + (key,)] = value
+
+
+def _column_encoding(values: list[Any]) -> str:
+    if all(type(v) is float for v in values):
+        return "f8"
+    if all(type(v) is int and _INT64_MIN <= v <= _INT64_MAX for v in values):
+        return "i8"
+    return "json"
+
+
+def _merged_paths(rows: list[dict[tuple[str, ...], Any]]) -> list[tuple[str, ...]]:
+    """All key paths of a group, each new path placed after its predecessor in its row.
+
+    Keeps every record's key order when rows differ in which keys they have.
+    """
+    paths: list[tuple[str, ...]] = []
+    position: dict[tuple[str, ...], int] = {}
+    for flat in rows:
+        cursor = -1
+        for path in flat:
+            index = position.get(path)
+            if index is None:
+                index = cursor + 1
+                paths.insert(index, path)
+                if index == len(paths) - 1:
+                    position[path] = index
+                else:
+                    position = {p: i for i, p in enumerate(paths)}
+            cursor = index
+    return paths
+
+
+def _encode_group(
+    rows: list[dict[tuple[str, ...], Any]]
+) -> tuple[list[dict[str, Any]], list[bytes]]:
+    """Column specs plus the group's four blobs (f8, i8, json, presence rows)."""
+    paths = _merged_paths(rows)
+    floats = array("d")
+    ints = array("q")
+    json_columns: list[list[Any]] = []
+    presence = array("I")
+    columns = []
+    for path in paths:
+        present = [i for i, flat in enumerate(rows) if path in flat]
+        values = [rows[i][path] for i in present]
+        encoding = _column_encoding(values)
+        if encoding == "f8":
+            floats.extend(values)
+        elif encoding == "i8":
+            ints.extend(values)
+        else:
+            json_columns.append(values)
+        complete = len(present) == len(rows)
+        if not complete:
+            presence.extend(present)
+        columns.append(
+            {"path": list(path), "enc": encoding, "n": None if complete else len(present)}
+        )
+    blobs = [
+        floats.tobytes(),
+        ints.tobytes(),
+        orjson.dumps(json_columns, option=_ORJSON_OPTIONS),
+        presence.tobytes(),
+    ]
+    return columns, blobs
+
+
+def _encode_entities(
+    entities: Sequence[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[list[int]], list[bytes]]:
+    """Group entities by type and split each group into column blobs."""
+    group_index: dict[Any, int] = {}
+    group_rows: list[list[dict[tuple[str, ...], Any]]] = []
+    group_types: list[Any] = []
+    order: list[list[int]] = []
+    for entity in entities:
+        entity_type = entity.get("type")
+        index = group_index.get(entity_type)
+        if index is None:
+            index = group_index[entity_type] = len(group_rows)
+            group_rows.append([])
+            group_types.append(entity_type)
+        flat: dict[tuple[str, ...], Any] = {}
+        _flatten(entity, (), flat)
+        group_rows[index].append(flat)
+        if order and order[-1][0] == index:
+            order[-1][1] += 1
+        else:
+            order.append([index, 1])
+
+    groups: list[dict[str, Any]] = []
+    blobs: list[bytes] = []
+    for entity_type, rows in zip(group_types, group_rows, strict=True):
+        columns, group_blobs = _encode_group(rows)
+        groups.append({"type": entity_type, "count": len(rows), "columns": columns})
+        blobs.extend(group_blobs)
+    return groups, order, blobs
+
+
+def encode_binary_snapshot(snapshot: dict[str, Any], compression: str = "gzip") -> bytes:
+    """Encode a snapshot dict in the binary columnar format."""
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown snapshot compression {compression!r}")
+    if compression == "zstd" and zstandard is None:
+        raise ValueError("zstd snapshot compression requires the 'zstandard' package")
+
+    entities = list(snapshot.get("entities", []))
+    groups, order, blobs = _encode_entities(entities)
+    header = {
+        "snapshot": {key: value for key, value in snapshot.items() if key != "entities"},
+        "entity_count": len(entities),
+        "groups": groups,
+        "order": order,
+    }
+    body = io.BytesIO()
+    for payload in (orjson.dumps(header, option=_ORJSON_OPTIONS), *blobs):
+        body.write(_LENGTH.pack(len(payload)))
+        body.write(payload)
+
+    raw = body.getvalue()
+    if compression == "gzip":
+        raw = gzip.compress(raw, compresslevel=6, mtime=0)
+    elif compression == "zstd":
+        raw = zstandard.ZstdCompressor(level=3).compress(raw)
+    preamble = _PREAMBLE.pack(_MAGIC, BINARY_FORMAT_VERSION, COMPRESSIONS.index(compression), 0)
+    return preamble + raw
+
+
+def write_snapshot_file(
+    path: Path, snapshot: dict[str, Any], snapshot_format: str, compression: str = "gzip"
+) -> None:
+    """Write ``snapshot`` to ``path`` in ``snapshot_format`` ("json" or "binary")."""
+    if snapshot_format == "json":
+        entities = snapshot.get("entities")
+        if entities is not None and not isinstance(entities, list):
+            snapshot = {**snapshot, "entities": list(entities)}
+        with open(path, "w") as f:
+            json.dump(snapshot, f, indent=2)
+    elif snapshot_format == "binary":
+        data = encode_binary_snapshot(snapshot, compression)
+        with open(path, "wb") as f:
+            f.write(data)
+    else:
+        raise ValueError(f"Unknown snapshot format {snapshot_format!r}")
+
+
+# ---------------------------------------------------------------------------
+# Decoding
+# ---------------------------------------------------------------------------
+
+
+def _check_preamble(stream: BinaryIO) -> str:
+    """Validate the preamble and return the compression name."""
+    preamble = stream.read(_PREAMBLE.size)
+    if len(preamble) != _PREAMBLE.size:
+        raise PersistenceError("Truncated binary snapshot")
+    magic, version, compression, _ = _PREAMBLE.unpack(preamble)
+    if magic != _MAGIC:
+        raise PersistenceError("Not a binary snapshot file")
+    if version != BINARY_FORMAT_VERSION:
+        raise PersistenceError(f"Unsupported binary snapshot version {version}")
+    if compression >= len(COMPRESSIONS):
+        raise PersistenceError(f"Unknown binary snapshot compression {compression}")
+    name = COMPRESSIONS[compression]
+    if name == "zstd" and zstandard is None:
+        raise PersistenceError("Snapshot is zstd-compressed but 'zstandard' is not installed")
+    return name
+
+
+def _open_body(stream: BinaryIO) -> BinaryIO:
+    """Incremental reader over the records (used to read just the header)."""
+    compression = _check_preamble(stream)
+    if compression == "gzip":
+        return cast(BinaryIO, gzip.GzipFile(fileobj=stream, mode="rb"))
+    if compression == "zstd":
+        return cast(BinaryIO, zstandard.ZstdDecompressor().stream_reader(stream))
+    return stream
+
+
+def _read_body(stream: BinaryIO) -> bytes:
+    """All record bytes, decompressed in one call."""
+    compression = _check_preamble(stream)
+    raw = stream.read()
+    if compression == "gzip":
+        return gzip.decompress(raw)
+    if compression == "zstd":
+        return cast(bytes, zstandard.ZstdDecompressor().stream_reader(io.BytesIO(raw)).read())
+    return raw
+
+
+def _read_exact(body: BinaryIO, size: int) -> bytes:
+    # Decompressing readers may return short reads
+    chunks = []
+    while size > 0:
+        chunk = body.read(size)
+        if not chunk:
+            raise PersistenceError("Truncated binary snapshot")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _read_record(body: BinaryIO) -> bytes:
+    (length,) = _LENGTH.unpack(_read_exact(body, _LENGTH.size))
+    return _read_exact(body, length)
+
+
+def _split_records(body: bytes) -> Iterator[memoryview]:
+    view = memoryview(body)
+    offset = 0
+    while offset < len(view):
+        if offset + _LENGTH.size > len(view):
+            raise PersistenceError("Truncated binary snapshot")
+        (length,) = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+        if offset + length > len(view):
+            raise PersistenceError("Truncated binary snapshot")
+        yield view[offset : offset + length]
+        offset += length
+
+
+def _array_values(typecode: str, blob: bytes | memoryview) -> list[Any]:
+    values = array(typecode)
+    values.frombytes(blob)
+    return values.tolist()
+
+
+class _Group:
+    """One entity type's column blobs; rebuilt into records on first access."""
+
+    def __init__(self, spec: dict[str, Any], blobs: list[bytes]) -> None:
+        self.spec = spec
+        self.blobs = blobs
+        self.records: list[dict[str, Any]] | None = None
+
+    def _columns(self) -> Iterator[tuple[tuple[Any, ...], Sequence[int] | None, list[Any]]]:
+        """(path, present rows or None if complete, values) per column."""
+        count = self.spec["count"]
+        f8_blob, i8_blob, json_blob, presence_blob = self.blobs
+        sources = {
+            "f8": _array_values("d", f8_blob),
+            "i8": _array_values("q", i8_blob),
+        }
+        offsets = {"f8": 0, "i8": 0}
+        json_columns = iter(orjson.loads(json_blob))
+        presence = _array_values("I", presence_blob)
+        presence_offset = 0
+        for column in self.spec["columns"]:
+            n = column["n"]
+            rows = None
+            if n is not None:
+                rows = presence[presence_offset : presence_offset + n]
+                presence_offset += n
+            encoding = column["enc"]
+            if encoding == "json":
+                values = next(json_columns)
+            elif encoding in offsets:
+                start = offsets[encoding]
+                offsets[encoding] = start + (count if n is None else n)
+                values = sources[encoding][start : offsets[encoding]]
+            else:
+                raise PersistenceError(f"Unknown snapshot column encoding {encoding!r}")
+            yield tuple(column["path"]), rows, values
+
+    def decode(self) -> list[dict[str, Any]]:
+        """Rebuild the group's records column by column, then drop the blobs."""
+        if self.records is not None:
+            return self.records
+        count = self.spec["count"]
+        records: list[dict[str, Any]] = [{} for _ in range(count)]
+        # Nested dicts per key-path prefix (None where a row has none yet),
+        # created in column order so keys keep their original position
+        containers: dict[tuple[Any, ...], list[Any]] = {(): records}
+        filled = {()}  # prefixes that already have a dict in every row
+        for path, present, values in self._columns():
+            rows = range(count) if present is None else present
+            for depth in range(1, len(path)):
+                prefix = path[:depth]
+                if prefix in filled:
+                    continue
+                parents = containers[prefix[:-1]]
+                children = containers.setdefault(prefix, [None] * count)
+                for row in rows:
+                    if children[row] is None:
+                        children[row] = parents[row].setdefault(prefix[-1], {})
+                if present is None:
+                    filled.add(prefix)
+            parents = containers[path[:-1]]
+            key = path[-1]
+            if present is None:
+                for parent, value in zip(parents, values, strict=True):
+                    parent[key] = value
+            else:
+                for row, value in zip(rows, values, strict=True):
+                    parents[row][key] = value
+        self.records = records
+        self.blobs = []
+        return records
+
+
+class ColumnarEntities(Sequence[dict[str, Any]]):
+    """Entity list of a binary snapshot, rebuilt one entity type at a time.
+
+    A type's records are only built once iteration (or indexing) reaches it.
+    """
+
+    def __init__(self, groups: list[_Group], order: list[list[int]]) -> None:
+        self._groups = groups
+        self._order = order
+        self._length = sum(run for _, run in order)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        cursors = [0] * len(self._groups)
+        for group_index, run in self._order:
+            start = cursors[group_index]
+            yield from self._groups[group_index].decode()[start : start + run]
+            cursors[group_index] = start + run
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        cursors = [0] * len(self._groups)
+        for group_index, run in self._order:
+            if index < run:
+                return self._groups[group_index].decode()[cursors[group_index] + index]
+            index -= run
+            cursors[group_index] += run
+        raise IndexError(index)
+
+
+def _parse_header(payload: bytes | memoryview) -> dict[str, Any]:
+    header = orjson.loads(payload)
+    if not isinstance(header, dict) or not isinstance(header.get("snapshot"), dict):
+        raise PersistenceError("Malformed binary snapshot header")
+    return header
+
+
+def decode_binary_snapshot(stream: BinaryIO) -> dict[str, Any]:
+    """Decode a binary snapshot; ``entities`` is a lazy ``ColumnarEntities``."""
+    records = _split_records(_read_body(stream))
+    try:
+        header = _parse_header(next(records))
+        groups = []
+        for spec in header["groups"]:
+            # bytes copies keep the snapshot picklable (process-mode restore)
+            groups.append(_Group(spec, [bytes(next(records)) for _ in range(_GROUP_BLOBS)]))
+    except StopIteration:
+        raise PersistenceError("Truncated binary snapshot") from None
+    snapshot = cast(dict[str, Any], header["snapshot"])
+    snapshot["entities"] = ColumnarEntities(groups, header["order"])
+    return snapshot
+
+
+def read_snapshot_file(path: str | Path) -> dict[str, Any] | None:
+    """Load a snapshot file of either format (None if it is not a JSON object)."""
+    if snapshot_format_for(path) == "binary":
+        with open(path, "rb") as f:
+            return decode_binary_snapshot(f)
+    with open(path) as f:
+        obj = json.load(f)
+    return cast(dict[str, Any], obj) if isinstance(obj, dict) else None
+
+
+def read_snapshot_metadata(path: str | Path) -> dict[str, Any]:
+    """``saved_at``/``frame``/``entity_count`` without decoding binary entities."""
+    if snapshot_format_for(path) == "binary":
+        with open(path, "rb") as f:
+            header = _parse_header(_read_record(_open_body(f)))
+        snapshot, entity_count = header["snapshot"], header["entity_count"]
+    else:
+        with open(path) as f:
+            snapshot = json.load(f)
+        entity_count = len(snapshot.get("entities", []))
+    return {
+        "saved_at": snapshot.get("saved_at"),
+        "frame": snapshot.get("frame"),
+        "entity_count": entity_count,
+    }
@@ -238,7 +238,16 @@ class StartupManager:
                             # Restore entities and state into the world
                             from backend.world_persistence import restore_world_from_snapshot
 
-                            success = restore_world_from_snapshot(snapshot, instance.runner.world)
+                            # Process-mode runners restore inside their worker
+                            restore_in_worker = getattr(
+                                instance.runner, "restore_from_snapshot", None
+                            )
+                            if restore_in_worker is not None:
+                                success = restore_in_worker(snapshot)
+                            else:
+                                success = restore_world_from_snapshot(
+                                    snapshot, instance.runner.world
+                                )
                             if success:
                                 logger.info(f"Restored world {world_id[:8]} from snapshot")
                             else:
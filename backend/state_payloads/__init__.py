@@ -8,6 +8,7 @@ frames); this package re-exports the full public surface so
 from __future__ import annotations
 
 from backend.state_payloads._common import orjson
+from backend.state_payloads.binary import decode_binary_state, encode_binary_state
 from backend.state_payloads.entities import EntitySnapshot
 from backend.state_payloads.frames import STATE_SCHEMA_VERSION, DeltaStatePayload, FullStatePayload
 from backend.state_payloads.metrics import (
@@ -47,4 +48,6 @@ __all__ = [
     "SoccerMatchEventPayload",
     "SoccerParticipantPayload",
     "StatsPayload",
+    "decode_binary_state",
+    "encode_binary_state",
 ]
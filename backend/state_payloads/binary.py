@@ -0,0 +1,213 @@
+"""Binary encoding of state frames for clients that negotiate it.
+
+JSON frames repeat every entity key and print every float as text, which is
+most of a large tank's frame. The binary encoding keeps the JSON payload for
+everything except the entity lists (``snapshot.entities`` on full frames,
+``snapshot.updates`` and ``snapshot.added`` on deltas), which become packed
+little-endian columns. Fields without a column go to a JSON side channel,
+per entity and only when present.
+
+Layout::
+
+    b"\\x00TKB"  u8 version  u32 header length  header (JSON)  column data
+
+The leading NUL can never start a JSON message, so a client can accept both
+encodings on one socket (command responses stay JSON). The header is the
+frame's JSON payload minus the encoded lists, plus ``binary_tables``: one
+entry per list giving its snapshot key, kind, record count, id dtype, type
+names (entity tables) and side-channel ``extras`` as ``[index, {...}]``.
+Column data follows in table order with no padding:
+
+- ``entity`` tables: id, type code (u1 index into the type names), x, y,
+  width, height (f4), vel_x, vel_y (f2), energy (f4, NaN when absent).
+- ``update`` tables: id, x, y (f4), vel_x, vel_y (f2). Effect fields absent
+  from the extras are ``null``, as in the JSON delta.
+
+Positions and sizes are quantized to float32 and velocities to float16.
+A list whose fixed fields are not all numbers stays in the JSON header.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from array import array
+from collections.abc import Sequence
+from operator import itemgetter
+from typing import Any
+
+import numpy as np
+import orjson
+
+# Value of the ``encoding`` websocket query parameter that selects this format
+BINARY_ENCODING = "binary"
+BINARY_MAGIC = b"\x00TKB"
+BINARY_VERSION = 1
+_PREAMBLE = struct.Struct("<4sBI")
+
+_ENTITY_COLUMNS = (("x", "<f4"), ("y", "<f4"), ("width", "<f4"), ("height", "<f4"))
+_ENTITY_VEL_COLUMNS = (("vel_x", "<f2"), ("vel_y", "<f2"))
+_ENTITY_FIXED = frozenset(("id", "type", "x", "y", "width", "height", "vel_x", "vel_y", "energy"))
+_UPDATE_COLUMNS = (("x", "<f4"), ("y", "<f4"), ("vel_x", "<f2"), ("vel_y", "<f2"))
+_UPDATE_FIXED = frozenset(("id", "x", "y", "vel_x", "vel_y"))
+# Always present in a JSON delta update, usually null
+_UPDATE_DEFAULTS = (
+    "poker_effect_state",
+    "birth_effect_timer",
+    "death_effect_state",
+    "soccer_effect_state",
+)
+
+_update_getter = itemgetter(*(key for key, _ in _UPDATE_COLUMNS), *_UPDATE_DEFAULTS)
+_UPDATE_GETTER_WIDTH = len(_UPDATE_COLUMNS) + len(_UPDATE_DEFAULTS)
+_NO_EFFECTS = (None,) * len(_UPDATE_DEFAULTS)
+
+# snapshot key -> table kind, per frame type
+_TABLES = {
+    "update": (("entities", "entity"),),
+    "delta": (("updates", "update"), ("added", "entity")),
+}
+
+_U4_MAX = 2**32
+
+
+def _id_column(records: list[dict[str, Any]]) -> tuple[str, bytes]:
+    ids = np.frombuffer(array("q", [record["id"] for record in records]), dtype=np.int64)
+    dtype = "<u4" if ids.size == 0 or (ids.min() >= 0 and ids.max() < _U4_MAX) else "<i8"
+    return dtype, ids.astype(dtype).tobytes()
+
+
+def _encode_entities(records: list[dict[str, Any]]) -> tuple[dict[str, Any], list[bytes]]:
+    id_dtype, ids = _id_column(records)
+    type_codes: dict[str, int] = {}
+    codes = [type_codes.setdefault(record["type"], len(type_codes)) for record in records]
+    if len(type_codes) > 255:
+        raise ValueError("too many entity types for a u1 type column")
+    columns = [ids, np.asarray(codes, dtype="<u1").tobytes()]
+    for key, dtype in _ENTITY_COLUMNS + _ENTITY_VEL_COLUMNS:
+        columns.append(_number_column([record[key] for record in records], dtype))
+    energy = [record.get("energy") for record in records]
+    columns.append(_number_column([math.nan if e is None else e for e in energy], "<f4"))
+
+    extras = []
+    for index, record in enumerate(records):
+        if len(record) > 9 or (len(record) > 8 and "energy" not in record):
+            extra = {k: v for k, v in record.items() if k not in _ENTITY_FIXED}
+            if extra:
+                extras.append([index, extra])
+    meta = {"id": id_dtype, "types": list(type_codes), "extras": extras}
+    return meta, columns
+
+
+def _encode_updates(records: list[dict[str, Any]]) -> tuple[dict[str, Any], list[bytes]]:
+    # One C-level pass (itemgetter + zip transpose) per table: this runs for
+    # every delta frame, so per-record Python work is kept off the hot path.
+    id_dtype, ids = _id_column(records)
+    columns = [ids]
+    values = list(zip(*map(_update_getter, records), strict=True)) or [()] * _UPDATE_GETTER_WIDTH
+    for (_, dtype), column in zip(_UPDATE_COLUMNS, values, strict=False):
+        columns.append(_number_column(column, dtype))
+
+    extras: list[list[Any]] = []
+    if set(map(len, records)) - {len(_UPDATE_FIXED) + len(_UPDATE_DEFAULTS)}:
+        # Some records carry keys beyond the standard delta fields
+        for index, record in enumerate(records):
+            extra = {
+                k: v
+                for k, v in record.items()
+                if k not in _UPDATE_FIXED and (v is not None or k not in _UPDATE_DEFAULTS)
+            }
+            if extra:
+                extras.append([index, extra])
+    elif any(set(effects) - {None} for effects in values[len(_UPDATE_COLUMNS) :]):
+        for index, row in enumerate(zip(*values[len(_UPDATE_COLUMNS) :], strict=True)):
+            if row != _NO_EFFECTS:
+                extra = {k: v for k, v in zip(_UPDATE_DEFAULTS, row, strict=True) if v is not None}
+                extras.append([index, extra])
+    return {"id": id_dtype, "extras": extras}, columns
+
+
+def _number_column(values: Sequence[Any], dtype: str) -> bytes:
+    # array() rejects None and strings, which numpy would silently coerce
+    return np.frombuffer(array("d", values)).astype(dtype).tobytes()
+
+
+def encode_binary_state(state: Any) -> bytes:
+    """Encode a state payload (anything with ``to_dict()``) as a binary frame."""
+    payload = state.to_dict()
+    snapshot = payload.get("snapshot")
+    tables: list[dict[str, Any]] = []
+    blobs: list[bytes] = []
+    if isinstance(snapshot, dict):
+        for key, kind in _TABLES.get(payload.get("type", ""), ()):
+            records = snapshot.get(key)
+            if not isinstance(records, list):
+                continue
+            try:
+                meta, columns = (
+                    _encode_entities(records) if kind == "entity" else _encode_updates(records)
+                )
+            except (KeyError, TypeError, ValueError, OverflowError):
+                continue  # Stays in the JSON header
+            del snapshot[key]
+            tables.append({"key": key, "kind": kind, "count": len(records), **meta})
+            blobs.extend(columns)
+    payload["binary_tables"] = tables
+    header = orjson.dumps(payload)
+    return b"".join([_PREAMBLE.pack(BINARY_MAGIC, BINARY_VERSION, len(header)), header, *blobs])
+
+
+def is_binary_frame(data: bytes) -> bool:
+    return data[: len(BINARY_MAGIC)] == BINARY_MAGIC
+
+
+def decode_binary_state(data: bytes) -> dict[str, Any]:
+    """Decode a binary frame back into the JSON payload shape (floats quantized)."""
+    magic, version, header_len = _PREAMBLE.unpack_from(data)
+    if magic != BINARY_MAGIC:
+        raise ValueError("not a binary state frame")
+    if version != BINARY_VERSION:
+        raise ValueError(f"unsupported binary state frame version {version}")
+    offset = _PREAMBLE.size
+    payload: dict[str, Any] = orjson.loads(data[offset : offset + header_len])
+    offset += header_len
+
+    def column(dtype: str, count: int) -> list[Any]:
+        nonlocal offset
+        values = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+        offset += values.nbytes
+        decoded: list[Any] = values.tolist()
+        return decoded
+
+    snapshot = payload["snapshot"]
+    for table in payload.pop("binary_tables"):
+        n = table["count"]
+        ids = column(table["id"], n)
+        if table["kind"] == "entity":
+            types = table["types"]
+            type_names = [types[code] for code in column("<u1", n)]
+            fixed = [column(dtype, n) for _, dtype in _ENTITY_COLUMNS + _ENTITY_VEL_COLUMNS]
+            energy = column("<f4", n)
+            records = []
+            for i in range(n):
+                record = {"id": ids[i], "type": type_names[i]}
+                for (key, _), values in zip(
+                    _ENTITY_COLUMNS + _ENTITY_VEL_COLUMNS, fixed, strict=True
+                ):
+                    record[key] = values[i]
+                if not math.isnan(energy[i]):
+                    record["energy"] = energy[i]
+                records.append(record)
+        else:
+            fixed = [column(dtype, n) for _, dtype in _UPDATE_COLUMNS]
+            records = []
+            for i in range(n):
+                record = {"id": ids[i]}
+                for (key, _), values in zip(_UPDATE_COLUMNS, fixed, strict=True):
+                    record[key] = values[i]
+                record.update(dict.fromkeys(_UPDATE_DEFAULTS))
+                records.append(record)
+        for index, extra in table["extras"]:
+            records[index].update(extra)
+        snapshot[table["key"]] = records
+    return payload
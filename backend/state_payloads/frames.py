@@ -101,6 +101,9 @@ class DeltaStatePayload:
     view_mode: str | None = "side"
     tank_soccer_enabled: bool | None = None  # Whether tank practice soccer (ball/goals) is enabled
     new_metrics_sample: MetricsSamplePayload | None = None
+    # Frame of the state this delta was diffed against. Server-side only (not
+    # serialized): the broadcaster uses it to tell which clients can apply it.
+    base_frame: int | None = None
 
     def to_dict(self) -> dict[str, Any]:
         # Build snapshot containing delta simulation state
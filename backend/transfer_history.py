@@ -2,10 +2,17 @@
 
 This module logs all entity transfers between tanks and provides
 query capabilities for the transfer history.
+
+Records logged from an event loop are buffered and appended to the log file
+by a worker thread shortly afterwards, one open per batch instead of one per
+record; call ``flush_transfer_log()`` to write them out immediately. Records
+logged with no running loop are written synchronously.
 """
 
+import asyncio
 import json
 import logging
+import threading
 from collections import deque
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
@@ -22,6 +29,14 @@ _transfer_history: deque["TransferRecord"] = deque(maxlen=100)  # Keep last 100
 _migration_in_counts: dict[str, int] = {}
 _migration_out_counts: dict[str, int] = {}
 
+# Buffered log writer state
+LOG_FLUSH_DELAY = 0.5  # Seconds a record may wait in the buffer
+_pending_lines: list[str] = []
+_pending_lock = threading.Lock()
+_write_lock = threading.Lock()  # Keeps batches in log order
+_flush_loop: asyncio.AbstractEventLoop | None = None  # Loop with a flush scheduled
+_flush_tasks: set[asyncio.Task] = set()
+
 
 @dataclass
 class TransferRecord:
@@ -113,21 +128,61 @@ def log_transfer(
 
 
 def _append_to_log(record: TransferRecord) -> None:
-    """Append a transfer record to the persistent log file.
+    """Queue a transfer record for the persistent log file.
 
     Args:
         record: The transfer record to append
     """
+    global _flush_loop
+
+    with _pending_lock:
+        _pending_lines.append(json.dumps(asdict(record)))
+
     try:
-        # Ensure log directory exists
-        HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        flush_transfer_log()
+        return
 
-        # Append as JSON line
-        with open(HISTORY_FILE, "a") as f:
-            f.write(json.dumps(asdict(record)) + "\n")
+    if _flush_loop is not loop:
+        _flush_loop = loop
+        loop.call_later(LOG_FLUSH_DELAY, _start_background_flush)
 
-    except Exception as e:
-        logger.error(f"Failed to write transfer log: {e}")
+
+def _start_background_flush() -> None:
+    global _flush_loop
+
+    _flush_loop = None
+    task = asyncio.get_running_loop().create_task(asyncio.to_thread(flush_transfer_log))
+    _flush_tasks.add(task)
+    task.add_done_callback(_flush_tasks.discard)
+
+
+def flush_transfer_log() -> int:
+    """Append every buffered record to the log file.
+
+    Returns:
+        Number of records written
+    """
+    with _write_lock:
+        with _pending_lock:
+            lines = _pending_lines[:]
+            _pending_lines.clear()
+        if not lines:
+            return 0
+
+        try:
+            # Ensure log directory exists
+            HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+            # Append as JSON lines
+            with open(HISTORY_FILE, "a") as f:
+                f.write("\n".join(lines) + "\n")
+
+        except Exception as e:
+            logger.error(f"Failed to write transfer log: {e}")
+
+        return len(lines)
 
 
 def get_transfer_history(
@@ -255,8 +310,11 @@ def clear_history() -> None:
     WARNING: This is destructive and cannot be undone.
     """
     _transfer_history.clear()
-    if HISTORY_FILE.exists():
-        HISTORY_FILE.unlink()
+    with _write_lock:
+        with _pending_lock:
+            _pending_lines.clear()
+        if HISTORY_FILE.exists():
+            HISTORY_FILE.unlink()
     logger.warning("Transfer history cleared")
 
 
@@ -12,6 +12,7 @@ from __future__ import annotations
 import asyncio
 import inspect
 import logging
+import os
 import uuid
 from collections.abc import Awaitable, Callable, Coroutine
 from dataclasses import dataclass, field
@@ -20,6 +21,7 @@ from typing import TYPE_CHECKING, Any
 
 from fastapi import WebSocket
 
+from backend.runner.process_runner import ProcessSimulationRunner
 from backend.runner.runner_protocol import RunnerProtocol
 from backend.simulation_runner import SimulationRunner
 from backend.world_registry import create_world, get_all_world_metadata, get_world_metadata
@@ -42,7 +44,8 @@ class WorldInstance:
     """Represents an active world instance.
 
     This is the unified container for all world types. The runner field
-    is always a SimulationRunner for tank worlds or WorldRunner for others.
+    is a SimulationRunner (or, in process mode, a ProcessSimulationRunner)
+    for tank worlds and a WorldRunner for others.
     """
 
     world_id: str
@@ -113,8 +116,22 @@ class WorldManager:
         _default_world_id: ID of the default world
     """
 
-    def __init__(self) -> None:
-        """Initialize the world manager."""
+    def __init__(self, process_worlds: bool | None = None) -> None:
+        """Initialize the world manager.
+
+        Args:
+            process_worlds: Run each tank/petri world in its own worker process
+                (see ``backend.runner.process_runner``). Defaults to the
+                ``TANK_WORLD_PROCESSES`` environment variable.
+        """
+        if process_worlds is None:
+            process_worlds = os.getenv("TANK_WORLD_PROCESSES", "0").strip().lower() in (
+                "1",
+                "true",
+                "yes",
+                "on",
+            )
+        self.process_worlds = process_worlds
         self._worlds: dict[str, WorldInstance] = {}
         self._default_world_id: str | None = None
         self._start_broadcast_callback: BroadcastCallback | None = None
@@ -306,15 +323,27 @@ class WorldManager:
         """Create a tank/petri world using SimulationRunner directly.
 
         SimulationRunner handles both tank and petri worlds via switch_world_type().
+        In process mode the runner lives in a worker process behind a
+        ProcessSimulationRunner proxy.
         """
-        # Create SimulationRunner directly (no SimulationManager intermediary)
-        runner = SimulationRunner(
-            seed=seed,
-            world_id=world_id,
-            world_name=name,
-            world_type=world_type,
-            config=config,
-        )
+        runner: SimulationRunner | ProcessSimulationRunner
+        if self.process_worlds:
+            runner = ProcessSimulationRunner(
+                seed=seed,
+                world_id=world_id,
+                world_name=name,
+                world_type=world_type,
+                config=config,
+            )
+        else:
+            # Create SimulationRunner directly (no SimulationManager intermediary)
+            runner = SimulationRunner(
+                seed=seed,
+                world_id=world_id,
+                world_name=name,
+                world_type=world_type,
+                config=config,
+            )
         runner.world_manager = self
         runner.connection_manager = self.connection_manager
         # Re-inject world_manager into environment now that it's set
@@ -9,14 +9,20 @@ Schema Versioning:
                    No legacy compatibility - old saves will not load
 """
 
-import json
 import logging
+import os
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 from backend.lineage_restore import advance_fish_id_counter, restore_lineage_state
+from backend.snapshot_codec import (
+    SNAPSHOT_SUFFIXES,
+    read_snapshot_file,
+    read_snapshot_metadata,
+    write_snapshot_file,
+)
 from core.contracts import SNAPSHOT_VERSION, validate_snapshot_version
 from core.exceptions import PersistenceError
 
@@ -29,6 +35,11 @@ logger = logging.getLogger(__name__)
 # Base directory for all world data
 DATA_DIR = Path("data/worlds")
 
+# On-disk snapshot format ("json" or "binary") and binary compression; see
+# backend.snapshot_codec
+SNAPSHOT_FORMAT = os.getenv("TANK_SNAPSHOT_FORMAT", "json")
+SNAPSHOT_COMPRESSION = os.getenv("TANK_SNAPSHOT_COMPRESSION", "gzip")
+
 
 def _bootstrap_transient_elements(engine: Any) -> None:
     """Re-create transient elements (Soccer Ball/Goals) after world restoration.
@@ -149,12 +160,15 @@ def ensure_world_directory(world_id: str) -> Path:
     return world_dir
 
 
-def save_snapshot_data(world_id: str, snapshot: dict[str, Any]) -> str | None:
+def save_snapshot_data(
+    world_id: str, snapshot: dict[str, Any], snapshot_format: str | None = None
+) -> str | None:
     """Save pre-captured snapshot data to disk.
 
     Args:
         world_id: The world identifier
         snapshot: The complete snapshot dictionary
+        snapshot_format: "json" or "binary" (defaults to SNAPSHOT_FORMAT)
 
     Returns:
         Filepath of saved snapshot, or None if save failed
@@ -174,12 +188,10 @@ def save_snapshot_data(world_id: str, snapshot: dict[str, Any]) -> str | None:
             timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
             snapshot["saved_at"] = datetime.now(timezone.utc).isoformat()
 
+        snapshot_format = snapshot_format or SNAPSHOT_FORMAT
         world_dir = ensure_world_directory(world_id)
-        snapshot_file = world_dir / f"snapshot_{timestamp}.json"
-
-        # Write to file
-        with open(snapshot_file, "w") as f:
-            json.dump(snapshot, f, indent=2)
+        snapshot_file = world_dir / f"snapshot_{timestamp}{SNAPSHOT_SUFFIXES[snapshot_format]}"
+        write_snapshot_file(snapshot_file, snapshot, snapshot_format, SNAPSHOT_COMPRESSION)
 
         logger.info(
             f"Saved world {world_id[:8]} state to {snapshot_file.name} "
@@ -239,20 +251,17 @@ def save_world_state(
 
 
 def load_snapshot(snapshot_path: str) -> dict[str, Any] | None:
-    """Load a snapshot from disk.
+    """Load a snapshot (JSON or binary, detected from the file) from disk.
 
     Args:
         snapshot_path: Path to the snapshot file
 
     Returns:
-        Snapshot dictionary, or None if load failed
+        Snapshot dictionary, or None if load failed. Binary snapshots return
+        their entities as a lazily decoded sequence.
     """
     try:
-        with open(snapshot_path) as f:
-            obj = json.load(f)
-            if not isinstance(obj, dict):
-                return None
-            return cast(dict[str, Any], obj)
+        return read_snapshot_file(snapshot_path)
     except Exception as e:
         logger.error(f"Failed to load snapshot {snapshot_path}: {e}", exc_info=True)
         return None
@@ -566,21 +575,22 @@ def list_world_snapshots(world_id: str) -> list[dict[str, Any]]:
         return []
 
     snapshots = []
-    for snapshot_file in sorted(world_dir.glob("snapshot_*.json"), reverse=True):
+    snapshot_files = [
+        path
+        for suffix in SNAPSHOT_SUFFIXES.values()
+        for path in world_dir.glob(f"snapshot_*{suffix}")
+    ]
+    for snapshot_file in sorted(snapshot_files, key=lambda path: path.name, reverse=True):
         try:
-            # Read just the metadata without loading full state
-            with open(snapshot_file) as f:
-                data = json.load(f)
-                snapshots.append(
-                    {
-                        "filename": snapshot_file.name,
-                        "filepath": str(snapshot_file),
-                        "saved_at": data.get("saved_at"),
-                        "frame": data.get("frame"),
-                        "entity_count": len(data.get("entities", [])),
-                        "size_bytes": snapshot_file.stat().st_size,
-                    }
-                )
+            # Read just the metadata (binary snapshots skip entity decoding)
+            snapshots.append(
+                {
+                    "filename": snapshot_file.name,
+                    "filepath": str(snapshot_file),
+                    **read_snapshot_metadata(snapshot_file),
+                    "size_bytes": snapshot_file.stat().st_size,
+                }
+            )
         except Exception as e:
             logger.warning(f"Failed to read snapshot {snapshot_file.name}: {e}")
             continue
@@ -15,13 +15,21 @@ with no UI dependencies. Key modules include:
 Design note: this module exposes a small, explicit public API via ``__all__``.
 Use direct imports from subpackages for internal helpers to avoid coupling to
 the package internals.
+
+Note: the public subpackages are loaded lazily by the module-level
+``__getattr__`` (PEP 562), so ``import core.worlds`` or ``import core.config``
+does not pay for the simulation engine, poker and soccer stacks.
 """
 
-from . import algorithms as algorithms
-from . import entities as entities
-from . import genetics as genetics
-from . import interfaces as interfaces
-from . import simulation as simulation
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import algorithms as algorithms
+    from . import entities as entities
+    from . import genetics as genetics
+    from . import interfaces as interfaces
+    from . import simulation as simulation
 
 # Public API of the core package. Keep this list intentionally small.
 __all__ = [
@@ -31,3 +39,11 @@ __all__ = [
     "interfaces",
     "simulation",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import public subpackages on first attribute access."""
+    if name in __all__:
+        # import_module binds the submodule as a package attribute
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,6 +13,7 @@ from core.behavior.primitives.steering import (
 from core.entities import Crab
 from core.entities import Fish as FishClass
 from core.math_utils import Vector2
+from core.movement.perception import perceive
 
 from .definitions import FoodApproach, PokerEngagement, SocialMode, ThreatResponse
 from .food_selection import predict_food_target, select_food_target
@@ -33,7 +34,6 @@ class BehaviorActionsMixin:
     - _circle_angle: float
     - _zigzag_phase: float
     - _patrol_angle: float
-    - _nearest_crab_200_age: int | None, _nearest_crab_200: Any (perception memo)
     - BehaviorHelpersMixin methods (_find_nearest, _safe_normalize, etc.)
     """
 
@@ -46,8 +46,6 @@ class BehaviorActionsMixin:
     _circle_angle: float
     _zigzag_phase: float
     _patrol_angle: float
-    _nearest_crab_200_age: int | None
-    _nearest_crab_200: Any
 
     # Required helpers (provided by BehaviorHelpersMixin)
     def _find_nearest(
@@ -62,25 +60,16 @@ class BehaviorActionsMixin:
         raise NotImplementedError
 
     def _nearest_crab_within_200(self, fish: "Fish") -> Any | None:
-        """Memoized nearest-Crab-within-200 lookup for one fish's decision pass.
+        """Nearest Crab within 200px, read from the fish's perception record.
 
         has_threat_priority (called from both the ball_pursuit and code_policy
-        movement considerations) and _execute_threat_response (called from the
-        composable-behavior consideration) all run this identical query for
-        the same fish on the same frame; caching here collapses up to three
-        identical spatial-grid queries into one. Keyed on fish.age, which
-        increments exactly once per fish per frame before movement/behavior
-        runs (see Fish.update), so a stale value can never leak into the next
-        frame. Non-Fish callers (e.g. the foraging gym's lightweight fish
-        stand-in, which has no notion of frame age) simply get no caching,
-        matching their prior behavior.
+        movement considerations) and _execute_threat_response all ask this for
+        the same fish in one decision pass; the record (core/movement/perception.py) collapses them
+        into a single spatial-grid query.
         """
-        if not isinstance(fish, FishClass):
-            return self._find_nearest(fish, Crab, max_distance=200.0)
-        if fish.age != self._nearest_crab_200_age:
-            self._nearest_crab_200 = self._find_nearest(fish, Crab, max_distance=200.0)
-            self._nearest_crab_200_age = fish.age
-        return self._nearest_crab_200
+        return perceive(
+            fish, "nearest_threat", lambda: self._find_nearest(fish, Crab, max_distance=200.0)
+        )
 
     def has_threat_priority(self, fish: "Fish") -> bool:
         predator = self._nearest_crab_within_200(fish)
@@ -94,7 +83,8 @@ class BehaviorActionsMixin:
     def has_food_priority(self, fish: "Fish") -> bool:
         if hasattr(fish, "can_eat") and not fish.can_eat():
             return False
-        return self._find_nearest_food(fish) is not None
+        nearest = perceive(fish, "nearest_food", lambda: self._find_nearest_food(fish))
+        return nearest is not None
 
     def has_survival_priority(self, fish: "Fish") -> bool:
         """Whether the fish has an active survival drive (threat or food).
@@ -450,7 +440,11 @@ class BehaviorActionsMixin:
         return dx * speed, dy * speed
 
     def _find_nearby_fish(self, fish: "Fish", radius: float) -> list["Fish"]:
-        """Find nearby fish within radius."""
+        """Find nearby fish within radius (memoized per decision pass)."""
+        key = ("nearby_fish", radius)
+        return perceive(fish, key, lambda: self._query_nearby_fish(fish, radius))
+
+    def _query_nearby_fish(self, fish: "Fish", radius: float) -> list["Fish"]:
         env = fish.environment
         fish_id = fish.fish_id
 
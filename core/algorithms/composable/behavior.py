@@ -54,12 +54,6 @@ class ComposableBehavior(BehaviorHelpersMixin, BehaviorActionsMixin):
     # invalidates this cache itself - see mutate()'s last line.
     _behavior_id_cache: str | None = field(default=None, repr=False, compare=False)
 
-    # Memoized nearest-Crab-within-200 lookup for one fish's decision pass
-    # (see _nearest_crab_within_200 in BehaviorActionsMixin). None never
-    # matches a real fish.age, so it reads as "not yet computed this frame".
-    _nearest_crab_200_age: int | None = field(default=None, repr=False, compare=False)
-    _nearest_crab_200: Any = field(default=None, repr=False, compare=False)
-
     @staticmethod
     def _format_behavior_id(
         threat_response: ThreatResponse,
@@ -23,6 +23,7 @@ from core.config.food import (
 )
 from core.entities import Food
 from core.math_utils import Vector2
+from core.movement.perception import perceive
 from core.predictive_movement import predict_falling_intercept
 
 if TYPE_CHECKING:
@@ -121,8 +122,14 @@ def score_food_candidates(fish: Fish) -> list[FoodCandidateScore]:
     See ``select_food_target`` for the desirability formula this applies.
     Returns every in-range candidate (not just the best) in iteration order;
     ``select_food_target`` is a thin wrapper that picks the max from this list,
-    so the two can never disagree on what "value" means.
+    so the two can never disagree on what "value" means. Within a decision
+    pass the list is shared through the fish's perception record; treat it
+    as read-only.
     """
+    return perceive(fish, "food_candidates", lambda: _score_food_candidates(fish))
+
+
+def _score_food_candidates(fish: Fish) -> list[FoodCandidateScore]:
     env = fish.environment
 
     detection_modifier = getattr(env, "get_detection_modifier", lambda: 1.0)()
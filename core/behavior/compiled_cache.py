@@ -9,14 +9,24 @@ from typing import TypeVar, cast
 from core.behavior.nodes import NodeRegistry
 
 _COMPILED_GRAPH_CACHE_MAXSIZE = 256
-_COMPILED_GRAPH_CACHE: OrderedDict[tuple[NodeRegistry, str], object] = OrderedDict()
+_COMPILED_GRAPH_CACHE: OrderedDict[tuple[NodeRegistry, str, str], object] = OrderedDict()
 
 T = TypeVar("T")
 
 
-def get_compiled_plan(registry: NodeRegistry, fingerprint: str, compiler: Callable[[], T]) -> T:
-    """Return a registry-specific LRU entry, compiling only when absent."""
-    key = (registry, fingerprint)
+def get_compiled_plan(
+    registry: NodeRegistry,
+    fingerprint: str,
+    compiler: Callable[[], T],
+    *,
+    tier: str = "generated",
+) -> T:
+    """Return a registry- and tier-specific LRU entry, compiling only when absent.
+
+    ``tier`` names the execution strategy (``"generated"`` source or the
+    ``"checked"`` interpreter) so both plans of one graph can coexist.
+    """
+    key = (registry, fingerprint, tier)
     compiled = _COMPILED_GRAPH_CACHE.pop(key, None)
     if compiled is not None:
         _COMPILED_GRAPH_CACHE[key] = compiled
@@ -7,7 +7,7 @@ NodeTrace support is added here.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from typing import Protocol, cast, runtime_checkable
 
@@ -80,6 +80,17 @@ class CompiledBehaviorGraph:
             values.append(step.run(context, values))
         return values[self.output_index]
 
+    def evaluate_batch(self, columns: Mapping[str, Sequence[object]]) -> list[NodeValue]:
+        """Evaluate once per row of equal-length context columns.
+
+        Row ``i``'s context maps every column name to ``columns[name][i]``.
+        """
+        names = tuple(columns)
+        return [
+            self.evaluate(dict(zip(names, row, strict=True)))
+            for row in zip(*columns.values(), strict=True)
+        ]
+
     def evaluate_with_trace(
         self, context: object
     ) -> tuple[NodeValue, tuple[tuple[str, NodeValue], ...]]:
@@ -0,0 +1,365 @@
+"""Per-node source templates of the generated behavior graph tier.
+
+``generated_graph.py`` walks a compiled plan and, for every step, looks up
+the step's node type in ``_EMITTERS``. An emitter writes that node's math into
+a ``_SourceBuilder``, with its parameters bound as named globals, and returns
+True, or returns False to have the node called through its evaluator instead
+(``_emit_call``). The builder tracks each local's kind and whether it is
+already known to be finite, so input checks are only emitted where the
+interpreter could still fail.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from typing import cast
+
+from core.behavior.compiled_graph import CompiledStep
+from core.behavior.nodes import SensorNode
+from core.behavior.pursuit_nodes import _InterceptTargetSteering
+from core.behavior.standard_nodes import (
+    _ContextBoolSensor,
+    _ContextScalarSensor,
+    _ContextVectorSensor,
+    _InvertVectorSteering,
+    _NormalizeVectorSteering,
+    _parameter_float,
+    _PriorityVectorSelector,
+    _ScaleVectorSteering,
+    _ThresholdVectorSelector,
+    _WeightedVectorBlend,
+    _WeightedVectorSteering,
+)
+
+_HELPERS: dict[str, object] = {
+    "_hypot": math.hypot,
+    "_isfinite": math.isfinite,
+    "_sqrt": math.sqrt,
+}
+
+# Value kinds tracked per plan index. "opaque" values come from nodes called
+# through their evaluator, so nothing is known about their runtime type.
+_VECTOR, _SCALAR, _BOOL, _OPAQUE = "vector", "scalar", "bool", "opaque"
+
+
+class _SourceBuilder:
+    """Accumulates generated lines plus what is known about each local."""
+
+    def __init__(self, *, batch: bool = False) -> None:
+        self.batch = batch
+        # Batch mode: sensor index -> context column it reads.
+        self.columns: dict[int, str] = {}
+        self.batchable = True
+        self.lines: list[str] = []
+        self.namespace: dict[str, object] = dict(_HELPERS)
+        # Plan-specific globals (parameters, sensor methods), in binding order.
+        self.bound: dict[str, object] = {}
+        self.kinds: dict[int, str] = {}
+        self.finite: set[int] = set()
+        self._components: set[int] = set()
+        self._tuples: set[int] = set()
+
+    def emit(self, line: str, depth: int = 1) -> None:
+        # Batch bodies sit two levels deeper, inside the segment and row loops.
+        self.lines.append("    " * (depth + 2 * self.batch) + line)
+
+    def bind(self, name: str, value: object) -> str:
+        """Bind a plan-specific value by name so the source stays value-free."""
+        self.namespace[name] = value
+        self.bound[name] = value
+        return name
+
+    def constant(self, index: int, name: str, value: float) -> str:
+        return self.bind(f"k{index}_{name}", value)
+
+    def define(self, index: int, kind: str, *, finite: bool, as_tuple: bool) -> None:
+        self.kinds[index] = kind
+        if finite:
+            self.finite.add(index)
+        (self._tuples if as_tuple else self._components).add(index)
+
+    def components(self, index: int) -> tuple[str, str]:
+        """Names of a vector's ``x``/``y`` locals, unpacking its tuple once."""
+        if index not in self._components:
+            self.emit(f"x{index}, y{index} = v{index}")
+            self._components.add(index)
+        return f"x{index}", f"y{index}"
+
+    def value(self, index: int) -> str:
+        """Name of the local holding the value exactly as the interpreter would."""
+        if self.kinds[index] == _VECTOR and index not in self._tuples:
+            self.emit(f"v{index} = (x{index}, y{index})")
+            self._tuples.add(index)
+        return f"v{index}"
+
+    def require_vector(self, index: int, message: str, depth: int = 1) -> None:
+        if index in self.finite:
+            return
+        x, y = f"x{index}", f"y{index}"
+        self.emit(f"if not (_isfinite({x}) and _isfinite({y})):", depth)
+        self.emit(f"raise TypeError({message!r})", depth + 1)
+        if depth == 1:
+            # Every later top-level line runs only after this check passed.
+            self.finite.add(index)
+
+    def require_scalar(self, index: int, message: str) -> None:
+        if index not in self.finite:
+            self.emit(f"if not _isfinite(v{index}):")
+            self.emit(f"raise TypeError({message!r})", 2)
+            self.finite.add(index)
+
+    def normalized(self, index: int, x: str, y: str) -> None:
+        """Inline ``normalized_components(x, y)`` into ``x<index>``/``y<index>``."""
+        self.emit(f"l{index} = {x} * {x} + {y} * {y}")
+        self.emit(f"if l{index} > 0:")
+        self.emit(f"s{index} = _sqrt(l{index})", 2)
+        self.emit(f"x{index} = {x} / s{index}", 2)
+        self.emit(f"y{index} = {y} / s{index}", 2)
+        self.emit("else:")
+        self.emit(f"x{index} = y{index} = 0.0", 2)
+
+
+_Emitter = Callable[[_SourceBuilder, int, CompiledStep, dict[str, int]], bool]
+
+
+def _vector_message(step: CompiledStep, port: str) -> str:
+    return f"{step.node.node_type} requires a finite two-component vector '{port}'"
+
+
+# Conditions under which a context sensor's ``sense`` would return the raw
+# field value unchanged; ``v - v == 0.0`` is the finite test (inf and NaN give
+# NaN). Anything else falls back to ``sense``, which converts or raises.
+_PLAIN_SENSOR_VALUE = {
+    _VECTOR: (
+        "type({v}) is tuple and len({v}) == 2 and type({v}[0]) is float"
+        " and type({v}[1]) is float and {v}[0] - {v}[0] == 0.0 and {v}[1] - {v}[1] == 0.0"
+    ),
+    _SCALAR: "type({v}) is float and {v} - {v} == 0.0",
+    _BOOL: "type({v}) is bool",
+}
+
+
+def _sensor_emitter(kind: str) -> _Emitter:
+    def emit(builder: _SourceBuilder, index: int, step: CompiledStep, _: dict[str, int]) -> bool:
+        builder.bind(f"_sense{index}", cast(SensorNode, step.node).sense)
+        field_name = step.node.to_parameters().get("field")
+        if not isinstance(field_name, str):
+            if builder.batch:
+                return False
+            builder.emit(f"v{index} = _sense{index}(context)")
+        else:
+            if builder.batch:
+                # The row loop binds v<index>; a one-field context is all sense() reads.
+                builder.columns[index] = field_name
+                fallback = f"{{{field_name!r}: v{index}}}"
+            else:
+                builder.emit(f"v{index} = context.get({field_name!r}) if plain_context else None")
+                fallback = "context"
+            plain = _PLAIN_SENSOR_VALUE[kind].format(v=f"v{index}")
+            builder.emit(f"if not ({plain}):")
+            builder.emit(f"v{index} = _sense{index}({fallback})", 2)
+        builder.define(index, kind, finite=True, as_tuple=True)
+        return True
+
+    return emit
+
+
+def _emit_normalize(
+    builder: _SourceBuilder, index: int, step: CompiledStep, inputs: dict[str, int]
+) -> bool:
+    source = inputs["vector"]
+    builder.normalized(index, *builder.components(source))
+    builder.define(index, _VECTOR, finite=source in builder.finite, as_tuple=False)
+    return True
+
+
+def _emit_invert(
+    builder: _SourceBuilder, index: int, step: CompiledStep, inputs: dict[str, int]
+) -> bool:
+    source = inputs["vector"]
+    x, y = builder.components(source)
+    builder.require_vector(source, _vector_message(step, "vector"))
+    builder.emit(f"x{index} = -{x}")
+    builder.emit(f"y{index} = -{y}")
+    builder.define(index, _VECTOR, finite=True, as_tuple=False)
+    return True
+
+
+def _emit_scale(
+    builder: _SourceBuilder, index: int, step: CompiledStep, inputs: dict[str, int]
+) -> bool:
+    try:
+        scale = _parameter_float(step.node.to_parameters(), "scale", 1.0)
+    except ValueError:
+        return False
+    source = inputs["vector"]
+    x, y = builder.components(source)
+    builder.require_vector(source, _vector_message(step, "vector"))
+    constant = builder.constant(index, "scale", scale)
+    builder.emit(f"x{index} = {x} * {constant}")
+    builder.emit(f"y{index} = {y} * {constant}")
+    # The input is finite once checked; only a magnifying scale can overflow it.
+    builder.define(index, _VECTOR, finite=abs(scale) <= 1.0, as_tuple=False)
+    return True
+
+
+def _weighted_terms(
+    builder: _SourceBuilder, index: int, step: CompiledStep, inputs: dict[str, int]
+) -> tuple[str, str] | None:
+    parameters = step.node.to_parameters()
+    try:
+        first_weight = _parameter_float(parameters, "first_weight", 1.0)
+        second_weight = _parameter_float(parameters, "second_weight", 1.0)
+    except ValueError:
+        return None
+    first_weight_name = builder.constant(index, "first_weight", first_weight)
+    second_weight_name = builder.constant(index, "second_weight", second_weight)
+    first, second = inputs["first"], inputs["second"]
+    first_x, first_y = builder.components(first)
+    second_x, second_y = builder.components(second)
+    builder.require_vector(first, _vector_message(step, "first"))
+    builder.require_vector(second, _vector_message(step, "second"))
+    return (
+        f"{first_x} * {first_weight_name} + {second_x} * {second_weight_name}",
+        f"{first_y} * {first_weight_name} + {second_y} * {second_weight_name}",
+    )
+
+
+def _emit_weighted(
+    builder: _SourceBuilder, index: int, step: CompiledStep, inputs: dict[str, int]
+) -> bool:
+    terms = _weighted_terms(builder, index, step, inputs)
+    if terms is None:
+        return False
+    builder.emit(f"a{index} = {terms[0]}")
+    builder.emit(f"b{index} = {terms[1]}")
+    builder.normalized(index, f"a{index}", f"b{index}")
+    builder.define(index, _VECTOR, finite=False, as_tuple=False)
+    return True
+
+
+def _emit_blend(
+    builder: _SourceBuilder, index: int, step: CompiledStep, inputs: dict[str, int]
+) -> bool:
+    terms = _weighted_terms(builder, index, step, inputs)
+    if terms is None:
+        return False
+    builder.emit(f"x{index} = {terms[0]}")
+    builder.emit(f"y{index} = {terms[1]}")
+    builder.define(index, _VECTOR, finite=False, as_tuple=False)
+    return True
+
+
+def _emit_choice(
+    builder: _SourceBuilder,
+    index: int,
+    step: CompiledStep,
+    condition: str,
+    chosen: tuple[str, int],
+    other: tuple[str, int],
+) -> None:
+    """Select one of two vectors, checking only the branch that is taken."""
+    for keyword, (port, source) in (("if", chosen), ("else", other)):
+        builder.emit(f"if {condition}:" if keyword == "if" else "else:")
+        builder.require_vector(source, _vector_message(step, port), depth=2)
+        builder.emit(f"x{index}, y{index} = x{source}, y{source}", 2)
+    builder.define(index, _VECTOR, finite=True, as_tuple=False)
+
+
+def _emit_threshold(
+    builder: _SourceBuilder, index: int, step: CompiledStep, inputs: dict[str, int]
+) -> bool:
+    try:
+        threshold = _parameter_float(step.node.to_parameters(), "threshold", 0.0)
+    except ValueError:
+        return False
+    value = inputs["value"]
+    builder.components(inputs["when_true"])
+    builder.components(inputs["when_false"])
+    builder.require_scalar(value, "threshold_vector_selector requires a finite scalar 'value'")
+    _emit_choice(
+        builder,
+        index,
+        step,
+        f"v{value} >= {builder.constant(index, 'threshold', threshold)}",
+        ("when_true", inputs["when_true"]),
+        ("when_false", inputs["when_false"]),
+    )
+    return True
+
+
+def _emit_priority(
+    builder: _SourceBuilder, index: int, step: CompiledStep, inputs: dict[str, int]
+) -> bool:
+    primary, fallback = inputs["primary"], inputs["fallback"]
+    x, y = builder.components(primary)
+    builder.components(fallback)
+    builder.require_vector(primary, _vector_message(step, "primary"))
+    _emit_choice(
+        builder,
+        index,
+        step,
+        f"{x} != 0.0 or {y} != 0.0",
+        ("primary", primary),
+        ("fallback", fallback),
+    )
+    return True
+
+
+def _emit_intercept(
+    builder: _SourceBuilder, index: int, step: CompiledStep, inputs: dict[str, int]
+) -> bool:
+    parameters = step.node.to_parameters()
+    try:
+        multiplier = float(parameters.get("speed_multiplier", 1.0))
+        strength = float(parameters.get("prediction_strength", 1.0))
+        horizon = float(parameters.get("max_prediction_horizon", 100.0))
+    except (TypeError, ValueError):
+        return False
+    ports = ("target_vector", "target_velocity", "self_velocity")
+    (tx, ty), (vx, vy), (sx, sy) = (builder.components(inputs[port]) for port in ports)
+    for port in ports:
+        builder.require_vector(
+            inputs[port], "intercept_target requires finite two-component vectors"
+        )
+    speed = inputs["self_speed"]
+    builder.require_scalar(speed, "intercept_target requires a finite scalar self_speed")
+    multiplier_name = builder.constant(index, "speed_multiplier", multiplier)
+    strength_name = builder.constant(index, "prediction_strength", strength)
+    horizon_name = builder.constant(index, "max_prediction_horizon", horizon)
+    builder.emit(f"s{index} = v{speed} * {multiplier_name}")
+    builder.emit(f"if s{index} > 0.0:")
+    builder.emit(f"t{index} = _hypot({tx}, {ty}) / s{index}", 2)
+    builder.emit(f"if t{index} > {horizon_name}:", 2)
+    builder.emit(f"t{index} = {horizon_name}", 3)
+    builder.emit(f"x{index} = {tx} + ({vx} - {sx}) * t{index} * {strength_name}", 2)
+    builder.emit(f"y{index} = {ty} + ({vy} - {sy}) * t{index} * {strength_name}", 2)
+    builder.emit("else:")
+    builder.emit(f"x{index} = y{index} = 0.0", 2)
+    builder.define(index, _VECTOR, finite=False, as_tuple=False)
+    return True
+
+
+_EMITTERS: dict[type, _Emitter] = {
+    _ContextVectorSensor: _sensor_emitter(_VECTOR),
+    _ContextScalarSensor: _sensor_emitter(_SCALAR),
+    _ContextBoolSensor: _sensor_emitter(_BOOL),
+    _NormalizeVectorSteering: _emit_normalize,
+    _InvertVectorSteering: _emit_invert,
+    _ScaleVectorSteering: _emit_scale,
+    _WeightedVectorSteering: _emit_weighted,
+    _WeightedVectorBlend: _emit_blend,
+    _ThresholdVectorSelector: _emit_threshold,
+    _PriorityVectorSelector: _emit_priority,
+    _InterceptTargetSteering: _emit_intercept,
+}
+
+
+def _emit_call(builder: _SourceBuilder, index: int, step: CompiledStep) -> None:
+    # Evaluators take the whole context, which a batch row loop does not build.
+    builder.batchable = not builder.batch
+    builder.bind(f"_evaluate{index}", step.evaluate)
+    arguments = ", ".join(f"{port!r}: {builder.value(source)}" for port, source in step.inputs)
+    builder.emit(f"v{index} = _evaluate{index}(context, {{{arguments}}})")
+    builder.define(index, _OPAQUE, finite=False, as_tuple=True)
@@ -0,0 +1,184 @@
+"""Source-generated execution tier for compiled behavior graphs.
+
+The interpreter in ``compiled_graph.py`` builds a ``{port: value}`` dict and
+calls a bound lambda for every node on every evaluation. :func:`generate_plan`
+turns an already-compiled plan into one straight-line Python function per
+graph: values live in locals, the standard steering and selector math is
+inlined with its parameters folded in as constants, and input checks that the
+graph's typed edges already prove (port types, finite sensor outputs) are
+dropped. Checks the interpreter can still fail at run time - an overflowing
+``scale_vector`` feeding a node that requires finite input - are kept, in
+interpreter order and with the interpreter's messages, so generated and
+interpreted plans return identical values and raise identical errors.
+
+Context sensors read plain dict fields directly and fall back to their bound
+``sense`` method for anything else, and nodes without an inline template,
+such as those of a custom registry, are called through the same evaluator the
+interpreter uses. ``BehaviorGraph.compile_cached`` returns this tier unless
+``TANK_BEHAVIOR_GRAPH_DEBUG=1`` asks for the checked interpreter.
+
+Parameters are bound as globals of the generated function rather than written
+into its source, so mutants that share a topology - the whole population of an
+evolution run - share one compiled code object. Plans whose sensors all read
+named fields also get a batched variant that loops over context columns and
+takes those values as arguments, so one call can evaluate many such mutants.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import linecache
+import os
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from types import CodeType
+from typing import cast
+
+from core.behavior.compiled_graph import CompiledBehaviorGraph
+from core.behavior.generated_emitters import (
+    _EMITTERS,
+    _HELPERS,
+    _OPAQUE,
+    _emit_call,
+    _SourceBuilder,
+)
+from core.behavior.nodes import NodeValue
+
+_DEBUG_ENV = "TANK_BEHAVIOR_GRAPH_DEBUG"
+
+
+def behavior_graph_debug_enabled() -> bool:
+    """Whether cached plans should use the checked interpreter."""
+    return os.environ.get(_DEBUG_ENV, "0") == "1"
+
+
+# (bindings, columns) segments -> one output per row; see generate_batch_source.
+BatchFunction = Callable[
+    [Iterable[tuple[tuple[object, ...], Mapping[str, Sequence[object]]]]], list[NodeValue]
+]
+
+
+@dataclass(frozen=True)
+class GeneratedBehaviorGraph(CompiledBehaviorGraph):
+    """Compiled plan whose ``evaluate`` runs generated straight-line source.
+
+    The trace methods still walk the interpreter steps, which hold the same
+    node instances, so inspectors see the values ``evaluate`` computes.
+    """
+
+    source: str = field(compare=False)
+    function: Callable[[object], NodeValue] = field(compare=False, repr=False)
+    batch_function: BatchFunction | None = field(default=None, compare=False, repr=False)
+    batch_bindings: tuple[object, ...] = field(default=(), compare=False, repr=False)
+    batch_fields: frozenset[str] = field(default=frozenset(), compare=False, repr=False)
+
+    def evaluate(self, context: object) -> NodeValue:
+        return self.function(context)
+
+    def evaluate_batch(self, columns: Mapping[str, Sequence[object]]) -> list[NodeValue]:
+        if self.batch_function is None or not self.batch_fields <= columns.keys():
+            return super().evaluate_batch(columns)
+        return self.batch_function(((self.batch_bindings, columns),))
+
+
+def _build(plan: CompiledBehaviorGraph, *, batch: bool) -> _SourceBuilder:
+    builder = _SourceBuilder(batch=batch)
+    for index, step in enumerate(plan.steps):
+        builder.emit(f"# {step.node_id}: {step.node.node_type}")
+        inputs = dict(step.inputs)
+        emitter = _EMITTERS.get(type(step.node))
+        typed = all(builder.kinds[source] != _OPAQUE for source in inputs.values())
+        if emitter is None or not typed or not emitter(builder, index, step, inputs):
+            _emit_call(builder, index, step)
+    return builder
+
+
+def generate_source(plan: CompiledBehaviorGraph) -> tuple[str, dict[str, object]]:
+    """Return the generated function source and the globals it needs."""
+    builder = _build(plan, batch=False)
+    builder.emit(f"return {builder.value(plan.output_index)}")
+    header = ["def evaluate(context):", "    plain_context = type(context) is dict"]
+    return "\n".join([*header, *builder.lines]) + "\n", builder.namespace
+
+
+def generate_batch_source(
+    plan: CompiledBehaviorGraph,
+) -> tuple[str, tuple[object, ...], frozenset[str]] | None:
+    """Return a segment-looping variant's source, bindings, and the columns it reads.
+
+    The function takes ``(bindings, columns)`` segments and returns one output
+    per row of every segment, in order. Plans that share a topology share its
+    source, so one call can evaluate rows of many mutants, each segment
+    supplying its plan's ``bindings``. ``None`` when some node needs the full
+    context (custom evaluators, sensors without a ``field`` parameter).
+    """
+    builder = _build(plan, batch=True)
+    if not builder.batchable or not builder.columns:
+        return None
+    builder.emit(f"append({builder.value(plan.output_index)})")
+    bound = "".join(f"{name}, " for name in builder.bound)
+    names = ", ".join(f"v{index}" for index in builder.columns)
+    columns = ", ".join(f"columns[{field_name!r}]" for field_name in builder.columns.values())
+    header = [
+        "def evaluate_batch(segments):",
+        "    results = []",
+        "    append = results.append",
+        f"    for ({bound}), columns in segments:",
+        f"        for {names}, in zip({columns}, strict=True):",
+    ]
+    source = "\n".join([*header, *builder.lines, "    return results"]) + "\n"
+    return source, tuple(builder.bound.values()), frozenset(builder.columns.values())
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_source(source: str) -> CodeType:
+    """Compile generated source once per distinct text (graph shape)."""
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+    filename = f"<behavior-graph {digest}>"
+    # Let tracebacks from generated code show the offending line.
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    return compile(source, filename, "exec")
+
+
+def _define(source: str, namespace: dict[str, object], name: str) -> object:
+    exec(_compiled_source(source), namespace)
+    return namespace[name]
+
+
+@functools.lru_cache(maxsize=256)
+def _batch_function(source: str) -> object:
+    # Batch sources take every plan-specific value as an argument, so one
+    # function object serves every plan with this source.
+    return _define(source, dict(_HELPERS), "evaluate_batch")
+
+
+def generate_plan(plan: CompiledBehaviorGraph) -> GeneratedBehaviorGraph:
+    """Compile ``plan`` into a :class:`GeneratedBehaviorGraph`."""
+    source, namespace = generate_source(plan)
+    function = _define(source, namespace, "evaluate")
+    batch = generate_batch_source(plan)
+    batch_function = None
+    bindings: tuple[object, ...] = ()
+    batch_fields: frozenset[str] = frozenset()
+    if batch is not None:
+        batch_source, bindings, batch_fields = batch
+        batch_function = _batch_function(batch_source)
+    return GeneratedBehaviorGraph(
+        plan.steps,
+        plan.output_index,
+        source,
+        cast(Callable[[object], NodeValue], function),
+        cast(BatchFunction | None, batch_function),
+        bindings,
+        batch_fields,
+    )
+
+
+__all__ = [
+    "GeneratedBehaviorGraph",
+    "behavior_graph_debug_enabled",
+    "generate_batch_source",
+    "generate_plan",
+    "generate_source",
+]
@@ -356,17 +356,40 @@ class BehaviorGraph:
             steps.append(CompiledStep(node_id, evaluator, inputs, node))
         return CompiledBehaviorGraph(tuple(steps), indices[self.output_node_id])
 
-    def compile_cached(self, registry: NodeRegistry = NODE_REGISTRY) -> CompiledBehaviorGraph:
-        """Return a bounded, registry-specific cached plan for the hot path."""
-        if registry is NODE_REGISTRY:
-            if hasattr(self, "_compiled_plan_cached"):
-                return cast(CompiledBehaviorGraph, self._compiled_plan_cached)
+    def compile_cached(
+        self, registry: NodeRegistry = NODE_REGISTRY, *, debug: bool | None = None
+    ) -> CompiledBehaviorGraph:
+        """Return a bounded, registry-specific cached plan for the hot path.
+
+        The plan runs source generated for this graph (see
+        ``core.behavior.generated_graph``). ``debug`` selects the checked
+        interpreter instead; when omitted it follows
+        ``TANK_BEHAVIOR_GRAPH_DEBUG``, read the first time a graph is compiled.
+        """
+        remember = debug is None and registry is NODE_REGISTRY
+        if remember and hasattr(self, "_compiled_plan_cached"):
+            return cast(CompiledBehaviorGraph, self._compiled_plan_cached)
+
+        from core.behavior.generated_graph import behavior_graph_debug_enabled, generate_plan
+
+        if debug is None:
+            debug = behavior_graph_debug_enabled()
+        fingerprint = self.fingerprint()
+        compiled: CompiledBehaviorGraph
+        if debug:
+            compiled = get_compiled_plan(
+                registry,
+                fingerprint,
+                lambda: self.compile(registry, validate_outputs=True),
+                tier="checked",
+            )
+        else:
             compiled = get_compiled_plan(
-                registry, self.fingerprint(), lambda: self.compile(registry)
+                registry, fingerprint, lambda: generate_plan(self.compile(registry))
             )
+        if remember:
             object.__setattr__(self, "_compiled_plan_cached", compiled)
-            return compiled
-        return get_compiled_plan(registry, self.fingerprint(), lambda: self.compile(registry))
+        return compiled
 
     def crossed_over(
         self,
@@ -18,6 +18,7 @@ from core.behavior.standard_nodes import register_standard_nodes
 from core.behavior.target_memory import TargetCandidate, TargetId, TargetMemoryState, decide_target
 from core.behavior.targeting import TargetObservation
 from core.entities import Crab, Fish
+from core.movement.perception import perceive
 
 if TYPE_CHECKING:
     from core.behavior.target_memory import TargetMemoryDecision
@@ -280,6 +281,12 @@ def default_foraging_graph() -> BehaviorGraph:
 
 
 def _nearest_threat(fish: Fish) -> Any | None:
+    # Own key: this scans grid cells without the exact-radius cut that the
+    # composable behavior's nearest-crab query applies.
+    return perceive(fish, "graph_nearest_threat", lambda: _query_nearest_threat(fish))
+
+
+def _query_nearest_threat(fish: Fish) -> Any | None:
     candidates = [
         entity
         for entity in fish.environment.nearby_agents_by_type(fish, 200.0, Crab)
@@ -225,6 +225,10 @@ class TankConfig:
     # switch, for food AND soccer-ball pursuit. Independent from the other
     # two flags so experiments can isolate any component.
     target_memory_enabled: bool = False
+    # Spatial grid backend: "dict" (per-cell lists) or "array" (NumPy columns
+    # with bulk rebuilds and batched queries). Both return identical query
+    # results in identical order, so the choice never changes trajectories.
+    spatial_grid_backend: str = "dict"
 
 
 @dataclass
@@ -392,6 +396,8 @@ class SimulationConfig:
             )
         if "target_memory_enabled" in config_dict:
             cfg.tank.target_memory_enabled = bool(config_dict["target_memory_enabled"])
+        if "spatial_grid_backend" in config_dict:
+            cfg.tank.spatial_grid_backend = str(config_dict["spatial_grid_backend"])
 
         # Soccer evaluator
         soccer_map = {
@@ -15,6 +15,7 @@ unchanged:
   distribution reports
 """
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any, Optional
 
 import core.ecosystem_reporting as ecosystem_reporting
@@ -324,7 +325,7 @@ class EcosystemManager:
         """Record a telemetry event emitted by domain entities."""
         self.telemetry.record_event(event)
 
-    def ingest_energy_deltas(self, deltas: list[Any]) -> None:
+    def ingest_energy_deltas(self, deltas: Iterable[Any]) -> None:
         """Process a batch of energy deltas from the engine recorder."""
         self.telemetry.ingest_energy_deltas(deltas)
 
@@ -395,6 +396,7 @@ class EcosystemManager:
             record_energy_burn=self.record_energy_burn,
         )
         self.taxonomy.record_death(fish_id)
+        self.lineage.record_death(fish_id)
 
     def update_population_stats(self, fish_list: list["Fish"]) -> None:
         """Update population statistics from current fish list."""
@@ -425,6 +427,15 @@ class EcosystemManager:
         """Get complete lineage data for phylogenetic tree visualization."""
         return self.lineage.get_lineage_data(alive_fish_ids)
 
+    def get_lineage_delta(
+        self,
+        since_version: int = 0,
+        epoch: str | None = None,
+        alive_fish_ids: set[int] | None = None,
+    ) -> dict[str, Any]:
+        """Get lineage records changed since a client's last version."""
+        return self.lineage.get_lineage_delta(since_version, epoch, alive_fish_ids)
+
     def get_summary_stats(self, entities: list | None = None) -> dict[str, Any]:
         """Get comprehensive ecosystem summary statistics."""
         return ecosystem_reporting.build_summary_stats(self, entities)
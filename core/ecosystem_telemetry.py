@@ -7,9 +7,11 @@ delegating facades, and all calls go back through the manager so
 monkeypatched manager methods are honored.
 """
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Optional
 
 from core.constants import SOURCE_POKER_FISH
+from core.simulation.energy_ledger import EnergyLedger
 from core.telemetry.events import BirthEvent, FoodEatenEvent, ReproductionEvent
 
 if TYPE_CHECKING:
@@ -20,6 +22,25 @@ if TYPE_CHECKING:
     from core.worlds.contracts import EnergyDeltaRecord
 
 
+def _gain_label(source: str, metadata: dict[str, object] | None) -> str:
+    """Map an energy-gain source to the name the energy tracker records."""
+    if source == "ate_food":
+        # Try to get detailed info from metadata if available
+        if metadata and "food_type" in metadata:
+            return str(metadata["food_type"])
+        return "food"
+    if source == "poker_win":
+        return SOURCE_POKER_FISH
+    return source
+
+
+def _burn_label(source: str) -> str:
+    """Map an energy-burn source to the name the energy tracker records."""
+    if source == "poker_loss":
+        return "poker"
+    return source
+
+
 class EcosystemTelemetryRouter:
     """Routes telemetry events and energy deltas into ecosystem trackers."""
 
@@ -91,43 +112,29 @@ class EcosystemTelemetryRouter:
         elif isinstance(event, ReproductionEvent):
             self.on_reproduction(event)
 
-    def ingest_energy_deltas(self, deltas: list["EnergyDeltaRecord"]) -> None:
+    def ingest_energy_deltas(self, deltas: Iterable["EnergyDeltaRecord"]) -> None:
         """Process a batch of energy deltas from the engine recorder.
 
         This replaces the old event-based telemetry for energy.
         Args:
-            deltas: List of EnergyDeltaRecord objects
+            deltas: EnergyDeltaRecord objects, or the frame's EnergyLedger, whose
+                columns are summed per source instead of walked record by record
         """
+        if isinstance(deltas, EnergyLedger):
+            gains, burns = deltas.totals_by_source()
+            for source, amount in gains.items():
+                self._manager.record_energy_gain(_gain_label(source, None), amount)
+            for source, amount in burns.items():
+                self._manager.record_energy_burn(_burn_label(source), amount)
+            deltas = deltas.records_with_metadata()
+
         for delta in deltas:
             if delta.delta > 0:
-                # Energy Gain
-                source = delta.source
-                amount = delta.delta
-
-                # Map source names if needed for consistency
-                if source == "ate_food":
-                    # Try to get detailed info from metadata if available
-                    food_type = "food"
-                    if delta.metadata and "food_type" in delta.metadata:
-                        food_type = str(delta.metadata["food_type"])
-                    self._manager.record_energy_gain(food_type, amount)
-                elif source == "poker_win":
-                    self._manager.record_energy_gain(SOURCE_POKER_FISH, amount)
-                else:
-                    self._manager.record_energy_gain(source, amount)
-
+                self._manager.record_energy_gain(
+                    _gain_label(delta.source, delta.metadata), delta.delta
+                )
             elif delta.delta < 0:
-                # Energy Burn
-                source = delta.source
-                amount = -delta.delta
-
-                if source == "metabolism":
-                    # Metabolism is now aggregated, but we can log it
-                    self._manager.record_energy_burn("metabolism", amount)
-                elif source == "poker_loss":
-                    self._manager.record_energy_burn("poker", amount)
-                else:
-                    self._manager.record_energy_burn(source, amount)
+                self._manager.record_energy_burn(_burn_label(delta.source), -delta.delta)
 
     # =========================================================================
     # Food Recording
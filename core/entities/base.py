@@ -61,6 +61,8 @@ class SpriteGroup(Protocol):
 class Rect:
     """Simple rectangle class for collision detection and positioning."""
 
+    __slots__ = ("height", "width", "x", "y")
+
     def __init__(self, x: float = 0, y: float = 0, width: float = 32, height: float = 32):
         self.x = x
         self.y = y
@@ -9,15 +9,17 @@ from __future__ import annotations
 import random
 import time
 from collections.abc import Callable, Iterable
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
 from core.entities import Agent, Entity
 from core.interfaces import MigrationHandler
 from core.simulation.profiler import is_profiling
 from core.spatial.bounds import WorldBounds
-from core.spatial.grid import SpatialGrid
+from core.spatial.grid import create_spatial_grid
 from core.util.rng import require_rng_param
 
+_T = TypeVar("_T")
+
 # Type alias for energy delta recorder callback
 # Signature: (entity, delta, source, metadata) -> None
 EnergyDeltaRecorder = Callable[["Entity", float, str, dict[str, object]], None]
@@ -42,6 +44,7 @@ class Environment:
         rng: random.Random | None = None,
         event_bus: object | None = None,
         simulation_config: Any | None = None,
+        spatial_grid_backend: str = "dict",
     ):
         """
         Initialize the environment.
@@ -54,6 +57,7 @@ class Environment:
             rng: Random number generator for deterministic behavior
             event_bus: Optional EventBus for domain event dispatch
             simulation_config: Optional SimulationConfig for runtime parameters
+            spatial_grid_backend: "dict" (default) or "array" (NumPy-backed, same results)
         """
         agents_list: list[Entity] | None
         if agents is None:
@@ -70,7 +74,9 @@ class Environment:
         self.bounds = WorldBounds(width, height)
         # OPTIMIZATION: Cache bounds as tuple to avoid allocation in hot path
         self._cached_bounds = ((0.0, 0.0), (float(width), float(height)))
-        self.spatial_grid = SpatialGrid(width, height, cell_size=150)
+        self.spatial_grid = create_spatial_grid(
+            width, height, cell_size=150, backend=spatial_grid_backend
+        )
 
         self.time_system = time_system
         self.event_bus = event_bus  # Domain event dispatch
@@ -281,6 +287,10 @@ class Environment:
         """Update an agent's position in the spatial grid. Call when agent moves."""
         self.spatial_grid.update_agent(agent)
 
+    def update_agent_positions(self, agents: Iterable[Entity]) -> None:
+        """Bulk update_agent_position (array-backed grids vectorize the cell checks)."""
+        self.spatial_grid.update_agents(agents)
+
     def resolve_boundary_collision(self, agent: Agent) -> bool:
         """Resolve collision with custom boundary (e.g., circular dish).
 
@@ -327,15 +337,15 @@ class Environment:
 
     def closest_fish(self, agent: Entity, radius: float) -> Entity | None:
         """Find closest fish efficiently."""
-        return self.spatial_grid.closest_fish(agent, radius)
+        return self._timed_query(self.spatial_grid.closest_fish, agent, radius)
 
     def closest_food(self, agent: Entity, radius: float) -> Entity | None:
         """Find closest food efficiently."""
-        return self.spatial_grid.closest_food(agent, radius)
+        return self._timed_query(self.spatial_grid.closest_food, agent, radius)
 
     def closest_type(self, agent: Entity, radius: float, agent_type: type[Entity]) -> Entity | None:
         """Find the closest agent of a given type efficiently."""
-        return self.spatial_grid.closest_type(agent, radius, agent_type)
+        return self._timed_query(self.spatial_grid.closest_type, agent, radius, agent_type)
 
     def nearby_agents_by_type(
         self,
@@ -397,6 +407,26 @@ class Environment:
             return res
         return self.spatial_grid.query_interaction_candidates(agent, float(radius), crab_type)
 
+    def nearby_evolving_agents_batch(
+        self, agents: list[Entity], radius: float
+    ) -> list[list[Entity]]:
+        """Batched nearby_evolving_agents: one result list per agent, same order."""
+        return self._timed_query(self.spatial_grid.query_fish_batch, agents, float(radius))
+
+    def nearby_resources_batch(self, agents: list[Entity], radius: float) -> list[list[Entity]]:
+        """Batched nearby_resources: one result list per agent, same order."""
+        return self._timed_query(self.spatial_grid.query_food_batch, agents, float(radius))
+
+    def _timed_query(self, query: Callable[..., _T], *args: object) -> _T:
+        """Run a spatial query, charging its time to the profiler when enabled."""
+        engine = self.engine
+        if not is_profiling(engine):
+            return query(*args)
+        start = time.perf_counter()
+        res = query(*args)
+        engine.profiler.record_query(time.perf_counter() - start)  # type: ignore[attr-defined]
+        return res
+
     def nearby_poker_entities(self, agent: Entity, radius: float) -> list[Entity]:
         """
         Optimized method to get nearby fish and Plant entities for poker.
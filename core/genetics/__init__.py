@@ -23,6 +23,7 @@ from core.genetics.diversity import (
     sharing_factor,
 )
 from core.genetics.genome import GeneticCrossoverMode, Genome
+from core.genetics.genome_matrix import GenomeMatrix
 from core.genetics.physical import PHYSICAL_TRAIT_SPECS, PhysicalTraits
 from core.genetics.plant_genome import PlantGenome
 from core.genetics.reproduction import ReproductionMutationContext, ReproductionParams
@@ -69,4 +70,5 @@ __all__ = [
     "population_diversity",
     "sharing_factor",
     "diversity_bonus",
+    "GenomeMatrix",
 ]
@@ -222,7 +222,7 @@ def genetic_distance(genome1: Genome, genome2: Genome) -> float:
 # =============================================================================
 
 
-def population_diversity(genomes: Sequence[Genome]) -> dict[str, float]:
+def population_diversity(genomes: Sequence[Genome], exact: bool = False) -> dict[str, float]:
     """Calculate diversity metrics for a population of genomes.
 
     Returns a dictionary with:
@@ -233,10 +233,13 @@ def population_diversity(genomes: Sequence[Genome]) -> dict[str, float]:
     - num_niches: Estimated number of genetic niches (clusters)
     - effective_diversity: Combined diversity score (0.0 = monoculture, 1.0 = max diverse)
 
-    For large populations, uses sampling to keep computation tractable.
+    For large populations, uses sampling to keep computation tractable
+    unless ``exact`` is set.
 
     Args:
         genomes: Sequence of Genome objects
+        exact: Use every pair and every genome (via ``GenomeMatrix``) instead
+            of sampling 500 pairs and 50 genomes for niche estimation
 
     Returns:
         Dictionary of diversity metrics
@@ -257,8 +260,16 @@ def population_diversity(genomes: Sequence[Genome]) -> dict[str, float]:
     total_possible = n * (n - 1) // 2
 
     distances: list[float] = []
+    niche_threshold = 0.3  # Genomes closer than this are in the same niche
+    num_niches: int | None = None
+
+    if exact:
+        from core.genetics.genome_matrix import GenomeMatrix
 
-    if total_possible <= max_pairs:
+        matrix = GenomeMatrix(genomes)
+        distances = matrix.pairwise_distances().tolist()
+        num_niches = len(matrix.niche_leaders(niche_threshold))
+    elif total_possible <= max_pairs:
         # Compute all pairs
         for i in range(n):
             for j in range(i + 1, n):
@@ -297,8 +308,8 @@ def population_diversity(genomes: Sequence[Genome]) -> dict[str, float]:
     behavioral_entropy = _shannon_entropy(list(behavior_counts.values()), n)
 
     # Estimate niches using simple threshold-based clustering
-    niche_threshold = 0.3  # Genomes closer than this are in the same niche
-    num_niches = _estimate_niches(genomes, niche_threshold, max_sample=50)
+    if num_niches is None:
+        num_niches = _estimate_niches(genomes, niche_threshold, max_sample=50)
 
     # Effective diversity: combines distance spread and behavioral variety
     # Normalize to 0-1 range (assuming max realistic distance ~3.0)
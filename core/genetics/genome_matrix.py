@@ -0,0 +1,177 @@
+"""Vectorized genetic distances for a whole population.
+
+``genetic_distance`` compares two genomes in Python, so population-level
+metrics either sample pairs (``population_diversity``, ``_estimate_niches``)
+or pay O(n) Python distance calls per genome (``sharing_factor``).
+
+``GenomeMatrix`` packs the cached distance profiles of a population into one
+float array (one column per row of the trait table, plus integer codes for
+the composable behavior sub-behaviors) and computes distances for blocks of
+genomes at once. Build it once per frame or generation and reuse it for the
+full distance matrix, sharing factors and niche clustering.
+
+Every distance is accumulated trait by trait in trait-table order, exactly as
+``genetic_distance`` does, so ``distance_matrix()[i, j]`` is bit-identical to
+``genetic_distance(genomes[i], genomes[j])``. Sharing factors are likewise
+summed in population order and match ``sharing_factor`` exactly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from core.genetics.diversity import (
+    _BEHAVIOR_MISMATCH_WEIGHT,
+    _KIND_CONTINUOUS,
+    _KIND_DISCRETE,
+    _distance_profile,
+    _get_trait_table,
+)
+
+if TYPE_CHECKING:
+    from core.genetics.genome import Genome
+
+# Rows per distance block; bounds temporaries to _ROW_BLOCK * n floats
+_ROW_BLOCK = 256
+
+
+class GenomeMatrix:
+    """Packed trait values of a population, for batched distance queries."""
+
+    def __init__(self, genomes: Sequence[Genome]) -> None:
+        _, kind_weight_rows, base_total_weight = _get_trait_table()
+        self.genomes = list(genomes)
+        n = len(self.genomes)
+        self._kind_weights = kind_weight_rows
+        self._base_total_weight = base_total_weight
+
+        self._values = np.zeros((n, len(kind_weight_rows)))
+        behavior_keys: list[tuple[object, ...] | None] = []
+        for i, genome in enumerate(self.genomes):
+            values, behavior_key = _distance_profile(genome)
+            self._values[i] = values
+            behavior_keys.append(behavior_key)
+        self._behavior_codes, self._has_behavior = _encode_behavior_keys(behavior_keys)
+
+        # Equal codes mark the same genome object (sharing_factor skips ``is`` matches)
+        first_index: dict[int, int] = {}
+        self._identity = np.fromiter(
+            (first_index.setdefault(id(g), i) for i, g in enumerate(self.genomes)),
+            dtype=np.intp,
+            count=n,
+        )
+        self._matrix: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.genomes)
+
+    def distances_from(self, rows: Sequence[int] | np.ndarray) -> np.ndarray:
+        """Distances from each genome in ``rows`` to every genome, shape (len(rows), n)."""
+        indices = np.asarray(rows, dtype=np.intp)
+        if self._matrix is not None:
+            return self._matrix[indices]
+        return self._distance_block(indices)
+
+    def distance_matrix(self) -> np.ndarray:
+        """Full symmetric (n, n) distance matrix, computed once and cached."""
+        if self._matrix is None:
+            n = len(self.genomes)
+            matrix = np.zeros((n, n))
+            for start in range(0, n, _ROW_BLOCK):
+                rows = np.arange(start, min(start + _ROW_BLOCK, n))
+                matrix[rows] = self._distance_block(rows)
+            self._matrix = matrix
+        return self._matrix
+
+    def pairwise_distances(self) -> np.ndarray:
+        """Distances of all pairs ``i < j``, in ``(0, 1), (0, 2), ..., (1, 2), ...`` order."""
+        upper = np.triu_indices(len(self.genomes), k=1)
+        return self.distance_matrix()[upper]
+
+    def sharing_factors(self, sigma: float = 0.5) -> np.ndarray:
+        """``sharing_factor(genome, genomes, sigma)`` for every genome at once."""
+        n = len(self.genomes)
+        factors = np.ones(n)
+        if n == 0:
+            return factors
+        for start in range(0, n, _ROW_BLOCK):
+            rows = np.arange(start, min(start + _ROW_BLOCK, n))
+            d = self.distances_from(rows)
+            close = d < sigma
+            close[self._identity[rows][:, None] == self._identity[None, :]] = False
+            # Python float ``**`` rounds differently from NumPy's vectorized
+            # square/pow, so the (few) in-radius terms are evaluated as scalars
+            share = np.zeros(d.shape)
+            share[close] = [1.0 - (x / sigma) ** 2 for x in d[close].tolist()]
+            # Left-to-right from the 1.0 self count, like the per-genome loop
+            with_self = np.concatenate([np.ones((len(rows), 1)), share], axis=1)
+            factors[rows] = np.add.accumulate(with_self, axis=1)[:, -1]
+        return factors
+
+    def diversity_bonuses(self, sigma: float = 0.5, bonus_weight: float = 0.1) -> np.ndarray:
+        """``diversity_bonus`` for every genome at once."""
+        return bonus_weight / self.sharing_factors(sigma)
+
+    def niche_leaders(self, threshold: float) -> list[int]:
+        """Indices of the niche leaders found by greedy leader clustering.
+
+        Same algorithm as ``_estimate_niches`` without sampling: genomes are
+        visited in order and each one farther than ``threshold`` from every
+        existing leader starts a new niche.
+        """
+        n = len(self.genomes)
+        if n == 0:
+            return []
+        matrix = self.distance_matrix()
+        leaders = [0]
+        for i in range(1, n):
+            if not np.any(matrix[i, leaders] < threshold):
+                leaders.append(i)
+        return leaders
+
+    def _distance_block(self, rows: np.ndarray) -> np.ndarray:
+        values = self._values
+        block = values[rows]
+        distance_sq = np.zeros((len(rows), len(values)))
+        for column, (kind, weight) in enumerate(self._kind_weights):
+            if kind == _KIND_CONTINUOUS:
+                d = block[:, column, None] - values[None, :, column]
+            elif kind == _KIND_DISCRETE:
+                d = (block[:, column, None] != values[None, :, column]).astype(float)
+            else:
+                diff = np.abs(block[:, column, None] - values[None, :, column]) % 1.0
+                d = np.minimum(diff, 1.0 - diff)
+            distance_sq += weight * d * d
+
+        total_weight = np.full(distance_sq.shape, self._base_total_weight)
+        both = self._has_behavior[rows, None] & self._has_behavior[None, :]
+        codes = self._behavior_codes
+        for position in range(codes.shape[1]):
+            mismatch = both & (codes[rows, position, None] != codes[None, :, position])
+            penalty = np.where(mismatch, _BEHAVIOR_MISMATCH_WEIGHT, 0.0)
+            distance_sq += penalty
+            total_weight += penalty
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            distances = np.sqrt(distance_sq / total_weight)
+        return np.where(total_weight > 0, distances, 0.0)
+
+
+def _encode_behavior_keys(
+    keys: list[tuple[object, ...] | None],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Map behavior sub-behavior keys to integer codes per position."""
+    width = max((len(key) for key in keys if key is not None), default=0)
+    codes = np.full((len(keys), width), -1, dtype=np.intp)
+    has_behavior = np.zeros(len(keys), dtype=bool)
+    lookups: list[dict[object, int]] = [{} for _ in range(width)]
+    for i, key in enumerate(keys):
+        if key is None:
+            continue
+        has_behavior[i] = True
+        for position, value in enumerate(key):
+            codes[i, position] = lookups[position].setdefault(value, len(lookups[position]))
+    return codes, has_behavior
@@ -2,17 +2,30 @@
 
 This module tracks parent-child relationships between fish for
 building phylogenetic trees in the frontend.
+
+Records are indexed by id and linked parent -> children. Every record keeps a
+pin count (1 if the fish is alive, plus 1 per child whose subtree holds a
+living fish), so a record is an ancestor of a living fish exactly when its
+count is non-zero and births, deaths and pruning each touch only the records
+whose pinned state actually changes. Each change also bumps a version, so
+``get_lineage_delta`` can return just the records changed since a client's
+last poll; the epoch token changes whenever versions stop being comparable
+(a new tracker, ``clear`` or a snapshot restore).
 """
 
 from __future__ import annotations
 
+import heapq
 import logging
+import uuid
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 MAX_LINEAGE_LOG_SIZE = 10000
 
+LineageRecord = dict[str, Any]
+
 
 class LineageTracker:
     """Tracks fish lineage for phylogenetic tree visualization.
@@ -21,24 +34,60 @@ class LineageTracker:
     generation info, algorithm, and color for tree rendering.
 
     Smart pruning ensures complete ancestry is preserved for all living fish.
-    Only extinct lineages (dead fish with no living descendants) are pruned.
+    Only extinct lineages (dead fish with no living descendants) are pruned,
+    oldest first.
     """
 
     def __init__(self):
         """Initialize the lineage tracker."""
-        self.lineage_log: list[dict[str, Any]] = []
+        self._records: dict[str, LineageRecord] = {}  # id -> record, in log order
+        self._children: dict[str, set[str]] = {}
+        self._pins: dict[str, int] = {}
+        self._order: dict[str, int] = {}  # id -> position in the log, for pruning order
+        self._next_order = 0
+        self._unpinned: list[tuple[int, str]] = []  # heap of prune candidates
         self._alive_fish_ids: set[int] = set()
         self._fixed_orphans: set[str] = (
             set()
         )  # Track already-fixed orphans to avoid repeat warnings
 
+        # Versioned change log for get_lineage_delta
+        self._epoch = uuid.uuid4().hex
+        self._version = 0
+        self._changed: dict[str, int] = {}  # id -> version, oldest change first
+        self._removed: dict[str, int] = {}  # id -> version, oldest removal first
+        self._full_since = 0  # Deltas from before this version need a full reload
+        self._views: dict[str, LineageRecord] = {}  # id -> enriched record
+
+    @property
+    def lineage_log(self) -> list[LineageRecord]:
+        """Lineage records in log order (a new list; the records are live)."""
+        return list(self._records.values())
+
+    @lineage_log.setter
+    def lineage_log(self, records: list[LineageRecord]) -> None:
+        self._load(records)
+
+    @property
+    def version(self) -> int:
+        """Version of the most recent change."""
+        return self._version
+
+    @property
+    def epoch(self) -> str:
+        """Token identifying the version sequence ``version`` belongs to."""
+        return self._epoch
+
     def update_alive_fish(self, alive_fish_ids: set[int]) -> None:
         """Update the set of alive fish IDs and trigger smart pruning.
 
         Args:
             alive_fish_ids: Set of fish IDs that are currently alive
         """
-        self._alive_fish_ids = alive_fish_ids
+        for fish_id in self._alive_fish_ids - alive_fish_ids:
+            self._set_alive(fish_id, False)
+        for fish_id in alive_fish_ids - self._alive_fish_ids:
+            self._set_alive(fish_id, True)
         self._smart_prune_if_needed()
 
     def record_birth(
@@ -71,45 +120,93 @@ class LineageTracker:
             "birth_time": birth_frame,
             "tank_name": tank_name,
         }
-        self.lineage_log.append(lineage_record)
-
-        # Add to alive set
-        self._alive_fish_ids.add(fish_id)
-
-    def _build_ancestor_set(self, alive_ids: set[int]) -> set[str]:
-        """Build the complete set of ancestor IDs for all living fish.
+        self._alive_fish_ids.discard(fish_id)
+        if lineage_record["id"] in self._records:
+            self._remove(lineage_record["id"])
+        self._insert(lineage_record)
+        self._fix_orphan(lineage_record)
+        self._set_alive(fish_id, True)
+        self._smart_prune_if_needed()
 
-        Traces the ancestry chain for each living fish back to root,
-        collecting all ancestor IDs along the way.
+    def record_death(self, fish_id: int) -> None:
+        """Mark a fish dead; its record stays while it has living descendants.
 
         Args:
-            alive_ids: Set of currently alive fish IDs
-
-        Returns:
-            Set of all ancestor IDs (as strings) that must be preserved
+            fish_id: ID of the fish that died
         """
-        # Build ID -> record lookup for fast parent traversal
-        id_to_record: dict[str, dict[str, Any]] = {rec["id"]: rec for rec in self.lineage_log}
-
-        ancestors: set[str] = set()
-        alive_str_ids = {str(fid) for fid in alive_ids}
-
-        # For each living fish, trace back to root
-        for alive_id in alive_str_ids:
-            current_id = alive_id
-            visited = set()  # Prevent infinite loops from bad data
-
-            while current_id and current_id != "root" and current_id not in visited:
-                visited.add(current_id)
-                ancestors.add(current_id)
-
-                record = id_to_record.get(current_id)
-                if record:
-                    current_id = record.get("parent_id", "root")
-                else:
-                    break
-
-        return ancestors
+        self._set_alive(fish_id, False)
+
+    def _insert(self, record: LineageRecord) -> None:
+        rec_id = record["id"]
+        self._records[rec_id] = record
+        self._pins[rec_id] = 0
+        self._order[rec_id] = self._next_order
+        self._next_order += 1
+        self._removed.pop(rec_id, None)
+        parent_id = record["parent_id"]
+        if parent_id in self._records:
+            self._children.setdefault(parent_id, set()).add(rec_id)
+        self._touch(rec_id)
+        heapq.heappush(self._unpinned, (self._order[rec_id], rec_id))
+
+    def _set_alive(self, fish_id: int, alive: bool) -> None:
+        if alive == (fish_id in self._alive_fish_ids):
+            return
+        if alive:
+            self._alive_fish_ids.add(fish_id)
+        else:
+            self._alive_fish_ids.discard(fish_id)
+        rec_id = str(fish_id)
+        if rec_id in self._records:
+            self._touch(rec_id)
+            self._pin(rec_id, 1 if alive else -1)
+
+    def _pin(self, rec_id: str, delta: int) -> None:
+        """Adjust a pin count, walking up only while a subtree's pinned state flips."""
+        visited: set[str] = set()
+        while rec_id in self._records and rec_id not in visited:
+            visited.add(rec_id)
+            before = self._pins[rec_id]
+            after = before + delta
+            self._pins[rec_id] = after
+            if after == 0:
+                heapq.heappush(self._unpinned, (self._order[rec_id], rec_id))
+            if (before > 0) == (after > 0):
+                return
+            rec_id = self._records[rec_id]["parent_id"]
+
+    def _touch(self, rec_id: str) -> None:
+        self._version += 1
+        self._changed.pop(rec_id, None)
+        self._changed[rec_id] = self._version
+        self._views.pop(rec_id, None)
+
+    def _remove(self, rec_id: str) -> None:
+        """Drop a record; its remaining children are remapped to root."""
+        if self._pins[rec_id] > 0:
+            self._pin(self._records[rec_id]["parent_id"], -1)
+        record = self._records.pop(rec_id)
+        self._pins.pop(rec_id)
+        self._order.pop(rec_id)
+        self._changed.pop(rec_id, None)
+        self._views.pop(rec_id, None)
+        self._fixed_orphans.discard(rec_id)
+        siblings = self._children.get(record["parent_id"])
+        if siblings is not None:
+            siblings.discard(rec_id)
+            if not siblings:
+                del self._children[record["parent_id"]]
+        for child_id in self._children.pop(rec_id, ()):
+            child = self._records[child_id]
+            child["_original_parent_id"] = rec_id
+            child["parent_id"] = "root"
+            self._touch(child_id)
+
+        self._version += 1
+        self._removed[rec_id] = self._version
+        if len(self._removed) > MAX_LINEAGE_LOG_SIZE:
+            oldest = next(iter(self._removed))
+            self._full_since = self._removed.pop(oldest)
 
     def _smart_prune_if_needed(self) -> None:
         """Smart prune that preserves complete ancestry for living fish.
@@ -120,119 +217,163 @@ class LineageTracker:
 
         This ensures the phylogenetic tree is always complete for living fish.
         """
-        if len(self.lineage_log) <= MAX_LINEAGE_LOG_SIZE:
+        excess = len(self._records) - MAX_LINEAGE_LOG_SIZE
+        if excess <= 0:
             return
 
-        # Build set of all ancestors of living fish
-        ancestors_to_keep = self._build_ancestor_set(self._alive_fish_ids)
+        pruned = 0
+        while pruned < excess and self._unpinned:
+            order, rec_id = heapq.heappop(self._unpinned)
+            # Entries go stale when a record is re-pinned, pruned or replaced.
+            if self._order.get(rec_id) == order and self._pins[rec_id] <= 0:
+                self._remove(rec_id)
+                pruned += 1
 
-        # Find prunable records: not in ancestor set and not alive
-        alive_str_ids = {str(fid) for fid in self._alive_fish_ids}
-        prunable_indices: list[int] = []
-
-        for i, rec in enumerate(self.lineage_log):
-            rec_id = rec["id"]
-            # Keep if: is alive OR is an ancestor of someone alive
-            if rec_id not in alive_str_ids and rec_id not in ancestors_to_keep:
-                prunable_indices.append(i)
-
-        # Calculate how many to prune
-        excess = len(self.lineage_log) - MAX_LINEAGE_LOG_SIZE
-        to_remove = prunable_indices[:excess]
-
-        if to_remove:
+        if pruned:
             logger.debug(
-                "Lineage: Pruning %d extinct lineage records (keeping %d ancestor records)",
-                len(to_remove),
-                len(ancestors_to_keep),
+                "Lineage: Pruned %d extinct lineage record(s) (%d records kept)",
+                pruned,
+                len(self._records),
             )
 
-        # Remove in reverse order to preserve indices
-        for i in reversed(to_remove):
-            self.lineage_log.pop(i)
-
-    def _fix_orphans_permanently(self) -> int:
-        """Fix orphaned records permanently in the lineage log.
-
-        Returns:
-            Number of orphans fixed
-        """
-        valid_ids: set[str] = {"root"}
-        for record in self.lineage_log:
-            rec_id = record.get("id")
-            if rec_id is not None:
-                valid_ids.add(str(rec_id))
-
-        orphan_count = 0
-
-        for record in self.lineage_log:
-            rec_id_raw = record.get("id")
-            if rec_id_raw is None:
+    def _fix_orphan(self, record: LineageRecord) -> bool:
+        """Remap a record whose parent is missing to root, warning once per id."""
+        parent_id = record["parent_id"]
+        if parent_id == "root" or parent_id in self._records:
+            return False
+
+        rec_id = record["id"]
+        if rec_id not in self._fixed_orphans:
+            logger.warning(
+                "Lineage: Orphaned record detected - id=%s parent_id=%s; remapping to root",
+                rec_id,
+                parent_id,
+            )
+            self._fixed_orphans.add(rec_id)
+        record["_original_parent_id"] = parent_id
+        record["parent_id"] = "root"
+        return True
+
+    def _load(self, records: list[LineageRecord]) -> None:
+        """Replace the log with ``records``, rebuilding every index."""
+        self._reset()
+        for raw in records:
+            if raw.get("id") is None:
                 continue
-            rec_id = str(rec_id_raw)
-
-            parent_id_raw = record.get("parent_id", "root")
-            parent_id = str(parent_id_raw) if parent_id_raw is not None else "root"
-
-            # If parent_id references a missing id and we haven't fixed this before
-            if parent_id not in valid_ids:
-                orphan_count += 1
-                if rec_id not in self._fixed_orphans:
-                    logger.warning(
-                        "Lineage: Orphaned record detected - id=%s parent_id=%s; remapping to root",
-                        rec_id,
-                        parent_id,
-                    )
-                    self._fixed_orphans.add(rec_id)
-
-                # Permanently fix in the actual record
-                record["_original_parent_id"] = parent_id
-                record["parent_id"] = "root"
-
-        return orphan_count
+            record = dict(raw)
+            record["id"] = str(record["id"])
+            parent_id = record.get("parent_id", "root")
+            record["parent_id"] = str(parent_id) if parent_id is not None else "root"
+            if record["id"] in self._records:
+                self._remove(record["id"])
+            self._insert(record)
+
+        orphan_count = sum(self._fix_orphan(record) for record in self._records.values())
+        if orphan_count > 0:
+            logger.info(
+                "Lineage: Fixed %d orphaned lineage record(s) by remapping parents to root",
+                orphan_count,
+            )
+        for rec_id, record in self._records.items():
+            if record["parent_id"] != "root":
+                self._children.setdefault(record["parent_id"], set()).add(rec_id)
+
+    def _reset(self) -> None:
+        self._records.clear()
+        self._children.clear()
+        self._pins.clear()
+        self._order.clear()
+        self._unpinned.clear()
+        self._alive_fish_ids = set()
+        self._fixed_orphans.clear()
+        self._changed.clear()
+        self._removed.clear()
+        self._views.clear()
+        self._epoch = uuid.uuid4().hex
+        self._full_since = self._version
+
+    def _view(self, rec_id: str) -> LineageRecord:
+        view = self._views.get(rec_id)
+        if view is None:
+            view = dict(self._records[rec_id])
+            try:
+                fish_numeric_id = int(rec_id)
+            except ValueError:
+                fish_numeric_id = -1
+            view["is_alive"] = fish_numeric_id in self._alive_fish_ids
+            self._views[rec_id] = view
+        return view
 
-    def get_lineage_data(self, alive_fish_ids: set[int] | None = None) -> list[dict[str, Any]]:
+    def get_lineage_data(self, alive_fish_ids: set[int] | None = None) -> list[LineageRecord]:
         """Get complete lineage data for phylogenetic tree visualization.
 
+        Records are shared between calls until they change, so callers must
+        treat them as read-only.
+
         Args:
             alive_fish_ids: Set of fish IDs that are currently alive
 
         Returns:
             List of lineage records with parent-child relationships and alive status
         """
-        if alive_fish_ids is None:
-            alive_fish_ids = self._alive_fish_ids
-        else:
-            # Update our internal tracking
-            self._alive_fish_ids = alive_fish_ids
-
-        # Fix any orphans permanently (modifies lineage_log in place)
-        orphan_count = self._fix_orphans_permanently()
-
-        if orphan_count > 0:
-            logger.info(
-                "Lineage: Fixed %d orphaned lineage record(s) by remapping parents to root",
-                orphan_count,
-            )
-
-        enriched_lineage: list[dict[str, Any]] = []
+        if alive_fish_ids is not None:
+            self.update_alive_fish(alive_fish_ids)
+        return [self._view(rec_id) for rec_id in self._records]
 
-        for record in self.lineage_log:
-            sanitized = dict(record)
-
-            # Determine alive status
-            try:
-                fish_numeric_id = int(sanitized["id"]) if sanitized.get("id") != "root" else -1
-            except (ValueError, TypeError, KeyError):
-                fish_numeric_id = -1
+    def get_lineage_delta(
+        self,
+        since_version: int = 0,
+        epoch: str | None = None,
+        alive_fish_ids: set[int] | None = None,
+    ) -> dict[str, Any]:
+        """Get the lineage records that changed after ``since_version``.
 
-            sanitized["is_alive"] = fish_numeric_id in alive_fish_ids
-            enriched_lineage.append(sanitized)
+        Args:
+            since_version: ``version`` from the client's previous response
+            epoch: ``epoch`` from the client's previous response (None for none)
+            alive_fish_ids: Set of fish IDs that are currently alive
 
-        return enriched_lineage
+        Returns:
+            Dict with the current ``epoch`` and ``version``; ``full`` (True
+            when ``records`` is the whole log, replacing whatever the client
+            holds); ``records``, the new or changed records in change order;
+            and ``removed``, the ids of pruned records
+        """
+        if alive_fish_ids is not None:
+            self.update_alive_fish(alive_fish_ids)
+
+        if (
+            epoch != self._epoch
+            or since_version < self._full_since
+            or since_version > self._version
+        ):
+            return {
+                "epoch": self._epoch,
+                "version": self._version,
+                "full": True,
+                "records": [self._view(rec_id) for rec_id in self._records],
+                "removed": [],
+            }
+
+        changed: list[str] = []
+        for rec_id, version in reversed(self._changed.items()):
+            if version <= since_version:
+                break
+            changed.append(rec_id)
+        removed: list[str] = []
+        for rec_id, version in reversed(self._removed.items()):
+            if version <= since_version:
+                break
+            removed.append(rec_id)
+
+        return {
+            "epoch": self._epoch,
+            "version": self._version,
+            "full": False,
+            "records": [self._view(rec_id) for rec_id in reversed(changed)],
+            "removed": removed[::-1],
+        }
 
     def clear(self) -> None:
         """Clear the lineage log."""
-        self.lineage_log.clear()
-        self._alive_fish_ids.clear()
-        self._fixed_orphans.clear()
+        self._reset()
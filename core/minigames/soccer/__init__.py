@@ -5,57 +5,66 @@ training policies that can transfer to the real RoboCup Soccer Simulator.
 
 Components:
 - RCSSLiteEngine: Core physics engine with RCSS-compatible stepping
+- BatchRCSSLiteEngine: Lockstep NumPy engine for many matches at once
 - SoccerMatch: Interactive match manager for frontend integration
 - SoccerMatchRunner: Training runner for evolution experiments
 - SoccerParticipant: Entity-agnostic participant protocol
 """
 
-from core.minigames.soccer.engine import RCSSCommand, RCSSLiteEngine, RCSSVector
-from core.minigames.soccer.evaluator import (
-    SelectionStrategy,
-    SoccerMatchSetup,
-    SoccerMinigameOutcome,
-    create_soccer_match,
-    create_soccer_match_from_participants,
-    derive_soccer_seed,
-    finalize_soccer_match,
-    run_soccer_minigame,
-    select_soccer_participants,
-)
-from core.minigames.soccer.fake_server import FakeRCSSServer
-from core.minigames.soccer.field_profiles import (
-    SoccerFieldGeometry,
-    get_field_profile,
-    rcss_standard_105x68,
-    tank_small_sided,
-)
-from core.minigames.soccer.league_runtime import SoccerLeagueRuntime
-from core.minigames.soccer.match import SoccerMatch
-from core.minigames.soccer.match_runner import AgentResult, EpisodeResult, SoccerMatchRunner
-from core.minigames.soccer.params import DEFAULT_RCSS_PARAMS, SOCCER_CANONICAL_PARAMS, RCSSParams
-from core.minigames.soccer.participant import (
-    SoccerParticipant,
-    create_participants_from_fish,
-    fish_to_participant,
-)
-from core.minigames.soccer.reconciliation import (
-    EntityCollectionResolver,
-    InMemoryReconciliationStore,
-    ReconciliationResult,
-    SoccerSettlement,
-    SourceIdentity,
-    SourceResolutionUnavailableError,
-    build_world_source_resolver,
-    reconcile_match,
-)
-from core.minigames.soccer.rewards import apply_soccer_entry_fees, apply_soccer_rewards
-from core.minigames.soccer.roster_snapshot import (
-    RosterSnapshot,
-    SoccerParticipantSnapshot,
-    SoccerRosterSnapshot,
-    snapshot_roster,
-)
-from core.minigames.soccer.scheduler import SoccerMinigameScheduler
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.minigames.soccer.batch_engine import BatchRCSSLiteEngine
+    from core.minigames.soccer.engine import RCSSCommand, RCSSLiteEngine, RCSSVector
+    from core.minigames.soccer.evaluator import (
+        SelectionStrategy,
+        SoccerMatchSetup,
+        SoccerMinigameOutcome,
+        create_soccer_match,
+        create_soccer_match_from_participants,
+        derive_soccer_seed,
+        finalize_soccer_match,
+        run_soccer_minigame,
+        select_soccer_participants,
+    )
+    from core.minigames.soccer.fake_server import FakeRCSSServer
+    from core.minigames.soccer.field_profiles import (
+        SoccerFieldGeometry,
+        get_field_profile,
+        rcss_standard_105x68,
+        tank_small_sided,
+    )
+    from core.minigames.soccer.league_runtime import SoccerLeagueRuntime
+    from core.minigames.soccer.match import SoccerMatch
+    from core.minigames.soccer.match_runner import AgentResult, EpisodeResult, SoccerMatchRunner
+    from core.minigames.soccer.params import (
+        DEFAULT_RCSS_PARAMS,
+        SOCCER_CANONICAL_PARAMS,
+        RCSSParams,
+    )
+    from core.minigames.soccer.participant import (
+        SoccerParticipant,
+        create_participants_from_fish,
+        fish_to_participant,
+    )
+    from core.minigames.soccer.reconciliation import (
+        EntityCollectionResolver,
+        InMemoryReconciliationStore,
+        ReconciliationResult,
+        SoccerSettlement,
+        SourceIdentity,
+        SourceResolutionUnavailableError,
+        build_world_source_resolver,
+        reconcile_match,
+    )
+    from core.minigames.soccer.rewards import apply_soccer_entry_fees, apply_soccer_rewards
+    from core.minigames.soccer.roster_snapshot import (
+        RosterSnapshot,
+        SoccerParticipantSnapshot,
+        SoccerRosterSnapshot,
+        snapshot_roster,
+    )
+    from core.minigames.soccer.scheduler import SoccerMinigameScheduler
 
 __all__ = [
     # Engine
@@ -63,6 +72,7 @@ __all__ = [
     "DEFAULT_RCSS_PARAMS",
     "SOCCER_CANONICAL_PARAMS",
     "RCSSLiteEngine",
+    "BatchRCSSLiteEngine",
     "RCSSCommand",
     "RCSSVector",
     "FakeRCSSServer",
@@ -106,3 +116,65 @@ __all__ = [
     "fish_to_participant",
     "create_participants_from_fish",
 ]
+
+# Exports are loaded on first access (PEP 562) so importing one soccer module,
+# e.g. core.minigames.soccer.fish_stats from the tank engine, does not load
+# the whole league/match/reconciliation stack.
+_lazy_imports = {
+    "AgentResult": "core.minigames.soccer.match_runner",
+    "BatchRCSSLiteEngine": "core.minigames.soccer.batch_engine",
+    "DEFAULT_RCSS_PARAMS": "core.minigames.soccer.params",
+    "EntityCollectionResolver": "core.minigames.soccer.reconciliation",
+    "EpisodeResult": "core.minigames.soccer.match_runner",
+    "FakeRCSSServer": "core.minigames.soccer.fake_server",
+    "InMemoryReconciliationStore": "core.minigames.soccer.reconciliation",
+    "RCSSCommand": "core.minigames.soccer.engine",
+    "RCSSLiteEngine": "core.minigames.soccer.engine",
+    "RCSSParams": "core.minigames.soccer.params",
+    "RCSSVector": "core.minigames.soccer.engine",
+    "ReconciliationResult": "core.minigames.soccer.reconciliation",
+    "RosterSnapshot": "core.minigames.soccer.roster_snapshot",
+    "SOCCER_CANONICAL_PARAMS": "core.minigames.soccer.params",
+    "SelectionStrategy": "core.minigames.soccer.evaluator",
+    "SoccerFieldGeometry": "core.minigames.soccer.field_profiles",
+    "SoccerLeagueRuntime": "core.minigames.soccer.league_runtime",
+    "SoccerMatch": "core.minigames.soccer.match",
+    "SoccerMatchRunner": "core.minigames.soccer.match_runner",
+    "SoccerMatchSetup": "core.minigames.soccer.evaluator",
+    "SoccerMinigameOutcome": "core.minigames.soccer.evaluator",
+    "SoccerMinigameScheduler": "core.minigames.soccer.scheduler",
+    "SoccerParticipant": "core.minigames.soccer.participant",
+    "SoccerParticipantSnapshot": "core.minigames.soccer.roster_snapshot",
+    "SoccerRosterSnapshot": "core.minigames.soccer.roster_snapshot",
+    "SoccerSettlement": "core.minigames.soccer.reconciliation",
+    "SourceIdentity": "core.minigames.soccer.reconciliation",
+    "SourceResolutionUnavailableError": "core.minigames.soccer.reconciliation",
+    "apply_soccer_entry_fees": "core.minigames.soccer.rewards",
+    "apply_soccer_rewards": "core.minigames.soccer.rewards",
+    "build_world_source_resolver": "core.minigames.soccer.reconciliation",
+    "create_participants_from_fish": "core.minigames.soccer.participant",
+    "create_soccer_match": "core.minigames.soccer.evaluator",
+    "create_soccer_match_from_participants": "core.minigames.soccer.evaluator",
+    "derive_soccer_seed": "core.minigames.soccer.evaluator",
+    "finalize_soccer_match": "core.minigames.soccer.evaluator",
+    "fish_to_participant": "core.minigames.soccer.participant",
+    "get_field_profile": "core.minigames.soccer.field_profiles",
+    "rcss_standard_105x68": "core.minigames.soccer.field_profiles",
+    "reconcile_match": "core.minigames.soccer.reconciliation",
+    "run_soccer_minigame": "core.minigames.soccer.evaluator",
+    "select_soccer_participants": "core.minigames.soccer.evaluator",
+    "snapshot_roster": "core.minigames.soccer.roster_snapshot",
+    "tank_small_sided": "core.minigames.soccer.field_profiles",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Lazy import handler for the package exports."""
+    if name in _lazy_imports:
+        import importlib
+
+        value = getattr(importlib.import_module(_lazy_imports[name]), name)
+        # Cache in module namespace for future access
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
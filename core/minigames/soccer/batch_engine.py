@@ -0,0 +1,499 @@
+"""Lockstep RCSS-Lite physics for many independent matches.
+
+``BatchRCSSLiteEngine`` steps N matches with the same roster one cycle at a
+time, holding players and balls as NumPy columns (one row per match) instead
+of ``RCSSPlayerState`` objects. Each cycle follows
+``RCSSLiteEngine.step_cycle`` operation for operation and returns the same
+``{"cycle", "events", "score"}`` dict per match.
+
+The order-dependent parts of the scalar engine stay ordered: simultaneous
+kicks are summed into the ball (and update touch tracking) in queue order,
+and collisions resolve pair by pair in roster order. Collisions only run for
+matches with an overlap at the start of the pass; without one, nothing
+changes. With ``params.noise_enabled``, each match has its own
+``random.Random``, drawn in the scalar engine's order by a per-match loop.
+
+With ``strict=True`` (the default) dash and kick directions use ``math.cos``
+and ``math.sin``, and trajectories are bit-identical to ``RCSSLiteEngine``
+with the same seed and commands. ``strict=False`` uses NumPy trigonometry,
+which may differ from libm in the last bit. Positions then stay within
+``FAST_MODE_TOLERANCE`` of the scalar engine, unless a difference that small
+flips a threshold (kickable range, collision, goal line).
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from core.deterministic_random import normal
+from core.minigames.soccer.engine import CommandType, RCSSCommand, RCSSVector
+from core.minigames.soccer.params import SOCCER_CANONICAL_PARAMS, RCSSParams
+
+# Command codes for queue_commands(); NO_COMMAND leaves a player idle
+NO_COMMAND = -1
+COMMAND_CODES: dict[CommandType, int] = {
+    CommandType.DASH: 0,
+    CommandType.TURN: 1,
+    CommandType.TURN_NECK: 2,
+    CommandType.KICK: 3,
+    CommandType.MOVE: 4,
+}
+_DASH, _TURN, _TURN_NECK, _KICK, _MOVE = range(5)
+
+# Max position difference from RCSSLiteEngine in non-strict mode
+FAST_MODE_TOLERANCE = 1e-9
+
+# Same constant as math.radians()
+_DEG = math.pi / 180.0
+_TWO_PI = 2 * math.pi
+_ASSIST_WINDOW = 50
+_KICK_OFF_MODES = ("before_kick_off", "kick_off_left", "kick_off_right")
+_SNAPSHOT_FIELDS = ("x", "y", "vx", "vy", "body_angle", "stamina")
+
+
+class BatchRCSSLiteEngine:
+    """RCSS-Lite engine stepping one match per seed in lockstep.
+
+    Example:
+        >>> batch = BatchRCSSLiteEngine(seeds=range(64))
+        >>> batch.add_player("left_1", "left", RCSSVector(-20, 0))
+        >>> batch.queue_command(0, "left_1", RCSSCommand.dash(100))
+        >>> results = batch.step_cycle()  # one dict per match
+    """
+
+    def __init__(
+        self,
+        seeds: Sequence[int | None],
+        params: RCSSParams | None = None,
+        strict: bool = True,
+    ):
+        """Initialize the batch.
+
+        Args:
+            seeds: One seed per match, as for ``RCSSLiteEngine`` (None means 0)
+            params: Physics parameters shared by every match
+            strict: Bit-identical to the scalar engine (see module docstring)
+        """
+        self.params = params or SOCCER_CANONICAL_PARAMS
+        self.strict = strict
+        self._rngs = [random.Random(seed if seed is not None else 0) for seed in seeds]
+        m = self.n_matches = len(self._rngs)
+        self._cycle = 0
+        self._player_ids: list[str] = []
+        self._column: dict[str, int] = {}
+        self._teams: list[str] = []
+
+        # Player columns, shape (matches, players)
+        empty = np.zeros((m, 0))
+        self._px, self._py = empty.copy(), empty.copy()
+        self._vx, self._vy = empty.copy(), empty.copy()
+        self._ax, self._ay = empty.copy(), empty.copy()
+        self._body, self._neck = empty.copy(), empty.copy()
+        self._stamina, self._recovery, self._effort = empty.copy(), empty.copy(), empty.copy()
+
+        # Ball, shape (matches,)
+        self._bx, self._by, self._bvx, self._bvy, self._bax, self._bay = np.zeros((6, m))
+
+        # Command queue: kind, power, direction and queue order per player
+        self._kind = np.full((m, 0), NO_COMMAND, dtype=np.int8)
+        self._power, self._direction = empty.copy(), empty.copy()
+        self._seq = np.zeros((m, 0), dtype=np.int64)
+        self._next_seq = 0
+
+        self._score = np.zeros((m, 2), dtype=np.int64)  # [left, right]
+        self._play_modes = ["before_kick_off"] * m
+        self._swapped = np.zeros(m, dtype=bool)
+        # Touch tracking as player columns (-1 = nobody)
+        touch = np.full((4, m), -1, dtype=np.int64)
+        self._last_touch, self._last_touch_cycle, self._prev_touch, self._prev_touch_cycle = touch
+
+    @property
+    def cycle(self) -> int:
+        """Current cycle number (shared by every match)."""
+        return self._cycle
+
+    @property
+    def player_ids(self) -> tuple[str, ...]:
+        """Player IDs in column order."""
+        return tuple(self._player_ids)
+
+    def add_player(
+        self,
+        player_id: str,
+        team: str,
+        position: RCSSVector | None = None,
+        body_angle: float = 0.0,
+    ) -> None:
+        """Add a player to every match, at the same position."""
+        if player_id in self._column:
+            raise ValueError(f"Player {player_id!r} already added")
+        pos = position or RCSSVector(0.0, 0.0)
+        self._column[player_id] = len(self._player_ids)
+        self._player_ids.append(player_id)
+        self._teams.append(team)
+
+        def column(array: np.ndarray, value: float) -> np.ndarray:
+            return np.concatenate([array, np.full((self.n_matches, 1), value, array.dtype)], axis=1)
+
+        self._px, self._py = column(self._px, pos.x), column(self._py, pos.y)
+        self._vx, self._vy = column(self._vx, 0.0), column(self._vy, 0.0)
+        self._ax, self._ay = column(self._ax, 0.0), column(self._ay, 0.0)
+        self._body, self._neck = column(self._body, body_angle), column(self._neck, 0.0)
+        self._stamina = column(self._stamina, self.params.stamina_max)
+        self._recovery, self._effort = column(self._recovery, 1.0), column(self._effort, 1.0)
+        self._kind = column(self._kind, NO_COMMAND)
+        self._power, self._direction = column(self._power, 0.0), column(self._direction, 0.0)
+        self._seq = column(self._seq, 0)
+
+    def set_ball_position(self, x: float, y: float, match: int | None = None) -> None:
+        """Place the ball at rest, in one match or (``match=None``) all of them."""
+        rows = slice(None) if match is None else match
+        self._bx[rows], self._by[rows] = x, y
+        for array in (self._bvx, self._bvy, self._bax, self._bay):
+            array[rows] = 0.0
+
+    def set_play_mode(self, mode: str, match: int | None = None) -> None:
+        """Set the play mode of one match or all of them."""
+        if mode not in _KICK_OFF_MODES:
+            raise ValueError(f"Invalid play mode: {mode!r}. Expected one of {_KICK_OFF_MODES}.")
+        for m in range(self.n_matches) if match is None else (match,):
+            self._play_modes[m] = mode
+
+    def set_swapped_sides(self, swapped: bool, match: int | None = None) -> None:
+        """Set whether teams have swapped sides (affects goal attribution)."""
+        self._swapped[slice(None) if match is None else match] = swapped
+
+    def queue_command(self, match: int, player_id: str, command: RCSSCommand) -> bool:
+        """Queue a command for a player in one match (last one per cycle wins)."""
+        p = self._column.get(player_id)
+        if p is None:
+            return False
+        if self._kind[match, p] == NO_COMMAND:
+            self._seq[match, p] = self._next_seq
+            self._next_seq += 1
+        self._kind[match, p] = COMMAND_CODES[command.cmd_type]
+        self._power[match, p] = command.power
+        self._direction[match, p] = command.direction
+        return True
+
+    def queue_commands(self, kinds: ArrayLike, powers: ArrayLike, directions: ArrayLike) -> None:
+        """Queue commands for every match at once.
+
+        Args:
+            kinds: ``(matches, players)`` codes from ``COMMAND_CODES``, or
+                ``NO_COMMAND`` to leave that player's queue as it is
+            powers: Dash/kick power, or move x (same shape)
+            directions: Dash/kick direction, turn moment, or move y
+        """
+        kinds = np.asarray(kinds, dtype=np.int8)
+        given = kinds != NO_COMMAND
+        # New entries queue after earlier ones, in column order
+        fresh = given & (self._kind == NO_COMMAND)
+        self._seq[fresh] = self._next_seq + np.nonzero(fresh)[1]
+        self._next_seq += len(self._player_ids)
+        self._kind[given] = kinds[given]
+        self._power[given] = np.asarray(powers, dtype=float)[given]
+        self._direction[given] = np.asarray(directions, dtype=float)[given]
+
+    def step_cycle(self) -> list[dict[str, object]]:
+        """Execute one cycle in every match; returns one result dict per match."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._apply_commands()
+            self._update_player_physics()
+            self._update_ball_physics()
+            self._handle_collisions()
+        events = self._check_goals()
+        self._cycle += 1
+        cycle = self._cycle
+        return [
+            {"cycle": cycle, "events": match_events, "score": {"left": left, "right": right}}
+            for match_events, (left, right) in zip(events, self._score.tolist(), strict=True)
+        ]
+
+    def _cos_sin(self, angles: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if not self.strict:
+            return np.cos(angles), np.sin(angles)
+        values = angles.tolist()
+        return np.array([math.cos(a) for a in values]), np.array([math.sin(a) for a in values])
+
+    def _apply_commands(self) -> None:
+        kind = self._kind
+        if not (kind != NO_COMMAND).any():
+            return
+        params = self.params
+        if (dash := kind == _DASH).any():
+            power = np.clip(self._power[dash], -100, 100)
+            stamina = self._stamina[dash]
+            cost = np.abs(power) * params.dash_consume_rate
+            short = stamina < cost
+            power = np.where(short & (cost > 0), power * (stamina / cost), power)
+            self._stamina[dash] = stamina - np.where(short, stamina, cost)
+            effective_power = power * self._effort[dash]
+            cos, sin = self._cos_sin(self._body[dash] + self._direction[dash] * _DEG)
+            accel_mag = effective_power * params.dash_power_rate
+            self._ax[dash], self._ay[dash] = cos * accel_mag, sin * accel_mag
+
+        if (turn := kind == _TURN).any():
+            moment = np.clip(self._direction[turn], params.min_moment, params.max_moment)
+            vx, vy = self._vx[turn], self._vy[turn]
+            speed = np.sqrt(vx * vx + vy * vy)
+            body = self._body[turn] + (moment / (1.0 + params.inertia_moment * speed)) * _DEG
+            while (over := body > math.pi).any():
+                body[over] -= _TWO_PI
+            while (under := body < -math.pi).any():
+                body[under] += _TWO_PI
+            self._body[turn] = body
+
+        if (neck := kind == _TURN_NECK).any():
+            moment = np.clip(self._direction[neck], params.min_moment, params.max_moment)
+            self._neck[neck] = np.clip(
+                self._neck[neck] + moment * _DEG,
+                math.radians(params.min_neck_angle),
+                math.radians(params.max_neck_angle),
+            )
+
+        if (kind == _KICK).any():
+            self._apply_kicks(kind == _KICK)
+
+        move = kind == _MOVE
+        if move.any():
+            move &= np.array([mode in _KICK_OFF_MODES for mode in self._play_modes])[:, None]
+            half_length, half_width = params.field_length / 2, params.field_width / 2
+            self._px[move] = np.clip(self._power[move], -half_length, half_length)
+            self._py[move] = np.clip(self._direction[move], -half_width, half_width)
+            for array in (self._vx, self._vy, self._ax, self._ay):
+                array[move] = 0.0
+
+        kind.fill(NO_COMMAND)
+        self._next_seq = 0
+
+    def _apply_kicks(self, kick: np.ndarray) -> None:
+        params = self.params
+        dx = self._px - self._bx[:, None]
+        dy = self._py - self._by[:, None]
+        kick &= ~(np.sqrt(dx * dx + dy * dy) > params.kickable_margin + params.player_size)
+        if not kick.any():
+            return
+        # Column order of each match's kickers, in queue order
+        order = np.argsort(np.where(kick, self._seq, np.iinfo(np.int64).max), axis=1)
+        kickers = kick.sum(axis=1)
+        angle = np.zeros_like(self._body)
+        angle[kick] = self._body[kick] + self._direction[kick] * _DEG
+        if params.noise_enabled:
+            for m in np.flatnonzero(kickers).tolist():
+                for p in order[m, : kickers[m]].tolist():
+                    angle[m, p] += normal(self._rngs[m], 0, params.kick_rand)
+        kick_accel = np.clip(self._power[kick], 0, 100) * params.kick_power_rate
+        cos, sin = self._cos_sin(angle[kick])
+        accel_x, accel_y = np.zeros_like(angle), np.zeros_like(angle)
+        accel_x[kick], accel_y[kick] = cos * kick_accel, sin * kick_accel
+
+        rows = np.arange(self.n_matches)
+        for rank in range(int(kickers.max())):
+            p = order[:, rank]
+            on = rank < kickers
+            self._bax[on] += accel_x[rows, p][on]
+            self._bay[on] += accel_y[rows, p][on]
+            last = self._last_touch
+            handover = on & (last >= 0) & (last != p)
+            self._prev_touch[handover] = last[handover]
+            self._prev_touch_cycle[handover] = self._last_touch_cycle[handover]
+            last[on] = p[on]
+            self._last_touch_cycle[on] = self._cycle
+
+    def _update_player_physics(self) -> None:
+        params = self.params
+        vx, vy = self._vx + self._ax, self._vy + self._ay
+        if params.noise_enabled:
+            self._add_velocity_noise(vx, vy)
+        mag = np.sqrt(vx * vx + vy * vy)
+        fast = mag > params.player_speed_max
+        scale = params.player_speed_max / mag
+        vx, vy = np.where(fast, vx * scale, vx), np.where(fast, vy * scale, vy)
+
+        half_length, half_width = params.field_length / 2, params.field_width / 2
+        self._px = np.clip(self._px + vx, -half_length, half_length)
+        self._py = np.clip(self._py + vy, -half_width, half_width)
+        self._vx, self._vy = vx * params.player_decay, vy * params.player_decay
+        self._ax.fill(0.0)
+        self._ay.fill(0.0)
+
+        stamina_max = params.stamina_max
+        low = self._stamina <= stamina_max * 0.25
+        if low.any():
+            self._recovery[low] = np.maximum(
+                params.recover_min, self._recovery[low] - params.recover_dec
+            )
+            self._effort[low] = np.maximum(params.effort_min, self._effort[low] - params.effort_dec)
+        self._stamina = np.minimum(
+            stamina_max, self._stamina + params.stamina_inc_max * self._recovery
+        )
+        tired = (self._stamina >= stamina_max * 0.6) & (self._effort < 1.0)
+        if tired.any():
+            self._effort[tired] = np.minimum(1.0, self._effort[tired] + params.effort_inc)
+
+    def _add_velocity_noise(self, vx: np.ndarray, vy: np.ndarray) -> None:
+        player_rand = self.params.player_rand
+        for m, rng in enumerate(self._rngs):
+            for p in range(len(self._player_ids)):
+                x, y = float(vx[m, p]), float(vy[m, p])
+                v_mag = math.sqrt(x * x + y * y)
+                if v_mag > 0.001:
+                    noise_range = v_mag * player_rand
+                    vx[m, p] = x + rng.uniform(-noise_range, noise_range)
+                    vy[m, p] = y + rng.uniform(-noise_range, noise_range)
+
+    def _update_ball_physics(self) -> None:
+        params = self.params
+        vx, vy = self._bvx + self._bax, self._bvy + self._bay
+        mag = np.sqrt(vx * vx + vy * vy)
+        fast = mag > params.ball_speed_max
+        scale = params.ball_speed_max / mag
+        vx, vy = np.where(fast, vx * scale, vx), np.where(fast, vy * scale, vy)
+        self._bx, self._by = self._bx + vx, self._by + vy
+        self._bvx, self._bvy = vx * params.ball_decay, vy * params.ball_decay
+        self._bax.fill(0.0)
+        self._bay.fill(0.0)
+
+        half_length, half_width = params.field_length / 2, params.field_width / 2
+        outside_goal = ~(np.abs(self._by) < params.goal_width / 2)
+        low, high = outside_goal & (self._bx < -half_length), outside_goal & (
+            self._bx > half_length
+        )
+        self._bx[low], self._bx[high] = -half_length, half_length
+        self._bvx[low | high] *= -0.8
+        low, high = self._by < -half_width, self._by > half_width
+        self._by[low], self._by[high] = -half_width, half_width
+        self._bvy[low | high] *= -0.8
+
+    def _handle_collisions(self) -> None:
+        params = self.params
+        n = len(self._player_ids)
+        min_dist = params.player_size * 2
+        if n > 1:
+            i, j = np.triu_indices(n, k=1)
+            dx = self._px[:, j] - self._px[:, i]
+            dy = self._py[:, j] - self._py[:, i]
+            dist = np.sqrt(dx * dx + dy * dy)
+            rows = np.flatnonzero(((dist < min_dist) & (dist > 0)).any(axis=1))
+            if rows.size:
+                self._separate_players(rows, min_dist)
+
+        min_dist = params.player_size + params.ball_size
+        dx = self._bx[:, None] - self._px
+        dy = self._by[:, None] - self._py
+        dist = np.sqrt(dx * dx + dy * dy)
+        rows = np.flatnonzero(((dist < min_dist) & (dist > 0)).any(axis=1))
+        if rows.size:
+            px, py = self._px[rows], self._py[rows]
+            bx, by = self._bx[rows], self._by[rows]
+            for p in range(n):
+                dx, dy = bx - px[:, p], by - py[:, p]
+                dist = np.sqrt(dx * dx + dy * dy)
+                hit = (dist < min_dist) & (dist > 0)
+                if hit.any():
+                    overlap = min_dist - dist
+                    bx = np.where(hit, bx + dx / dist * overlap, bx)
+                    by = np.where(hit, by + dy / dist * overlap, by)
+            self._bx[rows], self._by[rows] = bx, by
+
+    def _separate_players(self, rows: np.ndarray, min_dist: float) -> None:
+        """Resolve player overlaps pair by pair, as the scalar engine does."""
+        px, py = self._px[rows], self._py[rows]
+        vx, vy = self._vx[rows], self._vy[rows]
+        n = len(self._player_ids)
+        for a in range(n):
+            for b in range(a + 1, n):
+                dx, dy = px[:, b] - px[:, a], py[:, b] - py[:, a]
+                dist = np.sqrt(dx * dx + dy * dy)
+                hit = (dist < min_dist) & (dist > 0)
+                if not hit.any():
+                    continue
+                overlap = min_dist - dist
+                nx, ny = dx / dist, dy / dist
+                px[hit, a] -= (nx * overlap / 2)[hit]
+                py[hit, a] -= (ny * overlap / 2)[hit]
+                px[hit, b] += (nx * overlap / 2)[hit]
+                py[hit, b] += (ny * overlap / 2)[hit]
+                for c in (a, b):
+                    vx[hit, c] *= 0.1
+                    vy[hit, c] *= 0.1
+        self._px[rows], self._py[rows] = px, py
+        self._vx[rows], self._vy[rows] = vx, vy
+
+    def _check_goals(self) -> list[list[dict[str, object]]]:
+        events: list[list[dict[str, object]]] = [[] for _ in range(self.n_matches)]
+        params = self.params
+        half_length = params.field_length / 2
+        in_mouth = ~(np.abs(self._by) > params.goal_width / 2)
+        right_scores = in_mouth & (self._bx < -half_length - params.ball_size)
+        left_scores = in_mouth & (self._bx > half_length + params.ball_size)
+        for m in np.flatnonzero(right_scores | left_scores).tolist():
+            team = "right" if right_scores[m] else "left"
+            if self._swapped[m]:
+                team = "left" if team == "right" else "right"
+            events[m].append(
+                {"type": "goal", "team": team, "cycle": self._cycle, **self._credit(m)}
+            )
+            self._score[m, 0 if team == "left" else 1] += 1
+            self.set_ball_position(0.0, 0.0, match=m)
+            self._play_modes[m] = f"kick_off_{'right' if team == 'left' else 'left'}"
+            self._last_touch[m] = self._last_touch_cycle[m] = -1
+            self._prev_touch[m] = self._prev_touch_cycle[m] = -1
+        return events
+
+    def _credit(self, match: int) -> dict[str, str | None]:
+        scorer, prev = int(self._last_touch[match]), int(self._prev_touch[match])
+        assist = None
+        if (
+            scorer >= 0
+            and prev >= 0
+            and prev != scorer
+            and self._prev_touch_cycle[match] >= 0
+            and self._last_touch_cycle[match] - self._prev_touch_cycle[match] <= _ASSIST_WINDOW
+            and self._teams[scorer] == self._teams[prev]
+        ):
+            assist = self._player_ids[prev]
+        return {
+            "scorer_id": self._player_ids[scorer] if scorer >= 0 else None,
+            "assist_id": assist,
+        }
+
+    def score(self, match: int) -> dict[str, int]:
+        """Current score of one match."""
+        left, right = self._score[match].tolist()
+        return {"left": left, "right": right}
+
+    def play_mode(self, match: int) -> str:
+        return self._play_modes[match]
+
+    def last_touch_info(self, match: int) -> dict[str, object]:
+        """Last-touch tracking of one match, as ``RCSSLiteEngine.last_touch_info``."""
+        last, prev = int(self._last_touch[match]), int(self._prev_touch[match])
+        return {
+            "player_id": self._player_ids[last] if last >= 0 else None,
+            "cycle": int(self._last_touch_cycle[match]),
+            "prev_player_id": self._player_ids[prev] if prev >= 0 else None,
+            "prev_cycle": int(self._prev_touch_cycle[match]),
+        }
+
+    def get_snapshot(self, match: int) -> dict[str, object]:
+        """Snapshot of one match, shaped like ``RCSSLiteEngine.get_snapshot``."""
+        columns = (self._px, self._py, self._vx, self._vy, self._body, self._stamina)
+        rows = zip(*(column[match].tolist() for column in columns), strict=True)
+        ball = [float(array[match]) for array in (self._bx, self._by, self._bvx, self._bvy)]
+        return {
+            "cycle": self._cycle,
+            "ball": dict(zip(("x", "y", "vx", "vy"), ball, strict=True)),
+            "players": [
+                {"id": player_id, "team": team, **dict(zip(_SNAPSHOT_FIELDS, row, strict=True))}
+                for player_id, team, row in zip(self._player_ids, self._teams, rows, strict=True)
+            ],
+            "score": self.score(match),
+            "play_mode": self._play_modes[match],
+        }
@@ -21,6 +21,7 @@ from typing import TYPE_CHECKING, Protocol
 from core.code_pool import BUILTIN_FLEE_FROM_THREAT_ID
 from core.movement.ball_pursuit import BallPursuitConsideration
 from core.movement.intents import MovementArbitration, MovementIntent, Velocity
+from core.movement.perception import perception_pass
 from core.simulation.profiler import is_profiling
 
 if TYPE_CHECKING:
@@ -164,7 +165,16 @@ class MovementArbiter:
         return self._considerations
 
     def arbitrate(self, strategy: AlgorithmicMovement, fish: Fish) -> MovementArbitration:
-        """Select an intent without evaluating lower-priority drives unnecessarily."""
+        """Select an intent without evaluating lower-priority drives unnecessarily.
+
+        All drives share one perception record for the fish (see
+        core.movement.perception), so a query asked by several drives hits the
+        spatial grid once.
+        """
+        with perception_pass(fish):
+            return self._arbitrate(strategy, fish)
+
+    def _arbitrate(self, strategy: AlgorithmicMovement, fish: Fish) -> MovementArbitration:
         engine = getattr(fish.environment, "engine", None)
         if is_profiling(engine) and engine is not None:
             import time
@@ -0,0 +1,89 @@
+"""Per-fish perception records for one movement decision pass.
+
+During a single ``MovementArbiter.arbitrate`` call several drives ask the
+world the same questions about the same fish: ball pursuit and the code
+policy both check ``has_survival_priority`` (nearest crab, nearest food), the
+graph adapter and the composable behavior both score food candidates and look
+for the nearest threat. Nothing moves while one fish decides, so every repeat
+returns what the first query returned.
+
+``perception_pass`` opens a :class:`FishPerception` record for the deciding
+fish; :func:`perceive` answers a keyed query from that record, running the
+query only the first time. Outside a pass (inspectors, tests, the foraging
+gym's stand-in fish) ``perceive`` simply runs the query, so callers behave
+exactly as before.
+
+Why per fish rather than one batch for the whole population: fish decide
+sequentially inside ENTITY_ACT and each one moves before it decides, so a
+fish deciding later sees earlier fish at their new positions. A population
+pass computed up front would see stale positions and change decisions.
+
+Records are never shared across frames or fish, and queries consume no RNG,
+so decision outputs are identical with or without the record.
+
+The gain is small. With ``scripts/benchmark_perception_records.py`` (seed 42,
+about 240 fish), records cut spatial-grid queries from 1371 to 1231 per frame
+and profiled perception time by 1-2 ms (5-9%). Whole-frame time moves by less
+than run-to-run noise. This module removes repeated queries; it is not a
+frame-rate optimization.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar, cast
+
+T = TypeVar("T")
+
+__all__ = ["FishPerception", "perceive", "perception_pass"]
+
+
+class FishPerception:
+    """Memoized world queries for one fish during one decision pass.
+
+    Keys name the query (``"nearest_food"``, ``("nearby_fish", radius)``...).
+    Values are shared between callers, so treat returned lists as read-only.
+    """
+
+    __slots__ = ("_values", "fish")
+
+    def __init__(self, fish: object) -> None:
+        self.fish = fish
+        self._values: dict[Hashable, object] = {}
+
+    def lookup(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the value recorded under ``key``, computing it on first use."""
+        values = self._values
+        if key in values:
+            return cast(T, values[key])
+        value = compute()
+        values[key] = value
+        return value
+
+
+_ACTIVE: ContextVar[FishPerception | None] = ContextVar("fish_perception", default=None)
+
+
+@contextmanager
+def perception_pass(fish: object) -> Iterator[FishPerception]:
+    """Open (or re-enter) the perception record for ``fish``'s decision."""
+    active = _ACTIVE.get()
+    if active is not None and active.fish is fish:
+        yield active
+        return
+    record = FishPerception(fish)
+    token = _ACTIVE.set(record)
+    try:
+        yield record
+    finally:
+        _ACTIVE.reset(token)
+
+
+def perceive(fish: object, key: Hashable, compute: Callable[[], T]) -> T:
+    """Answer ``key`` for ``fish`` from its open record, or run ``compute``."""
+    active = _ACTIVE.get()
+    if active is None or active.fish is not fish:
+        return compute()
+    return active.lookup(key, compute)
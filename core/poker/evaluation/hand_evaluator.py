@@ -5,11 +5,13 @@ This module provides hand evaluation logic for determining the best 5-card
 poker hand from hole cards and community cards.
 """
 
+from collections.abc import Sequence
 from functools import lru_cache
 from itertools import combinations
 
 from core.poker.core.cards import Card, get_card
 from core.poker.core.hand import HandRank, PokerHand
+from core.poker.evaluation.rank_tables import HandClass, best_class_index, get_rank_tables
 
 # Pre-computed rank names for fast lookup (index 0-14, only 2-14 valid)
 _RANK_NAMES = (
@@ -188,37 +190,46 @@ def _evaluate_five_cards(cards: list[Card]) -> PokerHand:
     )
 
 
-@lru_cache(maxsize=4096)
-def _evaluate_five_cards_cached(five_cards_key: tuple[int, int, int, int, int]) -> PokerHand:
-    """Cached hand evaluation using compact int keys.
+def _hand_from_class(
+    hand_class: HandClass, sorted_cards: list[tuple[int, int]], flush_suit: int
+) -> PokerHand:
+    """Build the PokerHand for a table class, picking its cards from ``sorted_cards``.
 
-    `five_cards_key` is a tuple of 5 integers encoding (rank << 2) | suit,
-    sorted by rank descending. Evaluates directly from integers to avoid
-    Enum construction overhead in the hot path.
+    Takes the first cards (in ``sorted_cards`` order) that supply the class's
+    ranks, which is the same 5-card combination the combination-by-combination
+    evaluator settled on.
     """
-    # Extract ranks and suits directly (no Enum construction)
-    ranks = [(k >> 2) for k in five_cards_key]
-    suits = [(k & 3) for k in five_cards_key]
-
-    hand_type, rank_value, description, primary_ranks, kickers = _evaluate_five_cards_core(
-        ranks, suits
-    )
-    cards = [get_card(r, s) for r, s in zip(ranks, suits, strict=False)]
+    if len(sorted_cards) == 5:
+        cards = [get_card(r, s) for r, s in sorted_cards]
+    else:
+        need = list(hand_class.rank_counts)
+        cards = []
+        for r, s in sorted_cards:
+            if need[r] and (flush_suit < 0 or s == flush_suit):
+                need[r] -= 1
+                cards.append(get_card(r, s))
     return PokerHand(
-        hand_type=hand_type,
-        rank_value=rank_value,
-        description=description,
+        hand_type=hand_class.hand_type,
+        rank_value=hand_class.rank_value,
+        description=hand_class.description,
         cards=cards,
-        primary_ranks=primary_ranks,
-        kickers=kickers,
+        primary_ranks=list(hand_class.primary_ranks),
+        kickers=list(hand_class.kickers),
     )
 
 
+def _evaluate_sorted_cards(sorted_cards: list[tuple[int, int]]) -> PokerHand:
+    """Evaluate 5-7 rank-sorted ``(rank, suit)`` cards with the rank tables."""
+    tables = get_rank_tables()
+    index, flush_suit = best_class_index(sorted_cards, tables)
+    return _hand_from_class(tables.classes[index], sorted_cards, flush_suit)
+
+
 def _make_pokerhand_from_ints(
     hand_type: str,
     rank_value: HandRank,
     description: str,
-    card_ints: list[tuple[int, int]],
+    card_ints: Sequence[tuple[int, int]],
     primary_ranks: list[int],
     kickers: list[int],
 ) -> PokerHand:
@@ -249,10 +260,9 @@ def evaluate_hand(hole_cards: list[Card], community_cards: list[Card]) -> PokerH
         PokerHand with rank, description, and kickers
     """
     # Implementation notes:
-    # - Each 5-card combination is sorted once and passed to a cached
-    #   evaluator (`_evaluate_five_cards_cached`) to avoid repeated work.
-    # - The cache key is the tuple of Card objects; Card instances are
-    #   expected to be stable/immutable during evaluations.
+    # - 5-7 card hands are scored with one lookup in the precomputed rank
+    #   tables (core.poker.evaluation.rank_tables) instead of enumerating
+    #   the 5-card combinations.
     # Combine all available cards
     all_cards = hole_cards + community_cards
     n_cards = len(all_cards)
@@ -281,9 +291,9 @@ def evaluate_hand_cached(hole_key: tuple[int, ...], community_key: tuple[int, ..
     """Cached evaluate_hand that uses compact int keys for input cards.
 
     This function reconstructs minimal int lists for ranks and suits and
-    reuses `_evaluate_five_cards_cached` for 5-card evaluation. Final
-    returned `PokerHand.cards` are constructed as real `Card` objects to
-    preserve downstream expectations.
+    scores 5-7 cards with the precomputed rank tables. Final returned
+    `PokerHand.cards` are constructed as real `Card` objects to preserve
+    downstream expectations.
     """
     # Reconstruct lists of (rank,suit) ints
     hole_cards = [((k >> 2), (k & 3)) for k in hole_key]
@@ -317,18 +327,35 @@ def evaluate_hand_cached(hole_key: tuple[int, ...], community_key: tuple[int, ..
             [r for r, s in card_ints[1:5]],
         )
 
-    # For exactly 5 cards, directly evaluate using cached five-card evaluator
+    # For exactly 5 cards the hand is the cards themselves, ordered by
+    # (rank, suit) descending
     if n_cards == 5:
-        # Create compact keys tuple sorted by rank descending
-        five_sorted = tuple(sorted([r << 2 | s for r, s in all_cards_int], reverse=True))
-        return _evaluate_five_cards_cached(five_sorted)
+        return _evaluate_sorted_cards(sorted(all_cards_int, reverse=True))
 
-    # For 6-7 cards, evaluate all 5-card combinations using cached evaluator
     all_sorted = sorted(all_cards_int, key=lambda x: x[0], reverse=True)
+    if n_cards <= 7:
+        return _evaluate_sorted_cards(all_sorted)
+
+    # Beyond the tables' 7 cards, fall back to checking every 5-card combination
+    return _best_of_combinations(all_sorted)
+
+
+def _best_of_combinations(sorted_cards: list[tuple[int, int]]) -> PokerHand:
+    """Best hand over every 5-card combination of rank-sorted ``(rank, suit)`` cards.
+
+    The table-free reference evaluator: the first combination (in
+    ``itertools.combinations`` order) with the best rank and kickers wins.
+    """
     best_hand = None
-    for five in combinations(all_sorted, 5):
-        key = tuple(((r << 2) | s) for r, s in five)
-        hand = _evaluate_five_cards_cached(key)
+    for five in combinations(sorted_cards, 5):
+        ranks = [r for r, _ in five]
+        suits = [s for _, s in five]
+        hand_type, rank_value, description, primary_ranks, kickers = _evaluate_five_cards_core(
+            ranks, suits
+        )
+        hand = _make_pokerhand_from_ints(
+            hand_type, rank_value, description, list(five), primary_ranks, kickers
+        )
         if best_hand is None or hand.beats(best_hand):
             best_hand = hand
     assert best_hand is not None
@@ -0,0 +1,313 @@
+"""Precomputed hand-class tables for O(1) 5-7 card hand evaluation.
+
+Every 5-card poker hand falls into one of 7462 *hand classes* (its
+``HandRank`` plus primary ranks and kickers). The best class of a 5-7 card
+hand depends only on:
+
+- the multiset of its ranks, when no suit has 5+ cards; and
+- the rank bitmask of the flush suit, when one does.
+
+``RankTables`` maps both keys straight to a class index. Rank multisets are
+keyed by summing per-rank constants chosen so that every multiset of ``n``
+cards (``n`` <= 7, at most four of a rank) has a unique sum; one dict per
+card count avoids cross-size collisions. Class indices are assigned in
+strength order, so ``max()`` of the rank and flush lookups is the best hand.
+
+Tables are built once per process on first use (see ``get_rank_tables``).
+``save_rank_tables``/``load_rank_tables`` persist them to a compact binary
+file that is memory-mapped on load, for processes that would rather skip
+the build.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+from itertools import combinations, combinations_with_replacement
+from pathlib import Path
+
+from core.poker.core.hand import HandRank
+
+# Per-rank additive keys (index = rank, 2-14); sums are unique per multiset
+# of up to 7 ranks with at most 4 copies of any rank.
+RANK_KEYS = (0, 0, 0, 1, 5, 22, 98, 453, 2031, 8698, 22854, 83661, 262349, 636345, 1479181)
+
+# Card counts the tables cover
+TABLE_SIZES = (5, 6, 7)
+
+_FILE_MAGIC = b"TANKPKR1"
+
+
+@dataclass(frozen=True)
+class HandClass:
+    """One of the 7462 distinct 5-card hand outcomes."""
+
+    hand_type: str
+    rank_value: HandRank
+    description: str
+    primary_ranks: tuple[int, ...]
+    kickers: tuple[int, ...]
+    # The five ranks making up the hand (descending) and whether they are suited
+    ranks: tuple[int, ...]
+    flush: bool
+    # Copies needed per rank index 0-14, used to pick the hand's cards
+    rank_counts: tuple[int, ...]
+
+
+@dataclass
+class RankTables:
+    """Class list plus the rank-multiset and flush-mask lookup tables."""
+
+    classes: list[HandClass]
+    # card count -> {sum of RANK_KEYS: class index}
+    rank_tables: dict[int, dict[int, int]]
+    # flush-suit rank bitmask (bit r set for rank r) -> class index; -1 if < 5 bits
+    flush_table: list[int]
+
+
+# (high card, rank bitmask) for every straight, best first; 5 is the wheel
+_STRAIGHT_MASKS = [(high, 0b11111 << (high - 4)) for high in range(14, 5, -1)]
+_STRAIGHT_MASKS.append((5, (1 << 14) | 0b111100))
+
+
+def _straight_high(rank_mask: int) -> int:
+    """Highest straight in a rank bitmask (5 for a wheel), else 0."""
+    for high, bits in _STRAIGHT_MASKS:
+        if rank_mask & bits == bits:
+            return high
+    return 0
+
+
+def _straight_ranks(high: int) -> tuple[int, ...]:
+    if high == 5:
+        return (14, 5, 4, 3, 2)
+    return tuple(range(high, high - 5, -1))
+
+
+def best_five_ranks(counts: list[int]) -> tuple[int, ...]:
+    """Ranks (descending) of the best non-flush hand given per-rank card counts."""
+    present = [r for r in range(14, 1, -1) if counts[r]]
+    quads = [r for r in present if counts[r] == 4]
+    trips = [r for r in present if counts[r] == 3]
+    pairs = [r for r in present if counts[r] == 2]
+
+    if quads:
+        kicker = next(r for r in present if r != quads[0])
+        return (quads[0],) * 4 + (kicker,)
+    if trips and (len(trips) > 1 or pairs):
+        pair = max(trips[1:] + pairs)
+        return (trips[0],) * 3 + (pair,) * 2
+    rank_mask = 0
+    for r in present:
+        rank_mask |= 1 << r
+    high = _straight_high(rank_mask)
+    if high:
+        return _straight_ranks(high)
+    if trips:
+        kickers = [r for r in present if r != trips[0]][:2]
+        return (trips[0],) * 3 + tuple(kickers)
+    if len(pairs) >= 2:
+        kicker = next(r for r in present if r not in pairs[:2])
+        return (pairs[0],) * 2 + (pairs[1],) * 2 + (kicker,)
+    if pairs:
+        kickers = [r for r in present if r != pairs[0]][:3]
+        return (pairs[0],) * 2 + tuple(kickers)
+    return tuple(present[:5])
+
+
+def best_flush_ranks(rank_mask: int) -> tuple[int, ...]:
+    """Ranks (descending) of the best hand among 5+ suited ranks given as a bitmask."""
+    high = _straight_high(rank_mask)
+    if high:
+        return _straight_ranks(high)
+    return tuple(r for r in range(14, 1, -1) if rank_mask >> r & 1)[:5]
+
+
+def _rank_count_vectors(n: int) -> Iterator[tuple[list[int], int]]:
+    """Yield (per-rank counts, rank key) for every multiset of ``n`` ranks, max 4 each."""
+    for multiset in combinations_with_replacement(range(14, 1, -1), n):
+        # Sorted, so five of a rank would make an element equal its 4th successor
+        if any(multiset[i] == multiset[i + 4] for i in range(n - 4)):
+            continue
+        counts = [0] * 15
+        key = 0
+        for r in multiset:
+            counts[r] += 1
+            key += RANK_KEYS[r]
+        yield counts, key
+
+
+def _make_class(ranks: tuple[int, ...], flush: bool) -> HandClass:
+    from core.poker.evaluation.hand_evaluator import _evaluate_five_cards_core
+
+    ordered = sorted(ranks, reverse=True)
+    suits = [0] * 5 if flush else [0, 0, 0, 0, 1]
+    hand_type, rank_value, description, primary, kickers = _evaluate_five_cards_core(ordered, suits)
+    counts = [0] * 15
+    for r in ranks:
+        counts[r] += 1
+    return HandClass(
+        hand_type=hand_type,
+        rank_value=rank_value,
+        description=description,
+        primary_ranks=tuple(primary),
+        kickers=tuple(kickers),
+        ranks=tuple(ordered),
+        flush=flush,
+        rank_counts=tuple(counts),
+    )
+
+
+def _strength(hand_class: HandClass) -> tuple[int, tuple[int, ...], tuple[int, ...]]:
+    # Same ordering PokerHand.beats() uses
+    return (int(hand_class.rank_value), hand_class.primary_ranks, hand_class.kickers)
+
+
+def _assemble(
+    classes_by_key: dict[tuple[tuple[int, ...], bool], HandClass],
+    rank_entries: dict[int, dict[int, tuple[tuple[int, ...], bool]]],
+    flush_entries: dict[int, tuple[tuple[int, ...], bool]],
+) -> RankTables:
+    """Number classes in strength order and resolve table entries to indices."""
+    ordered_keys = sorted(classes_by_key, key=lambda k: _strength(classes_by_key[k]))
+    index_of = {key: i for i, key in enumerate(ordered_keys)}
+    flush_table = [-1] * (1 << 15)
+    for mask, key in flush_entries.items():
+        flush_table[mask] = index_of[key]
+    return RankTables(
+        classes=[classes_by_key[key] for key in ordered_keys],
+        rank_tables={
+            n: {rank_key: index_of[key] for rank_key, key in entries.items()}
+            for n, entries in rank_entries.items()
+        },
+        flush_table=flush_table,
+    )
+
+
+def build_rank_tables() -> RankTables:
+    """Enumerate every rank multiset and flush mask for 5-7 cards."""
+    classes: dict[tuple[tuple[int, ...], bool], HandClass] = {}
+    rank_entries: dict[int, dict[int, tuple[tuple[int, ...], bool]]] = {}
+    flush_entries: dict[int, tuple[tuple[int, ...], bool]] = {}
+
+    def class_key(ranks: tuple[int, ...], flush: bool) -> tuple[tuple[int, ...], bool]:
+        key = (ranks, flush)
+        if key not in classes:
+            classes[key] = _make_class(ranks, flush)
+        return key
+
+    for n in TABLE_SIZES:
+        entries: dict[int, tuple[tuple[int, ...], bool]] = {}
+        for counts, rank_key in _rank_count_vectors(n):
+            if rank_key in entries:
+                raise AssertionError(f"RANK_KEYS collide for {n}-card counts {counts}")
+            entries[rank_key] = class_key(best_five_ranks(counts), False)
+        rank_entries[n] = entries
+
+        for suited in combinations(range(2, 15), n):
+            mask = 0
+            for r in suited:
+                mask |= 1 << r
+            flush_entries[mask] = class_key(best_flush_ranks(mask), True)
+
+    return _assemble(classes, rank_entries, flush_entries)
+
+
+_TABLES: RankTables | None = None
+
+
+def get_rank_tables() -> RankTables:
+    """Process-wide tables, built on first use."""
+    global _TABLES
+    if _TABLES is None:
+        _TABLES = build_rank_tables()
+    return _TABLES
+
+
+def set_rank_tables(tables: RankTables) -> None:
+    """Install tables (e.g. from ``load_rank_tables``) as the process-wide set."""
+    global _TABLES
+    _TABLES = tables
+
+
+def save_rank_tables(tables: RankTables, path: str | Path) -> None:
+    """Write tables to ``path`` as a compact binary file."""
+    class_bytes = array("B")
+    for hand_class in tables.classes:
+        class_bytes.extend(hand_class.ranks)
+        class_bytes.append(1 if hand_class.flush else 0)
+    flush = [(mask, index) for mask, index in enumerate(tables.flush_table) if index >= 0]
+
+    with open(path, "wb") as f:
+        f.write(_FILE_MAGIC)
+        f.write(struct.pack("<II", len(tables.classes), len(flush)))
+        f.write(struct.pack("<III", *(len(tables.rank_tables[n]) for n in TABLE_SIZES)))
+        f.write(class_bytes.tobytes())
+        f.write(array("I", [mask for mask, _ in flush]).tobytes())
+        f.write(array("H", [index for _, index in flush]).tobytes())
+        for n in TABLE_SIZES:
+            table = tables.rank_tables[n]
+            f.write(array("I", table.keys()).tobytes())
+            f.write(array("H", table.values()).tobytes())
+
+
+def load_rank_tables(path: str | Path) -> RankTables:
+    """Memory-map a file written by ``save_rank_tables`` and rebuild the tables."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            if bytes(view[:8]) != _FILE_MAGIC:
+                raise ValueError(f"{path} is not a poker rank table file")
+            n_classes, n_flush = struct.unpack_from("<II", view, 8)
+            sizes = struct.unpack_from("<III", view, 16)
+            offset = 28
+
+            def take(fmt: str, count: int) -> list[int]:
+                nonlocal offset
+                values = array(fmt)
+                end = offset + count * values.itemsize
+                values.frombytes(view[offset:end])
+                offset = end
+                return values.tolist()
+
+            raw_classes = take("B", n_classes * 6)
+            flush_masks = take("I", n_flush)
+            flush_indices = take("H", n_flush)
+            rank_tables = {}
+            for n, size in zip(TABLE_SIZES, sizes, strict=True):
+                keys = take("I", size)
+                rank_tables[n] = dict(zip(keys, take("H", size), strict=True))
+        finally:
+            view.release()
+
+    classes = [
+        _make_class(tuple(raw_classes[i : i + 5]), bool(raw_classes[i + 5]))
+        for i in range(0, len(raw_classes), 6)
+    ]
+    flush_table = [-1] * (1 << 15)
+    for mask, index in zip(flush_masks, flush_indices, strict=True):
+        flush_table[mask] = index
+    return RankTables(classes=classes, rank_tables=rank_tables, flush_table=flush_table)
+
+
+def best_class_index(cards: list[tuple[int, int]], tables: RankTables) -> tuple[int, int]:
+    """Best class index for 5-7 ``(rank, suit)`` cards, and the flush suit used (-1 if none)."""
+    rank_key = 0
+    suit_counts = [0, 0, 0, 0]
+    for rank, suit in cards:
+        rank_key += RANK_KEYS[rank]
+        suit_counts[suit] += 1
+    best = tables.rank_tables[len(cards)][rank_key]
+    for suit in range(4):
+        if suit_counts[suit] >= 5:
+            mask = 0
+            for rank, card_suit in cards:
+                if card_suit == suit:
+                    mask |= 1 << rank
+            flush_index = tables.flush_table[mask]
+            if flush_index > best:
+                return flush_index, suit
+    return best, -1
@@ -5,6 +5,7 @@ encodes selections from multiple sub-behavior categories plus continuous paramet
 """
 
 from core.poker.strategy.composable.cfr_inheritance import CFRInheritance, CFRInheritanceMode
+from core.poker.strategy.composable.cfr_tables import CFRTables
 from core.poker.strategy.composable.codec import PokerStrategyCodec
 from core.poker.strategy.composable.definitions import (
     CFR_ACTIONS,
@@ -38,6 +39,7 @@ __all__ = [
     "BluffingApproach",
     "CFRInheritance",
     "CFRInheritanceMode",
+    "CFRTables",
     "ComposablePokerStrategy",
     "HandSelection",
     "PokerStrategyCodec",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import random
+from collections.abc import Mapping
 from typing import Protocol
 
 from core.poker.betting.actions import BettingAction
@@ -16,7 +17,9 @@ class CfrDecisionStrategy(Protocol):
     """Composable strategy surface needed for decision-time CFR lookup."""
 
     parameters: dict[str, float]
-    visit_count: dict[str, int]
+
+    @property
+    def visit_count(self) -> Mapping[str, int]: ...
 
     def get_info_set(
         self,
@@ -0,0 +1,85 @@
+"""Info-set index for the CFR learning tables.
+
+CFR info sets are keyed by strings like ``"3:1:IP:0"`` (hand-strength bucket,
+pot-ratio bucket, position, street). ``CFRTables`` stores them as rows of flat
+arrays, so every key needs a row number. This module owns that mapping: one
+process-wide index in which the grid keys produced by ``info_set_key`` get the
+first rows (street-major, so a preflop-only learner only ever allocates the
+first street's rows) and any other key (hand-built tables, tests) is appended
+on first use.
+
+It also names the action orders a row can have. Old dict-backed tables
+iterated a row's actions in the order its dict was built, and regret matching
+sums and samples in that order, so rows remember it as an index into
+``ACTION_ORDERS``.
+"""
+
+from itertools import permutations
+
+from core.poker.strategy.composable.definitions import (
+    CFR_ACTIONS,
+    CFR_HAND_STRENGTH_BUCKETS,
+    CFR_POT_RATIO_BUCKETS,
+    CFR_STREETS,
+)
+
+ACTION_INDEX = {action: index for index, action in enumerate(CFR_ACTIONS)}
+# Every order a row's actions can be iterated in; rows store an index into it
+ACTION_ORDERS = tuple(permutations(range(len(CFR_ACTIONS))))
+_ORDER_ID = {order: index for index, order in enumerate(ACTION_ORDERS)}
+# Fresh rows follow CFR_ACTIONS; inherited (blended) rows are sorted by name
+CANONICAL_ORDER = _ORDER_ID[tuple(range(len(CFR_ACTIONS)))]
+SORTED_ORDER = _ORDER_ID[tuple(sorted(range(len(CFR_ACTIONS)), key=CFR_ACTIONS.__getitem__))]
+# Action names of each order
+ORDER_NAMES = tuple(tuple(CFR_ACTIONS[i] for i in order) for order in ACTION_ORDERS)
+
+_POSITIONS = ("IP", "OOP")
+
+# Process-wide index (row -> key): grid keys first, other keys appended
+INFO_SET_KEYS: list[str] = [
+    f"{hs}:{pr}:{pos}:{street}"
+    for street in range(CFR_STREETS)
+    for hs in range(CFR_HAND_STRENGTH_BUCKETS)
+    for pr in range(CFR_POT_RATIO_BUCKETS)
+    for pos in _POSITIONS
+]
+_ROW_OF_KEY: dict[str, int] = {key: row for row, key in enumerate(INFO_SET_KEYS)}
+# Row of an already-registered key, or None (lookups never register keys)
+known_row = _ROW_OF_KEY.get
+# Memo for action_order_of, keyed by a row dict's action names
+_ORDER_OF_ACTIONS: dict[tuple[str, ...], int] = {}
+
+
+def info_set_key(hs_bucket: int, pr_bucket: int, position_on_button: bool, street: int) -> str:
+    """Info-set key for bucketed game state (the grid key, not a new string)."""
+    if (
+        0 <= street < CFR_STREETS
+        and 0 <= hs_bucket < CFR_HAND_STRENGTH_BUCKETS
+        and 0 <= pr_bucket < CFR_POT_RATIO_BUCKETS
+    ):
+        row = (
+            (street * CFR_HAND_STRENGTH_BUCKETS + hs_bucket) * CFR_POT_RATIO_BUCKETS + pr_bucket
+        ) * len(_POSITIONS) + (0 if position_on_button else 1)
+        return INFO_SET_KEYS[row]
+    pos = "IP" if position_on_button else "OOP"
+    return f"{hs_bucket}:{pr_bucket}:{pos}:{street}"
+
+
+def info_set_row(key: str) -> int:
+    """Row of an info-set key, registering keys outside the grid."""
+    row = _ROW_OF_KEY.get(key)
+    if row is None:
+        row = len(INFO_SET_KEYS)
+        INFO_SET_KEYS.append(key)
+        _ROW_OF_KEY[key] = row
+    return row
+
+
+def action_order_of(actions: tuple[str, ...]) -> int:
+    """Order id for a row dict's action names; missing actions go last."""
+    order = _ORDER_OF_ACTIONS.get(actions)
+    if order is None:
+        indices = [ACTION_INDEX[action] for action in actions]
+        indices += [index for index in range(len(CFR_ACTIONS)) if index not in indices]
+        order = _ORDER_OF_ACTIONS[actions] = _ORDER_ID[tuple(indices)]
+    return order
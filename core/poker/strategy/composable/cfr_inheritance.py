@@ -11,13 +11,17 @@ owns the rules for how that learned state crosses generations:
 - ``CFRInheritance.filter_inheritable`` selects which info sets are
   trustworthy enough to serialize/inherit at all.
 
-Determinism note: all iteration here is over ``sorted(...)`` keys and no RNG
-is consumed, so inheritance is byte-identical for identical parents.
+The tables themselves are ``CFRTables`` (see ``cfr_tables``); blending and
+filtering run over whole tables at once.
+
+Determinism note: blended info sets are emitted in sorted key order and no
+RNG is consumed, so inheritance is byte-identical for identical parents.
 """
 
 from enum import Enum
 from typing import TYPE_CHECKING
 
+from core.poker.strategy.composable.cfr_tables import CFRTables
 from core.poker.strategy.composable.definitions import (
     CFR_INHERITANCE_DECAY,
     CFR_MIN_VISITS_FOR_INHERITANCE,
@@ -26,9 +30,9 @@ from core.poker.strategy.composable.definitions import (
 if TYPE_CHECKING:
     from core.poker.strategy.composable.strategy import ComposablePokerStrategy
 
-# regret/strategy_sum tables: info_set key -> action -> cumulative value
+# Serialized regret/strategy_sum tables: info_set key -> action -> cumulative value
 RegretTable = dict[str, dict[str, float]]
-# visit counts: info_set key -> number of visits
+# Serialized visit counts: info_set key -> number of visits
 VisitCounts = dict[str, int]
 
 # Matches the ComposablePokerStrategy.learning_rate dataclass default.
@@ -58,14 +62,12 @@ class CFRInheritance:
 
     @staticmethod
     def blend_tables(
-        table1: RegretTable,
-        table2: RegretTable,
+        tables1: CFRTables,
+        tables2: CFRTables,
         weight1: float,
         decay: float,
         min_visits: int,
-        visit_count1: VisitCounts,
-        visit_count2: VisitCounts,
-    ) -> RegretTable:
+    ) -> CFRTables:
         """Blend two regret/strategy_sum tables with weighting and decay.
 
         Blend math:
@@ -97,55 +99,24 @@ class CFRInheritance:
            passed on again, and they are first in line for pruning.
 
         Info sets and actions are iterated in sorted order so the resulting
-        dict ordering is deterministic.
+        dict ordering is deterministic. Both the regret and strategy_sum
+        tables are blended.
         """
-        blended: RegretTable = {}
-
-        # Collect all info sets from both parents that meet minimum visits
-        all_info_sets: set[str] = set()
-        for k in table1:
-            if visit_count1.get(k, 0) >= min_visits:
-                all_info_sets.add(k)
-        for k in table2:
-            if visit_count2.get(k, 0) >= min_visits:
-                all_info_sets.add(k)
-
-        for info_set in sorted(all_info_sets):
-            actions1 = table1.get(info_set, {})
-            actions2 = table2.get(info_set, {})
-            all_actions = sorted(set(actions1.keys()) | set(actions2.keys()))
-
-            blended[info_set] = {}
-            for action in all_actions:
-                val1 = actions1.get(action, 0.0)
-                val2 = actions2.get(action, 0.0)
-                # Weighted blend with decay
-                blended_val = (val1 * weight1 + val2 * (1 - weight1)) * decay
-                blended[info_set][action] = blended_val
-
-        return blended
+        return CFRTables.blend(tables1, tables2, weight1, decay, min_visits)
 
     @staticmethod
     def filter_inheritable(
-        regret: RegretTable,
-        strategy_sum: RegretTable,
-        visit_count: VisitCounts,
+        tables: CFRTables,
         min_visits: int = CFR_MIN_VISITS_FOR_INHERITANCE,
     ) -> tuple[RegretTable, RegretTable, VisitCounts]:
         """Keep only well-visited info sets (used when serializing).
 
         An info set qualifies if it has been visited at least ``min_visits``
         times; the strategy_sum and visit_count tables are filtered to the
-        same key set as the qualifying regret entries.
+        same key set as the qualifying regret entries. Returns the
+        ``(regret, strategy_sum, visit_count)`` dicts that get serialized.
         """
-        inheritable_regret = {
-            k: v for k, v in regret.items() if visit_count.get(k, 0) >= min_visits
-        }
-        inheritable_strategy_sum = {
-            k: v for k, v in strategy_sum.items() if k in inheritable_regret
-        }
-        inheritable_visit_count = {k: v for k, v in visit_count.items() if k in inheritable_regret}
-        return inheritable_regret, inheritable_strategy_sum, inheritable_visit_count
+        return tables.to_dicts(min_visits=min_visits)
 
     @classmethod
     def inherit(
@@ -154,36 +125,25 @@ class CFRInheritance:
         parent2: "ComposablePokerStrategy",
         weight1: float = 0.5,
         mode: CFRInheritanceMode = CFRInheritanceMode.BLEND_DECAY,
-    ) -> tuple[RegretTable, RegretTable, float]:
+    ) -> tuple[CFRTables, float]:
         """Compute offspring CFR state from two parents.
 
-        Returns ``(regret, strategy_sum, learning_rate)`` for the offspring.
+        Returns ``(cfr_tables, learning_rate)`` for the offspring.
         See ``CFRInheritanceMode`` for the semantics of each mode and
         ``blend_tables`` for the BLEND_DECAY math.
         """
         if mode is CFRInheritanceMode.RESET:
-            return {}, {}, _DEFAULT_LEARNING_RATE
+            return CFRTables(), _DEFAULT_LEARNING_RATE
 
-        inherited_regret = cls.blend_tables(
-            parent1.regret,
-            parent2.regret,
-            weight1=weight1,
-            decay=CFR_INHERITANCE_DECAY,
-            min_visits=CFR_MIN_VISITS_FOR_INHERITANCE,
-            visit_count1=parent1.visit_count,
-            visit_count2=parent2.visit_count,
-        )
-        inherited_strategy_sum = cls.blend_tables(
-            parent1.strategy_sum,
-            parent2.strategy_sum,
+        inherited_tables = cls.blend_tables(
+            parent1.cfr_tables,
+            parent2.cfr_tables,
             weight1=weight1,
             decay=CFR_INHERITANCE_DECAY,
             min_visits=CFR_MIN_VISITS_FOR_INHERITANCE,
-            visit_count1=parent1.visit_count,
-            visit_count2=parent2.visit_count,
         )
         # Blend learning rates
         inherited_learning_rate = parent1.learning_rate * weight1 + parent2.learning_rate * (
             1 - weight1
         )
-        return inherited_regret, inherited_strategy_sum, inherited_learning_rate
+        return inherited_tables, inherited_learning_rate
@@ -0,0 +1,153 @@
+"""Dict-shaped live views of ``CFRTables``.
+
+Strategy code, tools and tests read and write CFR state as
+``strategy.regret[info_set][action]``, ``strategy.visit_count[info_set]`` and
+so on. These views keep that API on top of the array-backed tables: every
+read and write goes straight to the table rows, and iteration follows
+insertion order like the dicts they replace.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import TYPE_CHECKING
+
+from core.poker.strategy.composable.cfr_info_sets import (
+    ACTION_INDEX,
+    ACTION_ORDERS,
+    INFO_SET_KEYS,
+    action_order_of,
+    info_set_row,
+    known_row,
+)
+from core.poker.strategy.composable.definitions import CFR_ACTIONS
+
+if TYPE_CHECKING:
+    from core.poker.strategy.composable.cfr_tables import CFRTables, _Table
+
+_WIDTH = len(CFR_ACTIONS)
+
+
+class CFRRowView(MutableMapping[str, float]):
+    """Live ``action -> value`` view of one table row."""
+
+    __slots__ = ("_row", "_table")
+
+    def __init__(self, table: _Table, row: int) -> None:
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, action: str) -> float:
+        index = ACTION_INDEX[action]
+        return float(self._table.values[self._row * _WIDTH + index])
+
+    def __setitem__(self, action: str, value: float) -> None:
+        self._table.values[self._row * _WIDTH + ACTION_INDEX[action]] = value
+
+    def __delitem__(self, action: str) -> None:
+        self[action] = 0.0
+
+    def __iter__(self) -> Iterator[str]:
+        return (CFR_ACTIONS[i] for i in ACTION_ORDERS[self._table.order[self._row]])
+
+    def __len__(self) -> int:
+        return _WIDTH
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class CFRTableView(MutableMapping[str, CFRRowView]):
+    """Live ``info set -> {action: value}`` view of a regret/strategy-sum table."""
+
+    __slots__ = ("_table", "_tables")
+
+    def __init__(self, tables: CFRTables, table: _Table) -> None:
+        self._tables = tables
+        self._table = table
+
+    def __getitem__(self, key: str) -> CFRRowView:
+        row = known_row(key)
+        if row is None or not self._table.has(row):
+            raise KeyError(key)
+        return CFRRowView(self._table, row)
+
+    def __setitem__(self, key: str, actions: Mapping[str, float]) -> None:
+        row = info_set_row(key)
+        table = self._table
+        # Like a dict, replacing an existing key keeps its position
+        seq = table.seq[row] if table.has(row) else self._tables._seq()
+        table.remove(row)
+        table.add(row, seq, action_order_of(tuple(actions)))
+        base = row * _WIDTH
+        for action, value in actions.items():
+            table.values[base + ACTION_INDEX[action]] = value
+
+    def __delitem__(self, key: str) -> None:
+        row = known_row(key)
+        if row is None or not self._table.has(row):
+            raise KeyError(key)
+        self._table.remove(row)
+
+    def __contains__(self, key: object) -> bool:
+        row = known_row(key) if isinstance(key, str) else None
+        return row is not None and self._table.has(row)
+
+    def __iter__(self) -> Iterator[str]:
+        return (INFO_SET_KEYS[row] for row in self._table.present_rows())
+
+    def __len__(self) -> int:
+        return self._table.count
+
+    def __repr__(self) -> str:
+        return repr({key: dict(row) for key, row in self.items()})
+
+
+class VisitCountView(MutableMapping[str, int]):
+    """Live ``info set -> visits`` view of the visit-count table."""
+
+    __slots__ = ("_tables",)
+
+    def __init__(self, tables: CFRTables) -> None:
+        self._tables = tables
+
+    def __getitem__(self, key: str) -> int:
+        row = known_row(key)
+        visits = self._tables.visits
+        if row is None or not visits.has(row):
+            raise KeyError(key)
+        return int(visits.values[row])
+
+    def get(self, key: str, default: int | None = None) -> int | None:  # type: ignore[override]
+        # Decision-time lookups mostly miss; skip Mapping.get's KeyError
+        row = known_row(key)
+        visits = self._tables.visits
+        if row is None or not visits.has(row):
+            return default
+        return int(visits.values[row])
+
+    def __setitem__(self, key: str, count: int) -> None:
+        row = info_set_row(key)
+        visits = self._tables.visits
+        if not visits.has(row):
+            visits.add(row, self._tables._seq())
+        visits.values[row] = int(count)
+
+    def __delitem__(self, key: str) -> None:
+        row = known_row(key)
+        if row is None or not self._tables.visits.has(row):
+            raise KeyError(key)
+        self._tables.visits.remove(row)
+
+    def __contains__(self, key: object) -> bool:
+        row = known_row(key) if isinstance(key, str) else None
+        return row is not None and self._tables.visits.has(row)
+
+    def __iter__(self) -> Iterator[str]:
+        return (INFO_SET_KEYS[row] for row in self._tables.visits.present_rows())
+
+    def __len__(self) -> int:
+        return self._tables.visits.count
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
@@ -0,0 +1,430 @@
+"""Dense CFR learning tables for composable poker strategies.
+
+ComposablePokerStrategy's learned state (regret, strategy sums, visit
+counts) used to be three dicts keyed by info-set strings, with a fresh
+inner dict per info set. The info-set space is a small fixed grid (hand
+strength x pot ratio x position x street buckets), so ``CFRTables`` stores
+it as flat ``array`` rows instead: row ``i`` of the regret table is
+``values[i * 4 : i * 4 + 4]`` in ``CFR_ACTIONS`` order.
+
+Info-set keys map to rows through the process-wide index in
+``cfr_info_sets``. Tables grow to the highest row they hold and nothing is
+allocated until a strategy learns.
+
+The dict-shaped API is kept as live views (``cfr_table_views``), and a few
+details of the old dicts are tracked so results stay bit-for-bit identical:
+
+- Each row remembers the action order of the dict it came from (fresh rows
+  use ``CFR_ACTIONS`` order, inherited rows sorted order). Regret matching
+  sums and samples in that order.
+- Each present row has an insertion sequence number: iteration, pruning tie
+  breaks and serialized dict order follow it.
+
+Per-row regret matching stays scalar: with four actions, NumPy's per-call
+overhead costs more than the arithmetic. Whole-table operations
+(inheritance blending, filtering) are vectorized.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Mapping
+
+import numpy as np
+
+from core.poker.strategy.composable.cfr_info_sets import (
+    ACTION_ORDERS,
+    CANONICAL_ORDER,
+    INFO_SET_KEYS,
+    ORDER_NAMES,
+    SORTED_ORDER,
+    action_order_of,
+    info_set_row,
+)
+from core.poker.strategy.composable.cfr_table_views import CFRTableView, VisitCountView
+from core.poker.strategy.composable.definitions import CFR_ACTIONS
+
+_WIDTH = len(CFR_ACTIONS)
+_IDENTITY = ACTION_ORDERS[CANONICAL_ORDER]
+# The learning hot path is unrolled over the four actions
+_A0, _A1, _A2, _A3 = CFR_ACTIONS
+
+
+class _Table:
+    """One table: ``width`` values per row plus row presence/order metadata."""
+
+    __slots__ = ("count", "order", "seq", "typecode", "values", "width")
+
+    def __init__(self, typecode: str, width: int) -> None:
+        self.typecode = typecode
+        self.width = width
+        # Doubles for regret/strategy sums, int64 for visit counts
+        self.values: array[float] = array(typecode)
+        # 0 = row absent; otherwise the row's insertion sequence number
+        self.seq = array("Q")
+        self.order = array("B")
+        # Number of present rows
+        self.count = 0
+
+    @property
+    def rows(self) -> int:
+        return len(self.seq)
+
+    def grow(self, rows: int) -> None:
+        extra = rows - len(self.seq)
+        if extra > 0:
+            self.values.frombytes(bytes(extra * self.width * self.values.itemsize))
+            self.seq.frombytes(bytes(extra * self.seq.itemsize))
+            self.order.frombytes(bytes(extra))
+
+    def has(self, row: int) -> bool:
+        return row < len(self.seq) and self.seq[row] != 0
+
+    def add(self, row: int, seq: int, order: int = CANONICAL_ORDER) -> None:
+        """Make ``row`` present (zeroed) if it isn't already."""
+        if row >= len(self.seq):
+            self.grow(row + 1)
+        elif self.seq[row]:
+            return
+        self.seq[row] = seq
+        self.order[row] = order
+        self.count += 1
+
+    def remove(self, row: int) -> None:
+        if not self.has(row):
+            return
+        base = row * self.width
+        for i in range(base, base + self.width):
+            self.values[i] = 0
+        self.seq[row] = 0
+        self.count -= 1
+        self.order[row] = CANONICAL_ORDER
+
+    def present_rows(self) -> list[int]:
+        """Present rows in insertion order."""
+        if not self.count:
+            return []
+        seq = np.frombuffer(self.seq, dtype=np.uint64)
+        rows = np.flatnonzero(seq)
+        ordered: list[int] = rows[np.argsort(seq[rows], kind="stable")].tolist()
+        return ordered
+
+    def row_dicts(self, rows: list[int]) -> dict[str, dict[str, float]]:
+        """``{key: {action: value}}`` for ``rows``, each in its action order."""
+        flat = self.values.tolist()
+        orders = self.order
+        out = {}
+        for row in rows:
+            base = row * _WIDTH
+            order = orders[row]
+            n0, n1, n2, n3 = ORDER_NAMES[order]
+            i0, i1, i2, i3 = ACTION_ORDERS[order]
+            out[INFO_SET_KEYS[row]] = {
+                n0: flat[base + i0],
+                n1: flat[base + i1],
+                n2: flat[base + i2],
+                n3: flat[base + i3],
+            }
+        return out
+
+    def load(self, rows: Mapping[str, Mapping[str, float]], tables: CFRTables) -> None:
+        """Fill this (empty) table from ``{key: {action: value}}`` dicts."""
+        keyed = [(info_set_row(key), actions) for key, actions in rows.items()]
+        if not keyed:
+            return
+        size = max(row for row, _ in keyed) + 1
+        flat = [0.0] * (size * _WIDTH)
+        seq = [0] * size
+        orders = bytearray(size)
+        next_seq = tables._next_seq
+        for row, actions in keyed:
+            order = action_order_of(tuple(actions))
+            base = row * _WIDTH
+            if len(actions) == _WIDTH:
+                i0, i1, i2, i3 = ACTION_ORDERS[order]
+                v0, v1, v2, v3 = actions.values()
+                flat[base + i0] = v0
+                flat[base + i1] = v1
+                flat[base + i2] = v2
+                flat[base + i3] = v3
+            else:
+                for index, value in zip(ACTION_ORDERS[order], actions.values(), strict=False):
+                    flat[base + index] = value
+            seq[row] = next_seq
+            next_seq += 1
+            orders[row] = order
+        tables._next_seq = next_seq
+        self.values = array(self.typecode, flat)
+        self.seq = array("Q", seq)
+        self.order = array("B", orders)
+        self.count = len(keyed)
+
+    def row_items(self, row: int) -> list[tuple[str, float]]:
+        base = row * self.width
+        values = self.values
+        order = ACTION_ORDERS[self.order[row]]
+        if order is _IDENTITY:
+            return list(zip(CFR_ACTIONS, values[base : base + _WIDTH], strict=True))
+        return [(CFR_ACTIONS[i], values[base + i]) for i in order]
+
+    def matrix(self, rows: int) -> np.ndarray:
+        """Values as a ``(rows, width)`` float array, zero-padded to ``rows``."""
+        out = np.zeros((rows, self.width), dtype=np.float64)
+        if len(self.seq):
+            own = np.frombuffer(self.values, dtype=self.typecode).reshape(-1, self.width)
+            out[: len(own)] = own
+        return out
+
+    def present_mask(self, rows: int) -> np.ndarray:
+        out = np.zeros(rows, dtype=bool)
+        if len(self.seq):
+            out[: len(self.seq)] = np.frombuffer(self.seq, dtype=np.uint64) != 0
+        return out
+
+
+class CFRTables:
+    """Regret, strategy-sum and visit-count tables of one strategy."""
+
+    __slots__ = ("_next_seq", "regret", "strategy_sum", "visits")
+
+    def __init__(self) -> None:
+        self.regret = _Table("d", _WIDTH)
+        self.strategy_sum = _Table("d", _WIDTH)
+        self.visits = _Table("q", 1)
+        self._next_seq = 1
+
+    def _seq(self) -> int:
+        seq = self._next_seq
+        self._next_seq += 1
+        return seq
+
+    # ------------------------------------------------------------------
+    # Learning hot path
+    # ------------------------------------------------------------------
+
+    @property
+    def info_sets(self) -> int:
+        """Number of info sets with regret (what the prune cap counts)."""
+        return self.regret.count
+
+    def visit_count(self, row: int) -> int:
+        visits = self.visits
+        return int(visits.values[row]) if row < len(visits.seq) else 0
+
+    def update_regret(
+        self,
+        row: int,
+        action_taken: str,
+        action_values: Mapping[str, float],
+        learning_rate: float,
+    ) -> None:
+        """Accumulate one hand's counterfactual regret and strategy at ``row``."""
+        regret = self.regret
+        strategy_sum = self.strategy_sum
+        visits = self.visits
+        try:
+            # Tables can have different lengths (rows written through the views)
+            present = visits.seq[row] and regret.seq[row] and strategy_sum.seq[row]
+        except IndexError:
+            present = 0
+        if not present:
+            regret.add(row, self._seq())
+            strategy_sum.add(row, self._seq())
+            visits.add(row, self._seq())
+        visits.values[row] += 1
+
+        get = action_values.get
+        value_got = get(action_taken, 0.0)
+        base = row * _WIDTH
+        values = regret.values
+        values[base] = r0 = values[base] + (get(_A0, 0.0) - value_got) * learning_rate
+        values[base + 1] = r1 = values[base + 1] + (get(_A1, 0.0) - value_got) * learning_rate
+        values[base + 2] = r2 = values[base + 2] + (get(_A2, 0.0) - value_got) * learning_rate
+        values[base + 3] = r3 = values[base + 3] + (get(_A3, 0.0) - value_got) * learning_rate
+
+        # Regret matching (inlined from regret_matched) into the strategy sum
+        p0, p1, p2, p3 = max(r0, 0.0), max(r1, 0.0), max(r2, 0.0), max(r3, 0.0)
+        order = ACTION_ORDERS[regret.order[row]]
+        if order is _IDENTITY:
+            total = sum((p0, p1, p2, p3))
+            if total > 0:
+                sums = strategy_sum.values
+                sums[base] += p0 / total
+                sums[base + 1] += p1 / total
+                sums[base + 2] += p2 / total
+                sums[base + 3] += p3 / total
+            return
+        positive = [(p0, p1, p2, p3)[i] for i in order]
+        total = sum(positive)
+        if total > 0:
+            sums = strategy_sum.values
+            for index, p in zip(order, positive, strict=True):
+                sums[base + index] += p / total
+
+    def regret_matched(self, row: int) -> list[tuple[int, float]] | None:
+        """Regret-matching probabilities as ``(action index, p)`` in row order.
+
+        None when the row is absent or has no positive regret.
+        """
+        regret = self.regret
+        seq = regret.seq
+        if row >= len(seq) or not seq[row]:
+            return None
+        base = row * _WIDTH
+        r0, r1, r2, r3 = regret.values[base : base + _WIDTH]
+        positive: tuple[float, ...] = (max(r0, 0.0), max(r1, 0.0), max(r2, 0.0), max(r3, 0.0))
+        order = ACTION_ORDERS[regret.order[row]]
+        if order is not _IDENTITY:
+            positive = tuple(positive[i] for i in order)
+        # Summed in row order, as the old per-info-set dicts were
+        total = sum(positive)
+        if total <= 0:
+            return None
+        return [(i, p / total) for i, p in zip(order, positive, strict=True)]
+
+    def average_strategy(self, row: int) -> dict[str, float] | None:
+        table = self.strategy_sum
+        seq = table.seq
+        if row >= len(seq) or not seq[row]:
+            return None
+        if table.order[row] != CANONICAL_ORDER:
+            items = table.row_items(row)
+            total = sum(s for _, s in items)
+            return {action: s / total for action, s in items} if total > 0 else None
+        values = table.values
+        base = row * _WIDTH
+        s0, s1, s2, s3 = values[base], values[base + 1], values[base + 2], values[base + 3]
+        total = sum((s0, s1, s2, s3))
+        if total <= 0:
+            return None
+        return {_A0: s0 / total, _A1: s1 / total, _A2: s2 / total, _A3: s3 / total}
+
+    # ------------------------------------------------------------------
+    # Whole-table operations
+    # ------------------------------------------------------------------
+
+    def prune(self, keep: int) -> None:
+        """Keep the ``keep`` most-visited regret rows (ties: oldest first)."""
+        rows = self.regret.present_rows()
+        rows.sort(key=self.visit_count, reverse=True)
+        kept = set(rows[:keep])
+        for table in (self.regret, self.strategy_sum, self.visits):
+            for row in table.present_rows():
+                if row not in kept:
+                    table.remove(row)
+
+    @classmethod
+    def blend(
+        cls,
+        tables1: CFRTables,
+        tables2: CFRTables,
+        weight1: float,
+        decay: float,
+        min_visits: int,
+    ) -> CFRTables:
+        """Blend two parents' regret and strategy-sum tables (visits reset).
+
+        See ``CFRInheritance.blend_tables`` for the math. Blended rows are
+        ordered by info-set key, with their actions in sorted order.
+        """
+        out = cls()
+        rows = max(
+            tables1.regret.rows,
+            tables2.regret.rows,
+            tables1.strategy_sum.rows,
+            tables2.strategy_sum.rows,
+        )
+        visited1 = tables1.visits.matrix(rows)[:, 0] >= min_visits
+        visited2 = tables2.visits.matrix(rows)[:, 0] >= min_visits
+        pairs = (
+            (tables1.regret, tables2.regret, out.regret),
+            (tables1.strategy_sum, tables2.strategy_sum, out.strategy_sum),
+        )
+        for table1, table2, target in pairs:
+            eligible = (table1.present_mask(rows) & visited1) | (
+                table2.present_mask(rows) & visited2
+            )
+            if not eligible.any():
+                continue
+            blended = (table1.matrix(rows) * weight1 + table2.matrix(rows) * (1 - weight1)) * decay
+            eligible_rows = np.flatnonzero(eligible).tolist()
+            target.grow(eligible_rows[-1] + 1)
+            flat = blended.ravel().tolist()
+            for row in sorted(eligible_rows, key=INFO_SET_KEYS.__getitem__):
+                target.add(row, out._seq(), SORTED_ORDER)
+                base = row * _WIDTH
+                target.values[base : base + _WIDTH] = array("d", flat[base : base + _WIDTH])
+        return out
+
+    # ------------------------------------------------------------------
+    # Dict conversion
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_dicts(
+        cls,
+        regret: Mapping[str, Mapping[str, float]] | None = None,
+        strategy_sum: Mapping[str, Mapping[str, float]] | None = None,
+        visit_count: Mapping[str, int] | None = None,
+    ) -> CFRTables:
+        """Build tables from the serialized dict form (saved genomes)."""
+        tables = cls()
+        tables.regret.load(regret or {}, tables)
+        tables.strategy_sum.load(strategy_sum or {}, tables)
+        visits = tables.visits
+        for key, count in (visit_count or {}).items():
+            row = info_set_row(key)
+            visits.add(row, tables._seq())
+            visits.values[row] = int(count)
+        return tables
+
+    def to_dicts(
+        self, min_visits: int | None = None
+    ) -> tuple[dict[str, dict[str, float]], dict[str, dict[str, float]], dict[str, int]]:
+        """The serialized dict form, in insertion order.
+
+        With ``min_visits``, only regret rows visited at least that often
+        are kept, and the other two tables are filtered to the same rows.
+        """
+        regret, strategy_sum, visits = self.regret, self.strategy_sum, self.visits
+        counts = visits.values.tolist()
+        regret_rows = regret.present_rows()
+        sum_rows = strategy_sum.present_rows()
+        visit_rows = visits.present_rows()
+        if min_visits is not None:
+            visited = len(counts)
+            regret_rows = [
+                row for row in regret_rows if (counts[row] if row < visited else 0) >= min_visits
+            ]
+            kept = set(regret_rows)
+            sum_rows = [row for row in sum_rows if row in kept]
+            visit_rows = [row for row in visit_rows if row in kept]
+        return (
+            regret.row_dicts(regret_rows),
+            strategy_sum.row_dicts(sum_rows),
+            {INFO_SET_KEYS[row]: int(counts[row]) for row in visit_rows},
+        )
+
+    def regret_view(self) -> CFRTableView:
+        return CFRTableView(self, self.regret)
+
+    def strategy_sum_view(self) -> CFRTableView:
+        return CFRTableView(self, self.strategy_sum)
+
+    def visit_count_view(self) -> VisitCountView:
+        return VisitCountView(self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CFRTables):
+            return NotImplemented
+        return self.to_dicts() == other.to_dicts()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[object, ...]:
+        # Rows of keys outside the grid are numbered per process, so pickles
+        # (worker pools, deep copies) carry the dict form instead
+        return (CFRTables.from_dicts, self.to_dicts())
+
+    def __repr__(self) -> str:
+        return f"CFRTables(info_sets={self.regret.count})"
@@ -9,6 +9,7 @@ state Lamarckian-inheritable across save/load boundaries.
 from typing import TYPE_CHECKING, Any
 
 from core.poker.strategy.composable.cfr_inheritance import CFRInheritance
+from core.poker.strategy.composable.cfr_tables import CFRTables
 from core.poker.strategy.composable.definitions import (
     BettingStyle,
     BluffingApproach,
@@ -29,13 +30,7 @@ class PokerStrategyCodec:
     def encode(strategy: "ComposablePokerStrategy") -> dict[str, Any]:
         """Serialize a strategy to a dictionary for storage/transmission."""
         # Only include well-visited info sets in serialization
-        (
-            inheritable_regret,
-            inheritable_strategy_sum,
-            inheritable_visit_count,
-        ) = CFRInheritance.filter_inheritable(
-            strategy.regret, strategy.strategy_sum, strategy.visit_count
-        )
+        regret, strategy_sum, visit_count = CFRInheritance.filter_inheritable(strategy.cfr_tables)
 
         return {
             "type": "ComposablePokerStrategy",
@@ -48,9 +43,9 @@ class PokerStrategyCodec:
             "parameters": dict(strategy.parameters),
             "learning_rate": strategy.learning_rate,
             # CFR learned state (Lamarckian-inheritable)
-            "regret": inheritable_regret,
-            "strategy_sum": inheritable_strategy_sum,
-            "visit_count": inheritable_visit_count,
+            "regret": regret,
+            "strategy_sum": strategy_sum,
+            "visit_count": visit_count,
         }
 
     @staticmethod
@@ -73,7 +68,7 @@ class PokerStrategyCodec:
             showdown_tendency=coerce_enum(ShowdownTendency, data.get("showdown_tendency", 1)),
             parameters=data.get("parameters", {}),
             learning_rate=data.get("learning_rate", 1.0),
-            regret=data.get("regret", {}),
-            strategy_sum=data.get("strategy_sum", {}),
-            visit_count=data.get("visit_count", {}),
+            cfr_tables=CFRTables.from_dicts(
+                data.get("regret", {}), data.get("strategy_sum", {}), data.get("visit_count", {})
+            ),
         )
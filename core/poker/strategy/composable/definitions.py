@@ -119,3 +119,4 @@ CFR_MIN_VISITS_FOR_INHERITANCE = 3
 # Info set discretization buckets
 CFR_HAND_STRENGTH_BUCKETS = 5  # 0-4: trash, weak, medium, strong, monster
 CFR_POT_RATIO_BUCKETS = 5  # 0-4: tiny, small, medium, large, huge
+CFR_STREETS = 4  # 0-3: preflop, flop, turn, river
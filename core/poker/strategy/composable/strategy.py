@@ -5,6 +5,8 @@ definitions from definitions.py and opponent models from opponent.py.
 
 Collaborators (extracted for focus, public behavior unchanged):
 
+- cfr_info_sets.py, cfr_tables.py, cfr_table_views.py: dense storage of the
+  CFR learning tables, with dict-shaped views
 - cfr_inheritance.py: CFR table blending/filtering across generations
 - validator.py: parameter bounds, clamping, defaults, random sampling
 - codec.py: dict (de)serialization
@@ -17,6 +19,9 @@ from typing import Any
 from core.poker.betting.actions import BettingAction
 from core.poker.strategy.composable.cfr_decision import decide_from_cfr_regret
 from core.poker.strategy.composable.cfr_inheritance import CFRInheritance, CFRInheritanceMode
+from core.poker.strategy.composable.cfr_info_sets import info_set_key, info_set_row, known_row
+from core.poker.strategy.composable.cfr_table_views import CFRTableView, VisitCountView
+from core.poker.strategy.composable.cfr_tables import CFRTables
 from core.poker.strategy.composable.codec import PokerStrategyCodec
 from core.poker.strategy.composable.definitions import (
     CFR_ACTIONS,
@@ -38,7 +43,6 @@ from core.util.rng import require_rng_param
 from core.deterministic_random import normal
 
 _random_params = PokerStrategyValidator.random_parameters
-_blend_regret_tables = CFRInheritance.blend_tables
 _clamp_learning_rate = PokerStrategyValidator.clamp_learning_rate
 
 
@@ -68,13 +72,9 @@ class ComposablePokerStrategy(PokerStrategyAlgorithm):
     parameters: dict[str, float] = field(default_factory=dict)
     opponent_models: dict[str, SimpleOpponentModel] = field(default_factory=dict, repr=False)
 
-    # CFR Learning State (Lamarckian-inheritable)
-    # regret[info_set][action] = cumulative regret for that action
-    regret: dict[str, dict[str, float]] = field(default_factory=dict, repr=False)
-    # strategy_sum[info_set][action] = cumulative strategy for averaging
-    strategy_sum: dict[str, dict[str, float]] = field(default_factory=dict, repr=False)
-    # visit_count[info_set] = how many times we've visited this info set
-    visit_count: dict[str, int] = field(default_factory=dict, repr=False)
+    # CFR Learning State (Lamarckian-inheritable); read/written through the
+    # regret, strategy_sum and visit_count views below
+    cfr_tables: CFRTables = field(default_factory=CFRTables, repr=False)
     # Learning rate for regret accumulation (can evolve)
     learning_rate: float = 1.0
 
@@ -86,6 +86,21 @@ class ComposablePokerStrategy(PokerStrategyAlgorithm):
         # or deserialized instances (an old save may predate these bounds).
         self.learning_rate = _clamp_learning_rate(self.learning_rate)
 
+    @property
+    def regret(self) -> CFRTableView:
+        """regret[info_set][action] = cumulative regret for that action."""
+        return self.cfr_tables.regret_view()
+
+    @property
+    def strategy_sum(self) -> CFRTableView:
+        """strategy_sum[info_set][action] = cumulative strategy for averaging."""
+        return self.cfr_tables.strategy_sum_view()
+
+    @property
+    def visit_count(self) -> VisitCountView:
+        """visit_count[info_set] = how many times we've visited this info set."""
+        return self.cfr_tables.visit_count_view()
+
     @classmethod
     def create_random(cls, rng: random.Random | None = None) -> "ComposablePokerStrategy":
         """Create a random composable poker strategy."""
@@ -506,9 +521,7 @@ class ComposablePokerStrategy(PokerStrategyAlgorithm):
         )
         # Pot ratio bucket (0-4)
         pr_bucket = min(CFR_POT_RATIO_BUCKETS - 1, int(pot_ratio * CFR_POT_RATIO_BUCKETS / 2))
-        # Position
-        pos = "IP" if position_on_button else "OOP"
-        return f"{hs_bucket}:{pr_bucket}:{pos}:{street}"
+        return info_set_key(hs_bucket, pr_bucket, position_on_button, street)
 
     def get_regret_strategy(self, info_set: str) -> dict[str, float] | None:
         """Get action probabilities from regret matching.
@@ -522,18 +535,11 @@ class ComposablePokerStrategy(PokerStrategyAlgorithm):
         Returns:
             Dict mapping action -> probability, or None for default behavior
         """
-        if info_set not in self.regret:
-            return None
-
-        raw_regret = self.regret[info_set]
-        # Only use positive regret
-        positive = {a: max(r, 0.0) for a, r in raw_regret.items()}
-        total = sum(positive.values())
-
-        if total <= 0:
-            return None  # No positive regret - use defaults
-
-        return {a: r / total for a, r in positive.items()}
+        row = known_row(info_set)
+        matched = None if row is None else self.cfr_tables.regret_matched(row)
+        if matched is None:
+            return None  # No regret data, or no positive regret - use defaults
+        return {CFR_ACTIONS[index]: probability for index, probability in matched}
 
     def sample_cfr_action(self, info_set: str, rng: random.Random | None = None) -> str | None:
         """Sample an action from the regret-matched strategy.
@@ -545,17 +551,18 @@ class ComposablePokerStrategy(PokerStrategyAlgorithm):
         Returns:
             Action string ("fold", "call", "raise_small", "raise_big") or None
         """
-        strategy = self.get_regret_strategy(info_set)
-        if strategy is None:
+        row = known_row(info_set)
+        matched = None if row is None else self.cfr_tables.regret_matched(row)
+        if matched is None:
             return None
 
         rng = require_rng_param(rng, "__init__")
         roll = rng.random()
         cumulative = 0.0
-        for action, prob in strategy.items():
+        for index, prob in matched:
             cumulative += prob
             if roll < cumulative:
-                return action
+                return CFR_ACTIONS[index]
         return CFR_ACTIONS[-1]  # Fallback
 
     def update_regret(
@@ -571,49 +578,21 @@ class ComposablePokerStrategy(PokerStrategyAlgorithm):
             action_taken: The action we actually took
             action_values: Dict mapping each action -> counterfactual value
         """
-        if info_set not in self.regret:
-            self.regret[info_set] = dict.fromkeys(CFR_ACTIONS, 0.0)
-        if info_set not in self.strategy_sum:
-            self.strategy_sum[info_set] = dict.fromkeys(CFR_ACTIONS, 0.0)
-
-        # Update visit count
-        self.visit_count[info_set] = self.visit_count.get(info_set, 0) + 1
-
-        # Value we got from the action we took
-        value_got = action_values.get(action_taken, 0.0)
-
-        # Update regret for each action
-        for action in CFR_ACTIONS:
-            action_value = action_values.get(action, 0.0)
-            regret_delta = (action_value - value_got) * self.learning_rate
-            self.regret[info_set][action] += regret_delta
-
-        # Update strategy sum for averaging
-        strategy = self.get_regret_strategy(info_set)
-        if strategy:
-            for action, prob in strategy.items():
-                self.strategy_sum[info_set][action] += prob
+        tables = self.cfr_tables
+        tables.update_regret(
+            info_set_row(info_set), action_taken, action_values, self.learning_rate
+        )
 
         # Prune if we've accumulated too many info sets
-        if len(self.regret) > CFR_MAX_INFO_SETS:
+        if tables.info_sets > CFR_MAX_INFO_SETS:
             self._prune_info_sets()
 
     def _prune_info_sets(self) -> None:
         """Remove least-visited info sets to cap memory usage."""
-        if len(self.regret) <= CFR_MAX_INFO_SETS // 2:
+        if self.cfr_tables.info_sets <= CFR_MAX_INFO_SETS // 2:
             return
-
-        # Sort by visit count, keep most visited
-        sorted_sets = sorted(
-            self.regret.keys(), key=lambda k: self.visit_count.get(k, 0), reverse=True
-        )
-
-        # Keep top half
-        keeps = set(sorted_sets[: CFR_MAX_INFO_SETS // 2])
-
-        self.regret = {k: v for k, v in self.regret.items() if k in keeps}
-        self.strategy_sum = {k: v for k, v in self.strategy_sum.items() if k in keeps}
-        self.visit_count = {k: v for k, v in self.visit_count.items() if k in keeps}
+        # Keep the most visited half
+        self.cfr_tables.prune(CFR_MAX_INFO_SETS // 2)
 
     def get_average_strategy(self, info_set: str) -> dict[str, float] | None:
         """Get the time-averaged strategy for an info set.
@@ -621,14 +600,8 @@ class ComposablePokerStrategy(PokerStrategyAlgorithm):
         This is more stable than the regret-matched strategy and better
         for exploitation-resistant play.
         """
-        if info_set not in self.strategy_sum:
-            return None
-
-        sums = self.strategy_sum[info_set]
-        total = sum(sums.values())
-        if total <= 0:
-            return None
-        return {a: s / total for a, s in sums.items()}
+        row = known_row(info_set)
+        return None if row is None else self.cfr_tables.average_strategy(row)
 
     def get_learning_stats(self) -> dict[str, Any]:
         """Get statistics about learned knowledge."""
@@ -695,11 +668,7 @@ class ComposablePokerStrategy(PokerStrategyAlgorithm):
 
         # Lamarckian inheritance: blend and decay CFR tables, blend learning rates
         # (see cfr_inheritance.py for the documented blend math)
-        (
-            inherited_regret,
-            inherited_strategy_sum,
-            inherited_learning_rate,
-        ) = CFRInheritance.inherit(
+        inherited_tables, inherited_learning_rate = CFRInheritance.inherit(
             parent1, parent2, weight1=weight1, mode=CFRInheritanceMode.BLEND_DECAY
         )
 
@@ -711,8 +680,7 @@ class ComposablePokerStrategy(PokerStrategyAlgorithm):
             position_awareness=position_awareness,
             showdown_tendency=showdown_tendency,
             parameters=blended_params,
-            regret=inherited_regret,
-            strategy_sum=inherited_strategy_sum,
+            cfr_tables=inherited_tables,
             learning_rate=inherited_learning_rate,
         )
 
@@ -740,7 +708,7 @@ class ComposablePokerStrategy(PokerStrategyAlgorithm):
         stale regrets indefinitely.
         """
         rng = require_rng_param(rng, "__init__")
-        regret, strategy_sum, learning_rate = CFRInheritance.inherit(
+        cfr_tables, learning_rate = CFRInheritance.inherit(
             self, self, weight1=1.0, mode=CFRInheritanceMode.BLEND_DECAY
         )
         clone = ComposablePokerStrategy(
@@ -750,8 +718,7 @@ class ComposablePokerStrategy(PokerStrategyAlgorithm):
             position_awareness=self.position_awareness,
             showdown_tendency=self.showdown_tendency,
             parameters=dict(self.parameters),
-            regret=regret,
-            strategy_sum=strategy_sum,
+            cfr_tables=cfr_tables,
             learning_rate=learning_rate,
         )
         clone.mutate(
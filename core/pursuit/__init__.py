@@ -1,9 +1,6 @@
 """Deterministic, isolated evaluators for the shared Target Pursuit Module."""
 
-from core.pursuit.transfer_gym import (
-    InterceptionResult,
-    PursuitTransferEvaluation,
-    evaluate_pursuit_transfer,
-)
+from core.pursuit.episodes import InterceptionResult
+from core.pursuit.transfer_gym import PursuitTransferEvaluation, evaluate_pursuit_transfer
 
 __all__ = ["InterceptionResult", "PursuitTransferEvaluation", "evaluate_pursuit_transfer"]
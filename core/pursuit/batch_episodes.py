@@ -0,0 +1,268 @@
+"""Scenario-batched interception episodes for the pursuit transfer gym.
+
+``run_interception_episode`` steps one pursuer against one scripted target,
+allocating ``Vector2`` objects and an input dict every frame, and evolution
+repeats it for every individual of every generation. ``run_interception_batch``
+steps every (module, scenario) pair together instead: pursuer state lives in
+NumPy arrays indexed by row, rows drop out as they capture, and each frame
+evaluates the still-active rows of all mutants that share a topology with one
+call of their shared generated batch function.
+
+Every row performs the same IEEE double operations in the same order as the
+scalar episode (the output normalization keeps ``math.hypot``), so results are
+bit-identical to ``run_interception_episode``.
+
+``evaluate_modules_on_set`` adds a bounded memo keyed by scenario content and
+``BehaviorGraph.fingerprint()``: an elite carried into the next generation, or
+a child identical to its parent, is never simulated twice.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any, cast
+
+import numpy as np
+
+from core.behavior.generated_graph import BatchFunction, GeneratedBehaviorGraph
+from core.behavior.graph import BehaviorGraph
+from core.pursuit.episodes import (
+    CAPTURE_RADIUS,
+    MAX_FRAMES,
+    PURSUER_SPEED,
+    ConstantVelocityInterceptor,
+    EvaluationSummary,
+    InterceptionResult,
+    PursuitScenario,
+    summarize_results,
+    unit_direction,
+)
+
+PursuitModule = BehaviorGraph | ConstantVelocityInterceptor
+
+_FIELDS = frozenset({"target_vector", "target_velocity", "self_velocity", "self_speed"})
+_FITNESS_MEMO_MAXSIZE = 4096
+_FITNESS_MEMO: OrderedDict[tuple[tuple[str, ...], str], EvaluationSummary] = OrderedDict()
+
+
+class _ScenarioColumns:
+    """One scenario's trajectory as float64 arrays plus a content digest."""
+
+    __slots__ = ("digest", "start", "target")
+
+    def __init__(self, scenario: PursuitScenario) -> None:
+        self.start = (scenario.pursuer_start.x, scenario.pursuer_start.y)
+        # Columns: x, y, vx, vy; one row per frame.
+        self.target = np.array(
+            [
+                (position.x, position.y, velocity.x, velocity.y)
+                for position, velocity in zip(
+                    scenario.target_positions, scenario.target_velocities, strict=True
+                )
+            ],
+            dtype=np.float64,
+        )
+        content = hashlib.sha256(self.target.tobytes())
+        content.update(repr((scenario.family_name, self.start)).encode("utf-8"))
+        self.digest = content.hexdigest()
+
+
+def _columns(scenario: PursuitScenario) -> _ScenarioColumns:
+    # Scenarios are frozen snapshots; cache the conversion on the instance.
+    cached = scenario.__dict__.get("_columns_cached")
+    if cached is None:
+        cached = _ScenarioColumns(scenario)
+        object.__setattr__(scenario, "_columns_cached", cached)
+    return cached
+
+
+class _FrameInputs:
+    """One frame's context columns, indexed by position among the active rows."""
+
+    __slots__ = ("self_velocities", "target_vectors", "target_velocities")
+
+    def __init__(
+        self,
+        target_vectors: list[tuple[float, float]],
+        target_velocities: list[tuple[float, float]],
+        self_velocities: list[tuple[float, float]],
+    ) -> None:
+        self.target_vectors = target_vectors
+        self.target_velocities = target_velocities
+        self.self_velocities = self_velocities
+
+    def columns(self, low: int, high: int) -> dict[str, list[Any]]:
+        return {
+            "target_vector": self.target_vectors[low:high],
+            "target_velocity": self.target_velocities[low:high],
+            "self_velocity": self.self_velocities[low:high],
+            "self_speed": [PURSUER_SPEED] * (high - low),
+        }
+
+
+def _shared_batch_function(plan: object) -> BatchFunction | None:
+    """The batch function ``plan`` shares with same-topology plans, if any."""
+    if isinstance(plan, GeneratedBehaviorGraph) and plan.batch_fields <= _FIELDS:
+        return plan.batch_function
+    return None
+
+
+def _headings(
+    plans: list[Any], segments: list[tuple[int, int, int]], inputs: _FrameInputs
+) -> list[tuple[float, float]]:
+    """Headings for ``(slot, low, high)`` segments whose plans share one batch function."""
+    slot, low, high = segments[0]
+    if len(segments) == 1:
+        outputs = plans[slot].evaluate_batch(inputs.columns(low, high))
+    else:
+        batch_function = cast(BatchFunction, plans[slot].batch_function)
+        outputs = batch_function(
+            [
+                (plans[slot].batch_bindings, inputs.columns(low, high))
+                for slot, low, high in segments
+            ]
+        )
+    return list(map(unit_direction, outputs))
+
+
+def run_interception_batch(
+    modules: Sequence[PursuitModule],
+    scenarios: Sequence[PursuitScenario],
+) -> list[list[InterceptionResult]]:
+    """Run every module against every scenario; results are ``[module][scenario]``."""
+    scenario_count = len(scenarios)
+    columns = [_columns(scenario) for scenario in scenarios]
+    # (frame, scenario, field) block of every scripted target state.
+    target = np.stack([column.target for column in columns], axis=1)
+
+    # Rows are slot-major, scenario_count rows per module slot. Slots whose
+    # plans share a batch function are adjacent, so one call covers them.
+    plans = [module.compile_cached() for module in modules]
+    groups: dict[object, list[int]] = {}
+    for index, plan in enumerate(plans):
+        groups.setdefault(_shared_batch_function(plan) or index, []).append(index)
+    order = [index for members in groups.values() for index in members]
+    slot_plans = [plans[index] for index in order]
+    slot_functions = [_shared_batch_function(plan) for plan in slot_plans]
+    slot_of_row = np.repeat(np.arange(len(order)), scenario_count)
+
+    scenario_of = np.tile(np.arange(scenario_count), len(order))
+    start = np.array([column.start for column in columns], dtype=np.float64)[scenario_of]
+    pos_x, pos_y = start[:, 0].copy(), start[:, 1].copy()
+    vel_x, vel_y = np.zeros(len(scenario_of)), np.zeros(len(scenario_of))
+    dx = target[0, scenario_of, 0] - pos_x
+    dy = target[0, scenario_of, 1] - pos_y
+    closest = np.sqrt(dx * dx + dy * dy)
+    energy = np.zeros(len(scenario_of))
+    capture_frame = np.zeros(len(scenario_of), dtype=np.int64)
+    active = np.ones(len(scenario_of), dtype=np.bool_)
+
+    for frame in range(1, MAX_FRAMES + 1):
+        rows = np.flatnonzero(active)
+        if not rows.size:
+            break
+        state = target[frame, scenario_of[rows]]
+        row_pos_x, row_pos_y = pos_x[rows], pos_y[rows]
+        inputs = _FrameInputs(
+            list(
+                zip(
+                    (state[:, 0] - row_pos_x).tolist(),
+                    (state[:, 1] - row_pos_y).tolist(),
+                    strict=True,
+                )
+            ),
+            list(zip(state[:, 2].tolist(), state[:, 3].tolist(), strict=True)),
+            list(zip(vel_x[rows].tolist(), vel_y[rows].tolist(), strict=True)),
+        )
+
+        # Split the active rows into one segment per slot, then hand each run
+        # of segments sharing a batch function to a single call.
+        row_slots = slot_of_row[rows]
+        cuts = (np.flatnonzero(row_slots[1:] != row_slots[:-1]) + 1).tolist()
+        lows, highs = [0, *cuts], [*cuts, len(rows)]
+        directions: list[tuple[float, float]] = []
+        pending: list[tuple[int, int, int]] = []
+        for slot, low, high in zip(row_slots[lows].tolist(), lows, highs, strict=True):
+            function = slot_functions[slot]
+            if pending and (function is None or function is not slot_functions[pending[0][0]]):
+                directions.extend(_headings(slot_plans, pending, inputs))
+                pending = []
+            pending.append((slot, low, high))
+        directions.extend(_headings(slot_plans, pending, inputs))
+
+        direction = np.array(directions, dtype=np.float64)
+        step_x = direction[:, 0] * PURSUER_SPEED
+        step_y = direction[:, 1] * PURSUER_SPEED
+        row_pos_x = row_pos_x + step_x
+        row_pos_y = row_pos_y + step_y
+        pos_x[rows], pos_y[rows] = row_pos_x, row_pos_y
+        vel_x[rows], vel_y[rows] = step_x, step_y
+        energy[rows] += np.sqrt(step_x * step_x + step_y * step_y)
+
+        dx = state[:, 0] - row_pos_x
+        dy = state[:, 1] - row_pos_y
+        distance = np.sqrt(dx * dx + dy * dy)
+        closest[rows] = np.minimum(closest[rows], distance)
+        captured = rows[distance <= CAPTURE_RADIUS]
+        capture_frame[captured] = frame
+        active[captured] = False
+
+    results = [
+        InterceptionResult(frame > 0, frame or None, approach, spent)
+        for frame, approach, spent in zip(
+            capture_frame.tolist(), closest.tolist(), energy.tolist(), strict=True
+        )
+    ]
+    by_module: list[list[InterceptionResult]] = [[] for _ in modules]
+    for slot, index in enumerate(order):
+        by_module[index] = results[slot * scenario_count : (slot + 1) * scenario_count]
+    return by_module
+
+
+def evaluate_modules_on_set(
+    modules: Sequence[PursuitModule],
+    scenarios: Sequence[PursuitScenario],
+) -> list[EvaluationSummary]:
+    """Summaries for ``modules`` on one scenario set, simulating only memo misses.
+
+    Graphs are memoized by fingerprint; the analytical interceptor has none
+    and is always simulated.
+    """
+    set_key = tuple(_columns(scenario).digest for scenario in scenarios)
+    summaries: list[EvaluationSummary | None] = [None] * len(modules)
+    pending: dict[str, list[int]] = {}
+    to_run: list[PursuitModule] = []
+    run_slots: list[list[int]] = []
+    for index, module in enumerate(modules):
+        if not isinstance(module, BehaviorGraph):
+            to_run.append(module)
+            run_slots.append([index])
+            continue
+        fingerprint = module.fingerprint()
+        memo_key = (set_key, fingerprint)
+        summary = _FITNESS_MEMO.get(memo_key)
+        if summary is not None:
+            _FITNESS_MEMO.move_to_end(memo_key)
+            summaries[index] = summary
+        elif fingerprint in pending:
+            pending[fingerprint].append(index)
+        else:
+            pending[fingerprint] = [index]
+            to_run.append(module)
+            run_slots.append(pending[fingerprint])
+
+    batch_results = run_interception_batch(to_run, scenarios) if to_run else []
+    for module, slots, results in zip(to_run, run_slots, batch_results, strict=True):
+        summary = summarize_results(scenarios, results)
+        for index in slots:
+            summaries[index] = summary
+        if isinstance(module, BehaviorGraph):
+            _FITNESS_MEMO[(set_key, module.fingerprint())] = summary
+            if len(_FITNESS_MEMO) > _FITNESS_MEMO_MAXSIZE:
+                _FITNESS_MEMO.popitem(last=False)
+    return cast(list[EvaluationSummary], summaries)
+
+
+__all__ = ["evaluate_modules_on_set", "run_interception_batch"]
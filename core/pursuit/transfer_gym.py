@@ -10,16 +10,19 @@ from __future__ import annotations
 import math
 import random
 from dataclasses import dataclass
-from typing import Any
 
 from core.behavior.graph import BehaviorGraph, GraphNode
 from core.behavior.nodes import Scalar
 from core.behavior.pursuit_nodes import default_pursuit_module_graph
 from core.math_utils import Vector2
-
-PURSUER_SPEED = 3.0
-CAPTURE_RADIUS = 12.0
-MAX_FRAMES = 300
+from core.pursuit.batch_episodes import evaluate_modules_on_set
+from core.pursuit.episodes import (
+    MAX_FRAMES,
+    PURSUER_SPEED,
+    ConstantVelocityInterceptor,
+    EvaluationSummary,
+    PursuitScenario,
+)
 
 # Evolution hyperparameters
 POPULATION_SIZE = 16
@@ -30,57 +33,6 @@ MUTATION_STRENGTH = 0.1
 CROSSOVER_WEIGHT = 0.5
 
 
-@dataclass(frozen=True)
-class InterceptionResult:
-    """One pursuer's outcome chasing one scripted moving target."""
-
-    intercepted: bool
-    time_to_intercept: int | None
-    closest_approach: float
-    energy_spent: float
-
-    def to_dict(self) -> dict[str, float | int | bool | None]:
-        return {
-            "intercepted": self.intercepted,
-            "time_to_intercept": self.time_to_intercept,
-            "closest_approach": self.closest_approach,
-            "energy_spent": self.energy_spent,
-        }
-
-
-@dataclass(frozen=True)
-class EvaluationSummary:
-    """Aggregated metrics over a set of scenarios."""
-
-    capture_rate: float
-    median_time: float | None
-    mean_miss_distance: float
-    mean_energy_spent: float
-    family_fitness: dict[str, float]
-    overall_score: float
-
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "capture_rate": self.capture_rate,
-            "median_time": self.median_time,
-            "mean_miss_distance": self.mean_miss_distance,
-            "mean_energy_spent": self.mean_energy_spent,
-            "family_fitness": self.family_fitness,
-            "overall_score": self.overall_score,
-        }
-
-
-@dataclass(frozen=True)
-class PursuitScenario:
-    """A parameterized interception scenario with a specific trajectory pattern."""
-
-    scenario_id: str
-    family_name: str
-    pursuer_start: Vector2
-    target_positions: list[Vector2]
-    target_velocities: list[Vector2]
-
-
 @dataclass(frozen=True)
 class PursuitTransferEvaluation:
     """Rich evaluation payload comparing multiple groups on the zero-shot test set."""
@@ -111,63 +63,6 @@ class PursuitTransferEvaluation:
         return self.group_summaries["constant_velocity_solver"].overall_score
 
 
-def _fitness(result: InterceptionResult) -> float:
-    """Higher is better. Any interception beats any non-interception; within
-    a category, faster interception / closer approach scores higher."""
-    if result.intercepted:
-        assert result.time_to_intercept is not None
-        return 1.0 + 1.0 / result.time_to_intercept
-    return 1.0 / (1.0 + result.closest_approach)
-
-
-class ConstantVelocityInterceptor:
-    """Analytical reference policy for targets that keep a constant velocity.
-
-    Held-out ball trajectories can bounce, decelerate, or change direction, so
-    this is a comparison group rather than an upper-bound "ceiling."
-    """
-
-    def compile_cached(self) -> ConstantVelocityInterceptor:
-        return self
-
-    def evaluate(self, inputs: dict[str, Any]) -> tuple[float, float]:
-        target_x, target_y = inputs["target_vector"]
-        target_vx, target_vy = inputs["target_velocity"]
-        self_vx, self_vy = inputs["self_velocity"]
-        self_speed = inputs["self_speed"]
-
-        # Solve: ||P_t + V_t * t - P_s|| = s * t
-        # Let P_t - P_s be (target_x, target_y)
-        # Solve quadratic: a * t^2 + b * t + c = 0
-        # a = s^2 - ||V_t||^2
-        # b = -2 * (P_t - P_s) . V_t
-        # c = -||P_t - P_s||^2
-        a = self_speed**2 - (target_vx**2 + target_vy**2)
-        b = -2.0 * (target_x * target_vx + target_y * target_vy)
-        c = -(target_x**2 + target_y**2)
-
-        discriminant = b**2 - 4 * a * c
-        if discriminant < 0:
-            # Cannot intercept: steer directly at current target position
-            dist = math.hypot(target_x, target_y)
-            return (target_x / dist, target_y / dist) if dist > 0 else (0.0, 0.0)
-
-        if abs(a) < 1e-6:
-            t = -c / b if abs(b) > 1e-6 else 0.0
-        else:
-            t1 = (-b + math.sqrt(discriminant)) / (2 * a)
-            t2 = (-b - math.sqrt(discriminant)) / (2 * a)
-            pos_ts = [val for val in (t1, t2) if val > 0]
-            t = min(pos_ts) if pos_ts else 0.0
-
-        # Predicted interception point
-        ix = target_x + target_vx * t
-        iy = target_y + target_vy * t
-
-        dist = math.hypot(ix, iy)
-        return (ix / dist, iy / dist) if dist > 0 else (0.0, 0.0)
-
-
 def generate_food_trajectory(
     family_idx: int,
     rng: random.Random,
@@ -373,96 +268,12 @@ def generate_scenario_set(
     return scenarios
 
 
-def run_interception_episode(
-    module: BehaviorGraph | ConstantVelocityInterceptor,
-    scenario: PursuitScenario,
-) -> InterceptionResult:
-    """Run one deterministic pursuer-vs-target episode."""
-    compiled = module.compile_cached()
-    pursuer_pos = scenario.pursuer_start.copy()
-    pursuer_vel = Vector2(0.0, 0.0)
-    closest = (scenario.target_positions[0] - pursuer_pos).length()
-    energy_spent = 0.0
-
-    for frame in range(1, MAX_FRAMES + 1):
-        target_pos = scenario.target_positions[frame]
-        target_velocity = scenario.target_velocities[frame]
-        target_vector = (target_pos.x - pursuer_pos.x, target_pos.y - pursuer_pos.y)
-
-        inputs = {
-            "target_vector": target_vector,
-            "target_velocity": (target_velocity.x, target_velocity.y),
-            "self_velocity": (pursuer_vel.x, pursuer_vel.y),
-            "self_speed": PURSUER_SPEED,
-        }
-
-        output = compiled.evaluate(inputs)
-        vx, vy = (float(output[0]), float(output[1])) if isinstance(output, tuple) else (0.0, 0.0)
-
-        mag = math.hypot(vx, vy)
-        if mag > 1e-9:
-            vx, vy = vx / mag, vy / mag
-
-        pursuer_vel = Vector2(vx * PURSUER_SPEED, vy * PURSUER_SPEED)
-        pursuer_pos = pursuer_pos + pursuer_vel
-        energy_spent += pursuer_vel.length()
-
-        distance = (target_pos - pursuer_pos).length()
-        closest = min(closest, distance)
-        if distance <= CAPTURE_RADIUS:
-            return InterceptionResult(True, frame, closest, energy_spent)
-
-    return InterceptionResult(False, None, closest, energy_spent)
-
-
 def evaluate_module_on_set(
     module: BehaviorGraph | ConstantVelocityInterceptor,
     scenarios: list[PursuitScenario],
 ) -> EvaluationSummary:
     """Evaluate a module across an entire scenario set and calculate aggregated statistics."""
-    results = []
-    for scenario in scenarios:
-        res = run_interception_episode(module, scenario)
-        results.append((scenario, res))
-
-    captured = [res for _, res in results if res.intercepted]
-    capture_rate = len(captured) / len(results)
-
-    if captured:
-        times: list[int] = sorted(
-            [res.time_to_intercept for res in captured if res.time_to_intercept is not None]
-        )
-        n = len(times)
-        if n == 0:
-            median_time = None
-        elif n % 2 == 1:
-            median_time = float(times[n // 2])
-        else:
-            median_time = float(times[n // 2 - 1] + times[n // 2]) / 2.0
-    else:
-        median_time = None
-
-    mean_miss_distance = sum(res.closest_approach for _, res in results) / len(results)
-    mean_energy_spent = sum(res.energy_spent for _, res in results) / len(results)
-    overall_score = sum(_fitness(res) for _, res in results) / len(results)
-
-    family_scores: dict[str, float] = {}
-    family_counts: dict[str, int] = {}
-    for scenario, res in results:
-        fam = scenario.family_name
-        family_scores[fam] = family_scores.get(fam, 0.0) + _fitness(res)
-        family_counts[fam] = family_counts.get(fam, 0) + 1
-
-    family_fitness = {fam: family_scores[fam] / family_counts[fam] for fam in family_scores}
-
-    return EvaluationSummary(
-        capture_rate=capture_rate,
-        median_time=median_time,
-        mean_miss_distance=mean_miss_distance,
-        mean_energy_spent=mean_energy_spent,
-        family_fitness=family_fitness,
-        overall_score=overall_score,
-    )
+    return evaluate_modules_on_set([module], scenarios)[0]
 
 
 def run_evolution(
@@ -488,8 +299,10 @@ def run_evolution(
     history = []
 
     pop_scores = []
-    for module in population:
-        score = evaluate_module_on_set(module, scenarios).overall_score
+    for module, summary in zip(
+        population, evaluate_modules_on_set(population, scenarios), strict=True
+    ):
+        score = summary.overall_score
         pop_scores.append(score)
         if score > best_score:
             best_score = score
@@ -537,8 +350,11 @@ def run_evolution(
         population = new_population
         pop_scores = [best_score]
 
-        for module in population[1:]:
-            score = evaluate_module_on_set(module, scenarios).overall_score
+        children = population[1:]
+        for module, summary in zip(
+            children, evaluate_modules_on_set(children, scenarios), strict=True
+        ):
+            score = summary.overall_score
             pop_scores.append(score)
             if score > best_score:
                 best_score = score
@@ -604,15 +420,22 @@ def evaluate_pursuit_transfer(seed: int) -> PursuitTransferEvaluation:
     rng_random = random.Random(seed + 4000)
     best_random = base_module
     best_random_score = float("-inf")
-    for _ in range(POPULATION_SIZE * GENERATIONS * EVOLUTION_RUNS):
-        candidate = base_module.crossed_over(
+    # Evaluation draws no randomness, so sampling every candidate up front and
+    # scoring them as one batch keeps the same candidates and the same winner.
+    candidates = [
+        base_module.crossed_over(
             base_module,
             weight1=1.0,
             mutation_rate=1.0,
             mutation_strength=MUTATION_STRENGTH,
             rng=rng_random,
         )
-        cand_score = evaluate_module_on_set(candidate, train_food).overall_score
+        for _ in range(POPULATION_SIZE * GENERATIONS * EVOLUTION_RUNS)
+    ]
+    for candidate, summary in zip(
+        candidates, evaluate_modules_on_set(candidates, train_food), strict=True
+    ):
+        cand_score = summary.overall_score
         if cand_score > best_random_score:
             best_random = candidate
             best_random_score = cand_score
@@ -633,7 +456,7 @@ def evaluate_pursuit_transfer(seed: int) -> PursuitTransferEvaluation:
         )
         food_trained_modules.append(best_of_run)
 
-    food_evals = [evaluate_module_on_set(m, test_ball) for m in food_trained_modules]
+    food_evals = evaluate_modules_on_set(food_trained_modules, test_ball)
     summaries["food_trained"] = EvaluationSummary(
         capture_rate=sum(e.capture_rate for e in food_evals) / len(food_evals),
         median_time=(
@@ -665,7 +488,7 @@ def evaluate_pursuit_transfer(seed: int) -> PursuitTransferEvaluation:
         )
         soccer_trained_modules.append(best_of_run)
 
-    soccer_evals = [evaluate_module_on_set(m, test_ball) for m in soccer_trained_modules]
+    soccer_evals = evaluate_modules_on_set(soccer_trained_modules, test_ball)
     summaries["soccer_trained"] = EvaluationSummary(
         capture_rate=sum(e.capture_rate for e in soccer_evals) / len(soccer_evals),
         median_time=(
@@ -12,6 +12,7 @@ from typing import TextIO
 from core.replay.fingerprint import SnapshotFingerprinter
 
 FINGERPRINT_STREAM_VERSION = 1
+_PRECISIONS: dict[str, int | None] = {"exact": None, "rounded": 6}
 
 
 def _snapshot_for_fingerprint(world: object) -> dict[str, object]:
@@ -60,6 +61,64 @@ def _entity_groups(snapshot: Mapping[str, object]) -> dict[str, list[object]]:
     return dict(sorted(groups.items()))
 
 
+def entity_type_fingerprints(
+    snapshot: Mapping[str, object], fingerprinter: SnapshotFingerprinter
+) -> dict[str, str]:
+    """Fingerprint each entity type of a snapshot separately."""
+
+    return {
+        name: fingerprinter.fingerprint({"entities": entities})
+        for name, entities in _entity_groups(snapshot).items()
+    }
+
+
+def _entity_key(entity: Mapping[str, object], index: int) -> object:
+    for key in ("id", "object_id"):
+        value = entity.get(key)
+        if value is not None:
+            return value
+    return f"#{index}"
+
+
+def entity_fingerprints(
+    snapshot: Mapping[str, object], fingerprinter: SnapshotFingerprinter
+) -> dict[str, dict[str, str]]:
+    """Fingerprint each entity of a snapshot, by type and then by entity key.
+
+    Entities are keyed by ``id`` (or ``object_id``), falling back to their
+    position within the type for id-less entities such as food. Keys are
+    strings so that the result survives a JSON round trip.
+    """
+
+    return {
+        name: {
+            str(_entity_key(entity, index)): fingerprinter.fingerprint(entity)
+            for index, entity in enumerate(group)
+            if isinstance(entity, Mapping)
+        }
+        for name, group in _entity_groups(snapshot).items()
+    }
+
+
+def diff_entity_fingerprints(
+    left: Mapping[str, Mapping[str, str]], right: Mapping[str, Mapping[str, str]]
+) -> dict[str, list[object]]:
+    """Entities that differ between two ``entity_fingerprints`` results, by type."""
+
+    differing: dict[str, list[object]] = {}
+    for name in sorted(set(left) | set(right)):
+        left_by_key = left.get(name, {})
+        right_by_key = right.get(name, {})
+        keys: list[object] = [
+            key
+            for key in {**left_by_key, **right_by_key}
+            if left_by_key.get(key) != right_by_key.get(key)
+        ]
+        if keys:
+            differing[name] = keys
+    return differing
+
+
 class FingerprintStreamRecorder:
     """Write periodic benchmark snapshot fingerprints for divergence bisection."""
 
@@ -70,15 +129,19 @@ class FingerprintStreamRecorder:
         benchmark_id: str,
         seed: int,
         interval: int = 100,
+        entities_every: int | None = None,
     ) -> None:
         if interval < 1:
             raise ValueError("interval must be >= 1")
+        if entities_every is not None and (entities_every < interval or entities_every % interval):
+            raise ValueError("entities_every must be a multiple of interval")
 
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.interval = interval
-        self._exact = SnapshotFingerprinter(float_precision=None)
-        self._rounded = SnapshotFingerprinter(float_precision=6)
+        self.entities_every = entities_every
+        self._exact = SnapshotFingerprinter(float_precision=_PRECISIONS["exact"])
+        self._rounded = SnapshotFingerprinter(float_precision=_PRECISIONS["rounded"])
         self._fh: TextIO = self.path.open("w", encoding="utf-8", newline="\n")
         self._write(
             {
@@ -87,6 +150,7 @@ class FingerprintStreamRecorder:
                 "benchmark_id": benchmark_id,
                 "seed": seed,
                 "interval": interval,
+                "entities_every": entities_every,
                 "environment": _environment_manifest(),
                 "fingerprints": {
                     "algorithm": self._exact.algorithm,
@@ -103,12 +167,17 @@ class FingerprintStreamRecorder:
 
         snapshot = _snapshot_for_fingerprint(world)
         entity_groups = _entity_groups(snapshot)
+        with_entities = self.entities_every is not None and frame % self.entities_every == 0
         self._write(
             {
                 "type": "checkpoint",
                 "frame": frame,
-                "exact": self._fingerprint_parts(snapshot, entity_groups, self._exact),
-                "rounded": self._fingerprint_parts(snapshot, entity_groups, self._rounded),
+                "exact": self._fingerprint_parts(
+                    snapshot, entity_groups, self._exact, with_entities
+                ),
+                "rounded": self._fingerprint_parts(
+                    snapshot, entity_groups, self._rounded, with_entities
+                ),
                 "entity_counts": {name: len(entities) for name, entities in entity_groups.items()},
             }
         )
@@ -132,11 +201,12 @@ class FingerprintStreamRecorder:
         snapshot: Mapping[str, object],
         entity_groups: dict[str, list[object]],
         fingerprinter: SnapshotFingerprinter,
+        with_entities: bool,
     ) -> dict[str, object]:
         without_entities = {key: value for key, value in snapshot.items() if key != "entities"}
         raw_entities = snapshot.get("entities", [])
         entities_list = list(raw_entities) if isinstance(raw_entities, (list, tuple)) else []
-        return {
+        parts: dict[str, object] = {
             "snapshot": fingerprinter.fingerprint(snapshot),
             "world": fingerprinter.fingerprint(without_entities),
             "entities": fingerprinter.fingerprint({"entities": entities_list}),
@@ -145,6 +215,10 @@ class FingerprintStreamRecorder:
                 for name, entities in entity_groups.items()
             },
         }
+        if with_entities:
+            # Same per-entity layout as a replay checkpoint's "entities"
+            parts["entity_fingerprints"] = entity_fingerprints(snapshot, fingerprinter)
+        return parts
 
     def _write(self, record: Mapping[str, object]) -> None:
         self._fh.write(json.dumps(record, separators=(",", ":"), ensure_ascii=True))
@@ -152,11 +226,22 @@ class FingerprintStreamRecorder:
         self._fh.flush()
 
 
-def compare_fingerprint_streams(left_path: str | Path, right_path: str | Path) -> dict[str, object]:
-    """Return the first exact and rounded divergences between two streams."""
+def compare_fingerprint_streams(
+    left_path: str | Path,
+    right_path: str | Path,
+    *,
+    end_frame: int | None = None,
+) -> dict[str, object]:
+    """Return the first exact and rounded divergences between two streams.
+
+    ``end_frame`` ignores checkpoints after that frame, so a shorter run can be
+    compared against the matching prefix of a longer one. When both divergent
+    checkpoints carry per-entity fingerprints (``entities_every``), the
+    divergence also lists the entities that differ.
+    """
 
-    left = _read_checkpoints(left_path)
-    right = _read_checkpoints(right_path)
+    left = _read_checkpoints(left_path, end_frame)
+    right = _read_checkpoints(right_path, end_frame)
     frames = sorted(set(left) | set(right))
     return {
         "exact": _first_divergence(left, right, frames, "exact"),
@@ -164,13 +249,18 @@ def compare_fingerprint_streams(left_path: str | Path, right_path: str | Path) -
     }
 
 
-def _read_checkpoints(path: str | Path) -> dict[int, dict[str, object]]:
+def _read_checkpoints(path: str | Path, end_frame: int | None) -> dict[int, dict[str, object]]:
     checkpoints: dict[int, dict[str, object]] = {}
     with Path(path).open(encoding="utf-8") as fh:
         for line in fh:
             record = json.loads(line)
-            if record.get("type") == "checkpoint":
-                checkpoints[int(record["frame"])] = record
+            if record.get("type") != "checkpoint":
+                continue
+            # Checkpoints are written in frame order
+            frame = int(record["frame"])
+            if end_frame is not None and frame > end_frame:
+                break
+            checkpoints[frame] = record
     return checkpoints
 
 
@@ -209,7 +299,7 @@ def _first_divergence(
         differing_parts = [
             name for name in ("world", "entities") if left_parts.get(name) != right_parts.get(name)
         ]
-        return {
+        divergence: dict[str, object] = {
             "frame": frame,
             "reason": "fingerprint_mismatch",
             "differing_parts": differing_parts,
@@ -217,4 +307,11 @@ def _first_divergence(
             "left_entity_counts": left_record.get("entity_counts", {}),
             "right_entity_counts": right_record.get("entity_counts", {}),
         }
+        left_entities = left_parts.get("entity_fingerprints")
+        right_entities = right_parts.get("entity_fingerprints")
+        if isinstance(left_entities, dict) and isinstance(right_entities, dict):
+            divergence["differing_entities"] = diff_entity_fingerprints(
+                left_entities, right_entities
+            )
+        return divergence
     return None
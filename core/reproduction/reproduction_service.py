@@ -510,16 +510,16 @@ class ReproductionService:
             # Small population: just pick the healthiest
             return max(fish_list, key=lambda f: f.energy / max(f.max_energy, 1.0))
 
-        from core.genetics.diversity import diversity_bonus
+        from core.genetics.genome_matrix import GenomeMatrix
 
+        # diversity_bonus() of every fish at once; rewards unique genomes (0.0 to 0.15)
         genomes = [f.genome for f in fish_list]
+        bonuses = GenomeMatrix(genomes).diversity_bonuses(sigma=0.5, bonus_weight=0.15).tolist()
         best_fish = fish_list[0]
         best_score = -1.0
 
-        for i, fish in enumerate(fish_list):
+        for fish, d_bonus in zip(fish_list, bonuses, strict=True):
             energy_ratio = fish.energy / max(fish.max_energy, 1.0)
-            # Diversity bonus rewards genetically unique fish (0.0 to 0.15)
-            d_bonus = diversity_bonus(genomes[i], genomes, sigma=0.5, bonus_weight=0.15)
             score = energy_ratio * 0.7 + d_bonus * 0.3 + (energy_ratio * d_bonus)
             if score > best_score:
                 best_score = score
@@ -0,0 +1,177 @@
+"""Column-bucketed index over a RootSpotManager's fixed spot list.
+
+Root spots never move, so their positions are bucketed once into fixed-width
+x columns. Spot *state* (occupied/blocked) changes through ``RootSpot``
+attribute writes, which call ``RootSpotIndex.update`` so the empty, occupied
+and blocked sets stay in step without rescanning every spot.
+
+Spots are identified by their position in the manager's ``spots`` list.
+Every query returns positions in list order, so callers that iterate, sort
+(stable) or ``rng.choice`` over the results see exactly the sequences the
+full-list scans produced: tie-breaking and RNG consumption are unchanged.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, insort
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.root_spots import RootSpot
+
+# Column width in pixels. Default tank spacing is ~30-45px, so a column holds
+# one or two spots and a 200px sprouting radius touches about seven columns.
+ROOT_SPOT_INDEX_COLUMN_WIDTH = 64.0
+
+
+class RootSpotIndex:
+    """Static x-column buckets plus live empty/occupied/blocked position sets."""
+
+    def __init__(
+        self, spots: Sequence[RootSpot], column_width: float = ROOT_SPOT_INDEX_COLUMN_WIDTH
+    ) -> None:
+        self._spots = spots
+        self.column_width = column_width
+        self._columns: dict[int, list[int]] = {}
+        self._column_empty: dict[int, int] = {}
+        self._empty_set: set[int] = set()
+        self._empty: list[int] = []
+        self._occupied: set[int] = set()
+        self._blocked: set[int] = set()
+
+        for pos, spot in enumerate(spots):
+            self._columns.setdefault(self._column(spot.x), []).append(pos)
+        self._min_column = min(self._columns, default=0)
+        self._max_column = max(self._columns, default=0)
+        for pos, spot in enumerate(spots):
+            self._set_state(pos, spot)
+
+    def _column(self, x: float) -> int:
+        return math.floor(x / self.column_width)
+
+    def _column_span(self, lo: float, hi: float) -> range:
+        """Columns that may hold x in ``[lo, hi]`` (one column of floor() slack)."""
+        first = max(self._column(lo) - 1, self._min_column)
+        last = min(self._column(hi) + 1, self._max_column)
+        return range(first, last + 1)
+
+    def _set_state(self, pos: int, spot: RootSpot) -> None:
+        if spot.occupied:
+            self._occupied.add(pos)
+        else:
+            self._occupied.discard(pos)
+        if spot.blocked:
+            self._blocked.add(pos)
+        else:
+            self._blocked.discard(pos)
+
+        is_empty = not spot.occupied and not spot.blocked
+        if is_empty == (pos in self._empty_set):
+            return
+        column = self._column(spot.x)
+        if is_empty:
+            self._empty_set.add(pos)
+            insort(self._empty, pos)
+            self._column_empty[column] = self._column_empty.get(column, 0) + 1
+        else:
+            self._empty_set.discard(pos)
+            del self._empty[bisect_left(self._empty, pos)]
+            self._column_empty[column] -= 1
+
+    def update(self, pos: int) -> None:
+        """Re-read the occupied/blocked state of the spot at ``pos``."""
+        self._set_state(pos, self._spots[pos])
+
+    @property
+    def empty_positions(self) -> list[int]:
+        """Positions of empty (unoccupied, unblocked) spots in list order.
+
+        The returned list is live; copy it before mutating spot state.
+        """
+        return self._empty
+
+    @property
+    def occupied_count(self) -> int:
+        return len(self._occupied)
+
+    @property
+    def blocked_count(self) -> int:
+        return len(self._blocked)
+
+    def occupied_positions(self) -> list[int]:
+        """Positions of occupied spots (blocked or not) in list order."""
+        return sorted(self._occupied)
+
+    def nearest_empty(self, x: float, y: float) -> int | None:
+        """Position of the empty spot nearest ``(x, y)``; ties go to the lower position.
+
+        Columns are visited outward from the query column and the search
+        stops once every unvisited column is provably farther than the best
+        candidate, so typical queries touch only a few columns.
+        """
+        if not self._empty:
+            return None
+
+        spots = self._spots
+        center = self._column(x)
+        best: tuple[float, int] | None = None
+        # Start at the first ring that contains a column (queries may lie
+        # far outside the spot band).
+        ring = max(0, self._min_column - center, center - self._max_column)
+        while True:
+            for column in (center,) if ring == 0 else (center - ring, center + ring):
+                if not self._column_empty.get(column):
+                    continue
+                for pos in self._columns[column]:
+                    if pos not in self._empty_set:
+                        continue
+                    spot = spots[pos]
+                    dx = spot.x - x
+                    dy = spot.y - y
+                    candidate = (dx * dx + dy * dy, pos)
+                    if best is None or candidate < best:
+                        best = candidate
+            # Unvisited columns lie more than (ring - 1) column widths away in
+            # x alone; the one-column slack absorbs floor() rounding at edges.
+            reach = (ring - 1) * self.column_width
+            if best is not None and ring >= 1 and best[0] < reach * reach:
+                return best[1]
+            if center - ring <= self._min_column and center + ring >= self._max_column:
+                return best[1] if best is not None else None
+            ring += 1
+
+    def in_range(self, x: float, y: float, radius: float, only_empty: bool) -> list[int]:
+        """Positions of unblocked spots within ``radius`` of ``(x, y)``, in list order."""
+        radius_sq = radius * radius
+        reach = abs(radius)
+        spots = self._spots
+        found: list[int] = []
+        for column in self._column_span(x - reach, x + reach):
+            for pos in self._columns.get(column, ()):
+                if pos in self._blocked:
+                    continue
+                if only_empty and pos in self._occupied:
+                    continue
+                spot = spots[pos]
+                dx = spot.x - x
+                dy = spot.y - y
+                if dx * dx + dy * dy <= radius_sq:
+                    found.append(pos)
+        found.sort()
+        return found
+
+    def in_rect(self, x: float, y: float, width: float, height: float) -> list[int]:
+        """Positions of unblocked spots inside the rectangle, in list order."""
+        spots = self._spots
+        found: list[int] = []
+        for column in self._column_span(x, x + width):
+            for pos in self._columns.get(column, ()):
+                if pos in self._blocked:
+                    continue
+                spot = spots[pos]
+                if x <= spot.x <= x + width and y <= spot.y <= y + height:
+                    found.append(pos)
+        found.sort()
+        return found
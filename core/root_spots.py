@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Optional
 
 from core.config.display import SCREEN_HEIGHT, SCREEN_WIDTH
 from core.config.plants import PLANT_ROOT_SPOT_COUNT
+from core.root_spot_index import RootSpotIndex
 from core.util.rng import require_rng_param
 
 if TYPE_CHECKING:
@@ -30,6 +31,9 @@ ROOT_SPOT_MIN_SPACING = 8  # Minimum pixels between spots
 # rule in core/tank_objects.py. Scaled down for small custom tanks.
 ROOT_SPOT_EDGE_MARGIN = 160
 
+# RootSpot fields mirrored by the manager's RootSpotIndex
+_INDEXED_SPOT_STATE = frozenset({"occupied", "blocked"})
+
 
 @dataclass
 class RootSpot:
@@ -58,6 +62,15 @@ class RootSpot:
     # Angle in radians (for radial_inward mode), relative to dish center
     angle: float | None = None
 
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        # Every occupied/blocked write (claim, release, blocking, reconcile
+        # repairs) keeps the manager's spot index current.
+        if name in _INDEXED_SPOT_STATE:
+            manager = self.__dict__.get("manager")
+            if manager is not None:
+                manager._on_spot_state_changed(self)
+
     def get_anchor_topleft(self, width: float, height: float) -> tuple[float, float]:
         """Get the topleft position for a plant of given size anchored here.
 
@@ -157,6 +170,17 @@ class RootSpotManager:
         self.rng = require_rng_param(rng, "__init__")
         self.spots: list[RootSpot] = []
         self._initialize_spots(spot_count)
+        # Built from the final spot list; state writes keep it current
+        self._index = RootSpotIndex(self.spots)
+
+    def _on_spot_state_changed(self, spot: RootSpot) -> None:
+        """Mirror a spot's occupied/blocked change into the index."""
+        index: RootSpotIndex | None = self.__dict__.get("_index")
+        if index is None:
+            return  # Still initializing; the index is built from final state
+        pos = spot.spot_id
+        if 0 <= pos < len(self.spots) and self.spots[pos] is spot:
+            index.update(pos)
 
     def _initialize_spots(self, count: int) -> None:
         """Create all root spots distributed along tank bottom.
@@ -190,11 +214,11 @@ class RootSpotManager:
         Returns:
             Random empty RootSpot, or None if all spots are occupied
         """
-        empty_spots = [s for s in self.spots if not s.occupied and not s.blocked]
-        if not empty_spots:
+        empty = self._index.empty_positions
+        if not empty:
             return None
         _rng = rng if rng is not None else self.rng
-        return _rng.choice(empty_spots)
+        return self.spots[_rng.choice(empty)]
 
     def get_nearest_empty_spot(self, x: float, y: float) -> RootSpot | None:
         """Get the nearest unoccupied spot to a position.
@@ -206,16 +230,8 @@ class RootSpotManager:
         Returns:
             Nearest empty RootSpot, or None if all occupied
         """
-        empty_spots = [s for s in self.spots if not s.occupied and not s.blocked]
-        if not empty_spots:
-            return None
-
-        def distance_sq(spot: RootSpot) -> float:
-            dx = spot.x - x
-            dy = spot.y - y
-            return dx * dx + dy * dy
-
-        return min(empty_spots, key=distance_sq)
+        pos = self._index.nearest_empty(x, y)
+        return self.spots[pos] if pos is not None else None
 
     def get_spot_by_id(self, spot_id: int) -> RootSpot | None:
         """Get a spot by its ID.
@@ -266,14 +282,10 @@ class RootSpotManager:
             width += padding * 2
             height += padding * 2
 
-        blocked = 0
-        for spot in self.spots:
-            if spot.blocked:
-                continue
-            if x <= spot.x <= x + width and y <= spot.y <= y + height:
-                spot.blocked = True
-                blocked += 1
-        return blocked
+        positions = self._index.in_rect(x, y, width, height)
+        for pos in positions:
+            self.spots[pos].blocked = True
+        return len(positions)
 
     def block_spots_for_entity(self, entity: "Entity", padding: float = 0.0) -> int:
         """Block spots underneath an entity that shouldn't allow plants.
@@ -312,7 +324,7 @@ class RootSpotManager:
         Returns:
             Count of spots with plants
         """
-        return sum(1 for s in self.spots if s.occupied)
+        return self._index.occupied_count
 
     def get_empty_count(self) -> int:
         """Get number of empty spots.
@@ -320,7 +332,7 @@ class RootSpotManager:
         Returns:
             Count of available spots
         """
-        return sum(1 for s in self.spots if not s.occupied and not s.blocked)
+        return len(self._index.empty_positions)
 
     def get_occupancy_ratio(self) -> float:
         """Get ratio of occupied to total spots.
@@ -328,10 +340,10 @@ class RootSpotManager:
         Returns:
             Occupancy ratio (0.0 to 1.0)
         """
-        available_spots = [s for s in self.spots if not s.blocked]
-        if not available_spots:
+        available = len(self.spots) - self._index.blocked_count
+        if not available:
             return 0.0
-        return self.get_occupied_count() / len(available_spots)
+        return self.get_occupied_count() / available
 
     def get_all_occupied_spots(self) -> list[RootSpot]:
         """Get all spots that have plants.
@@ -339,7 +351,7 @@ class RootSpotManager:
         Returns:
             List of occupied RootSpots
         """
-        return [s for s in self.spots if s.occupied]
+        return [self.spots[pos] for pos in self._index.occupied_positions()]
 
     def get_all_empty_spots(self) -> list[RootSpot]:
         """Get all available spots.
@@ -347,7 +359,7 @@ class RootSpotManager:
         Returns:
             List of empty RootSpots
         """
-        return [s for s in self.spots if not s.occupied and not s.blocked]
+        return [self.spots[pos] for pos in self._index.empty_positions]
 
     def get_spots_in_range(
         self, x: float, y: float, radius: float, only_empty: bool = False
@@ -363,20 +375,7 @@ class RootSpotManager:
         Returns:
             List of spots within range
         """
-        radius_sq = radius * radius
-        result = []
-
-        for spot in self.spots:
-            if spot.blocked:
-                continue
-            if only_empty and spot.occupied:
-                continue
-            dx = spot.x - x
-            dy = spot.y - y
-            if dx * dx + dy * dy <= radius_sq:
-                result.append(spot)
-
-        return result
+        return [self.spots[pos] for pos in self._index.in_range(x, y, radius, only_empty)]
 
     def find_spot_for_sprouting(
         self,
@@ -441,7 +440,7 @@ class RootSpotManager:
         """
         _rng = rng if rng is not None else self.rng
 
-        empty_spots = [s for s in self.spots if not s.occupied and not s.blocked]
+        empty_spots = [self.spots[pos] for pos in self._index.empty_positions]
         if not empty_spots:
             return None
 
@@ -4,11 +4,14 @@ This module provides the main StatsCalculator class that aggregates
 statistics from specialized sub-modules:
 - entity_stats: Fish, food, and plant counts/energy
 - genetic_stats: Genetic trait distributions
+- incremental_genetic_stats: The same distributions, maintained incrementally
+- core.genetics.diversity: Exact pairwise genetic diversity
 """
 
 from typing import TYPE_CHECKING, Any
 
 import core.services.stats.entity_stats as entity_stats
+from core.services.stats.incremental_genetic_stats import IncrementalGeneticStats
 from core.services.stats.utils import calculate_meta_stats, humanize_gene_label
 
 if TYPE_CHECKING:
@@ -23,6 +26,7 @@ class StatsCalculator:
 
     Attributes:
         _engine: Reference to the simulation engine
+        _genetic_stats: Incrementally maintained genetic distributions
     """
 
     def __init__(self, engine: "SimulationEngine") -> None:
@@ -32,6 +36,7 @@ class StatsCalculator:
             engine: The simulation engine to calculate stats for
         """
         self._engine = engine
+        self._genetic_stats = IncrementalGeneticStats()
 
     def _calculate_meta_stats(self, traits: list[Any], prefix: str) -> dict[str, Any]:
         """Delegate to utils module."""
@@ -73,12 +78,26 @@ class StatsCalculator:
         if include_distributions:
             # Add genetic distribution stats
             stats.update(self._get_genetic_distribution_stats())
+            stats["genetic_diversity"] = self._get_genetic_diversity_stats()
 
         return stats
 
     def _get_genetic_distribution_stats(self) -> dict[str, Any]:
-        """Get genetic trait distribution statistics with histograms."""
-        from core.services.stats.genetic_stats import get_genetic_distribution_stats
+        """Get genetic trait distribution statistics with histograms.
 
+        Only fish born or removed since the previous call are read; see
+        ``IncrementalGeneticStats``.
+        """
         fish_list = self._engine.entity_manager.get_fish()
-        return get_genetic_distribution_stats(fish_list)
+        return self._genetic_stats.update(fish_list)
+
+    def _get_genetic_diversity_stats(self) -> dict[str, float]:
+        """Get pairwise genetic distance and niche metrics over every living fish.
+
+        Uses ``population_diversity(exact=True)``, which computes all pairs in
+        one ``GenomeMatrix`` instead of sampling them.
+        """
+        from core.genetics.diversity import population_diversity
+
+        genomes = [fish.genome for fish in self._engine.entity_manager.get_fish()]
+        return population_diversity(genomes, exact=True)
@@ -10,22 +10,18 @@ from typing import TYPE_CHECKING
 
 logger = logging.getLogger(__name__)
 
-from core.config.fish import (
-    BODY_ASPECT_MAX,
-    BODY_ASPECT_MIN,
-    EYE_SIZE_MAX,
-    EYE_SIZE_MIN,
-    FISH_ADULT_SIZE,
-    FISH_PATTERN_COUNT,
-    FISH_SIZE_MODIFIER_MAX,
-    FISH_SIZE_MODIFIER_MIN,
-    FISH_TEMPLATE_COUNT,
-    LIFESPAN_MODIFIER_MAX,
-    LIFESPAN_MODIFIER_MIN,
-)
+from core.config.fish import FISH_ADULT_SIZE
 from core.genetics.behavioral import BEHAVIORAL_TRAIT_SPECS
 from core.genetics.physical import PHYSICAL_TRAIT_SPECS
 from core.genetics.trait import TraitSpec
+from core.services.stats.histogram_specs import (
+    ADULT_SIZE_HISTOGRAM,
+    FLAT_STAT_HISTOGRAMS,
+    POKER_STRATEGY_HISTOGRAM,
+    HistogramSpec,
+    sub_behavior_histogram,
+    trait_spec_histogram,
+)
 from core.services.stats.utils import humanize_gene_label
 from core.statistics_utils import GeneDistribution, compute_meta_stats, create_histogram
 
@@ -102,10 +98,8 @@ def _get_trait_values(
     return values
 
 
-def _compute_numeric_stats(
-    values: list[float], min_val: float, max_val: float, key_prefix: str
-) -> dict[str, StatValue]:
-    """Compute standard stats and histogram for a list of values."""
+def _compute_numeric_stats(values: list[float], key_prefix: str) -> dict[str, StatValue]:
+    """Compute standard stats and the ``FLAT_STAT_HISTOGRAMS`` histogram for a list of values."""
     if not values:
         return {
             f"{key_prefix}_min": 0.0,
@@ -116,7 +110,7 @@ def _compute_numeric_stats(
             f"{key_prefix}_bin_edges": [],
         }
 
-    bins, edges = create_histogram(values, min_val, max_val, num_bins=10)
+    bins, edges = _histogram(values, FLAT_STAT_HISTOGRAMS[key_prefix])
 
     return {
         f"{key_prefix}_min": min(values),
@@ -128,6 +122,12 @@ def _compute_numeric_stats(
     }
 
 
+def _histogram(values: list[float], spec: HistogramSpec) -> tuple[list[int], list[float]]:
+    """``create_histogram`` over one ``HistogramSpec``."""
+    num_bins, range_min, range_max = spec
+    return create_histogram(values, range_min, range_max, num_bins=num_bins)
+
+
 def _get_adult_size_stats(fish_list: list["Fish"]) -> dict[str, StatValue]:
     # Calculate actual size (base * modifier)
     values = []
@@ -136,54 +136,47 @@ def _get_adult_size_stats(fish_list: list["Fish"]) -> dict[str, StatValue]:
             mod = f.genome.physical.size_modifier.value
             values.append(FISH_ADULT_SIZE * mod)
 
-    min_size = FISH_ADULT_SIZE * FISH_SIZE_MODIFIER_MIN
-    max_size = FISH_ADULT_SIZE * FISH_SIZE_MODIFIER_MAX
-
-    return _compute_numeric_stats(values, min_size, max_size, "adult_size")
+    return _compute_numeric_stats(values, "adult_size")
 
 
 def _get_eye_size_stats(fish_list: list["Fish"]) -> dict[str, StatValue]:
     values = _get_trait_values(fish_list, "eye_size", "physical")
-    return _compute_numeric_stats(values, EYE_SIZE_MIN, EYE_SIZE_MAX, "eye_size")
+    return _compute_numeric_stats(values, "eye_size")
 
 
 def _get_fin_size_stats(fish_list: list["Fish"]) -> dict[str, StatValue]:
-    # Hardcoded bounds from trait specs if not in config
     values = _get_trait_values(fish_list, "fin_size", "physical")
-    return _compute_numeric_stats(values, 0.5, 2.0, "fin_size")
+    return _compute_numeric_stats(values, "fin_size")
 
 
 def _get_tail_size_stats(fish_list: list["Fish"]) -> dict[str, StatValue]:
     values = _get_trait_values(fish_list, "tail_size", "physical")
-    return _compute_numeric_stats(values, 0.5, 2.0, "tail_size")
+    return _compute_numeric_stats(values, "tail_size")
 
 
 def _get_body_aspect_stats(fish_list: list["Fish"]) -> dict[str, StatValue]:
     values = _get_trait_values(fish_list, "body_aspect", "physical")
-    return _compute_numeric_stats(values, BODY_ASPECT_MIN, BODY_ASPECT_MAX, "body_aspect")
+    return _compute_numeric_stats(values, "body_aspect")
 
 
 def _get_template_id_stats(fish_list: list["Fish"]) -> dict[str, StatValue]:
     values = _get_trait_values(fish_list, "template_id", "physical")
-    # For discrete values, use min/max of possible range for histogram
-    return _compute_numeric_stats(values, 0, FISH_TEMPLATE_COUNT - 1, "template_id")
+    return _compute_numeric_stats(values, "template_id")
 
 
 def _get_pattern_type_stats(fish_list: list["Fish"]) -> dict[str, StatValue]:
     values = _get_trait_values(fish_list, "pattern_type", "physical")
-    return _compute_numeric_stats(values, 0, FISH_PATTERN_COUNT - 1, "pattern_type")
+    return _compute_numeric_stats(values, "pattern_type")
 
 
 def _get_pattern_intensity_stats(fish_list: list["Fish"]) -> dict[str, StatValue]:
     values = _get_trait_values(fish_list, "pattern_intensity", "physical")
-    return _compute_numeric_stats(values, 0.0, 1.0, "pattern_intensity")
+    return _compute_numeric_stats(values, "pattern_intensity")
 
 
 def _get_lifespan_modifier_stats(fish_list: list["Fish"]) -> dict[str, StatValue]:
     values = _get_trait_values(fish_list, "lifespan_modifier", "physical")
-    return _compute_numeric_stats(
-        values, LIFESPAN_MODIFIER_MIN, LIFESPAN_MODIFIER_MAX, "lifespan_modifier"
-    )
+    return _compute_numeric_stats(values, "lifespan_modifier")
 
 
 def _build_gene_distributions(fish_list: list["Fish"]) -> dict[str, list[GeneDistribution]]:
@@ -231,7 +224,7 @@ def _build_gene_distributions(fish_list: list["Fish"]) -> dict[str, list[GeneDis
                 edges: list[float] = []
                 median_val = min_val = max_val = 0.0
             else:
-                bins, edges = create_histogram(values, spec.min_val, spec.max_val, num_bins=20)
+                bins, edges = _histogram(values, trait_spec_histogram(spec))
                 median_val = statistics.median(values)
                 min_val = min(values)
                 max_val = max(values)
@@ -263,8 +256,7 @@ def _build_gene_distributions(fish_list: list["Fish"]) -> dict[str, list[GeneDis
 
     # Derived Adult Size Distribution
     try:
-        allowed_min = float(FISH_ADULT_SIZE * FISH_SIZE_MODIFIER_MIN)
-        allowed_max = float(FISH_ADULT_SIZE * FISH_SIZE_MODIFIER_MAX)
+        _, allowed_min, allowed_max = ADULT_SIZE_HISTOGRAM
 
         size_traits: list[object] = []
         adult_sizes = []
@@ -279,7 +271,7 @@ def _build_gene_distributions(fish_list: list["Fish"]) -> dict[str, list[GeneDis
                 adult_sizes.append(FISH_ADULT_SIZE * float(t.value))
 
         if adult_sizes:
-            bins, edges = create_histogram(adult_sizes, allowed_min, allowed_max, num_bins=16)
+            bins, edges = _histogram(adult_sizes, ADULT_SIZE_HISTOGRAM)
             median_val = statistics.median(adult_sizes)
             min_val, max_val = min(adult_sizes), max(adult_sizes)
         else:
@@ -319,7 +311,6 @@ def _get_composable_behavior_distributions(fish_list: list["Fish"]) -> list[Gene
 
     try:
         from core.algorithms.composable import ComposableBehavior
-        from core.algorithms.registry import SUB_BEHAVIOR_COUNTS
     except ImportError:
         return []
 
@@ -342,8 +333,9 @@ def _get_composable_behavior_distributions(fish_list: list["Fish"]) -> list[Gene
             threat_traits.append(trait)
 
     if threat_vals:
-        min_val, max_val = 0, SUB_BEHAVIOR_COUNTS["threat_response"] - 1
-        bins, edges = create_histogram(threat_vals, min_val, max_val, num_bins=max_val + 1)
+        histogram = sub_behavior_histogram("threat_response")
+        _, min_val, max_val = histogram
+        bins, edges = _histogram(threat_vals, histogram)
 
         distributions.append(
             GeneDistribution(
@@ -379,8 +371,9 @@ def _get_composable_behavior_distributions(fish_list: list["Fish"]) -> list[Gene
             food_traits.append(trait)
 
     if food_vals:
-        min_val, max_val = 0, SUB_BEHAVIOR_COUNTS["food_approach"] - 1
-        bins, edges = create_histogram(food_vals, min_val, max_val, num_bins=max_val + 1)
+        histogram = sub_behavior_histogram("food_approach")
+        _, min_val, max_val = histogram
+        bins, edges = _histogram(food_vals, histogram)
 
         distributions.append(
             GeneDistribution(
@@ -438,8 +431,8 @@ def _get_poker_strategy_distributions(fish_list: list["Fish"]) -> list[GeneDistr
         return []
 
     def build_dist(key: str, label: str, values: list[int]) -> GeneDistribution:
-        min_val, max_val = 0, 3
-        bins, edges = create_histogram(values, min_val, max_val, num_bins=4)
+        _, min_val, max_val = POKER_STRATEGY_HISTOGRAM
+        bins, edges = _histogram(values, POKER_STRATEGY_HISTOGRAM)
         return GeneDistribution(
             key=key,
             label=label,
@@ -0,0 +1,64 @@
+"""Histogram layouts of the genetic distribution stats.
+
+``get_genetic_distribution_stats`` and ``IncrementalGeneticStats`` must bin
+every trait identically, so both read their ranges and bin counts from here
+and bin with ``core.statistics_utils.histogram_bin``.
+"""
+
+from core.config.fish import (
+    BODY_ASPECT_MAX,
+    BODY_ASPECT_MIN,
+    EYE_SIZE_MAX,
+    EYE_SIZE_MIN,
+    FISH_ADULT_SIZE,
+    FISH_PATTERN_COUNT,
+    FISH_SIZE_MODIFIER_MAX,
+    FISH_SIZE_MODIFIER_MIN,
+    FISH_TEMPLATE_COUNT,
+    LIFESPAN_MODIFIER_MAX,
+    LIFESPAN_MODIFIER_MIN,
+)
+from core.genetics.physical import PHYSICAL_TRAIT_SPECS
+from core.genetics.trait import TraitSpec
+
+# (num_bins, range_min, range_max) of one histogram over a trait's values
+HistogramSpec = tuple[int, float, float]
+
+ADULT_SIZE_MIN = float(FISH_ADULT_SIZE * FISH_SIZE_MODIFIER_MIN)
+ADULT_SIZE_MAX = float(FISH_ADULT_SIZE * FISH_SIZE_MODIFIER_MAX)
+
+_PHYSICAL_SPECS = {spec.name: spec for spec in PHYSICAL_TRAIT_SPECS}
+
+
+def trait_spec_histogram(spec: TraitSpec, num_bins: int = 20) -> HistogramSpec:
+    """Histogram over a trait spec's allowed range."""
+    return num_bins, float(spec.min_val), float(spec.max_val)
+
+
+def sub_behavior_histogram(key: str) -> HistogramSpec:
+    """One bin per variant of a composable sub-behavior ("threat_response", ...)."""
+    from core.algorithms.registry import SUB_BEHAVIOR_COUNTS
+
+    top = SUB_BEHAVIOR_COUNTS[key] - 1
+    return top + 1, 0, top
+
+
+# The flat "<trait>_min/_max/_avg/_median/_bins/_bin_edges" dashboard stats,
+# in output order
+FLAT_STAT_HISTOGRAMS: dict[str, HistogramSpec] = {
+    "adult_size": (10, ADULT_SIZE_MIN, ADULT_SIZE_MAX),
+    "eye_size": (10, EYE_SIZE_MIN, EYE_SIZE_MAX),
+    "fin_size": trait_spec_histogram(_PHYSICAL_SPECS["fin_size"], 10),
+    "tail_size": trait_spec_histogram(_PHYSICAL_SPECS["tail_size"], 10),
+    "body_aspect": (10, BODY_ASPECT_MIN, BODY_ASPECT_MAX),
+    "template_id": (10, 0, FISH_TEMPLATE_COUNT - 1),
+    "pattern_type": (10, 0, FISH_PATTERN_COUNT - 1),
+    "pattern_intensity": (10, 0.0, 1.0),
+    "lifespan_modifier": (10, LIFESPAN_MODIFIER_MIN, LIFESPAN_MODIFIER_MAX),
+}
+
+# Derived adult size in the "physical" gene distributions
+ADULT_SIZE_HISTOGRAM: HistogramSpec = (16, ADULT_SIZE_MIN, ADULT_SIZE_MAX)
+
+# Composable poker strategy parts (hand selection, betting style, bluffing)
+POKER_STRATEGY_HISTOGRAM: HistogramSpec = (4, 0, 3)
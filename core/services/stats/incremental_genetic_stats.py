@@ -0,0 +1,425 @@
+"""Incremental genetic distribution statistics.
+
+``get_genetic_distribution_stats`` re-reads every trait of every fish and
+recomputes medians, histograms and mutation meta-stats from scratch, the
+meta-stats through ``statistics.stdev``'s exact fraction arithmetic. A fish's
+genome does not change while it lives, so ``IncrementalGeneticStats`` reads
+a fish's traits once, when it joins the population, and keeps running state
+per trait instead:
+
+- a sorted value list (min, max, median and mean);
+- histogram bin counts, binned exactly like ``create_histogram``;
+- Welford mean/variance of the mutation rate, strength and HGT probability.
+
+Each ``update`` therefore costs O(population changes) plus the size of the
+output. Every ``resync_interval`` updates the state is rebuilt from scratch,
+which discards accumulated floating-point error and picks up any trait that
+was edited in place; a rebuild that finds different trait values is logged.
+The output has the same keys and layout as ``get_genetic_distribution_stats``.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+from core.config.fish import FISH_ADULT_SIZE
+from core.genetics.behavioral import BEHAVIORAL_TRAIT_SPECS
+from core.genetics.physical import PHYSICAL_TRAIT_SPECS
+from core.services.stats.genetic_stats import GeneStatsValue, StatValue
+from core.services.stats.histogram_specs import (
+    ADULT_SIZE_HISTOGRAM,
+    FLAT_STAT_HISTOGRAMS,
+    POKER_STRATEGY_HISTOGRAM,
+    HistogramSpec,
+    sub_behavior_histogram,
+    trait_spec_histogram,
+)
+from core.services.stats.utils import humanize_gene_label
+from core.statistics_utils import GeneDistribution, MetaStats, histogram_bin, histogram_edges
+
+if TYPE_CHECKING:
+    from core.entities import Fish
+    from core.genetics.trait import GeneticTrait
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESYNC_INTERVAL = 100
+
+# What one fish contributes to one trait: (value, mutation rate, strength, HGT)
+Sample = tuple[float, float, float, float]
+TraitReader = Callable[["Fish"], tuple[float, "GeneticTrait"] | None]
+
+
+class RunningMoments:
+    """Welford running mean and sample variance that also supports removal."""
+
+    __slots__ = ("_m2", "count", "mean")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def remove(self, value: float) -> None:
+        if self.count <= 1:
+            self.count, self.mean, self._m2 = 0, 0.0, 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / (self.count - 1)
+        self._m2 -= delta * (value - self.mean)
+        self.count -= 1
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (0.0 below two values, like ``safe_mean_std``)."""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(max(self._m2, 0.0) / (self.count - 1))
+
+
+class _Histogram:
+    """Bin counts of one ``HistogramSpec``, binned exactly like ``create_histogram``."""
+
+    __slots__ = ("counts", "edges", "spec")
+
+    def __init__(self, spec: HistogramSpec) -> None:
+        num_bins, range_min, range_max = spec
+        self.spec = spec
+        self.counts = [0] * num_bins
+        self.edges = histogram_edges(range_min, range_max, num_bins)
+
+    def _bin(self, value: float) -> int:
+        num_bins, range_min, range_max = self.spec
+        return histogram_bin(value, range_min, range_max, num_bins)
+
+    def add(self, value: float) -> None:
+        self.counts[self._bin(value)] += 1
+
+    def remove(self, value: float) -> None:
+        self.counts[self._bin(value)] -= 1
+
+
+class _TraitState:
+    """Running state of one trait across the tracked population."""
+
+    __slots__ = ("histograms", "meta", "values")
+
+    def __init__(self, histograms: Iterable[HistogramSpec]) -> None:
+        self.values: list[float] = []
+        self.histograms = {spec: _Histogram(spec) for spec in histograms}
+        self.meta = (RunningMoments(), RunningMoments(), RunningMoments())
+
+    def add(self, sample: Sample) -> None:
+        value = sample[0]
+        insort(self.values, value)
+        for histogram in self.histograms.values():
+            histogram.add(value)
+        for moments, meta_value in zip(self.meta, sample[1:], strict=True):
+            moments.add(meta_value)
+
+    def remove(self, sample: Sample) -> None:
+        value = sample[0]
+        del self.values[bisect_left(self.values, value)]
+        for histogram in self.histograms.values():
+            histogram.remove(value)
+        for moments, meta_value in zip(self.meta, sample[1:], strict=True):
+            moments.remove(meta_value)
+
+    def median(self) -> float:
+        values = self.values
+        middle = len(values) // 2
+        if len(values) % 2:
+            return values[middle]
+        return (values[middle - 1] + values[middle]) / 2
+
+    def meta_stats(self) -> MetaStats:
+        rate, strength, hgt = self.meta
+        return MetaStats(
+            mut_rate_mean=rate.mean,
+            mut_rate_std=rate.std,
+            mut_strength_mean=strength.mean,
+            mut_strength_std=strength.std,
+            hgt_prob_mean=hgt.mean,
+            hgt_prob_std=hgt.std,
+        )
+
+    def distribution(
+        self, key: str, label: str, category: str, discrete: bool, histogram: HistogramSpec
+    ) -> GeneDistribution:
+        _, allowed_min, allowed_max = histogram
+        distribution = GeneDistribution(
+            key=key,
+            label=label,
+            category=category,
+            discrete=discrete,
+            allowed_min=allowed_min,
+            allowed_max=allowed_max,
+            meta=self.meta_stats(),
+        )
+        if self.values:
+            distribution.min = self.values[0]
+            distribution.max = self.values[-1]
+            distribution.median = self.median()
+            distribution.bins = list(self.histograms[histogram].counts)
+            distribution.bin_edges = list(self.histograms[histogram].edges)
+        return distribution
+
+
+@dataclass(frozen=True)
+class _Channel:
+    """One tracked trait: how to read it off a fish and how it is reported."""
+
+    key: str
+    label: str
+    category: str
+    discrete: bool
+    read: TraitReader
+    histogram: HistogramSpec
+    # Only reported when at least one fish has the trait (composable genes)
+    optional: bool = False
+
+
+def _spec_reader(category: str, name: str) -> TraitReader:
+    get_trait = attrgetter(f"genome.{category}.{name}")
+
+    def read(fish: Fish) -> tuple[float, GeneticTrait] | None:
+        trait = get_trait(fish)
+        return (float(trait.value), trait) if trait is not None else None
+
+    return read
+
+
+def _read_adult_size(fish: Fish) -> tuple[float, GeneticTrait] | None:
+    trait = fish.genome.physical.size_modifier
+    return FISH_ADULT_SIZE * float(trait.value), trait
+
+
+def _composable_reader(part: str) -> TraitReader:
+    from core.algorithms.composable import ComposableBehavior
+
+    get_part = attrgetter(part)
+
+    def read(fish: Fish) -> tuple[float, GeneticTrait] | None:
+        trait = fish.genome.behavioral.behavior
+        if trait is None or not isinstance(trait.value, ComposableBehavior):
+            return None
+        behavior = trait.value
+        # Truthiness (not None-ness) check, matching get_genetic_distribution_stats
+        sub_behavior = get_part(behavior)
+        return (sub_behavior.value, trait) if sub_behavior else None
+
+    return read
+
+
+def _poker_reader(part: str) -> TraitReader:
+    from core.poker.strategy.composable import ComposablePokerStrategy
+
+    get_part = attrgetter(part)
+
+    def read(fish: Fish) -> tuple[float, GeneticTrait] | None:
+        trait = fish.genome.behavioral.poker_strategy
+        if trait is None or not isinstance(trait.value, ComposablePokerStrategy):
+            return None
+        return get_part(trait.value).value, trait
+
+    return read
+
+
+def _build_channels() -> list[_Channel]:
+    """Every reported trait, in ``get_genetic_distribution_stats`` output order."""
+    channels = [
+        _Channel(
+            "adult_size",
+            humanize_gene_label("adult_size"),
+            "physical",
+            False,
+            _read_adult_size,
+            ADULT_SIZE_HISTOGRAM,
+        )
+    ]
+    for category, specs in (
+        ("physical", PHYSICAL_TRAIT_SPECS),
+        ("behavioral", BEHAVIORAL_TRAIT_SPECS),
+    ):
+        channels.extend(
+            _Channel(
+                spec.name,
+                humanize_gene_label(spec.name),
+                category,
+                spec.discrete,
+                _spec_reader(category, spec.name),
+                trait_spec_histogram(spec),
+            )
+            for spec in specs
+        )
+    for key, label in (("threat_response", "Threat Response"), ("food_approach", "Food Approach")):
+        channels.append(
+            _Channel(
+                key,
+                label,
+                "behavioral",
+                True,
+                _composable_reader(key),
+                sub_behavior_histogram(key),
+                True,
+            )
+        )
+    for part, label in (
+        ("hand_selection", "Poker Hand Selection"),
+        ("betting_style", "Poker Betting Style"),
+        ("bluffing_approach", "Poker Bluffing Approach"),
+    ):
+        channels.append(
+            _Channel(
+                f"poker_{part}",
+                label,
+                "behavioral",
+                True,
+                _poker_reader(part),
+                POKER_STRATEGY_HISTOGRAM,
+                True,
+            )
+        )
+    return channels
+
+
+class IncrementalGeneticStats:
+    """Genetic distribution stats maintained across population changes.
+
+    Call ``update`` with the current fish list whenever stats are needed; fish
+    that joined or left since the previous call are the only ones read.
+
+    Attributes:
+        resync_interval: Number of updates between full rebuilds
+    """
+
+    def __init__(self, resync_interval: int = DEFAULT_RESYNC_INTERVAL) -> None:
+        if resync_interval < 1:
+            raise ValueError("resync_interval must be positive")
+        self.resync_interval = resync_interval
+        self._channels = _build_channels()
+        self._states = self._new_states()
+        # id(fish) -> (fish, samples); the reference keeps ids from being reused
+        self._tracked: dict[int, tuple[Fish, tuple[Sample | None, ...]]] = {}
+        self._updates = 0
+
+    def _new_states(self) -> dict[str, _TraitState]:
+        flat = {key: (spec,) for key, spec in FLAT_STAT_HISTOGRAMS.items()}
+        return {
+            channel.key: _TraitState((channel.histogram, *flat.get(channel.key, ())))
+            for channel in self._channels
+        }
+
+    def _samples(self, fish: Fish) -> tuple[Sample | None, ...]:
+        samples: list[Sample | None] = []
+        for channel in self._channels:
+            read = channel.read(fish)
+            if read is None:
+                samples.append(None)
+                continue
+            value, trait = read
+            samples.append(
+                (
+                    value,
+                    float(trait.mutation_rate),
+                    float(trait.mutation_strength),
+                    float(trait.hgt_probability),
+                )
+            )
+        return tuple(samples)
+
+    def _apply(self, samples: tuple[Sample | None, ...], add: bool) -> None:
+        for channel, sample in zip(self._channels, samples, strict=True):
+            if sample is None:
+                continue
+            state = self._states[channel.key]
+            if add:
+                state.add(sample)
+            else:
+                state.remove(sample)
+
+    def update(self, fish_list: list[Fish]) -> dict[str, GeneStatsValue]:
+        """Sync with ``fish_list`` and return the current distribution stats."""
+        self._updates += 1
+        if self._updates % self.resync_interval == 0:
+            self.rebuild(fish_list)
+            return self.snapshot()
+
+        # Walk both sides in list order, not set order: the order values enter
+        # the running sums decides their last bits, and seeded runs must match
+        current = {id(fish): fish for fish in fish_list}
+        tracked = self._tracked
+        for fish_id in [fish_id for fish_id in tracked if fish_id not in current]:
+            self._apply(tracked.pop(fish_id)[1], add=False)
+        for fish_id, fish in current.items():
+            if fish_id not in tracked:
+                samples = self._samples(fish)
+                tracked[fish_id] = (fish, samples)
+                self._apply(samples, add=True)
+        return self.snapshot()
+
+    def rebuild(self, fish_list: list[Fish]) -> None:
+        """Recompute all state from ``fish_list``, logging any trait drift."""
+        previous = self._states
+        self._states = self._new_states()
+        self._tracked = {}
+        for fish in fish_list:
+            samples = self._samples(fish)
+            self._tracked[id(fish)] = (fish, samples)
+            self._apply(samples, add=True)
+        drifted = [
+            key for key, state in self._states.items() if state.values != previous[key].values
+        ]
+        if drifted:
+            logger.debug("Genetic stats resync corrected drifted traits: %s", drifted)
+
+    def snapshot(self) -> dict[str, GeneStatsValue]:
+        """Current stats in the ``get_genetic_distribution_stats`` layout."""
+        stats: dict[str, GeneStatsValue] = {}
+        for key, histogram in FLAT_STAT_HISTOGRAMS.items():
+            stats.update(self._flat_stats(key, self._states[key], histogram))
+
+        distributions: dict[str, list[dict[str, object]]] = {"physical": [], "behavioral": []}
+        for channel in self._channels:
+            state = self._states[channel.key]
+            if channel.optional and not state.values:
+                continue
+            distribution = state.distribution(
+                channel.key, channel.label, channel.category, channel.discrete, channel.histogram
+            )
+            distributions[channel.category].append(distribution.to_dict())
+        stats["gene_distributions"] = distributions
+        return stats
+
+    @staticmethod
+    def _flat_stats(key: str, state: _TraitState, histogram: HistogramSpec) -> dict[str, StatValue]:
+        values = state.values
+        if not values:
+            return {
+                f"{key}_min": 0.0,
+                f"{key}_max": 0.0,
+                f"{key}_avg": 0.0,
+                f"{key}_median": 0.0,
+                f"{key}_bins": [],
+                f"{key}_bin_edges": [],
+            }
+        return {
+            f"{key}_min": values[0],
+            f"{key}_max": values[-1],
+            f"{key}_avg": sum(values) / len(values),
+            f"{key}_median": state.median(),
+            f"{key}_bins": list(state.histograms[histogram].counts),
+            f"{key}_bin_edges": list(state.histograms[histogram].edges),
+        }
@@ -17,9 +17,12 @@ Usage:
     engine.run_headless(max_frames=1000)
 """
 
-from core.simulation.engine import HeadlessSimulator, SimulationEngine
-from core.simulation.entity_manager import EntityManager
-from core.simulation.system_registry import SystemRegistry
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.simulation.engine import HeadlessSimulator, SimulationEngine
+    from core.simulation.entity_manager import EntityManager
+    from core.simulation.system_registry import SystemRegistry
 
 __all__ = [
     "EntityManager",
@@ -27,3 +30,25 @@ __all__ = [
     "SimulationEngine",
     "SystemRegistry",
 ]
+
+# Loaded on first access so leaf modules (e.g. core.simulation.energy_ledger)
+# can be imported without the engine and everything it pulls in.
+_lazy_imports = {
+    "EntityManager": ("core.simulation.entity_manager", "EntityManager"),
+    "HeadlessSimulator": ("core.simulation.engine", "HeadlessSimulator"),
+    "SimulationEngine": ("core.simulation.engine", "SimulationEngine"),
+    "SystemRegistry": ("core.simulation.system_registry", "SystemRegistry"),
+}
+
+
+def __getattr__(name: str) -> object:
+    """Lazy import handler (PEP 562)."""
+    if name in _lazy_imports:
+        module_path, attr_name = _lazy_imports[name]
+        import importlib
+
+        value = getattr(importlib.import_module(module_path), attr_name)
+        # Cache in module namespace for future access
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -46,6 +46,13 @@ def format_simulation_stats(engine: "SimulationEngine", start_time: float) -> li
             ]
         )
 
+    diversity = stats.get("genetic_diversity", {})
+    if diversity:
+        lines.append(
+            f"Genetic Spread:  mean distance {diversity.get('mean_distance', 0.0)}, "
+            f"{diversity.get('num_niches', 0)} niches"
+        )
+
     deaths = stats.get("death_causes", {})
     if deaths:
         causes_str = ", ".join(f"{k}: {v}" for k, v in deaths.items())
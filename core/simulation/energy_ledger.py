@@ -0,0 +1,173 @@
+"""Columnar per-frame energy-delta ledger.
+
+Every non-zero energy change (metabolism, food, poker, soccer) is recorded
+through ``Environment.record_energy_delta``; a busy tank records hundreds per
+frame. ``EnergyLedger`` stores them as three parallel packed arrays (entity
+slot, source code, delta) instead of one ``EnergyDeltaRecord`` per call:
+
+- each entity's identity is resolved once per frame, the first time it
+  records, and interned to a slot (so identity providers still see entities
+  in the same order as before);
+- source strings are interned to small integer codes;
+- metadata is kept only for the rare rows that carry any.
+
+Frame-end consumers reduce the columns in bulk (``totals_by_source``).
+The ledger is also a read-only ``Sequence[EnergyDeltaRecord]``: records are
+materialized on first access, for consumers that still want objects.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import overload
+
+import numpy as np
+
+from core.worlds.contracts import EnergyDeltaRecord
+
+# (entity_id, stable_id, entity_type) of one interned entity
+_Identity = tuple[str, str | None, str | None]
+
+
+class EnergyLedger(Sequence[EnergyDeltaRecord]):
+    """One frame's energy deltas in columnar form.
+
+    Example:
+        ledger = EnergyLedger()
+        ledger.record(fish, -0.5, "metabolism", {}, get_identity)
+        gains, burns = ledger.totals_by_source()
+    """
+
+    def __init__(self) -> None:
+        self._slots = array("q")
+        self._source_codes = array("q")
+        self._deltas = array("d")
+        self._identities: list[_Identity] = []
+        self._slot_by_key: dict[object, int] = {}
+        # Keeps recorded entities alive so their id() keys cannot be reused
+        self._entities: list[object] = []
+        self._sources: list[str] = []
+        self._code_by_source: dict[str, int] = {}
+        self._metadata: dict[int, dict[str, object]] = {}
+        self._records: list[EnergyDeltaRecord] | None = None
+
+    def _source_code(self, source: str) -> int:
+        code = self._code_by_source.get(source)
+        if code is None:
+            code = self._code_by_source[source] = len(self._sources)
+            self._sources.append(source)
+        return code
+
+    def _append_row(self, slot: int, delta: float, source: str, meta: dict[str, object]) -> None:
+        if meta:
+            self._metadata[len(self._deltas)] = meta
+        self._slots.append(slot)
+        self._source_codes.append(self._source_code(source))
+        self._deltas.append(delta)
+        self._records = None
+
+    def record(
+        self,
+        entity: object,
+        delta: float,
+        source: str,
+        meta: dict[str, object],
+        get_identity: Callable[[object], tuple[str, str]],
+    ) -> None:
+        """Record one energy change, resolving ``entity``'s identity once per ledger."""
+        slot = self._slot_by_key.get(id(entity))
+        if slot is None:
+            entity_type, stable_id = get_identity(entity)
+            slot = self._slot_by_key[id(entity)] = len(self._identities)
+            self._identities.append((stable_id, stable_id, entity_type))
+            self._entities.append(entity)
+        self._append_row(slot, delta, source, meta)
+
+    def append(self, record: EnergyDeltaRecord) -> None:
+        """Add an already-built record (tests and external producers)."""
+        key = (record.entity_id, record.stable_id, record.entity_type)
+        slot = self._slot_by_key.get(key)
+        if slot is None:
+            slot = self._slot_by_key[key] = len(self._identities)
+            self._identities.append(key)
+        self._append_row(slot, record.delta, record.source, record.metadata)
+
+    def extend(self, records: Iterable[EnergyDeltaRecord]) -> None:
+        for record in records:
+            self.append(record)
+
+    def clear(self) -> None:
+        """Empty the ledger, keeping the arrays' allocated capacity."""
+        del self._slots[:], self._source_codes[:], self._deltas[:]
+        self._identities.clear()
+        self._slot_by_key.clear()
+        self._entities.clear()
+        self._metadata.clear()
+        self._records = None
+
+    def totals_by_source(self) -> tuple[dict[str, float], dict[str, float]]:
+        """Return (gains, burns) summed per source, burns as positive amounts.
+
+        Rows that carry metadata are left out; consumers that interpret
+        metadata handle them through ``records_with_metadata``.
+        """
+        if not self._deltas:
+            return {}, {}
+        deltas = np.frombuffer(self._deltas, dtype=np.float64)
+        codes = np.frombuffer(self._source_codes, dtype=np.int64)
+        if self._metadata:
+            keep = np.ones(len(deltas), dtype=bool)
+            keep[list(self._metadata)] = False
+            deltas, codes = deltas[keep], codes[keep]
+        size = len(self._sources)
+        gains = np.bincount(codes, weights=np.where(deltas > 0, deltas, 0.0), minlength=size)
+        burns = np.bincount(codes, weights=np.where(deltas < 0, -deltas, 0.0), minlength=size)
+        return (
+            {
+                source: float(gains[code])
+                for code, source in enumerate(self._sources)
+                if gains[code]
+            },
+            {
+                source: float(burns[code])
+                for code, source in enumerate(self._sources)
+                if burns[code]
+            },
+        )
+
+    def records_with_metadata(self) -> list[EnergyDeltaRecord]:
+        """The records ``totals_by_source`` leaves out."""
+        return [self._materialize(row) for row in self._metadata]
+
+    def _materialize(self, row: int) -> EnergyDeltaRecord:
+        entity_id, stable_id, entity_type = self._identities[self._slots[row]]
+        return EnergyDeltaRecord(
+            entity_id=entity_id,
+            stable_id=stable_id,
+            entity_type=entity_type,
+            delta=self._deltas[row],
+            source=self._sources[self._source_codes[row]],
+            metadata=self._metadata.get(row, {}),
+        )
+
+    def records(self) -> list[EnergyDeltaRecord]:
+        """All rows as ``EnergyDeltaRecord`` objects, built once per change."""
+        if self._records is None:
+            self._records = [self._materialize(row) for row in range(len(self._deltas))]
+        return self._records
+
+    def __len__(self) -> int:
+        return len(self._deltas)
+
+    @overload
+    def __getitem__(self, index: int) -> EnergyDeltaRecord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[EnergyDeltaRecord]: ...
+
+    def __getitem__(self, index: int | slice) -> EnergyDeltaRecord | list[EnergyDeltaRecord]:
+        return self.records()[index]
+
+    def __iter__(self) -> Iterator[EnergyDeltaRecord]:
+        return iter(self.records())
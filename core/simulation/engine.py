@@ -32,7 +32,7 @@ import os
 import random
 import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, Any
 
 import core.simulation.diagnostics as diagnostics
@@ -42,6 +42,7 @@ from core.config.simulation_config import SimulationConfig
 from core.entity_factory import create_initial_population
 from core.services.stats.calculator import StatsCalculator
 from core.simulation.coordinator import SystemCoordinator
+from core.simulation.energy_ledger import EnergyLedger
 from core.simulation.engine_setup import setup_engine
 from core.simulation.entity_manager import EntityManager
 from core.simulation.event_managers import SoccerEventManager
@@ -258,13 +259,15 @@ class SimulationEngine:
         return self.frame_aggregator.removals
 
     @property
-    def _frame_energy_deltas(self) -> list[EnergyDeltaRecord]:
-        """This frame's energy delta records (delegates to FrameAggregator)."""
+    def _frame_energy_deltas(self) -> EnergyLedger:
+        """This frame's energy delta ledger (delegates to FrameAggregator)."""
         return self.frame_aggregator.energy_deltas
 
     @_frame_energy_deltas.setter
-    def _frame_energy_deltas(self, value: list[EnergyDeltaRecord]) -> None:
-        self.frame_aggregator.energy_deltas = value
+    def _frame_energy_deltas(self, value: Iterable[EnergyDeltaRecord]) -> None:
+        ledger = EnergyLedger()
+        ledger.extend(value)
+        self.frame_aggregator.energy_deltas = ledger
 
     @property
     def _current_phase(self) -> UpdatePhase | None:
@@ -12,14 +12,16 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
-from core.worlds.contracts import EnergyDeltaRecord, RemovalRequest, SpawnRequest
+from core.simulation.energy_ledger import EnergyLedger
+from core.worlds.contracts import RemovalRequest, SpawnRequest
 
 
 @dataclass(frozen=True)
 class FrameOutputs:
     spawns: list[SpawnRequest]
     removals: list[RemovalRequest]
-    energy_deltas: list[EnergyDeltaRecord]
+    # A Sequence[EnergyDeltaRecord]; records are only built if iterated
+    energy_deltas: EnergyLedger
 
 
 class FrameAggregator:
@@ -32,7 +34,7 @@ class FrameAggregator:
     def __init__(self) -> None:
         self.spawns: list[SpawnRequest] = []
         self.removals: list[RemovalRequest] = []
-        self.energy_deltas: list[EnergyDeltaRecord] = []
+        self.energy_deltas = EnergyLedger()
 
     def clear(self) -> None:
         """Reset all per-frame buffers (called at FRAME_START)."""
@@ -41,12 +43,17 @@ class FrameAggregator:
         self.energy_deltas.clear()
 
     def drain(self) -> FrameOutputs:
-        """Return this frame's outputs and clear internal buffers."""
+        """Return this frame's outputs and clear internal buffers.
+
+        The energy ledger is handed over as-is and replaced with a fresh one,
+        so draining never copies or materializes energy records.
+        """
         outputs = FrameOutputs(
             spawns=list(self.spawns),
             removals=list(self.removals),
-            energy_deltas=list(self.energy_deltas),
+            energy_deltas=self.energy_deltas,
         )
+        self.energy_deltas = EnergyLedger()
         self.clear()
         return outputs
 
@@ -58,19 +65,11 @@ class FrameAggregator:
 
         Returns a function that can be passed to
         environment.set_energy_delta_recorder(). The recorder forwards energy
-        deltas into this aggregator, resolving stable IDs via ``get_identity``.
+        deltas into this aggregator's ledger, resolving stable IDs via
+        ``get_identity`` once per entity per frame.
         """
 
         def recorder(entity: Any, delta: float, source: str, meta: dict[str, Any]) -> None:
-            entity_type, stable_id = get_identity(entity)
-            record = EnergyDeltaRecord(
-                entity_id=stable_id,
-                stable_id=stable_id,
-                entity_type=entity_type,
-                delta=delta,
-                source=source,
-                metadata=meta or {},
-            )
-            self.energy_deltas.append(record)
+            self.energy_deltas.record(entity, delta, source, meta, get_identity)
 
         return recorder
@@ -140,19 +140,17 @@ class PhaseExecutor:
 
         # Update spatial grid for moved entities
         if engine.environment is not None:
-            update_position = engine.environment.update_agent_position
+            update_positions = engine.environment.update_agent_positions
             from core.simulation.profiler import is_profiling
 
             if is_profiling(engine):
                 import time
 
                 start = time.perf_counter()
-                for entity in engine.entity_manager.entities_list:
-                    update_position(entity)
+                update_positions(engine.entity_manager.entities_list)
                 engine.profiler.record_spatial_grid_update(time.perf_counter() - start)
             else:
-                for entity in engine.entity_manager.entities_list:
-                    update_position(entity)
+                update_positions(engine.entity_manager.entities_list)
 
     def collision(self) -> None:
         """COLLISION: Handle physical collisions between entities."""
@@ -0,0 +1,456 @@
+"""Array-backed spatial grid with bulk rebuilds and batched radius queries.
+
+``ArraySpatialGrid`` is a drop-in alternative to :class:`SpatialGrid`. Instead
+of maintaining per-cell Python lists with ``list.remove()`` on every cell
+change, it keeps per-entity cell ids, type tags and ordering keys in
+contiguous NumPy arrays and counting-sorts them into cell buckets lazily,
+once per batch of mutations.
+
+Determinism contract: candidate ordering is identical to ``SpatialGrid``.
+The dict grid orders a cell's type buckets by when each bucket was (re)created
+and the agents inside a bucket by when they entered it. Both are tracked here
+as monotonically increasing stamps (``_stamp`` per bucket, ``_seq`` per
+agent), so sorting by ``(cell, stamp, seq)`` reproduces the exact same
+traversal and enabling this backend leaves simulation trajectories
+bit-identical.
+
+Single-agent queries are inherited from ``SpatialGrid`` and run against the
+materialized buckets. The ``*_batch`` methods answer many agents at once with
+vectorized distance tests; they read positions at call time, so each result
+equals issuing the single-agent query for that agent.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from core.entities.base import Entity
+from core.spatial.grid import SpatialGrid
+
+# Type categories mirroring SpatialGrid's routing into fish_grid / food_grid.
+_CATEGORY_OTHER = 0
+_CATEGORY_FISH = 1
+_CATEGORY_FOOD = 2
+
+_INITIAL_CAPACITY = 256
+
+
+def _grown(column: np.ndarray, capacity: int) -> np.ndarray:
+    grown = np.zeros(capacity, dtype=column.dtype)
+    grown[: len(column)] = column
+    return grown
+
+
+class ArraySpatialGrid(SpatialGrid):
+    """Spatial grid storing entity state in NumPy arrays.
+
+    Mutations (add/remove/update/rebuild) only touch the arrays and mark the
+    index dirty; the dict views inherited from ``SpatialGrid`` (``grid``,
+    ``fish_grid``, ``food_grid``) are rebuilt from a single stable sort the
+    next time a query needs them.
+    """
+
+    def __init__(self, width: int, height: int, cell_size: int = 150):
+        super().__init__(width, height, cell_size)
+        self.grid = {}
+        self.fish_grid = {}
+        self.food_grid = {}
+
+        # Slot-indexed storage (swap-remove keeps it dense)
+        self._agents: list[Entity] = []
+        self._slot: dict[Entity, int] = {}
+        self._cell = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._type_id = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._stamp = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._seq = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+
+        # Exact type registry: type -> id, and id -> (type, category)
+        self._type_ids: dict[type[Entity], int] = {}
+        self._types: list[type[Entity]] = []
+        self._type_category: list[int] = []
+
+        # Bucket bookkeeping keyed by (cell id, type id)
+        self._bucket_count: dict[tuple[int, int], int] = {}
+        self._bucket_stamp: dict[tuple[int, int], int] = {}
+        self._next_stamp = 0
+        self._next_seq = 0
+
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # Bookkeeping helpers
+    # ------------------------------------------------------------------
+
+    def _type_id_for(self, agent_type: type[Entity]) -> int:
+        type_id = self._type_ids.get(agent_type)
+        if type_id is None:
+            type_id = len(self._types)
+            self._type_ids[agent_type] = type_id
+            self._types.append(agent_type)
+            if agent_type.__name__ == "Fish":
+                self._type_category.append(_CATEGORY_FISH)
+            elif issubclass(agent_type, self._food_base_type):
+                self._type_category.append(_CATEGORY_FOOD)
+            else:
+                self._type_category.append(_CATEGORY_OTHER)
+        return type_id
+
+    def _cell_id(self, x: float, y: float) -> int:
+        col, row = self._get_cell(x, y)
+        return col * self.rows + row
+
+    def _cell_ids(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Vectorized ``_get_cell`` (truncation toward zero, then clamping)."""
+        cols = np.clip((xs / self.cell_size).astype(np.int64), 0, self.cols - 1)
+        rows = np.clip((ys / self.cell_size).astype(np.int64), 0, self.rows - 1)
+        return cols * self.rows + rows
+
+    def _ensure_capacity(self, size: int) -> None:
+        capacity = len(self._cell)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        self._cell = _grown(self._cell, capacity)
+        self._type_id = _grown(self._type_id, capacity)
+        self._stamp = _grown(self._stamp, capacity)
+        self._seq = _grown(self._seq, capacity)
+
+    def _join_bucket(self, slot: int, cell_id: int, type_id: int) -> None:
+        key = (cell_id, type_id)
+        count = self._bucket_count.get(key, 0)
+        if count == 0:
+            self._bucket_stamp[key] = self._next_stamp
+            self._next_stamp += 1
+        self._bucket_count[key] = count + 1
+        self._cell[slot] = cell_id
+        self._stamp[slot] = self._bucket_stamp[key]
+        self._seq[slot] = self._next_seq
+        self._next_seq += 1
+
+    def _leave_bucket(self, cell_id: int, type_id: int) -> None:
+        key = (cell_id, type_id)
+        count = self._bucket_count[key] - 1
+        if count:
+            self._bucket_count[key] = count
+        else:
+            del self._bucket_count[key]
+            del self._bucket_stamp[key]
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+
+    def add_agent(self, agent: Entity) -> None:
+        """Add an agent to the grid (re-adding a known agent just updates it)."""
+        if not hasattr(agent, "pos"):
+            return
+        if agent in self._slot:
+            self.update_agent(agent)
+            return
+        pos = agent.pos
+        slot = len(self._agents)
+        self._ensure_capacity(slot + 1)
+        type_id = self._type_id_for(type(agent))
+        self._agents.append(agent)
+        self._slot[agent] = slot
+        self._type_id[slot] = type_id
+        cell_id = self._cell_id(pos.x, pos.y)
+        self._join_bucket(slot, cell_id, type_id)
+        self.agent_cells[agent] = divmod(cell_id, self.rows)
+        self._dirty = True
+
+    def remove_agent(self, agent: Entity) -> None:
+        """Remove an agent from the grid."""
+        slot = self._slot.pop(agent, None)
+        if slot is None:
+            return
+        self._leave_bucket(int(self._cell[slot]), int(self._type_id[slot]))
+        del self.agent_cells[agent]
+
+        last = len(self._agents) - 1
+        moved = self._agents.pop()
+        if slot != last:
+            self._agents[slot] = moved
+            self._slot[moved] = slot
+            for column in (self._cell, self._type_id, self._stamp, self._seq):
+                column[slot] = column[last]
+        self._dirty = True
+
+    def update_agent(self, agent: Entity) -> None:
+        """Move an agent to its current cell if it changed cells."""
+        slot = self._slot.get(agent)
+        if slot is None:
+            self.add_agent(agent)
+            return
+        pos = agent.pos
+        new_cell = self._cell_id(pos.x, pos.y)
+        old_cell = int(self._cell[slot])
+        if new_cell != old_cell:
+            type_id = int(self._type_id[slot])
+            self._leave_bucket(old_cell, type_id)
+            self._join_bucket(slot, new_cell, type_id)
+            self.agent_cells[agent] = divmod(new_cell, self.rows)
+            self._dirty = True
+
+    def update_agents(self, agents: Iterable[Entity]) -> None:
+        """Bulk ``update_agent``: cell ids are computed for all agents at once.
+
+        Only agents that changed cells go through per-agent bookkeeping, and
+        they are processed in iteration order so bucket ordering matches
+        calling ``update_agent`` in a loop.
+        """
+        agent_list = list(agents)
+        slot_get = self._slot.get
+        slots = np.fromiter(
+            (slot_get(agent, -1) for agent in agent_list), dtype=np.int64, count=len(agent_list)
+        )
+        if len(slots) and slots.min() < 0:
+            # Unknown agents are rare (they normally arrive via add_agent);
+            # the sequential path keeps their insertion order exact.
+            for agent in agent_list:
+                self.update_agent(agent)
+            return
+
+        xs, ys = self._positions(agent_list)
+        new_cells = self._cell_ids(xs, ys)
+        moved = np.flatnonzero(new_cells != self._cell[slots])
+        for index in moved.tolist():
+            self.update_agent(agent_list[index])
+
+    def clear(self) -> None:
+        """Clear all agents from the grid."""
+        super().clear()
+        self._agents.clear()
+        self._slot.clear()
+        self._bucket_count.clear()
+        self._bucket_stamp.clear()
+        self._next_stamp = 0
+        self._next_seq = 0
+        self._dirty = False
+
+    def rebuild(self, agents: list[Entity]) -> None:
+        """Rebuild the grid from scratch with one vectorized pass."""
+        self.clear()
+        placed = [agent for agent in agents if hasattr(agent, "pos")]
+        count = len(placed)
+        if not count:
+            return
+        self._ensure_capacity(count)
+
+        # Duplicates keep only their first occurrence (see add_agent)
+        unique: list[Entity] = []
+        for agent in placed:
+            if agent not in self._slot:
+                self._slot[agent] = len(unique)
+                unique.append(agent)
+        self._agents = unique
+        count = len(unique)
+
+        xs, ys = self._positions(unique)
+        cells = self._cell_ids(xs, ys)
+        type_id_for = self._type_id_for
+        type_ids = np.fromiter(
+            (type_id_for(type(agent)) for agent in unique), dtype=np.int64, count=count
+        )
+        # Bucket stamp = index of the first agent that entered the bucket,
+        # which is exactly the dict grid's key insertion order after rebuild.
+        keys = cells * len(self._types) + type_ids
+        _, first, inverse, counts = np.unique(
+            keys, return_index=True, return_inverse=True, return_counts=True
+        )
+        self._cell[:count] = cells
+        self._type_id[:count] = type_ids
+        self._stamp[:count] = first[inverse]
+        self._seq[:count] = np.arange(count)
+        self._next_stamp = count
+        self._next_seq = count
+
+        rows = self.rows
+        for index, bucket_count in zip(first.tolist(), counts.tolist(), strict=True):
+            key = (int(cells[index]), int(type_ids[index]))
+            self._bucket_count[key] = bucket_count
+            self._bucket_stamp[key] = index
+        self.agent_cells = {
+            agent: divmod(cell_id, rows)
+            for agent, cell_id in zip(unique, cells.tolist(), strict=True)
+        }
+        self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Index materialization
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _positions(agents: list[Entity]) -> tuple[np.ndarray, np.ndarray]:
+        count = len(agents)
+        xs = np.fromiter((agent.pos.x for agent in agents), dtype=np.float64, count=count)
+        ys = np.fromiter((agent.pos.y for agent in agents), dtype=np.float64, count=count)
+        return xs, ys
+
+    def _ensure_index(self) -> None:
+        """Counting-sort slots into (cell, bucket, entry) order and rebuild dict views."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        count = len(self._agents)
+        cells = self._cell[:count]
+        order = np.lexsort((self._seq[:count], self._stamp[:count], cells))
+
+        agents = self._agents
+        sorted_agents = [agents[i] for i in order.tolist()]
+        sorted_cells = cells[order]
+        sorted_stamps = self._stamp[:count][order]
+        boundaries = np.flatnonzero(
+            (np.diff(sorted_cells) != 0) | (np.diff(sorted_stamps) != 0)
+        ).tolist()
+        starts = [0, *[b + 1 for b in boundaries]]
+        ends = [*[b + 1 for b in boundaries], count]
+
+        rows = self.rows
+        types = self._types
+        sorted_type_ids = self._type_id[:count][order].tolist()
+        sorted_cell_list = sorted_cells.tolist()
+        grid: dict[tuple[int, int], dict[type[Entity], list[Entity]]] = {}
+        for start, end in zip(starts, ends, strict=True) if count else ():
+            cell = divmod(sorted_cell_list[start], rows)
+            grid.setdefault(cell, {})[types[sorted_type_ids[start]]] = sorted_agents[start:end]
+
+        self.grid = grid
+        self.fish_grid = self._category_cells(_CATEGORY_FISH)
+        self.food_grid = self._category_cells(_CATEGORY_FOOD)
+
+    def _category_cells(self, category: int) -> dict[tuple[int, int], list[Entity]]:
+        """Per-cell lists of one category in entry order (mixes exact types)."""
+        agents = self._agents
+        rows = self.rows
+        cells: dict[tuple[int, int], list[Entity]] = {}
+        slots = self._category_slots(category)
+        for slot, cell_id in zip(slots.tolist(), self._cell[slots].tolist(), strict=True):
+            cells.setdefault(divmod(cell_id, rows), []).append(agents[slot])
+        return cells
+
+    def _categories(self) -> np.ndarray:
+        count = len(self._agents)
+        return np.asarray(self._type_category, dtype=np.int64)[self._type_id[:count]]
+
+    def _category_slots(self, category: int) -> np.ndarray:
+        """Slots of one category sorted by cell, then entry order."""
+        slots = np.flatnonzero(self._categories() == category)
+        return slots[np.lexsort((self._seq[slots], self._cell[slots]))]
+
+    # ------------------------------------------------------------------
+    # Single-agent queries (inherited traversal over materialized buckets)
+    # ------------------------------------------------------------------
+
+    def query_radius(self, agent: Entity, radius: float) -> list[Entity]:
+        self._ensure_index()
+        return super().query_radius(agent, radius)
+
+    def query_fish(self, agent: Entity, radius: float) -> list[Entity]:
+        self._ensure_index()
+        return super().query_fish(agent, radius)
+
+    def query_food(self, agent: Entity, radius: float) -> list[Entity]:
+        self._ensure_index()
+        return super().query_food(agent, radius)
+
+    def closest_fish(self, agent: Entity, radius: float) -> Entity | None:
+        self._ensure_index()
+        return super().closest_fish(agent, radius)
+
+    def closest_food(self, agent: Entity, radius: float) -> Entity | None:
+        self._ensure_index()
+        return super().closest_food(agent, radius)
+
+    def query_interaction_candidates(
+        self, agent: Entity, radius: float, crab_type: type[Entity]
+    ) -> list[Entity]:
+        self._ensure_index()
+        return super().query_interaction_candidates(agent, radius, crab_type)
+
+    def query_poker_entities(self, agent: Entity, radius: float) -> list[Entity]:
+        self._ensure_index()
+        return super().query_poker_entities(agent, radius)
+
+    def query_type(self, agent: Entity, radius: float, agent_class: type[Entity]) -> list[Entity]:
+        self._ensure_index()
+        return super().query_type(agent, radius, agent_class)
+
+    def closest_type(
+        self, agent: Entity, radius: float, agent_class: type[Entity]
+    ) -> Entity | None:
+        self._ensure_index()
+        return super().closest_type(agent, radius, agent_class)
+
+    # ------------------------------------------------------------------
+    # Batched queries
+    # ------------------------------------------------------------------
+
+    def query_fish_batch(self, agents: list[Entity], radius: float) -> list[list[Entity]]:
+        """``query_fish`` for every agent in one vectorized pass."""
+        return self._batch_query(agents, radius, self._category_slots(_CATEGORY_FISH))
+
+    def query_food_batch(self, agents: list[Entity], radius: float) -> list[list[Entity]]:
+        """``query_food`` for every agent in one vectorized pass."""
+        return self._batch_query(agents, radius, self._category_slots(_CATEGORY_FOOD))
+
+    def _batch_query(
+        self, agents: list[Entity], radius: float, ordered_slots: np.ndarray
+    ) -> list[list[Entity]]:
+        """Radius-filter ``ordered_slots`` (sorted by cell) around each agent.
+
+        Agents sharing the same cell range share one candidate array, so the
+        distance test is a single (queries x candidates) NumPy expression per
+        distinct range.
+        """
+        num_queries = len(agents)
+        results: list[list[Entity]] = [[] for _ in range(num_queries)]
+        if not num_queries or not len(ordered_slots):
+            return results
+
+        stored = self._agents
+        cand_x, cand_y = self._positions([stored[i] for i in ordered_slots.tolist()])
+        num_cells = self.cols * self.rows
+        cell_start = np.searchsorted(self._cell[ordered_slots], np.arange(num_cells + 1))
+
+        qx, qy = self._positions(agents)
+        slot_get = self._slot.get
+        self_slots = np.fromiter(
+            (slot_get(agent, -1) for agent in agents), dtype=np.int64, count=num_queries
+        )
+        cs = self.cell_size
+        min_col = np.maximum((qx - radius) / cs, 0).astype(np.int64)
+        max_col = np.minimum(((qx + radius) / cs).astype(np.int64), self.cols - 1)
+        min_row = np.maximum((qy - radius) / cs, 0).astype(np.int64)
+        max_row = np.minimum(((qy + radius) / cs).astype(np.int64), self.rows - 1)
+        ranges = np.stack((min_col, max_col, min_row, max_row), axis=1)
+        unique_ranges, group_of = np.unique(ranges, axis=0, return_inverse=True)
+        group_of = group_of.reshape(-1)
+        radius_sq = radius * radius
+        rows = self.rows
+
+        for group, (c0, c1, r0, r1) in enumerate(unique_ranges.tolist()):
+            if c0 > c1 or r0 > r1:
+                continue
+            positions = np.concatenate(
+                [
+                    np.arange(cell_start[col * rows + r0], cell_start[col * rows + r1 + 1])
+                    for col in range(c0, c1 + 1)
+                ]
+            )
+            if not len(positions):
+                continue
+            members = np.flatnonzero(group_of == group)
+            dx = cand_x[positions][None, :] - qx[members][:, None]
+            dy = cand_y[positions][None, :] - qy[members][:, None]
+            hits = dx * dx + dy * dy <= radius_sq
+            hits &= ordered_slots[positions][None, :] != self_slots[members][:, None]
+            candidate_slots = ordered_slots[positions]
+            for row_index, member in enumerate(members.tolist()):
+                found = candidate_slots[hits[row_index]]
+                if len(found):
+                    results[member] = [stored[i] for i in found.tolist()]
+        return results
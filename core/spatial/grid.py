@@ -2,9 +2,11 @@
 
 import math
 from collections import defaultdict
+from collections.abc import Iterable
 
 from core.entities.base import Entity
 from core.entities.resources import Food
+from core.exceptions import ConfigurationError
 
 
 class SpatialGrid:
@@ -104,12 +106,7 @@ class SpatialGrid:
         # But we need to be careful about inheritance if we query by base class
         # For now, we'll store by exact type
         agent_type = type(agent)
-        cell_map = self.grid[cell]
-        is_new_type = agent_type not in cell_map
-        cell_map[agent_type].append(agent)
-        if is_new_type:
-            # Optimized: No longer maintaining _cell_type_order as it was unused and expensive
-            pass
+        self.grid[cell][agent_type].append(agent)
 
         # Update dedicated grids
         # We use string names to avoid circular imports or heavy isinstance checks
@@ -189,12 +186,7 @@ class SpatialGrid:
                             del self.food_grid[old_cell]
 
             # Add to new cell
-            new_cell_map = self.grid[new_cell]
-            is_new_type = agent_type not in new_cell_map
-            new_cell_map[agent_type].append(agent)
-            if is_new_type:
-                # Optimized: No longer maintaining _cell_type_order
-                pass
+            self.grid[new_cell][agent_type].append(agent)
 
             # Add to dedicated grids (new cell)
             type_name = agent_type.__name__
@@ -205,6 +197,12 @@ class SpatialGrid:
 
             self.agent_cells[agent] = new_cell
 
+    def update_agents(self, agents: Iterable[Entity]) -> None:
+        """Update many agents' cells (equivalent to calling update_agent in order)."""
+        update_agent = self.update_agent
+        for agent in agents:
+            update_agent(agent)
+
     def get_cells_in_radius(self, x: float, y: float, radius: float) -> list[tuple[int, int]]:
         """Get all grid cells that intersect with a circular radius."""
         # Calculate the range of cells to check
@@ -235,7 +233,6 @@ class SpatialGrid:
         agent_pos_y = pos.y
         radius_sq = radius * radius
 
-        # Calculate cell range directly
         # Calculate cell range directly
         cs = self.cell_size
         cols_m1 = self.cols - 1
@@ -618,6 +615,14 @@ class SpatialGrid:
 
         return result
 
+    def query_fish_batch(self, agents: list[Entity], radius: float) -> list[list[Entity]]:
+        """Run query_fish for each agent; array-backed grids vectorize this."""
+        return [self.query_fish(agent, radius) for agent in agents]
+
+    def query_food_batch(self, agents: list[Entity], radius: float) -> list[list[Entity]]:
+        """Run query_food for each agent; array-backed grids vectorize this."""
+        return [self.query_food(agent, radius) for agent in agents]
+
     def clear(self) -> None:
         """Clear all agents from the grid."""
         self.grid.clear()
@@ -793,3 +798,26 @@ class SpatialGrid:
                                 nearest_agent = other
 
         return nearest_agent
+
+
+SPATIAL_GRID_BACKENDS = ("dict", "array")
+
+
+def create_spatial_grid(
+    width: int, height: int, cell_size: int = 150, backend: str = "dict"
+) -> SpatialGrid:
+    """Create a spatial grid for the named backend.
+
+    ``"dict"`` is the default per-cell list grid; ``"array"`` is the
+    NumPy-backed :class:`~core.spatial.array_grid.ArraySpatialGrid`, which
+    yields identical query results and ordering.
+    """
+    if backend == "dict":
+        return SpatialGrid(width, height, cell_size)
+    if backend == "array":
+        from core.spatial.array_grid import ArraySpatialGrid
+
+        return ArraySpatialGrid(width, height, cell_size)
+    raise ConfigurationError(
+        f"Unknown spatial grid backend {backend!r}; expected one of {SPATIAL_GRID_BACKENDS}"
+    )
@@ -305,19 +305,31 @@ def create_histogram(
     if not values or num_bins <= 0:
         return [], []
 
-    # Ensure range is valid
-    if range_max <= range_min:
-        range_max = range_min + 1.0
+    bins = [0] * num_bins
+    for value in values:
+        bins[histogram_bin(value, range_min, range_max, num_bins)] += 1
+
+    return bins, histogram_edges(range_min, range_max, num_bins)
+
+
+def _histogram_range(range_min: float, range_max: float) -> float:
+    """Upper bound of a histogram range, widened to 1.0 when it is empty."""
+    return range_max if range_max > range_min else range_min + 1.0
+
 
+def histogram_edges(range_min: float, range_max: float, num_bins: int) -> list[float]:
+    """Bin edges of ``create_histogram`` for the given range and bin count."""
+    range_max = _histogram_range(range_min, range_max)
     bin_width = (range_max - range_min) / num_bins
-    bins = [0] * num_bins
-    edges = [range_min + i * bin_width for i in range(num_bins + 1)]
+    return [range_min + i * bin_width for i in range(num_bins + 1)]
 
-    for value in values:
-        # Clamp value to range
-        clamped = max(range_min, min(value, range_max - 0.0001))
-        bin_index = int((clamped - range_min) / bin_width)
-        bin_index = min(bin_index, num_bins - 1)  # Handle edge case
-        bins[bin_index] += 1
 
-    return bins, edges
+def histogram_bin(value: float, range_min: float, range_max: float, num_bins: int) -> int:
+    """Index of the ``create_histogram`` bin that ``value`` falls into.
+
+    Values outside the range are clamped into the first or last bin.
+    """
+    range_max = _histogram_range(range_min, range_max)
+    bin_width = (range_max - range_min) / num_bins
+    clamped = max(range_min, min(value, range_max - 0.0001))
+    return min(int((clamped - range_min) / bin_width), num_bins - 1)
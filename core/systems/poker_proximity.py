@@ -21,6 +21,8 @@ mixing physical collision handling with game logic. This separation:
 import logging
 from typing import TYPE_CHECKING, Any, cast
 
+import numpy as np
+
 from core.config.ecosystem import FISH_POKER_MAX_DISTANCE, FISH_POKER_MIN_DISTANCE
 from core.entities import Fish
 from core.poker.integration.poker_interaction import MAX_PLAYERS as POKER_MAX_PLAYERS
@@ -34,6 +36,7 @@ from core.update_phases import UpdatePhase, runs_in_phase
 
 if TYPE_CHECKING:
     from core.simulation import SimulationEngine
+    from core.spatial.grid import SpatialGrid
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +45,92 @@ import operator
 
 _fish_sort_key = operator.attrgetter("fish_id")
 
+# Populations at least this large build the proximity graph in NumPy; it is
+# already 1.5x faster than per-fish grid queries at 16 fish
+# (scripts/benchmark_poker_proximity.py).
+_VECTORIZED_MIN_FISH = 16
+# Rows of the (fish x fish) distance test evaluated per NumPy block; bounds
+# scratch memory at large populations (256 x 2000 x 8 bytes per array).
+_PAIR_BLOCK_ROWS = 256
+
+
+def _vectorized_poker_neighbors(fish_list: list["Fish"], grid: "SpatialGrid") -> list[list[int]]:
+    """Per-fish poker contacts as ``fish_list`` indices ordered by fish_id.
+
+    Mirrors the per-fish loop pair for pair. Living fish ``i`` sees ``j`` only
+    where ``SpatialGrid.query_fish`` would return it: ``j`` is an exact
+    ``Fish`` whose *recorded* grid cell lies in the cell range around ``i``'s
+    position and whose position is within the query radius. The pair is kept
+    when ``j`` is alive, has the larger fish_id, and the center distance falls
+    in the poker band. All arithmetic repeats the scalar expressions on the
+    same float64 values, so the results are identical.
+    """
+    count = len(fish_list)
+    state = np.array(
+        [(fish.pos.x, fish.pos.y, fish.width, fish.height) for fish in fish_list],
+        dtype=np.float64,
+    )
+    x = state[:, 0]
+    y = state[:, 1]
+    center_x = x + state[:, 2] * 0.5
+    center_y = y + state[:, 3] * 0.5
+    alive = np.fromiter((not fish.is_dead() for fish in fish_list), dtype=bool, count=count)
+    fish_ids = np.fromiter((fish.fish_id for fish in fish_list), dtype=np.int64, count=count)
+
+    cell_col = np.full(count, -1, dtype=np.int64)
+    cell_row = np.full(count, -1, dtype=np.int64)
+    agent_cells = grid.agent_cells
+    for index, fish in enumerate(fish_list):
+        cell = agent_cells.get(fish)
+        if cell is not None and type(fish) is Fish:
+            cell_col[index], cell_row[index] = cell
+    candidate = alive & (cell_col >= 0)
+
+    radius = float(FISH_POKER_MAX_DISTANCE)
+    radius_sq = radius * radius
+    poker_min_sq = FISH_POKER_MIN_DISTANCE * FISH_POKER_MIN_DISTANCE
+    poker_max_sq = FISH_POKER_MAX_DISTANCE * FISH_POKER_MAX_DISTANCE
+    cs = grid.cell_size
+    min_col = np.maximum((x - radius) / cs, 0).astype(np.int64)
+    max_col = np.minimum(((x + radius) / cs).astype(np.int64), grid.cols - 1)
+    min_row = np.maximum((y - radius) / cs, 0).astype(np.int64)
+    max_row = np.minimum(((y + radius) / cs).astype(np.int64), grid.rows - 1)
+
+    pair_i: list[np.ndarray] = []
+    pair_j: list[np.ndarray] = []
+    for start in range(0, count, _PAIR_BLOCK_ROWS):
+        rows = slice(start, min(start + _PAIR_BLOCK_ROWS, count))
+        dx = x[None, :] - x[rows, None]
+        dy = y[None, :] - y[rows, None]
+        cdx = center_x[rows, None] - center_x[None, :]
+        cdy = center_y[rows, None] - center_y[None, :]
+        center_sq = cdx * cdx + cdy * cdy
+        hits = (
+            alive[rows, None]
+            & candidate[None, :]
+            & (fish_ids[None, :] > fish_ids[rows, None])
+            & (cell_col[None, :] >= min_col[rows, None])
+            & (cell_col[None, :] <= max_col[rows, None])
+            & (cell_row[None, :] >= min_row[rows, None])
+            & (cell_row[None, :] <= max_row[rows, None])
+            & (dx * dx + dy * dy <= radius_sq)
+            & (center_sq > poker_min_sq)
+            & (center_sq <= poker_max_sq)
+        )
+        block_i, block_j = np.nonzero(hits)
+        pair_i.append(block_i + start)
+        pair_j.append(block_j)
+
+    # Each pair is a contact both ways; order every fish's contacts by fish_id.
+    first = np.concatenate(pair_i) if pair_i else np.zeros(0, dtype=np.int64)
+    second = np.concatenate(pair_j) if pair_j else np.zeros(0, dtype=np.int64)
+    source = np.concatenate((first, second))
+    target = np.concatenate((second, first))
+    order = np.lexsort((fish_ids[target], source))
+    bounds = np.searchsorted(source[order], np.arange(count + 1)).tolist()
+    targets = target[order].tolist()
+    return [targets[bounds[k] : bounds[k + 1]] for k in range(count)]
+
 
 @runs_in_phase(UpdatePhase.INTERACTION)
 class PokerProximitySystem(BaseSystem):
@@ -121,11 +210,17 @@ class PokerProximitySystem(BaseSystem):
 
         fish_poker_contacts: dict[Fish, list[Fish]] = {fish: [] for fish in fish_list}
 
+        environment = self._engine.environment
+        if environment is not None and len(fish_list) >= _VECTORIZED_MIN_FISH:
+            neighbors = _vectorized_poker_neighbors(fish_list, environment.spatial_grid)
+            for fish, indices in zip(fish_list, neighbors, strict=True):
+                fish_poker_contacts[fish] = [fish_list[k] for k in indices]
+            return fish_poker_contacts
+
         # Pre-compute squared distance constants
         poker_min_sq = FISH_POKER_MIN_DISTANCE * FISH_POKER_MIN_DISTANCE
         poker_max_sq = FISH_POKER_MAX_DISTANCE * FISH_POKER_MAX_DISTANCE
 
-        environment = self._engine.environment
         centers = {
             fish: (fish.pos.x + fish.width * 0.5, fish.pos.y + fish.height * 0.5)
             for fish in fish_list
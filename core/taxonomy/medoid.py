@@ -0,0 +1,133 @@
+"""Incremental medoid maintenance for species member profiles.
+
+``SpeciesRecord.update_medoid`` picks the cached member profile with the
+smallest summed distance to all members, summing in cache order and keeping
+the first profile on ties. Recomputing that from scratch costs O(k^2)
+distance calls on every birth and death.
+
+``MedoidTracker`` keeps the pairwise distances of the current members plus a
+running distance total per member, so a join or death costs one vectorized
+distance row (``distance_row``) and an O(k) total update. Running totals
+drift from the sequential sums by rounding, so they only shortlist members
+within a small tolerance of the minimum; the shortlist is then re-summed
+exactly in cache order, which keeps the chosen medoid identical to the
+from-scratch algorithm. Totals are re-summed exactly every ``k`` updates to
+keep the drift bounded.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import numpy as np
+
+from core.taxonomy.profile import PROFILE_VECTOR_SIZE, TaxonomyProfile, distance_row, profile_vector
+
+_INITIAL_CAPACITY = 16
+
+
+def _sequential_row_sums(matrix: np.ndarray) -> np.ndarray:
+    """Left-to-right row sums (``np.add.accumulate`` does not reorder like ``sum``)."""
+    if matrix.shape[1] == 0:
+        return np.zeros(matrix.shape[0])
+    return np.add.accumulate(matrix, axis=1)[:, -1]
+
+
+class MedoidTracker:
+    """Pairwise distances and running totals for one species' members."""
+
+    def __init__(self) -> None:
+        self._slots: dict[int, int] = {}  # entity id -> row in the arrays below
+        self._profiles: list[TaxonomyProfile | None] = [None] * _INITIAL_CAPACITY
+        self._free: list[int] = []
+        self._next_slot = 0
+        self._vectors = np.zeros((_INITIAL_CAPACITY, PROFILE_VECTOR_SIZE))
+        self._is_microbe = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self._distances = np.zeros((_INITIAL_CAPACITY, _INITIAL_CAPACITY))
+        self._totals = np.zeros(_INITIAL_CAPACITY)
+        self._updates_since_resync = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def medoid(self, members: Mapping[int, TaxonomyProfile]) -> TaxonomyProfile:
+        """Sync with ``members`` (id -> profile, in cache order) and return its medoid."""
+        self._sync(members)
+        order = np.fromiter(
+            (self._slots[eid] for eid in members), dtype=np.intp, count=len(members)
+        )
+        k = len(order)
+        if self._updates_since_resync >= k:
+            self._totals[order] = _sequential_row_sums(self._distances[np.ix_(order, order)])
+            self._updates_since_resync = 0
+
+        approx = self._totals[order]
+        # Running totals are within ~k * eps of the exact sums (distances are
+        # <= 1 and there are < k updates between resyncs); anything that could
+        # still be the minimum is re-summed exactly.
+        tolerance = 1e-9 * (1 + k)
+        shortlist = np.flatnonzero(approx <= approx.min() + tolerance)
+        if len(shortlist) == 1:
+            best = int(shortlist[0])
+        else:
+            exact = _sequential_row_sums(self._distances[np.ix_(order[shortlist], order)])
+            best = int(shortlist[int(np.argmin(exact))])  # argmin keeps the first tie
+        profile = self._profiles[int(order[best])]
+        assert profile is not None
+        return profile
+
+    def _sync(self, members: Mapping[int, TaxonomyProfile]) -> None:
+        for eid in [eid for eid in self._slots if eid not in members]:
+            self._remove(self._slots.pop(eid))
+        for eid, profile in members.items():
+            slot = self._slots.get(eid)
+            if slot is None:
+                self._slots[eid] = self._add(profile)
+            elif self._profiles[slot] is not profile:
+                # Same member, new profile object: keeps its place in cache order
+                self._remove(slot)
+                self._slots[eid] = self._add(profile)
+
+    def _active(self, exclude: int) -> np.ndarray:
+        return np.fromiter(
+            (slot for slot in self._slots.values() if slot != exclude), dtype=np.intp
+        )
+
+    def _add(self, profile: TaxonomyProfile) -> int:
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = self._next_slot
+            self._next_slot += 1
+            if slot == len(self._totals):
+                self._grow()
+        others = self._active(exclude=slot)
+        row = distance_row(profile, self._vectors[others], self._is_microbe[others])
+        self._profiles[slot] = profile
+        self._vectors[slot] = profile_vector(profile)
+        self._is_microbe[slot] = profile.is_microbe
+        self._distances[slot, others] = row
+        self._distances[others, slot] = row
+        self._distances[slot, slot] = 0.0
+        self._totals[others] += row
+        self._totals[slot] = row.sum()
+        self._updates_since_resync += 1
+        return slot
+
+    def _remove(self, slot: int) -> None:
+        others = self._active(exclude=slot)
+        self._totals[others] -= self._distances[others, slot]
+        self._profiles[slot] = None
+        self._free.append(slot)
+        self._updates_since_resync += 1
+
+    def _grow(self) -> None:
+        old = len(self._totals)
+        new = old * 2
+        self._profiles.extend([None] * (new - old))
+        self._vectors = np.vstack([self._vectors, np.zeros((new - old, PROFILE_VECTOR_SIZE))])
+        self._is_microbe = np.concatenate([self._is_microbe, np.zeros(new - old, dtype=bool)])
+        self._totals = np.concatenate([self._totals, np.zeros(new - old)])
+        distances = np.zeros((new, new))
+        distances[:old, :old] = self._distances
+        self._distances = distances
@@ -6,6 +6,8 @@ from collections.abc import Mapping
 from types import MappingProxyType
 from typing import Any, Protocol
 
+import numpy as np
+
 from core.algorithms.composable.definitions import FoodApproach, SocialMode, ThreatResponse
 from core.genetics.behavioral import BEHAVIORAL_TRAIT_SPECS
 from core.genetics.physical import PHYSICAL_TRAIT_SPECS
@@ -164,6 +166,63 @@ _FISH_TRAIT_WEIGHTS, _FISH_TOTAL_WEIGHT = _flatten_trait_weights(
 )
 
 
+# Column layout of ``profile_vector``: the fish trait table, then the microbe one
+_FISH_COLUMNS = slice(0, len(_FISH_TRAIT_WEIGHTS))
+_MICROBE_COLUMNS = slice(
+    len(_FISH_TRAIT_WEIGHTS), len(_FISH_TRAIT_WEIGHTS) + len(_MICROBE_TRAIT_WEIGHTS)
+)
+PROFILE_VECTOR_SIZE = _MICROBE_COLUMNS.stop
+
+
+def profile_vector(profile: TaxonomyProfile) -> list[float]:
+    """Trait values in ``distance_row`` column order (missing traits read as 0.5)."""
+    traits = profile.traits
+    return [traits.get(trait, 0.5) for trait, _, _ in _FISH_TRAIT_WEIGHTS] + [
+        traits.get(trait, 0.5) for trait, _, _ in _MICROBE_TRAIT_WEIGHTS
+    ]
+
+
+def distance_row(
+    profile: TaxonomyProfile, vectors: np.ndarray, is_microbe: np.ndarray
+) -> np.ndarray:
+    """``profile.distance(other)`` for every profile stored as a row of ``vectors``.
+
+    ``vectors`` holds ``profile_vector`` rows and ``is_microbe`` their domains.
+    Traits are accumulated in the same order with the same float operations
+    as ``TaxonomyProfile.distance``, so each entry is bit-for-bit identical.
+    """
+    if profile.is_microbe:
+        trait_weights, total_weight, columns = (
+            _MICROBE_TRAIT_WEIGHTS,
+            _MICROBE_TOTAL_WEIGHT,
+            _MICROBE_COLUMNS,
+        )
+    else:
+        trait_weights, total_weight, columns = (
+            _FISH_TRAIT_WEIGHTS,
+            _FISH_TOTAL_WEIGHT,
+            _FISH_COLUMNS,
+        )
+
+    own = profile_vector(profile)[columns]
+    others = vectors[:, columns]
+    distance_sq = np.zeros(len(vectors))
+    for j, (_, trait_weight, is_circular) in enumerate(trait_weights):
+        if is_circular:
+            diff = np.abs(own[j] - others[:, j]) % 1.0
+            d = np.minimum(diff, 1.0 - diff)
+        else:
+            d = own[j] - others[:, j]
+        distance_sq = distance_sq + trait_weight * (d * d)
+
+    if total_weight <= 0.0:
+        row = np.zeros(len(vectors))
+    else:
+        row = np.sqrt(distance_sq / total_weight)
+    row[is_microbe != profile.is_microbe] = 1.0
+    return row
+
+
 def _circular_distance(a: float, b: float) -> float:
     """Distance on a circular [0, 1] scale."""
     diff = abs(a - b) % 1.0
@@ -6,6 +6,7 @@ import os
 from dataclasses import dataclass, field
 from typing import Any
 
+from core.taxonomy.medoid import MedoidTracker
 from core.taxonomy.naming import CommonNameGenerator, ScientificNameGenerator, _stable_hash
 from core.taxonomy.profile import TaxonomyProfile
 
@@ -43,6 +44,9 @@ class SpeciesRecord:
     # Type specimen ID (original taxonomic reference member)
     type_specimen_id: int | None = None
 
+    # Incremental medoid state over member_profiles_cache (rebuilt lazily)
+    _medoid_tracker: MedoidTracker | None = field(default=None, repr=False, compare=False)
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize the record to a dictionary."""
         return {
@@ -104,21 +108,9 @@ class SpeciesRecord:
         """Update the current medoid profile based on cached member profiles."""
         if not self.member_profiles_cache:
             return
-        profiles = list(self.member_profiles_cache.values())
-        if len(profiles) == 1:
-            self.current_medoid_profile = profiles[0]
-            return
-
-        best_profile = profiles[0]
-        min_total_dist = float("inf")
-
-        for p in profiles:
-            total_dist = sum(p.distance(other) for other in profiles)
-            if total_dist < min_total_dist:
-                min_total_dist = total_dist
-                best_profile = p
-
-        self.current_medoid_profile = best_profile
+        if self._medoid_tracker is None:
+            self._medoid_tracker = MedoidTracker()
+        self.current_medoid_profile = self._medoid_tracker.medoid(self.member_profiles_cache)
 
 
 class SpeciesRegistry:
@@ -2,9 +2,34 @@
 
 This package provides a generic multi-agent world interface that can be
 implemented by different simulation environments (Tank, Petri, Soccer, etc.).
+
+Exports are loaded lazily (PEP 562); world backends are imported only when a
+world of that type is created, so ``from core.worlds import WorldRegistry``
+stays cheap.
 """
 
-from core.worlds.interfaces import MultiAgentWorldBackend, StepResult
-from core.worlds.registry import WorldRegistry
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.worlds.interfaces import MultiAgentWorldBackend, StepResult
+    from core.worlds.registry import WorldRegistry
 
 __all__ = ["MultiAgentWorldBackend", "StepResult", "WorldRegistry"]
+
+_lazy_imports = {
+    "MultiAgentWorldBackend": "core.worlds.interfaces",
+    "StepResult": "core.worlds.interfaces",
+    "WorldRegistry": "core.worlds.registry",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Lazy import handler for the package exports."""
+    if name in _lazy_imports:
+        import importlib
+
+        value = getattr(importlib.import_module(_lazy_imports[name]), name)
+        # Cache in module namespace for future access
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
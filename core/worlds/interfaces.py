@@ -5,6 +5,7 @@ These interfaces are implemented by specific world backends (Tank, Petri).
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -32,7 +33,9 @@ class StepResult:
     Extended Fields (World Loop Contract):
         spawns: Entity spawn records from this step (optional)
         removals: Entity removal records from this step (optional)
-        energy_deltas: Energy transfer records from this step (optional)
+        energy_deltas: Energy transfer records from this step (optional; the
+            Tank backend passes its frame's EnergyLedger, which builds record
+            objects only when they are read)
         render_hint: Frontend-agnostic rendering metadata (optional)
     """
 
@@ -45,7 +48,7 @@ class StepResult:
     # Extended fields for world loop contract (all optional)
     spawns: list["SpawnRequest"] = field(default_factory=list)
     removals: list["RemovalRequest"] = field(default_factory=list)
-    energy_deltas: list["EnergyDeltaRecord"] = field(default_factory=list)
+    energy_deltas: Sequence["EnergyDeltaRecord"] = field(default_factory=list)
     render_hint: dict[str, object] | None = None
 
 
@@ -96,6 +96,7 @@ class PetriPack(TankLikePackBase):
             rng=engine.rng,
             event_bus=engine.event_bus,
             simulation_config=self.config,
+            spatial_grid_backend=self.config.tank.spatial_grid_backend,
             dish=self.dish,
         )
         env.set_spawn_requester(engine.request_spawn)
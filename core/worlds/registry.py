@@ -9,7 +9,7 @@ from __future__ import annotations
 import logging
 import threading
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from core.exceptions import ConfigurationError
 from core.modes.interfaces import ModeConfig, ModePack, ModePackDefinition
@@ -17,6 +17,10 @@ from core.modes.petri import create_petri_mode_pack
 from core.modes.tank import create_tank_mode_pack
 from core.worlds.interfaces import MultiAgentWorldBackend
 
+if TYPE_CHECKING:
+    from core.worlds.petri.backend import PetriWorldBackendAdapter
+    from core.worlds.tank.backend import TankWorldBackendAdapter
+
 logger = logging.getLogger(__name__)
 
 # Factory receives seed + config overrides and returns a world backend.
@@ -171,14 +175,25 @@ def _ensure_builtin_modes() -> None:
         _builtins_registered = True
 
 
-def _register_builtin_modes() -> None:
-    from core.worlds.petri.backend import PetriWorldBackendAdapter
+def _tank_backend() -> type[TankWorldBackendAdapter]:
     from core.worlds.tank.backend import TankWorldBackendAdapter
 
+    return TankWorldBackendAdapter
+
+
+def _petri_backend() -> type[PetriWorldBackendAdapter]:
+    from core.worlds.petri.backend import PetriWorldBackendAdapter
+
+    return PetriWorldBackendAdapter
+
+
+def _register_builtin_modes() -> None:
+    # Backends are imported by their factories, so listing modes or creating
+    # a tank world never imports the other backends.
     # Implemented tank mode
     WorldRegistry.register_world_type(
         world_type="tank",
-        factory=lambda **kwargs: TankWorldBackendAdapter(**kwargs),
+        factory=lambda **kwargs: _tank_backend()(**kwargs),
         mode_pack=create_tank_mode_pack(),
         default_view_mode="side",
         display_name="Tank",
@@ -187,7 +202,7 @@ def _register_builtin_modes() -> None:
     # Implemented petri mode (reuses tank backend)
     WorldRegistry.register_world_type(
         world_type="petri",
-        factory=lambda **kwargs: PetriWorldBackendAdapter(**kwargs),
+        factory=lambda **kwargs: _petri_backend()(**kwargs),
         mode_pack=create_petri_mode_pack(),
     )
 
@@ -149,6 +149,7 @@ class TankLikePackBase(ABC):
             event_bus=engine.event_bus,
             # Don't pass code_pool - let Environment create GenomeCodePool
             simulation_config=self.config,
+            spatial_grid_backend=self.config.tank.spatial_grid_backend,
         )
         env.set_spawn_requester(engine.request_spawn)
         env.set_remove_requester(engine.request_remove)
@@ -25,6 +25,8 @@ class EnvironmentLike(Protocol):
 
     def update_agent_position(self, agent: Any) -> None: ...
 
+    def update_agent_positions(self, agents: Any) -> None: ...
+
     def update_detection_modifier(self) -> None: ...
 
 
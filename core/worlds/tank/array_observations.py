@@ -0,0 +1,228 @@
+"""Fixed-shape array observations for Tank-like worlds.
+
+``build_tank_observations`` returns one dict per fish with variable-length
+neighbour lists. Learners that step many worlds at once want the same
+information as dense arrays instead, so this module packs it into fixed
+shapes: each controlled fish owns a stable agent slot, and each slot carries
+its own features plus the nearest ``max_food`` / ``max_fish`` /
+``max_threats`` neighbours inside the perception radius (nearest first),
+zero-padded with a boolean mask.
+
+Neighbour selection mirrors the dict builder: food is every ``Food`` entity,
+other fish are living fish split into threats (more than 1.2x the agent's
+size) and non-threats, and a neighbour is visible when its squared distance
+is ``<= radius ** 2``. Distances are computed for all agent/neighbour pairs
+of a world in one NumPy pass.
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from core.worlds.tank.observation_builder import DEFAULT_PERCEPTION_RADIUS
+
+if TYPE_CHECKING:
+    from core.entities import Fish
+    from core.worlds.interfaces import MultiAgentWorldBackend
+
+ArrayObservation = dict[str, np.ndarray]
+
+SELF_FEATURES = ("x", "y", "vx", "vy", "energy", "max_energy", "age")
+FOOD_FEATURES = ("dx", "dy", "distance", "energy")
+FISH_FEATURES = ("dx", "dy", "distance", "vx", "vy", "energy")
+THREAT_FEATURES = ("dx", "dy", "distance", "vx", "vy", "size")
+
+# Same threshold as observation_builder._is_threat
+THREAT_SIZE_RATIO = 1.2
+
+
+@dataclass(frozen=True)
+class ArrayObservationSpec:
+    """Shape and perception settings for array observations."""
+
+    max_agents: int = 64
+    max_food: int = 8
+    max_fish: int = 8
+    max_threats: int = 4
+    perception_radius: float = DEFAULT_PERCEPTION_RADIUS
+    dtype: str = "float32"
+
+    def empty(self) -> ArrayObservation:
+        """Observation arrays for one world with every slot empty."""
+        a, dtype = self.max_agents, np.dtype(self.dtype)
+        return {
+            "agent_id": np.full(a, -1, dtype=np.int64),
+            "agent_mask": np.zeros(a, dtype=bool),
+            "self": np.zeros((a, len(SELF_FEATURES)), dtype=dtype),
+            "food": np.zeros((a, self.max_food, len(FOOD_FEATURES)), dtype=dtype),
+            "food_mask": np.zeros((a, self.max_food), dtype=bool),
+            "fish": np.zeros((a, self.max_fish, len(FISH_FEATURES)), dtype=dtype),
+            "fish_mask": np.zeros((a, self.max_fish), dtype=bool),
+            "threat": np.zeros((a, self.max_threats, len(THREAT_FEATURES)), dtype=dtype),
+            "threat_mask": np.zeros((a, self.max_threats), dtype=bool),
+        }
+
+
+class AgentSlots:
+    """Stable fish_id -> slot assignment for a fixed number of agent slots.
+
+    A fish keeps its slot until it disappears; newcomers take the lowest free
+    slot. Fish that arrive while every slot is taken wait, uncontrolled,
+    until a slot frees up.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.slot_of: dict[int, int] = {}
+        self._free = list(range(capacity))
+
+    def clear(self) -> None:
+        self.slot_of.clear()
+        self._free = list(range(self.capacity))
+
+    def sync(self, fish_ids: list[int]) -> list[int]:
+        """Assign slots for ``fish_ids`` (in order); return the slots that were vacated."""
+        present = set(fish_ids)
+        vacated = [slot for fish_id, slot in self.slot_of.items() if fish_id not in present]
+        if vacated:
+            self.slot_of = {k: v for k, v in self.slot_of.items() if k in present}
+            for slot in vacated:
+                heapq.heappush(self._free, slot)
+        for fish_id in fish_ids:
+            if not self._free:
+                break
+            if fish_id not in self.slot_of:
+                self.slot_of[fish_id] = heapq.heappop(self._free)
+        return vacated
+
+
+def living_fish(world: MultiAgentWorldBackend) -> list[Fish]:
+    """Living fish of a world, in entity order."""
+    from core.entities import Fish
+
+    return [e for e in world.entities_list if isinstance(e, Fish) and not e.is_dead()]
+
+
+def build_array_observations(
+    world: MultiAgentWorldBackend,
+    slots: AgentSlots,
+    spec: ArrayObservationSpec,
+) -> tuple[ArrayObservation, list[Fish | None]]:
+    """Build array observations for one world, syncing ``slots`` first.
+
+    Args:
+        world: Tank-like world backend
+        slots: Slot assignment, updated in place for the current fish
+        spec: Observation shapes and perception radius
+
+    Returns:
+        The observation arrays and the fish controlled by each slot (None
+        for empty slots)
+    """
+    from core.entities import Food
+
+    obs = spec.empty()
+    fish = living_fish(world)
+    slots.sync([f.fish_id for f in fish])
+    agents: list[Fish | None] = [None] * spec.max_agents
+    rows: list[int] = []  # index into ``fish`` per filled slot
+    slot_list: list[int] = []
+    for index, f in enumerate(fish):
+        slot = slots.slot_of.get(f.fish_id)
+        if slot is not None:
+            agents[slot] = f
+            rows.append(index)
+            slot_list.append(slot)
+    if not rows:
+        return obs, agents
+
+    fish_state = np.array(
+        [
+            (f.pos.x, f.pos.y, f.vel.x, f.vel.y, f.energy, f.max_energy, f.age or 0, f.size)
+            for f in fish
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 8)
+    food = [e for e in world.entities_list if isinstance(e, Food)]
+    food_state = np.array(
+        [(e.pos.x, e.pos.y, getattr(e, "energy_value", 10.0)) for e in food],
+        dtype=np.float64,
+    ).reshape(-1, 3)
+
+    idx = np.asarray(rows)
+    out = np.asarray(slot_list)
+    agent = fish_state[idx]
+    obs["agent_id"][out] = [fish[i].fish_id for i in rows]
+    obs["agent_mask"][out] = True
+    obs["self"][out] = agent[:, :7]
+
+    radius_sq = spec.perception_radius * spec.perception_radius
+    food_rel, food_d2 = _relative(agent, food_state[:, :2])
+    _fill_nearest(
+        obs["food"],
+        obs["food_mask"],
+        out,
+        food_rel,
+        food_d2,
+        food_d2 <= radius_sq,
+        food_state[:, 2:3],
+    )
+
+    fish_rel, fish_d2 = _relative(agent, fish_state[:, :2])
+    visible = fish_d2 <= radius_sq
+    visible[np.arange(len(idx)), idx] = False  # never see yourself
+    threat = fish_state[None, :, 7] > agent[:, 7:8] * THREAT_SIZE_RATIO
+    _fill_nearest(
+        obs["fish"], obs["fish_mask"], out, fish_rel, fish_d2, visible & ~threat, fish_state[:, 2:5]
+    )
+    _fill_nearest(
+        obs["threat"],
+        obs["threat_mask"],
+        out,
+        fish_rel,
+        fish_d2,
+        visible & threat,
+        fish_state[:, [2, 3, 7]],
+    )
+    return obs, agents
+
+
+def _relative(agent: np.ndarray, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Pairwise (dx, dy) from each agent to each position, and squared distances."""
+    rel = positions[None, :, :] - agent[:, None, :2]
+    return rel, rel[..., 0] * rel[..., 0] + rel[..., 1] * rel[..., 1]
+
+
+def _fill_nearest(
+    features: np.ndarray,
+    mask: np.ndarray,
+    out: np.ndarray,
+    rel: np.ndarray,
+    d2: np.ndarray,
+    visible: np.ndarray,
+    extra: np.ndarray,
+) -> None:
+    """Write the nearest visible neighbours of each agent row into slots ``out``."""
+    limit = features.shape[1]
+    if limit == 0 or d2.shape[1] == 0:
+        return
+    # Stable sort keeps entity order between equidistant neighbours.
+    order = np.argsort(np.where(visible, d2, np.inf), axis=1, kind="stable")[:, :limit]
+    taken = np.take_along_axis(visible, order, axis=1)
+    width = order.shape[1]
+    rows = np.take_along_axis(rel, order[..., None], axis=1)
+    block = np.concatenate(
+        [
+            rows,
+            np.sqrt(np.take_along_axis(d2, order, axis=1))[..., None],
+            extra[order],
+        ],
+        axis=2,
+    )
+    block[~taken] = 0.0
+    features[out, :width] = block
+    mask[out, :width] = taken
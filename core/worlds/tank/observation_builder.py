@@ -56,22 +56,26 @@ def build_tank_observations(
     frame = world.frame_count
 
     # Import Fish type for isinstance checks
-    from core.entities import Fish, Food
+    from core.entities import Fish
 
-    # Build observation for each fish
-    for entity in world.entities_list:
-        if not isinstance(entity, Fish):
-            continue
+    living_fish = [
+        entity
+        for entity in world.entities_list
+        if isinstance(entity, Fish) and not entity.is_dead()
+    ]
 
-        if entity.is_dead():
-            continue
+    # Positions do not change while observing, so query the spatial grid for
+    # every fish at once (array-backed grids vectorize these).
+    food_lists = env.nearby_resources_batch(living_fish, perception_radius)
+    fish_lists = env.nearby_evolving_agents_batch(living_fish, perception_radius)
 
+    # Build observation for each fish
+    for entity, food_nearby, fish_nearby in zip(living_fish, food_lists, fish_lists, strict=True):
         fish_id = str(entity.fish_id)
 
-        # Query nearby entities using spatial grid
-        nearby_food = _build_food_observations(entity, env, perception_radius, Food)
-        nearby_fish = _build_fish_observations(entity, env, perception_radius)
-        nearby_threats = _build_threat_observations(entity, env, perception_radius)
+        nearby_food = _build_food_observations(entity, food_nearby)
+        nearby_fish = _build_fish_observations(entity, fish_nearby)
+        nearby_threats = _build_threat_observations(entity, fish_nearby)
 
         # Build observation with standard and soccer fields
         obs_extra = {
@@ -107,18 +111,10 @@ def build_tank_observations(
     return observations
 
 
-def _build_food_observations(
-    fish: Fish,
-    env: Any,
-    radius: float,
-    food_type: type,
-) -> list[dict[str, Any]]:
-    """Build observations of nearby food items."""
+def _build_food_observations(fish: Fish, nearby: list[Any]) -> list[dict[str, Any]]:
+    """Build observations of nearby food items (``nearby`` from a food query)."""
     food_obs = []
 
-    # Use spatial grid query for efficiency
-    nearby = env.spatial_grid.query_food(fish, radius)
-
     for food in nearby:
         dx = food.pos.x - fish.pos.x
         dy = food.pos.y - fish.pos.y
@@ -138,17 +134,10 @@ def _build_food_observations(
     return food_obs
 
 
-def _build_fish_observations(
-    fish: Fish,
-    env: Any,
-    radius: float,
-) -> list[dict[str, Any]]:
-    """Build observations of nearby fish (non-threats)."""
+def _build_fish_observations(fish: Fish, nearby: list[Any]) -> list[dict[str, Any]]:
+    """Build observations of nearby fish (non-threats) from a fish query."""
     fish_obs = []
 
-    # Use spatial grid query for efficiency
-    nearby = env.spatial_grid.query_fish(fish, radius)
-
     for other in nearby:
         if other is fish:
             continue
@@ -183,17 +172,10 @@ def _build_fish_observations(
     return fish_obs
 
 
-def _build_threat_observations(
-    fish: Fish,
-    env: Any,
-    radius: float,
-) -> list[dict[str, Any]]:
-    """Build observations of nearby threats (larger fish)."""
+def _build_threat_observations(fish: Fish, nearby: list[Any]) -> list[dict[str, Any]]:
+    """Build observations of nearby threats (larger fish) from a fish query."""
     threat_obs = []
 
-    # Use spatial grid query for efficiency
-    nearby = env.spatial_grid.query_fish(fish, radius)
-
     for other in nearby:
         if other is fish:
             continue
@@ -0,0 +1,320 @@
+"""Vectorized stepping of several Tank-like worlds with array observations.
+
+``VectorWorldEnv`` drives K independent worlds (any mode whose backend
+exposes Tank-style fish, e.g. "tank" or "petri") in lockstep. Observations
+come from :func:`build_array_observations` and are stacked into
+``(K, max_agents, ...)`` arrays; actions are a ``(K, max_agents, 2)`` array
+of target velocities applied to the fish in each slot exactly as
+``apply_actions`` applies an external ``target_velocity``.
+
+Episodes end when a world has no living fish (terminated) or after
+``max_episode_steps`` frames (truncated). Finished worlds are reset
+immediately: the returned observation is the new episode's first one and
+the last observation of the finished episode is in ``final_observations``.
+
+Seeding is deterministic per world: world ``i`` starts with seed
+``seed + i`` and draws each later episode seed from ``random.Random(seed + i)``,
+so a world's trajectory does not depend on K, on the other worlds or on
+whether it runs in-process or in a worker subprocess.
+
+With ``num_workers > 0`` the worlds are split across worker processes that
+talk to the parent over ``multiprocessing`` pipes. A step sends every worker
+its actions before waiting for any reply, so workers simulate in parallel.
+"""
+
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import random
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from core.exceptions import SimulationError
+from core.modes.interfaces import ModeConfig
+from core.worlds.tank.array_observations import (
+    AgentSlots,
+    ArrayObservation,
+    ArrayObservationSpec,
+    build_array_observations,
+)
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+    from core.entities import Fish
+
+_STARTUP_TIMEOUT = 60.0
+_SHUTDOWN_TIMEOUT = 5.0
+
+
+@dataclass
+class VectorStep:
+    """Result of one ``VectorWorldEnv.step``.
+
+    Attributes:
+        observations: Stacked observation arrays, ``(K, max_agents, ...)``
+        rewards: ``(K, max_agents)`` energy change of each slot's fish this
+            step (a fish that disappeared counts as ending with 0 energy)
+        agent_done: ``(K, max_agents)`` True for slots whose fish disappeared
+        terminated: ``(K,)`` True for worlds whose fish all died
+        truncated: ``(K,)`` True for worlds that hit ``max_episode_steps``
+        final_observations: World index -> last observation of the episode
+            that just ended, for worlds that were reset this step
+    """
+
+    observations: ArrayObservation
+    rewards: np.ndarray
+    agent_done: np.ndarray
+    terminated: np.ndarray
+    truncated: np.ndarray
+    final_observations: dict[int, ArrayObservation] = field(default_factory=dict)
+
+
+# (mode_id, config, seed, spec, max_episode_steps) for one _EnvWorld
+_WorldArgs = tuple[str, ModeConfig | None, int, ArrayObservationSpec, int | None]
+_WorldStep = tuple[ArrayObservation, np.ndarray, np.ndarray, bool, bool, ArrayObservation | None]
+
+
+class _EnvWorld:
+    """One world plus its agent slots and episode bookkeeping."""
+
+    def __init__(
+        self,
+        mode_id: str,
+        config: ModeConfig | None,
+        seed: int,
+        spec: ArrayObservationSpec,
+        max_episode_steps: int | None,
+    ) -> None:
+        from core.worlds.registry import WorldRegistry
+
+        self.spec = spec
+        self.max_episode_steps = max_episode_steps
+        self.world = WorldRegistry.create_world(mode_id, seed=seed, config=config)
+        self.slots = AgentSlots(spec.max_agents)
+        self.agents: list[Fish | None] = []
+        self.slot_energy = np.zeros(spec.max_agents)
+        self.episode_steps = 0
+        self._seeds = random.Random(seed)
+        self._next_seed: int | None = seed
+
+    def reset(self, seed: int | None = None) -> ArrayObservation:
+        """Start an episode with ``seed``, or with the next seed of this world's sequence."""
+        if seed is not None:
+            self._seeds = random.Random(seed)
+            self._next_seed = seed
+        if self._next_seed is None:
+            self._next_seed = self._seeds.getrandbits(32)
+        self.world.reset(seed=self._next_seed)
+        self._next_seed = None
+        self.slots.clear()
+        self.episode_steps = 0
+        return self._observe()
+
+    def _observe(self) -> ArrayObservation:
+        obs, self.agents = build_array_observations(self.world, self.slots, self.spec)
+        self.slot_energy = np.where(obs["agent_mask"], obs["self"][:, 4], 0.0)
+        return obs
+
+    def step(self, actions: np.ndarray) -> _WorldStep:
+        for slot, fish in enumerate(self.agents):
+            if fish is not None:
+                fish.vel.x = float(actions[slot, 0])
+                fish.vel.y = float(actions[slot, 1])
+        had_agent = np.array([fish is not None for fish in self.agents])
+        before = self.slot_energy
+
+        self.world.update()
+        self.episode_steps += 1
+        previous = self.agents
+        obs = self._observe()
+
+        # A slot is done when its fish is gone, even if a newcomer took it over.
+        done = had_agent & np.array(
+            [
+                old is not None and old is not new
+                for old, new in zip(previous, self.agents, strict=True)
+            ]
+        )
+        after = np.where(done, 0.0, self.slot_energy)
+        rewards = np.where(had_agent, after - before, 0.0)
+        terminated = not self.slots.slot_of
+        truncated = (
+            self.max_episode_steps is not None and self.episode_steps >= self.max_episode_steps
+        )
+        final = None
+        if terminated or truncated:
+            final, obs = obs, self.reset()
+        return obs, rewards, done, terminated, truncated, final
+
+
+def _stack(observations: list[ArrayObservation]) -> ArrayObservation:
+    return {key: np.stack([obs[key] for obs in observations]) for key in observations[0]}
+
+
+def _serve_worlds(conn: Connection, world_args: list[_WorldArgs]) -> None:
+    """Worker process entry point: own some worlds and serve reset/step requests."""
+    try:
+        worlds = [_EnvWorld(*args) for args in world_args]
+    except Exception as e:
+        conn.send((False, (type(e).__name__, str(e))))
+        conn.close()
+        return
+    conn.send((True, []))
+    try:
+        while True:
+            try:
+                op, payload = conn.recv()
+            except (EOFError, OSError):
+                break  # Parent went away
+            if op == "close":
+                conn.send((True, None))
+                break
+            try:
+                if op == "reset":
+                    value: list = [w.reset(s) for w, s in zip(worlds, payload, strict=True)]
+                elif op == "step":
+                    value = [w.step(a) for w, a in zip(worlds, payload, strict=True)]
+                else:
+                    raise ValueError(f"Unknown vector env op: {op}")
+                reply = (True, value)
+            except Exception as e:
+                reply = (False, (type(e).__name__, str(e)))
+            conn.send(reply)
+    finally:
+        conn.close()
+
+
+class VectorWorldEnv:
+    """Steps K worlds in lockstep with fixed-shape NumPy observations.
+
+    Args:
+        num_worlds: Number of worlds K
+        mode_id: World mode for every world ("tank", "petri", ...)
+        seed: Base seed; world ``i`` uses ``seed + i``
+        config: Mode config passed to ``WorldRegistry.create_world``
+        spec: Observation shapes (agent slots, neighbours per kind, radius)
+        max_episode_steps: Truncate episodes after this many frames (None: never)
+        num_workers: Worker processes to spread worlds over (0: in-process)
+        start_method: ``multiprocessing`` start method for workers
+
+    Example:
+        >>> env = VectorWorldEnv(4, seed=7, max_episode_steps=500)
+        >>> obs = env.reset()
+        >>> result = env.step(np.zeros((4, env.spec.max_agents, 2)))
+        >>> env.close()
+    """
+
+    def __init__(
+        self,
+        num_worlds: int,
+        mode_id: str = "tank",
+        seed: int = 0,
+        config: ModeConfig | None = None,
+        spec: ArrayObservationSpec | None = None,
+        max_episode_steps: int | None = None,
+        num_workers: int = 0,
+        start_method: str = "spawn",
+    ) -> None:
+        if num_worlds < 1:
+            raise ValueError("num_worlds must be at least 1")
+        self.num_worlds = num_worlds
+        self.spec = spec or ArrayObservationSpec()
+        self.seed = seed
+        world_args: list[_WorldArgs] = [
+            (mode_id, config, seed + index, self.spec, max_episode_steps)
+            for index in range(num_worlds)
+        ]
+
+        self._worlds: list[_EnvWorld] = []
+        self._workers: list[tuple[Connection, BaseProcess, range]] = []
+        num_workers = min(num_workers, num_worlds)
+        if num_workers <= 0:
+            self._worlds = [_EnvWorld(*args) for args in world_args]
+        else:
+            ctx = multiprocessing.get_context(start_method)
+            bounds = np.linspace(0, num_worlds, num_workers + 1).astype(int)
+            for start, stop in itertools.pairwise(bounds.tolist()):
+                conn, child_conn = ctx.Pipe()
+                process = ctx.Process(  # type: ignore[attr-defined]
+                    target=_serve_worlds,
+                    args=(child_conn, world_args[start:stop]),
+                    name=f"vector-env-{start}",
+                    daemon=True,
+                )
+                process.start()
+                child_conn.close()
+                self._workers.append((conn, process, range(start, stop)))
+            for conn, process, _ in self._workers:
+                if not conn.poll(_STARTUP_TIMEOUT):
+                    self.close()
+                    raise SimulationError("Vector env worker did not start")
+                self._receive(conn)
+
+    def reset(self, seed: int | None = None) -> ArrayObservation:
+        """Reset every world; a new ``seed`` re-seeds them as ``seed + i``."""
+        if seed is not None:
+            self.seed = seed
+        seeds = [None if seed is None else seed + index for index in range(self.num_worlds)]
+        if self._worlds:
+            return _stack([w.reset(s) for w, s in zip(self._worlds, seeds, strict=True)])
+        for conn, _, indices in self._workers:
+            conn.send(("reset", seeds[indices.start : indices.stop]))
+        return _stack([obs for conn, _, _ in self._workers for obs in self._receive(conn)])
+
+    def step(self, actions: np.ndarray) -> VectorStep:
+        """Apply ``(K, max_agents, 2)`` target velocities and advance every world one frame."""
+        actions = np.asarray(actions, dtype=np.float64)
+        expected = (self.num_worlds, self.spec.max_agents, 2)
+        if actions.shape != expected:
+            raise ValueError(f"actions must have shape {expected}, got {actions.shape}")
+
+        if self._worlds:
+            results = [w.step(a) for w, a in zip(self._worlds, actions, strict=True)]
+        else:
+            for conn, _, indices in self._workers:
+                conn.send(("step", list(actions[indices.start : indices.stop])))
+            results = [r for conn, _, _ in self._workers for r in self._receive(conn)]
+
+        obs, rewards, done, terminated, truncated, final = zip(*results, strict=True)
+        return VectorStep(
+            observations=_stack(list(obs)),
+            rewards=np.stack(rewards).astype(self.spec.dtype),
+            agent_done=np.stack(done),
+            terminated=np.array(terminated, dtype=bool),
+            truncated=np.array(truncated, dtype=bool),
+            final_observations={i: f for i, f in enumerate(final) if f is not None},
+        )
+
+    def close(self) -> None:
+        """Stop worker processes (no-op for in-process worlds)."""
+        for conn, process, _ in self._workers:
+            try:
+                conn.send(("close", None))
+                conn.recv()
+            except (EOFError, OSError, BrokenPipeError):
+                pass
+            conn.close()
+            process.join(_SHUTDOWN_TIMEOUT)
+            if process.is_alive():
+                process.kill()
+        self._workers = []
+        self._worlds = []
+
+    def __enter__(self) -> VectorWorldEnv:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @staticmethod
+    def _receive(conn: Connection) -> list:
+        ok, value = conn.recv()
+        if not ok:
+            type_name, message = value
+            raise SimulationError(f"Vector env worker failed: {type_name}: {message}")
+        return value
@@ -1,7 +1,12 @@
 import React, { useEffect, useRef, useState, useCallback } from 'react';
 import Tree, { type CustomNodeElementProps } from 'react-d3-tree';
-import { transformLineageData } from '../utils/lineageUtils';
-import type { FishRecord, TreeNodeData, LineageTransformResult } from '../utils/lineageUtils';
+import { applyLineageDelta, transformLineageData } from '../utils/lineageUtils';
+import type {
+    FishRecord,
+    LineageDelta,
+    TreeNodeData,
+    LineageTransformResult,
+} from '../utils/lineageUtils';
 import { config } from '../config';
 import './PhylogeneticTree.css';
 
@@ -86,6 +91,13 @@ export const PhylogeneticTree: React.FC<PhylogeneticTreeProps> = ({ worldId }) =
     const [treeKey, setTreeKey] = useState<number>(0);
     // Last raw lineage records, kept so a chain can be expanded without refetching
     const rawRecordsRef = useRef<FishRecord[]>([]);
+    // Records by id plus the server version they reflect; each refetch only
+    // asks for the records changed since that version
+    const recordsByIdRef = useRef<Map<string, FishRecord>>(new Map());
+    const lineageVersionRef = useRef<{ epoch: string | null; version: number }>({
+        epoch: null,
+        version: 0,
+    });
     // Summary-node ids the user has expanded; survives the 10s refetch
     const expandedChainsRef = useRef<Set<string>>(new Set());
 
@@ -151,15 +163,21 @@ export const PhylogeneticTree: React.FC<PhylogeneticTreeProps> = ({ worldId }) =
             setLoading(true);
             setError(null);
 
-            const lineageUrl = `${config.apiBaseUrl}/api/worlds/${worldId}/lineage`;
+            const { epoch, version } = lineageVersionRef.current;
+            const params = new URLSearchParams({ since: String(version) });
+            if (epoch) params.set('epoch', epoch);
+            const lineageUrl = `${config.apiBaseUrl}/api/worlds/${worldId}/lineage?${params}`;
             const response = await fetch(lineageUrl);
 
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
             }
 
-            const data: FishRecord[] = await response.json();
-            rawRecordsRef.current = data ?? [];
+            const delta: LineageDelta = await response.json();
+            applyLineageDelta(recordsByIdRef.current, delta);
+            lineageVersionRef.current = { epoch: delta.epoch, version: delta.version };
+            const data: FishRecord[] = Array.from(recordsByIdRef.current.values());
+            rawRecordsRef.current = data;
 
             if (data && data.length > 0) {
                 const { tree, error: lineageError }: LineageTransformResult = transformLineageData(
@@ -199,6 +217,8 @@ export const PhylogeneticTree: React.FC<PhylogeneticTreeProps> = ({ worldId }) =
     };
 
     useEffect(() => {
+        recordsByIdRef.current = new Map();
+        lineageVersionRef.current = { epoch: null, version: 0 };
         fetchLineage();
         const interval = setInterval(fetchLineage, 10000);
         return () => clearInterval(interval);
@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { transformLineageData, type FishRecord } from './lineageUtils';
+import { applyLineageDelta, transformLineageData, type FishRecord } from './lineageUtils';
 
 describe('lineageUtils', () => {
     it('should handle empty lineage data', () => {
@@ -182,4 +182,27 @@ describe('lineageUtils', () => {
         expect(child2?.attributes.IsCollapsedChain).toBeUndefined();
         expect(child2?.attributes.ID).toBe('2');
     });
+
+    it('should apply lineage deltas in place and reset on full reloads', () => {
+        const record = (id: string, parent_id: string, is_alive: boolean): FishRecord => ({
+            id, parent_id, generation: 1, algorithm: 'AlgoA', color: '#ff0000', is_alive,
+        });
+        const records = new Map<string, FishRecord>();
+
+        applyLineageDelta(records, {
+            epoch: 'a', version: 3, full: true, removed: [],
+            records: [record('1', 'root', false), record('2', '1', true), record('3', '1', false)],
+        });
+        applyLineageDelta(records, {
+            epoch: 'a', version: 6, full: false, removed: ['3'],
+            records: [record('2', '1', false), record('4', '2', true)],
+        });
+        expect([...records.keys()]).toEqual(['1', '2', '4']);
+        expect(records.get('2')?.is_alive).toBe(false);
+
+        applyLineageDelta(records, {
+            epoch: 'b', version: 1, full: true, removed: [], records: [record('9', 'root', true)],
+        });
+        expect([...records.keys()]).toEqual(['9']);
+    });
 });
@@ -48,6 +48,32 @@ export interface LineageTransformResult {
     error: string | null;
 }
 
+/** Response of `/api/worlds/{id}/lineage?since=<version>&epoch=<epoch>`. */
+export interface LineageDelta {
+    epoch: string | null;
+    version: number;
+    /** True when `records` is the whole log and replaces the client's copy. */
+    full: boolean;
+    records: FishRecord[];
+    removed: string[];
+}
+
+/**
+ * Apply a lineage delta to the client's records (keyed by id, in place).
+ * New records are appended; changed records keep their position.
+ */
+export const applyLineageDelta = (records: Map<string, FishRecord>, delta: LineageDelta): void => {
+    if (delta.full) {
+        records.clear();
+    }
+    for (const id of delta.removed) {
+        records.delete(id);
+    }
+    for (const record of delta.records) {
+        records.set(record.id, record);
+    }
+};
+
 export interface LineageTransformOptions {
     /**
      * Summary-node IDs the user has expanded. Chains listed here are left
@@ -196,6 +196,10 @@ Examples:
 
   # Replay a recording (verifies fingerprints match)
   python main.py --headless --replay out.replay.jsonl
+
+  # Find the first divergent frame of a checkpointed recording
+  python main.py --headless --max-frames 10000 --seed 42 --record out.replay.jsonl --checkpoint-every 500
+  python main.py --headless --replay out.replay.jsonl --diff
         """,
     )
 
@@ -283,6 +287,14 @@ Examples:
         help="Record a fingerprint every N steps when using --record (default: 1)",
     )
 
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=None,
+        metavar="N",
+        help="During --record, embed per-entity fingerprints every N frames (for --diff)",
+    )
+
     parser.add_argument(
         "--replay",
         type=str,
@@ -291,6 +303,12 @@ Examples:
         help="Replay a recorded file and verify fingerprints match",
     )
 
+    parser.add_argument(
+        "--diff",
+        action="store_true",
+        help="With --replay, report the first divergent frame and entities instead of failing",
+    )
+
     args = parser.parse_args()
 
     if args.record and args.replay:
@@ -312,6 +330,16 @@ Examples:
             logger.info("Debug entity selected: %s", args.debug_entity)
         logger.info("")
 
+        if args.replay and args.diff:
+            from backend.replay import diff_replay
+
+            divergence = diff_replay(args.replay)
+            if divergence is None:
+                logger.info("Replay verified: %s", args.replay)
+                return
+            logger.error("Replay diverged: %s", divergence)
+            sys.exit(1)
+
         if args.replay:
             from backend.replay import replay_file
 
@@ -346,6 +374,7 @@ Examples:
                 steps=args.max_frames,
                 record_every=args.record_every,
                 plan=ReplayPlan(switch_at),
+                checkpoint_every=args.checkpoint_every,
             )
             logger.info("Replay recorded: %s", args.record)
             return
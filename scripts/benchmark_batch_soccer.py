@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Soccer physics throughput: RCSSLiteEngine per match vs BatchRCSSLiteEngine.
+
+Steps N independent matches (default formation, canonical params) through
+the same pre-generated random command stream and reports match-cycles per
+second for:
+
+- ``scalar``: one ``RCSSLiteEngine`` per match, ``queue_command`` +
+  ``step_cycle`` each;
+- ``batch``: one ``BatchRCSSLiteEngine`` (strict mode) fed with
+  ``queue_commands`` arrays;
+- ``fast``: the same with ``strict=False`` (NumPy trigonometry).
+
+Final snapshots of every strict batch match must equal the scalar ones.
+Policy execution and observation building are not included.
+
+Usage:
+    python scripts/benchmark_batch_soccer.py [--matches 1 16 64 256] [--cycles 300]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.minigames.soccer.batch_engine import COMMAND_CODES, BatchRCSSLiteEngine
+from core.minigames.soccer.engine import CommandType, RCSSCommand, RCSSLiteEngine, RCSSVector
+from core.minigames.soccer.formation import build_default_formation
+from core.minigames.soccer.params import SOCCER_CANONICAL_PARAMS
+
+_KINDS = [CommandType.DASH, CommandType.TURN, CommandType.KICK]
+
+
+def _commands(matches: int, players: int, cycles: int, seed: int) -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(seed)
+    shape = (cycles, matches, players)
+    kinds = np.array([COMMAND_CODES[k] for k in _KINDS])[rng.choice(3, shape, p=[0.7, 0.2, 0.1])]
+    return kinds, rng.uniform(0.0, 100.0, shape), rng.uniform(-90.0, 90.0, shape)
+
+
+def _setup(engine, team_size: int) -> list[str]:
+    specs = build_default_formation(team_size, SOCCER_CANONICAL_PARAMS)
+    for spec in specs:
+        engine.add_player(spec.player_id, spec.team, RCSSVector(spec.x, spec.y), spec.body_angle)
+    return [spec.player_id for spec in specs]
+
+
+def run_scalar(seeds: list[int], team_size: int, commands) -> tuple[float, list[dict]]:
+    kinds, powers, directions = commands
+    engines = [RCSSLiteEngine(seed=seed) for seed in seeds]
+    for engine in engines:
+        player_ids = _setup(engine, team_size)
+    by_code = {code: kind for kind, code in COMMAND_CODES.items()}
+    # Build command objects up front so only engine work is timed
+    stream = [
+        [
+            [
+                RCSSCommand(by_code[int(k)], power=float(p), direction=float(d))
+                for k, p, d in zip(kinds[c, m], powers[c, m], directions[c, m], strict=True)
+            ]
+            for m in range(len(seeds))
+        ]
+        for c in range(len(kinds))
+    ]
+    start = time.perf_counter()
+    for cycle_commands in stream:
+        for engine, match_commands in zip(engines, cycle_commands, strict=True):
+            for player_id, command in zip(player_ids, match_commands, strict=True):
+                engine.queue_command(player_id, command)
+            engine.step_cycle()
+    elapsed = time.perf_counter() - start
+    return elapsed, [engine.get_snapshot() for engine in engines]
+
+
+def run_batch(seeds: list[int], team_size: int, commands, strict: bool) -> tuple[float, list]:
+    kinds, powers, directions = commands
+    batch = BatchRCSSLiteEngine(seeds, strict=strict)
+    _setup(batch, team_size)
+    start = time.perf_counter()
+    for cycle in range(len(kinds)):
+        batch.queue_commands(kinds[cycle], powers[cycle], directions[cycle])
+        batch.step_cycle()
+    elapsed = time.perf_counter() - start
+    return elapsed, [batch.get_snapshot(m) for m in range(len(seeds))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--matches", nargs="*", type=int, default=[1, 16, 64, 256])
+    parser.add_argument("--cycles", type=int, default=300)
+    parser.add_argument("--team-size", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(
+        f"{'matches':>8} {'scalar mc/s':>12} {'batch mc/s':>11} {'fast mc/s':>10} "
+        f"{'speedup':>8}"
+    )
+    for matches in args.matches:
+        seeds = list(range(args.seed, args.seed + matches))
+        commands = _commands(matches, args.team_size * 2, args.cycles, args.seed)
+        scalar_s, expected = run_scalar(seeds, args.team_size, commands)
+        batch_s, snapshots = run_batch(seeds, args.team_size, commands, strict=True)
+        fast_s, _ = run_batch(seeds, args.team_size, commands, strict=False)
+        if snapshots != expected:
+            raise SystemExit(f"strict batch diverged from the scalar engine at {matches} matches")
+        work = matches * args.cycles
+        print(
+            f"{matches:>8} {work / scalar_s:>12,.0f} {work / batch_s:>11,.0f} "
+            f"{work / fast_s:>10,.0f} {scalar_s / batch_s:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Time one behavior-graph evaluation on each execution tier.
+
+For the default foraging graph and the shared pursuit module, reports the
+mean cost of a single ``evaluate`` call with the checked interpreter (debug
+mode), the interpreter ``compile_cached`` used to return, and the
+source-generated plan it returns now. All tiers must produce identical
+outputs over the sampled contexts, so the script also checks that.
+
+Usage:
+    python scripts/benchmark_behavior_graph.py [--evaluations N] [--repeats N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.behavior.generated_graph import generate_plan
+from core.behavior.pursuit_nodes import default_pursuit_module_graph
+from core.behavior.tank_adapter import default_foraging_graph
+
+
+def _vector(rng: random.Random) -> tuple[float, float]:
+    return rng.uniform(-1.0, 1.0), rng.uniform(-1.0, 1.0)
+
+
+def _foraging_context(rng: random.Random) -> dict[str, object]:
+    return {
+        "food_vector": _vector(rng),
+        "threat_away_vector": _vector(rng) if rng.random() < 0.3 else (0.0, 0.0),
+        "cohesion_vector": _vector(rng),
+        "energy_ratio": rng.random(),
+        "has_target": rng.random() < 0.8,
+    }
+
+
+def _pursuit_context(rng: random.Random) -> dict[str, object]:
+    return {
+        "target_vector": _vector(rng),
+        "target_velocity": _vector(rng),
+        "self_velocity": _vector(rng),
+        "self_speed": rng.uniform(0.0, 3.0),
+    }
+
+
+def _time_per_call(plan, contexts: list[dict[str, object]], repeats: int) -> float:
+    evaluate = plan.evaluate
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for context in contexts:
+            evaluate(context)
+        best = min(best, time.perf_counter() - start)
+    return best / len(contexts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark behavior-graph execution tiers")
+    parser.add_argument("--evaluations", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    cases = (
+        ("foraging", default_foraging_graph(), _foraging_context),
+        ("pursuit", default_pursuit_module_graph(), _pursuit_context),
+    )
+
+    print("=" * 72)
+    print("BEHAVIOR GRAPH EVALUATION BENCHMARK")
+    print("=" * 72)
+    print(f"{'graph':>10} {'tier':>12} {'us/eval':>10} {'speedup':>10}")
+    for name, graph, make_context in cases:
+        rng = random.Random(args.seed)
+        contexts = [make_context(rng) for _ in range(args.evaluations)]
+        plans = {
+            "checked": graph.compile(validate_outputs=True),
+            "interpreter": graph.compile(),
+            "generated": generate_plan(graph.compile()),
+        }
+        outputs = {tier: [plan.evaluate(c) for c in contexts] for tier, plan in plans.items()}
+        baseline = _time_per_call(plans["interpreter"], contexts, args.repeats)
+        for tier, plan in plans.items():
+            per_call = _time_per_call(plan, contexts, args.repeats)
+            print(f"{name:>10} {tier:>12} {per_call * 1e6:>10.3f} {baseline / per_call:>9.2f}x")
+        identical = outputs["generated"] == outputs["interpreter"] == outputs["checked"]
+        print(f"{'':>10} outputs identical: {identical}")
+        if not identical:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Compare JSON and binary websocket state frames: bytes and encode time.
+
+Runs a tank world briefly to get real entity snapshots, then replicates them
+(new ids, jittered positions) up to each target entity count and measures:
+
+- ``full``: a full frame with every entity;
+- ``delta``: a delta frame where every entity moved (worst case).
+
+JSON is ``state.to_json()`` (what the broadcast loop sends today); binary is
+``encode_binary_state(state)``. Both include building the payload dicts.
+
+Usage:
+    python scripts/benchmark_binary_frames.py [--entities 200 2000] [--repeat 20]
+"""
+
+import argparse
+import dataclasses
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.simulation_runner import SimulationRunner
+from backend.state_payloads import DeltaStatePayload, FullStatePayload
+from backend.state_payloads.binary import decode_binary_state, encode_binary_state
+
+
+def _base_states(seed: int) -> tuple[FullStatePayload, DeltaStatePayload]:
+    runner = SimulationRunner(world_type="tank", seed=seed)
+    runner.running = True
+    for _ in range(60):
+        runner.world.step()
+    full = runner.get_state(force_full=False, allow_delta=True)
+    runner.world.step()
+    delta = runner.get_state(force_full=False, allow_delta=True)
+    runner.running = False
+    if not isinstance(full, FullStatePayload) or not isinstance(delta, DeltaStatePayload):
+        raise SystemExit("expected a full frame followed by a delta frame")
+    return full, delta
+
+
+def _scaled(
+    full: FullStatePayload, delta: DeltaStatePayload, count: int, rng: random.Random
+) -> tuple[FullStatePayload, DeltaStatePayload]:
+    entities = []
+    for i in range(count):
+        source = full.entities[i % len(full.entities)]
+        entities.append(
+            dataclasses.replace(
+                source,
+                id=10_000_000 + i,
+                x=source.x + rng.uniform(-50.0, 50.0),
+                y=source.y + rng.uniform(-50.0, 50.0),
+                vel_x=rng.uniform(-3.0, 3.0),
+                vel_y=rng.uniform(-3.0, 3.0),
+            )
+        )
+    updates = [entity.to_delta_dict() for entity in entities]
+    return (
+        dataclasses.replace(full, entities=entities),
+        dataclasses.replace(delta, updates=updates, added=[], removed=[]),
+    )
+
+
+def _time_ms(encode, state, repeat: int) -> tuple[float, bytes]:
+    data = encode(state)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        encode(state)
+    return (time.perf_counter() - start) / repeat * 1000, data
+
+
+def _json(state) -> bytes:
+    return state.to_json().encode("utf-8")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--entities", nargs="*", type=int, default=[200, 2000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    base_full, base_delta = _base_states(args.seed)
+    rng = random.Random(args.seed)
+    print(
+        f"{'entities':>8} {'frame':>6} {'json KB':>9} {'binary KB':>10} {'ratio':>6} "
+        f"{'json ms':>8} {'binary ms':>10}"
+    )
+    for count in args.entities:
+        full, delta = _scaled(base_full, base_delta, count, rng)
+        for name, state in (("full", full), ("delta", delta)):
+            json_ms, json_data = _time_ms(_json, state, args.repeat)
+            binary_ms, binary_data = _time_ms(encode_binary_state, state, args.repeat)
+            snapshot = decode_binary_state(binary_data)["snapshot"]
+            if len(snapshot["entities" if name == "full" else "updates"]) != count:
+                raise SystemExit(f"binary {name} frame did not round-trip")
+            print(
+                f"{count:>8} {name:>6} {len(json_data) / 1024:>9.1f} "
+                f"{len(binary_data) / 1024:>10.1f} {len(json_data) / len(binary_data):>5.1f}x "
+                f"{json_ms:>8.2f} {binary_ms:>10.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
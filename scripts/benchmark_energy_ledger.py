@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Per-frame energy-delta cost: EnergyDeltaRecord list vs columnar EnergyLedger.
+
+Runs a seeded headless tank for ``--warmup`` frames, captures every
+``record_energy_delta`` call of the next ``--frames`` frames, then replays
+the captured calls through:
+
+- ``records``: the previous path, one ``EnergyDeltaRecord`` per call (identity
+  resolved per call) followed by per-record ``ingest_energy_deltas``;
+- ``materialized``: ``EnergyLedger.record`` (identity resolved once per entity
+  per frame) and the bulk ``ingest_energy_deltas``, then ``records()`` for the
+  frame's ``StepResult`` as the Tank backend used to do;
+- ``ledger``: the same, with the ledger itself handed to ``StepResult``.
+
+Recording, ingestion and building the ``StepResult`` are timed. Both paths must produce the same
+per-source gain and burn totals (to 1e-9 relative).
+
+Usage:
+    python scripts/benchmark_energy_ledger.py [--fish 90] [--frames 200] [--warmup 100]
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.ecosystem import EcosystemManager
+from core.simulation.energy_ledger import EnergyLedger
+from core.simulation.engine import SimulationEngine
+from core.worlds.contracts import EnergyDeltaRecord
+from core.worlds.interfaces import StepResult
+
+Call = tuple[object, float, str, dict[str, object]]
+
+
+def capture(
+    fish: int, seed: int, warmup: int, frames: int
+) -> tuple[SimulationEngine, list[list[Call]]]:
+    """Run the tank and return the engine plus each frame's recorder calls."""
+    engine = SimulationEngine(headless=True, seed=seed)
+    engine.config.ecosystem.initial_fish_count = fish
+    engine.setup()
+    for _ in range(warmup):
+        engine.update()
+
+    captured: list[list[Call]] = []
+    recorder = engine._create_energy_recorder()
+
+    def capturing(entity: object, delta: float, source: str, meta: dict[str, object]) -> None:
+        captured[-1].append((entity, delta, source, meta))
+        recorder(entity, delta, source, meta)
+
+    assert engine.environment is not None
+    engine.environment.set_energy_delta_recorder(capturing)
+    for _ in range(frames):
+        captured.append([])
+        engine.update()
+    return engine, captured
+
+
+def run_records(
+    engine: SimulationEngine, calls: list[list[Call]]
+) -> tuple[float, EcosystemManager]:
+    get_identity = engine._get_entity_identity
+    ecosystem = EcosystemManager()
+    start = time.perf_counter()
+    for frame in calls:
+        deltas = []
+        for entity, delta, source, meta in frame:
+            entity_type, stable_id = get_identity(entity)
+            deltas.append(
+                EnergyDeltaRecord(
+                    entity_id=stable_id,
+                    stable_id=stable_id,
+                    entity_type=entity_type,
+                    delta=delta,
+                    source=source,
+                    metadata=meta or {},
+                )
+            )
+        ecosystem.ingest_energy_deltas(deltas)
+        StepResult(energy_deltas=deltas)
+    return time.perf_counter() - start, ecosystem
+
+
+def run_ledger(
+    engine: SimulationEngine, calls: list[list[Call]], materialize: bool
+) -> tuple[float, EcosystemManager]:
+    get_identity = engine._get_entity_identity
+    ecosystem = EcosystemManager()
+    start = time.perf_counter()
+    for frame in calls:
+        ledger = EnergyLedger()
+        for entity, delta, source, meta in frame:
+            ledger.record(entity, delta, source, meta, get_identity)
+        ecosystem.ingest_energy_deltas(ledger)
+        StepResult(energy_deltas=ledger.records() if materialize else ledger)
+    return time.perf_counter() - start, ecosystem
+
+
+def _same_totals(a: dict[str, float], b: dict[str, float]) -> bool:
+    return a.keys() == b.keys() and all(math.isclose(a[k], b[k], rel_tol=1e-9) for k in a)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--fish", type=int, default=90)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    engine, calls = capture(args.fish, args.seed, args.warmup, args.frames)
+    records_s, expected = run_records(engine, calls)
+    materialized_s, materialized = run_ledger(engine, calls, materialize=True)
+    ledger_s, got = run_ledger(engine, calls, materialize=False)
+
+    for name in ("energy_sources", "energy_burn"):
+        for ecosystem in (materialized, got):
+            if not _same_totals(
+                dict(getattr(expected.energy_tracker, name)),
+                dict(getattr(ecosystem.energy_tracker, name)),
+            ):
+                raise SystemExit(f"ledger {name} totals diverged from the per-record path")
+
+    per_frame = sum(len(frame) for frame in calls) / args.frames
+    print(
+        f"{'deltas/frame':>13} {'records':>10} {'materialized':>13} {'ledger':>10} {'speedup':>8}"
+    )
+    print(
+        f"{per_frame:>13.1f} {records_s * 1000 / args.frames:>8.3f}ms "
+        f"{materialized_s * 1000 / args.frames:>11.3f}ms "
+        f"{ledger_s * 1000 / args.frames:>8.3f}ms {records_s / ledger_s:>7.1f}x"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Time genetic distribution stats: full recompute vs IncrementalGeneticStats.
+
+For each population size, replaces ``--churn`` fish (deaths and births) per
+frame and measures the per-frame cost of:
+
+- ``full``: ``get_genetic_distribution_stats`` over the whole population;
+- ``incremental``: ``IncrementalGeneticStats.update`` (including its periodic
+  full rebuild).
+
+Genomes are pre-generated so only stats work is timed. The incremental
+output must match the full recompute (floats to 1e-9 relative).
+
+Usage:
+    python scripts/benchmark_genetic_stats.py [--sizes 50 200 1000] [--churn 2]
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.genetics import Genome
+from core.services.stats.genetic_stats import get_genetic_distribution_stats
+from core.services.stats.incremental_genetic_stats import IncrementalGeneticStats
+
+
+class _Fish:
+    """Only the genome is read by the stats code."""
+
+    def __init__(self, genome: Genome) -> None:
+        self.genome = genome
+
+
+def _matches(expected: object, got: object) -> bool:
+    if isinstance(expected, dict) and isinstance(got, dict):
+        return expected.keys() == got.keys() and all(
+            _matches(expected[key], got[key]) for key in expected
+        )
+    if isinstance(expected, list) and isinstance(got, list):
+        return len(expected) == len(got) and all(
+            _matches(a, b) for a, b in zip(expected, got, strict=True)
+        )
+    if isinstance(expected, float) and isinstance(got, float):
+        return math.isclose(expected, got, rel_tol=1e-9, abs_tol=1e-12)
+    return expected == got
+
+
+def run_size(size: int, churn: int, frames: int, seed: int) -> tuple[float, float]:
+    """Return (full ms/frame, incremental ms/frame)."""
+    rng = random.Random(seed)
+    newborns = [_Fish(Genome.random(use_algorithm=True, rng=rng)) for _ in range(churn * frames)]
+    initial = [_Fish(Genome.random(use_algorithm=True, rng=rng)) for _ in range(size)]
+
+    populations = []
+    fish = list(initial)
+    for frame in range(frames):
+        for _ in range(churn):
+            fish.pop(rng.randrange(len(fish)))
+        fish.extend(newborns[frame * churn : (frame + 1) * churn])
+        populations.append(list(fish))
+
+    incremental = IncrementalGeneticStats()
+    incremental.update(initial)
+    start = time.perf_counter()
+    results = [incremental.update(population) for population in populations]
+    incremental_ms = (time.perf_counter() - start) * 1000 / frames
+
+    start = time.perf_counter()
+    expected = [get_genetic_distribution_stats(population) for population in populations]
+    full_ms = (time.perf_counter() - start) * 1000 / frames
+
+    if not _matches(expected, results):
+        raise SystemExit(f"incremental stats diverged from the full recompute at size {size}")
+    return full_ms, incremental_ms
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", nargs="*", type=int, default=[50, 200, 1000])
+    parser.add_argument("--churn", type=int, default=2)
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'fish':>6} {'full':>10} {'incremental':>12} {'speedup':>8}")
+    for size in args.sizes:
+        full_ms, incremental_ms = run_size(size, args.churn, args.frames, args.seed)
+        print(
+            f"{size:>6} {full_ms:>8.2f}ms {incremental_ms:>10.2f}ms "
+            f"{full_ms / incremental_ms:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Time population-wide fitness sharing: per-genome loop vs GenomeMatrix.
+
+For each population size, measures the cost of computing the sharing factor
+of every genome:
+
+- ``per genome``: ``sharing_factor`` called once per genome (O(n^2) Python
+  ``genetic_distance`` calls);
+- ``matrix``: building a ``GenomeMatrix`` and calling ``sharing_factors``.
+
+Both must produce identical factors. Also reports the cost of exact
+(non-sampled) ``population_diversity``.
+
+Usage:
+    python scripts/benchmark_genome_matrix.py [--sizes 50 200 1000] [--sigma 0.5]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.genetics import Genome, GenomeMatrix
+from core.genetics.diversity import population_diversity, sharing_factor
+
+
+def run_size(size: int, sigma: float, seed: int) -> tuple[float, float, float]:
+    """Return (per-genome ms, matrix ms, exact diversity ms)."""
+    rng = random.Random(seed)
+    genomes = [Genome.random(use_algorithm=True, rng=rng) for _ in range(size)]
+
+    start = time.perf_counter()
+    expected = [sharing_factor(g, genomes, sigma) for g in genomes]
+    loop_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    factors = GenomeMatrix(genomes).sharing_factors(sigma)
+    matrix_ms = (time.perf_counter() - start) * 1000
+    if factors.tolist() != expected:
+        raise SystemExit(f"sharing factor mismatch at size {size}")
+
+    start = time.perf_counter()
+    population_diversity(genomes, exact=True)
+    diversity_ms = (time.perf_counter() - start) * 1000
+    return loop_ms, matrix_ms, diversity_ms
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", nargs="*", type=int, default=[50, 200, 1000])
+    parser.add_argument("--sigma", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(
+        f"{'genomes':>8} {'per genome':>12} {'matrix':>10} {'speedup':>8} {'exact diversity':>16}"
+    )
+    for size in args.sizes:
+        loop_ms, matrix_ms, diversity_ms = run_size(size, args.sigma, args.seed)
+        print(
+            f"{size:>8} {loop_ms:>10.1f}ms {matrix_ms:>8.1f}ms "
+            f"{loop_ms / matrix_ms:>7.0f}x {diversity_ms:>14.1f}ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Compare the rank-table hand evaluator with combination enumeration.
+
+Times the table build (and a load from a saved table file), then scores the
+same random 5-, 6- and 7-card deals with:
+
+- ``combinations``: every 5-card combination through the core evaluator
+  (the pre-table algorithm, without its LRU caches);
+- ``tables``: one rank-table lookup per hand.
+
+Nearly every deal is unique, as in poker/ladder_20k, so neither path gets
+help from ``evaluate_hand_cached``. Results are checked for equality.
+
+Usage:
+    python scripts/benchmark_hand_evaluator.py [--hands N] [--seed S]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.poker.evaluation import rank_tables
+from core.poker.evaluation.hand_evaluator import _best_of_combinations, _evaluate_sorted_cards
+
+DECK = [(r, s) for r in range(2, 15) for s in range(4)]
+
+
+def _sort(cards: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    if len(cards) == 5:
+        return sorted(cards, reverse=True)
+    return sorted(cards, key=lambda c: c[0], reverse=True)
+
+
+def time_per_hand(evaluate, deals) -> tuple[float, list]:
+    start = time.perf_counter()
+    results = [evaluate(cards) for cards in deals]
+    return (time.perf_counter() - start) / len(deals) * 1e6, results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--hands", type=int, default=20000, help="Deals per card count")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    tables = rank_tables.build_rank_tables()
+    build_s = time.perf_counter() - start
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "poker_ranks.bin"
+        rank_tables.save_rank_tables(tables, path)
+        start = time.perf_counter()
+        rank_tables.load_rank_tables(path)
+        load_s = time.perf_counter() - start
+        size_kb = path.stat().st_size / 1024
+    rank_tables.set_rank_tables(tables)
+    print(f"Table build: {build_s:.2f}s, load from file: {load_s:.2f}s ({size_kb:.0f} KiB)")
+
+    rng = random.Random(args.seed)
+    print(f"{'cards':>5} {'combinations':>14} {'tables':>10} {'speedup':>8}")
+    ok = True
+    for n_cards in (5, 6, 7):
+        deals = [_sort(rng.sample(DECK, n_cards)) for _ in range(args.hands)]
+        combo_us, expected = time_per_hand(_best_of_combinations, deals)
+        table_us, actual = time_per_hand(_evaluate_sorted_cards, deals)
+        ok = ok and actual == expected
+        print(f"{n_cards:>5} {combo_us:>12.2f}us {table_us:>8.2f}us {combo_us / table_us:>7.1f}x")
+
+    print("Results identical" if ok else "MISMATCH between evaluators")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
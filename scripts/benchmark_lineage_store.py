@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark the lineage tracker under a long run of births and deaths.
+
+Simulates a steady population: every birth picks a random living parent, and
+once the population is above ``--population`` a random fish dies. The full
+alive set is also synced into the tracker every ``--sync-every`` births (the
+only point where the earlier list-based tracker pruned), and the
+phylogenetic tree endpoint is emulated every
+``--poll-every`` births, both as a full ``get_lineage_data`` call and, when the
+tracker supports it, as a ``get_lineage_delta`` call since the previous poll.
+
+Usage:
+    python scripts/benchmark_lineage_store.py [--births 50000] [--population 400]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.lineage_tracker import MAX_LINEAGE_LOG_SIZE, LineageTracker
+
+
+def run(births: int, population: int, sync_every: int, poll_every: int, seed: int) -> dict:
+    """Drive one tracker through ``births`` births and return timing statistics."""
+    rng = random.Random(seed)
+    tracker = LineageTracker()
+    record_death = getattr(tracker, "record_death", None)
+    get_delta = getattr(tracker, "get_lineage_delta", None)
+
+    alive: list[int] = []
+    next_id = 0
+    for _ in range(min(50, population)):
+        tracker.record_birth(next_id, None, 0, "seed", "#00ff00", 0)
+        alive.append(next_id)
+        next_id += 1
+
+    full_times: list[float] = []
+    delta_times: list[float] = []
+    delta_sizes: list[int] = []
+    version, epoch = 0, None
+    record_time = 0.0
+
+    for frame in range(1, births + 1):
+        start = time.perf_counter()
+        parent = rng.choice(alive)
+        tracker.record_birth(next_id, parent, frame // 100, "algo", "#00ff00", frame)
+        alive.append(next_id)
+        next_id += 1
+        if len(alive) > population:
+            dead = alive.pop(rng.randrange(len(alive)))
+            if record_death is not None:
+                record_death(dead)
+        if frame % sync_every == 0:
+            tracker.update_alive_fish(set(alive))
+        record_time += time.perf_counter() - start
+
+        if frame % poll_every == 0:
+            start = time.perf_counter()
+            tracker.get_lineage_data(set(alive))
+            full_times.append(time.perf_counter() - start)
+            if get_delta is not None:
+                start = time.perf_counter()
+                delta = get_delta(version, epoch)
+                delta_times.append(time.perf_counter() - start)
+                delta_sizes.append(len(delta["records"]) + len(delta["removed"]))
+                version, epoch = delta["version"], delta["epoch"]
+
+    return {
+        "births_per_second": births / record_time,
+        "full_ms": 1000 * sum(full_times) / max(1, len(full_times)),
+        "delta_ms": 1000 * sum(delta_times) / len(delta_times) if delta_times else None,
+        "delta_size": sum(delta_sizes) / len(delta_sizes) if delta_sizes else None,
+        "records": len(tracker.get_lineage_data(set(alive))),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the lineage tracker")
+    parser.add_argument("--births", type=int, default=50000)
+    parser.add_argument("--population", type=int, default=400)
+    parser.add_argument("--sync-every", type=int, default=50)
+    parser.add_argument("--poll-every", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    r = run(args.births, args.population, args.sync_every, args.poll_every, args.seed)
+
+    print("=" * 60)
+    print("LINEAGE STORE BENCHMARK")
+    print("=" * 60)
+    print(f"births:            {args.births} (population {args.population})")
+    print(f"record cap:        {MAX_LINEAGE_LOG_SIZE}, final records: {r['records']}")
+    print(f"births/s:          {r['births_per_second']:.0f} (incl. deaths and alive syncs)")
+    print(f"full poll:         {r['full_ms']:.2f} ms")
+    if r["delta_ms"] is not None:
+        print(f"delta poll:        {r['delta_ms']:.2f} ms ({r['delta_size']:.0f} changes per poll)")
+
+
+if __name__ == "__main__":
+    main()
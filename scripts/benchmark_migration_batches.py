@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Measure cross-server migration throughput with and without batching.
+
+Starts two in-process servers (server B's remote transfer router is reached
+through an ASGI transport, so HTTP encoding and routing are real but no socket
+is opened) and migrates entities from server A's tanks into one tank on B.
+"Single" runs one ``run_migration_tick`` per connection, which is what the
+scheduler did before migrations were batched; "batched" hands every
+connection to one tick. Reports entities per second and HTTP requests.
+
+Usage:
+    python scripts/benchmark_migration_batches.py [--sources 4] [--per-source 8] [--ticks 20]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import httpx
+from fastapi import FastAPI
+
+from backend.connection_manager import TankConnection
+from backend.migration_batch import run_migration_tick
+from backend.models import ServerInfo
+from backend.routers import remote_transfers
+from backend.server_client import ServerClient
+from backend.world_manager import WorldManager
+
+SERVER_B = ServerInfo(
+    server_id="server-b",
+    hostname="b",
+    host="server-b.local",
+    port=8000,
+    status="online",
+    world_count=1,
+    version="benchmark",
+    is_local=False,
+)
+
+
+class _CountingTransport(httpx.ASGITransport):
+    requests = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        return await super().handle_async_request(request)
+
+
+class _Discovery:
+    async def get_server(self, server_id: str) -> ServerInfo | None:
+        return SERVER_B if server_id == SERVER_B.server_id else None
+
+
+async def run_mode(batched: bool, sources: int, per_source: int, ticks: int) -> dict:
+    """Migrate ``sources * per_source`` entities per tick and return throughput stats."""
+    import backend.transfer_history as transfer_history
+
+    # Keep the benchmark's records out of data/transfers.log.
+    transfer_history.log_transfer = lambda **kwargs: None
+
+    server_a, server_b = WorldManager(process_worlds=False), WorldManager(process_worlds=False)
+    source_worlds = [
+        server_a.create_world("tank", f"Source {index}", seed=index, persistent=False)
+        for index in range(sources)
+    ]
+    dest = server_b.create_world("tank", "Dest", seed=99, persistent=False)
+
+    app = FastAPI()
+    app.include_router(remote_transfers.setup_router(server_b))
+    transport = _CountingTransport(app=app)
+    client = ServerClient(max_retries=1)
+    client._client = httpx.AsyncClient(transport=transport)
+    connections = [
+        TankConnection(
+            f"{world.world_id}-{index}",
+            world.world_id,
+            dest.world_id,
+            probability=100,
+            source_server_id="server-a",
+            destination_server_id="server-b",
+        )
+        for world in source_worlds
+        for index in range(per_source)
+    ]
+    groups = [connections] if batched else [[connection] for connection in connections]
+
+    migrated = 0
+    elapsed = 0.0
+    for _ in range(ticks):
+        start = time.perf_counter()
+        for group in groups:
+            result = await run_migration_tick(
+                group,
+                server_a,
+                discovery_service=_Discovery(),
+                server_client=client,
+                local_server_id="server-a",
+            )
+            migrated += result.migrated
+        elapsed += time.perf_counter() - start
+        # Let the simulation threads apply pending spawns and removals.
+        await asyncio.sleep(0.05)
+
+    await client._client.aclose()
+    server_a.stop_all_worlds()
+    server_b.stop_all_worlds()
+    return {
+        "migrated": migrated,
+        "per_second": migrated / elapsed if elapsed else 0.0,
+        "requests": transport.requests,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batched cross-server migration")
+    parser.add_argument("--sources", type=int, default=4)
+    parser.add_argument("--per-source", type=int, default=8)
+    parser.add_argument("--ticks", type=int, default=20)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("CROSS-SERVER MIGRATION BENCHMARK")
+    print("=" * 60)
+    print(f"{'mode':>8} {'migrated':>10} {'entities/s':>12} {'HTTP requests':>15}")
+    for name, batched in (("single", False), ("batched", True)):
+        r = await run_mode(batched, args.sources, args.per_source, args.ticks)
+        print(f"{name:>8} {r['migrated']:>10} {r['per_second']:>12.0f} {r['requests']:>15}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Measure PhaseProfiler "perception" time with and without perception records.
+
+Runs the same seeded tank twice with phase profiling on: once as shipped,
+where ``MovementArbiter.arbitrate`` opens a per-fish perception record, and
+once with the record disabled so every drive queries the spatial grid
+itself. Decisions are identical in both runs (records consume no RNG), so
+the two runs simulate the same frames and the difference is only repeated
+grid queries.
+
+Usage:
+    python scripts/benchmark_perception_records.py [--fish 260] [--frames 300]
+"""
+
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import core.movement.considerations as considerations
+from core.entities import Fish
+from core.worlds.tank.backend import TankWorldBackendAdapter
+
+
+@contextmanager
+def _no_record(fish):
+    yield None
+
+
+def run(records: bool, fish: int, frames: int, warmup: int, seed: int) -> dict:
+    """Profile ``frames`` frames after ``warmup`` and return per-frame statistics."""
+    original = considerations.perception_pass
+    if not records:
+        considerations.perception_pass = _no_record
+    try:
+        world = TankWorldBackendAdapter(
+            seed=seed, max_population=fish + 100, initial_fish_count=fish
+        )
+        world.reset(seed=seed)
+        for _ in range(warmup):
+            world.update()
+
+        profiler = world.engine.profiler
+        profiler.enabled = True
+        queries = 0
+        record_query = profiler.record_query
+
+        def counting(duration: float) -> None:
+            nonlocal queries
+            queries += 1
+            record_query(duration)
+
+        profiler.record_query = counting
+        populations = []
+        start = time.perf_counter()
+        for _ in range(frames):
+            world.update()
+            populations.append(sum(isinstance(e, Fish) for e in world.entities_list))
+        elapsed = time.perf_counter() - start
+    finally:
+        considerations.perception_pass = original
+
+    return {
+        "perception_ms": 1000 * profiler.times["perception"] / frames,
+        "queries": queries / frames,
+        "frame_ms": 1000 * elapsed / frames,
+        "fish": sum(populations) / len(populations),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark per-fish perception records")
+    parser.add_argument("--fish", type=int, default=260)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("PERCEPTION RECORD BENCHMARK")
+    print("=" * 60)
+    print(
+        f"{'records':>8} {'avg fish':>9} {'queries/frame':>14} {'perception ms':>14} {'frame ms':>9}"
+    )
+    for records in (False, True):
+        r = run(records, args.fish, args.frames, args.warmup, args.seed)
+        print(
+            f"{'on' if records else 'off':>8} {r['fish']:>9.0f} {r['queries']:>14.0f}"
+            f" {r['perception_ms']:>14.2f} {r['frame_ms']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
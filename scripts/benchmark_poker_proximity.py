@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Compare the per-fish and NumPy poker proximity graph builders.
+
+For each population size, settles a headless tank for a few frames and then
+times ``PokerProximitySystem._build_proximity_graph`` on the same fish with
+both builders, checking that the graphs are identical. The NumPy builder
+is used for populations of at least ``_VECTORIZED_MIN_FISH``.
+
+Usage:
+    python scripts/benchmark_poker_proximity.py [--fish 16 32 64 128 500 2000] [--repeats N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.systems import poker_proximity
+from core.systems.poker_proximity import _fish_sort_key
+from core.worlds import WorldRegistry
+
+
+def _time_build(system, fish_list: list, min_fish: int, repeats: int) -> tuple[float, dict]:
+    poker_proximity._VECTORIZED_MIN_FISH = min_fish
+    graph = system._build_proximity_graph(fish_list)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        system._build_proximity_graph(fish_list)
+    return (time.perf_counter() - start) * 1000 / repeats, graph
+
+
+def run(fish: int, frames: int, repeats: int, seed: int) -> dict:
+    """Time both builders on one settled tank of about ``fish`` fish."""
+    world = WorldRegistry.create_world(
+        "tank", seed=seed, headless=True, max_population=fish, num_schooling_fish=fish
+    )
+    world.reset(seed=seed)
+    for _ in range(frames):
+        world.update()
+    engine = world.engine
+    fish_list = sorted(engine.entity_manager.get_fish(), key=_fish_sort_key)
+    system = engine.get_system("PokerProximity")
+
+    threshold = poker_proximity._VECTORIZED_MIN_FISH
+    try:
+        loop_ms, loop_graph = _time_build(system, fish_list, len(fish_list) + 1, repeats)
+        numpy_ms, numpy_graph = _time_build(system, fish_list, 0, repeats)
+    finally:
+        poker_proximity._VECTORIZED_MIN_FISH = threshold
+    return {
+        "fish": len(fish_list),
+        "loop_ms": loop_ms,
+        "numpy_ms": numpy_ms,
+        "contacts": sum(len(c) for c in loop_graph.values()),
+        "identical": loop_graph == numpy_graph,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark poker proximity graph builders")
+    parser.add_argument("--fish", type=int, nargs="+", default=[16, 32, 64, 128, 500, 2000])
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("POKER PROXIMITY GRAPH BENCHMARK")
+    print("=" * 60)
+    print(f"{'fish':>6} {'contacts':>9} {'loop ms':>9} {'numpy ms':>9} {'speedup':>8}")
+    for fish in args.fish:
+        r = run(fish, args.frames, args.repeats, args.seed)
+        print(
+            f"{r['fish']:>6} {r['contacts']:>9} {r['loop_ms']:>9.3f} {r['numpy_ms']:>9.3f} "
+            f"{r['loop_ms'] / r['numpy_ms']:>7.2f}x"
+        )
+        if not r["identical"]:
+            print("graphs differ")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Compare the dict and array spatial grid backends.
+
+For each population size, runs a headless tank with each backend and reports
+mean frame time plus the PhaseProfiler "spatial grid" and "perception"
+buckets, then times one batched fish query for the whole population against
+the equivalent per-fish loop. The two backends must produce identical
+trajectories, so the script also checks that the final entity states match.
+
+Usage:
+    python scripts/benchmark_spatial_grid.py [--fish 100 500 2000] [--frames N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ["TANK_PROFILE_PHASES"] = "1"
+
+from core.worlds import WorldRegistry
+
+BACKENDS = ("dict", "array")
+QUERY_RADIUS = 150.0
+
+
+def _entity_state(world) -> list[tuple]:
+    return [(type(e).__name__, e.pos.x, e.pos.y) for e in world.entities_list]
+
+
+def run_backend(backend: str, fish: int, frames: int, warmup: int, seed: int) -> dict:
+    """Run one tank and return timing statistics for the given backend."""
+    world = WorldRegistry.create_world(
+        "tank",
+        seed=seed,
+        headless=True,
+        spatial_grid_backend=backend,
+        max_population=fish,
+        num_schooling_fish=fish,
+    )
+    world.reset(seed=seed)
+    engine = world.engine
+    for _ in range(warmup):
+        world.update()
+
+    profiler = engine.profiler
+    for key in profiler.times:
+        profiler.times[key] = 0.0
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        world.update()
+    elapsed = time.perf_counter() - start
+
+    env = engine.environment
+    population = engine.entity_manager.get_fish()
+    query_start = time.perf_counter()
+    batched = env.nearby_evolving_agents_batch(population, QUERY_RADIUS)
+    batch_ms = (time.perf_counter() - query_start) * 1000
+    query_start = time.perf_counter()
+    looped = [env.nearby_evolving_agents(f, QUERY_RADIUS) for f in population]
+    loop_ms = (time.perf_counter() - query_start) * 1000
+    assert batched == looped, "batched query diverged from per-agent queries"
+
+    return {
+        "frame_ms": elapsed * 1000 / frames,
+        "grid_ms": profiler.times["spatial grid"] * 1000 / frames,
+        "perception_ms": profiler.times["perception"] * 1000 / frames,
+        "fish": len(population),
+        "batch_ms": batch_ms,
+        "loop_ms": loop_ms,
+        "state": _entity_state(world),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark spatial grid backends")
+    parser.add_argument("--fish", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print("=" * 92)
+    print("SPATIAL GRID BACKEND BENCHMARK")
+    print("=" * 92)
+    print(
+        f"{'target':>7} {'backend':>8} {'fish':>6} {'frame ms':>10} {'grid ms':>9} "
+        f"{'percep ms':>10} {'batch query ms':>15} {'loop query ms':>14}"
+    )
+    for fish in args.fish:
+        results = {
+            backend: run_backend(backend, fish, args.frames, args.warmup, args.seed)
+            for backend in BACKENDS
+        }
+        for backend, r in results.items():
+            print(
+                f"{fish:>7} {backend:>8} {r['fish']:>6} {r['frame_ms']:>10.3f} "
+                f"{r['grid_ms']:>9.3f} {r['perception_ms']:>10.3f} "
+                f"{r['batch_ms']:>15.3f} {r['loop_ms']:>14.3f}"
+            )
+        identical = results["dict"]["state"] == results["array"]["state"]
+        print(f"{'':>7} trajectories identical: {identical}")
+        if not identical:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
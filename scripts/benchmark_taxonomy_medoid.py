@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Time species medoid updates: from-scratch vs incremental.
+
+For each species size, fills a SpeciesRecord with random fish profiles and
+then measures the cost of one birth followed by one death (two
+``update_medoid`` calls):
+
+- ``from scratch``: the original O(k^2) pairwise distance sum;
+- ``incremental``: ``SpeciesRecord.update_medoid`` (MedoidTracker).
+
+Both must pick the same medoid object after every update.
+
+Usage:
+    python scripts/benchmark_taxonomy_medoid.py [--sizes 50 200 1000] [--updates N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.taxonomy.profile import _FISH_TRAIT_WEIGHTS, TaxonomyProfile
+from core.taxonomy.registry import SpeciesRecord
+
+
+def random_profile(rng: random.Random) -> TaxonomyProfile:
+    return TaxonomyProfile({t: rng.random() for t, _, _ in _FISH_TRAIT_WEIGHTS}, False)
+
+
+def from_scratch_medoid(members: dict[int, TaxonomyProfile]) -> TaxonomyProfile:
+    profiles = list(members.values())
+    best, best_total = profiles[0], float("inf")
+    for p in profiles:
+        total = sum(p.distance(other) for other in profiles)
+        if total < best_total:
+            best, best_total = p, total
+    return best
+
+
+def run_size(size: int, updates: int, scratch_updates: int, seed: int) -> tuple[float, float]:
+    """Return (from-scratch ms, incremental ms) per birth+death pair."""
+    rng = random.Random(seed)
+    founder = random_profile(rng)
+    record = SpeciesRecord(taxon_id="bench", type_profile=founder, current_medoid_profile=founder)
+    for eid in range(size):
+        record.member_profiles_cache[eid] = random_profile(rng)
+    record.update_medoid()  # builds the tracker once
+
+    cache = record.member_profiles_cache
+    next_id = size
+    incremental = 0.0
+    scratch = 0.0
+    for i in range(updates):
+        cache[next_id] = random_profile(rng)
+        del cache[rng.choice(list(cache))]
+        next_id += 1
+        start = time.perf_counter()
+        record.update_medoid()
+        incremental += time.perf_counter() - start
+        if i < scratch_updates:
+            start = time.perf_counter()
+            expected = from_scratch_medoid(cache)
+            scratch += time.perf_counter() - start
+            if record.current_medoid_profile is not expected:
+                raise SystemExit(f"medoid mismatch at size {size}, update {i}")
+    # One update here covers both the birth and the death
+    return scratch / scratch_updates * 1000, incremental / updates * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", nargs="*", type=int, default=[50, 200, 1000])
+    parser.add_argument("--updates", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'members':>8} {'from scratch':>14} {'incremental':>13} {'speedup':>8}")
+    for size in args.sizes:
+        # The quadratic baseline gets slow quickly; sample fewer updates
+        scratch_updates = max(2, min(args.updates, 200_000 // (size * size) + 1))
+        scratch_ms, incremental_ms = run_size(size, args.updates, scratch_updates, args.seed)
+        print(
+            f"{size:>8} {scratch_ms:>12.2f}ms {incremental_ms:>11.3f}ms "
+            f"{scratch_ms / incremental_ms:>7.0f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Compare stepping K tank worlds through the dict path and the vector env.
+
+Both paths drive the same seeded worlds with the same policy (swim toward
+the nearest visible food at ``--speed``, otherwise keep the current velocity):
+
+- "dict": one ``TankWorldBackendAdapter`` per world in external brain mode.
+  Each frame calls ``step`` with a dict of ``{"target_velocity": ...}``
+  actions built from the previous frame's ``obs_by_agent`` dicts, which is
+  how an external controller uses the backend today.
+- "vector": ``VectorWorldEnv`` with the policy applied to the stacked
+  observation arrays, in-process and with ``--workers`` worker processes.
+
+Reports world-steps per second (frames summed over worlds) and agent-steps
+per second (controlled fish summed over frames and worlds), then the time to
+build one frame of observations for the final state of the first world with
+``build_tank_observations`` and ``build_array_observations``. ``--fish`` sets
+the initial population (and raises the population cap to match).
+
+Usage:
+    python scripts/benchmark_vector_env.py [--worlds 8] [--steps 300] [--workers 4] [--fish 80]
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from core.config.simulation_config import SimulationConfig
+from core.worlds.tank.array_observations import (
+    AgentSlots,
+    ArrayObservationSpec,
+    build_array_observations,
+)
+from core.worlds.tank.backend import TankWorldBackendAdapter
+from core.worlds.tank.observation_builder import build_tank_observations
+from core.worlds.vector_env import VectorWorldEnv
+
+
+def dict_policy(obs_by_agent: dict, speed: float) -> dict:
+    """Per-agent dict actions toward the nearest food."""
+    actions = {}
+    for agent_id, obs in obs_by_agent.items():
+        if not obs["nearby_food"]:
+            continue
+        food = min(obs["nearby_food"], key=lambda item: item["distance"])
+        scale = speed / max(food["distance"], 1e-6)
+        actions[agent_id] = {"target_velocity": (food["dx"] * scale, food["dy"] * scale)}
+    return actions
+
+
+def vector_policy(obs: dict, speed: float) -> np.ndarray:
+    """``(K, A, 2)`` actions toward the nearest food (slot 0), else current velocity."""
+    nearest = obs["food"][:, :, 0]
+    scale = speed / np.maximum(nearest[..., 2:3], 1e-6)
+    return np.where(obs["food_mask"][:, :, :1], nearest[..., :2] * scale, obs["self"][..., 2:4])
+
+
+def run_dict(worlds: int, steps: int, seed: int, speed: float, overrides: dict) -> dict:
+    config = SimulationConfig.production(headless=True).apply_flat_config(overrides)
+    config.tank.brain_mode = "external"
+    adapters = [TankWorldBackendAdapter(seed=seed + i, config=config) for i in range(worlds)]
+    for index, adapter in enumerate(adapters):
+        adapter.reset(seed=seed + index)
+    actions: list[dict] = [{} for _ in adapters]
+    agent_steps = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        for index, adapter in enumerate(adapters):
+            result = adapter.step(actions[index])
+            agent_steps += len(result.obs_by_agent)
+            actions[index] = dict_policy(result.obs_by_agent, speed)
+    elapsed = time.perf_counter() - start
+    return {"elapsed": elapsed, "agent_steps": agent_steps, "world": adapters[0]}
+
+
+def run_vector(
+    worlds: int, steps: int, seed: int, speed: float, workers: int, overrides: dict, agents: int
+) -> dict:
+    spec = ArrayObservationSpec(max_agents=agents)
+    with VectorWorldEnv(worlds, seed=seed, config=overrides, spec=spec, num_workers=workers) as env:
+        obs = env.reset()
+        agent_steps = 0
+        start = time.perf_counter()
+        for _ in range(steps):
+            agent_steps += int(obs["agent_mask"].sum())
+            obs = env.step(vector_policy(obs, speed)).observations
+        elapsed = time.perf_counter() - start
+    return {"elapsed": elapsed, "agent_steps": agent_steps}
+
+
+def time_observations(world: TankWorldBackendAdapter, agents: int, repeats: int = 50) -> dict:
+    """Milliseconds to build one frame of dict and of array observations."""
+    spec = ArrayObservationSpec(max_agents=agents)
+    slots = AgentSlots(agents)
+    timings = {}
+    for name, build in (
+        ("dict", lambda: build_tank_observations(world)),
+        ("array", lambda: build_array_observations(world, slots, spec)),
+    ):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            build()
+        timings[name] = 1000 * (time.perf_counter() - start) / repeats
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the vectorized multi-world env")
+    parser.add_argument("--worlds", type=int, default=8)
+    parser.add_argument("--steps", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--speed", type=float, default=2.0)
+    parser.add_argument("--fish", type=int, default=None, help="Initial fish per world")
+    args = parser.parse_args()
+
+    overrides: dict = {}
+    agents = 64
+    if args.fish is not None:
+        overrides = {"initial_fish_count": args.fish, "max_population": max(100, args.fish)}
+        agents = max(agents, args.fish)
+
+    def vector(workers: int) -> dict:
+        return run_vector(
+            args.worlds, args.steps, args.seed, args.speed, workers, overrides, agents
+        )
+
+    modes = [
+        ("dict", lambda: run_dict(args.worlds, args.steps, args.seed, args.speed, overrides)),
+        ("vector", lambda: vector(0)),
+    ]
+    if args.workers > 0:
+        modes.append((f"vector x{args.workers}", lambda: vector(args.workers)))
+
+    print("=" * 60)
+    print("VECTOR ENV BENCHMARK")
+    print("=" * 60)
+    print(f"worlds: {args.worlds}, steps: {args.steps}")
+    print(f"{'mode':>12} {'world-steps/s':>15} {'agent-steps/s':>15} {'speedup':>9}")
+    baseline = math.nan
+    world = None
+    for name, run in modes:
+        r = run()
+        world = r.get("world", world)
+        rate = args.worlds * args.steps / r["elapsed"]
+        if math.isnan(baseline):
+            baseline = rate
+        agent_rate = r["agent_steps"] / r["elapsed"]
+        print(f"{name:>12} {rate:>15.0f} {agent_rate:>15.0f} {rate / baseline:>8.2f}x")
+
+    timings = time_observations(world, agents)
+    fish = sum(1 for entity in world.entities_list if hasattr(entity, "fish_id"))
+    print(f"observation build ({fish} fish): ", end="")
+    print(f"dict {timings['dict']:.2f} ms, array {timings['array']:.2f} ms per frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -36,6 +36,18 @@ def _register_contracts():
     register_builtin_contracts_for_tests()
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _skill_evaluation_dir(tmp_path_factory):
+    """Keep app tests from writing skill results and their cache into data/.
+
+    ``AppContext`` reads ``TANK_SKILL_EVAL_DIR`` when it is built, so every app
+    a test creates stores ``latest.json`` and the observatory disk cache here.
+    """
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("TANK_SKILL_EVAL_DIR", str(tmp_path_factory.mktemp("skill_evaluations")))
+        yield
+
+
 @pytest.fixture(autouse=True)
 def _reset_poker_shutdown_flag():
     """Reset the global poker auto-evaluate shutdown flag between tests.
@@ -0,0 +1,144 @@
+"""Equivalence tests for the NumPy-backed spatial grid (core/spatial/array_grid.py).
+
+ArraySpatialGrid must be a drop-in replacement for SpatialGrid: every query
+returns the same entities *in the same order*, both for single-agent queries
+and for the batched ``*_batch`` variants, across rebuilds, moves, removals
+and re-insertions. Ordering matters because callers iterate candidates and
+break ties by first match, so any reordering would change trajectories.
+
+Determinism contract: all scenarios use fixed seeds only.
+"""
+
+import random
+
+import pytest
+
+from core.exceptions import ConfigurationError
+from core.math_utils import Vector2
+from core.spatial.array_grid import ArraySpatialGrid
+from core.spatial.grid import SpatialGrid, create_spatial_grid
+from tests.core.test_spatial_grid import Crab, FakeFood, FakeNectar, Fish, Probe, make_plant
+
+WIDTH, HEIGHT, CELL = 1000, 700, 150
+RADII = (0.0, 40.0, 150.0, 333.0)
+
+
+def _spawn(rng: random.Random, count: int) -> list:
+    kinds = (Fish, Fish, Fish, FakeFood, FakeNectar, Crab, Probe)
+    agents = []
+    for _ in range(count):
+        x = rng.uniform(-20, WIDTH + 20)
+        y = rng.uniform(-20, HEIGHT + 20)
+        kind = rng.choice(kinds)
+        agents.append(kind(x, y))
+    agents.extend(make_plant(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT)) for _ in range(3))
+    return agents
+
+
+def _pair(agents):
+    reference = SpatialGrid(WIDTH, HEIGHT, CELL)
+    candidate = ArraySpatialGrid(WIDTH, HEIGHT, CELL)
+    reference.rebuild(agents)
+    candidate.rebuild(agents)
+    return reference, candidate
+
+
+def _assert_same_queries(reference, candidate, agents):
+    for agent in agents:
+        for radius in RADII:
+            assert candidate.query_radius(agent, radius) == reference.query_radius(agent, radius)
+            assert candidate.query_fish(agent, radius) == reference.query_fish(agent, radius)
+            assert candidate.query_food(agent, radius) == reference.query_food(agent, radius)
+            assert candidate.query_interaction_candidates(
+                agent, radius, Crab
+            ) == reference.query_interaction_candidates(agent, radius, Crab)
+            assert candidate.query_poker_entities(agent, radius) == (
+                reference.query_poker_entities(agent, radius)
+            )
+            assert candidate.closest_fish(agent, radius) is reference.closest_fish(agent, radius)
+            assert candidate.closest_food(agent, radius) is reference.closest_food(agent, radius)
+
+
+def _assert_same_batches(reference, candidate, agents):
+    for radius in RADII:
+        assert candidate.query_fish_batch(agents, radius) == [
+            reference.query_fish(agent, radius) for agent in agents
+        ]
+        assert candidate.query_food_batch(agents, radius) == [
+            reference.query_food(agent, radius) for agent in agents
+        ]
+
+
+def _jiggle(rng: random.Random, agents, step: float) -> None:
+    for agent in agents:
+        agent.pos = Vector2(
+            agent.pos.x + rng.uniform(-step, step), agent.pos.y + rng.uniform(-step, step)
+        )
+
+
+class TestFactory:
+    def test_backends(self):
+        assert type(create_spatial_grid(WIDTH, HEIGHT)) is SpatialGrid
+        assert isinstance(create_spatial_grid(WIDTH, HEIGHT, backend="array"), ArraySpatialGrid)
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ConfigurationError):
+            create_spatial_grid(WIDTH, HEIGHT, backend="octree")
+
+
+class TestMatchesDictGrid:
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_rebuild_matches(self, seed):
+        agents = _spawn(random.Random(seed), 120)
+        reference, candidate = _pair(agents)
+        _assert_same_queries(reference, candidate, agents)
+        _assert_same_batches(reference, candidate, agents)
+
+    @pytest.mark.parametrize("seed", [4, 5])
+    def test_incremental_updates_match(self, seed):
+        rng = random.Random(seed)
+        agents = _spawn(rng, 80)
+        reference, candidate = _pair(agents)
+
+        for frame in range(6):
+            _jiggle(rng, agents, step=90.0)
+            if frame % 2:
+                for agent in agents:
+                    reference.update_agent(agent)
+                    candidate.update_agent(agent)
+            else:
+                reference.update_agents(agents)
+                candidate.update_agents(agents)
+
+            # Churn: remove a few, add a few fresh ones
+            for gone in rng.sample(agents, 5):
+                agents.remove(gone)
+                reference.remove_agent(gone)
+                candidate.remove_agent(gone)
+            for newcomer in _spawn(rng, 4):
+                agents.append(newcomer)
+                reference.add_agent(newcomer)
+                candidate.add_agent(newcomer)
+
+            _assert_same_queries(reference, candidate, agents)
+            _assert_same_batches(reference, candidate, agents)
+
+    def test_batch_query_for_unindexed_agents(self):
+        agents = _spawn(random.Random(9), 40)
+        reference, candidate = _pair(agents)
+        outsiders = [Fish(500, 350), Probe(10, 10)]
+        _assert_same_batches(reference, candidate, outsiders)
+
+    def test_empty_grid(self):
+        candidate = ArraySpatialGrid(WIDTH, HEIGHT, CELL)
+        probe = Fish(100, 100)
+        assert candidate.query_fish(probe, 200) == []
+        assert candidate.query_fish_batch([probe], 200) == [[]]
+
+    def test_clear_resets_indexes(self):
+        agents = _spawn(random.Random(11), 30)
+        _, candidate = _pair(agents)
+        candidate.clear()
+        assert candidate.agent_cells == {}
+        assert candidate.query_radius(agents[0], 1000) == []
+        assert candidate.query_food_batch(agents[:3], 1000) == [[], [], []]
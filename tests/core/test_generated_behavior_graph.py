@@ -0,0 +1,209 @@
+"""Equivalence tests for the source-generated behavior-graph tier.
+
+Generated plans must return exactly what the interpreter returns (bit for bit,
+including signed zeros and NaN) and raise the same error with the same
+message, for every registered node and for chains where overflow turns an
+intermediate value non-finite.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from types import MappingProxyType
+
+import pytest
+
+from core.behavior.compiled_graph import CompiledBehaviorGraph
+from core.behavior.generated_graph import GeneratedBehaviorGraph, generate_plan
+from core.behavior.graph import BehaviorGraph, BehaviorGraphError, GraphConnection, GraphNode
+from core.behavior.nodes import NODE_REGISTRY, NodeDefinition, ValueType
+from core.behavior.pursuit_nodes import default_pursuit_module_graph
+from core.behavior.standard_nodes import register_standard_nodes
+from core.behavior.tank_adapter import default_foraging_graph
+
+register_standard_nodes()
+
+_SENSORS = {
+    ValueType.VECTOR: "context_vector_sensor",
+    ValueType.SCALAR: "context_scalar_sensor",
+    ValueType.BOOL: "context_bool_sensor",
+}
+_COMPONENTS = (0.0, -0.0, 1.0, -2.5, 0.35, 3e-200, 7.5e307, -1e308)
+_IRREGULAR_VALUES = (2, True, [1, -3.5], (1, 0), (True, 1.0), (math.inf, 0.0), math.nan, "x")
+
+
+def _outcome(plan: CompiledBehaviorGraph, context: object) -> tuple[str, str]:
+    try:
+        return "value", repr(plan.evaluate(context))
+    except (TypeError, ValueError) as exc:
+        return type(exc).__name__, str(exc)
+
+
+def _random_parameters(rng: random.Random, definition: NodeDefinition) -> dict[str, float]:
+    return {
+        name: rng.choice((spec.minimum, spec.maximum, rng.uniform(spec.minimum, spec.maximum)))
+        for name, spec in definition.parameter_specs.items()
+    }
+
+
+def _random_context(rng: random.Random, fields: list[tuple[str, ValueType]]) -> object:
+    context: dict[str, object] = {}
+    for field, value_type in fields:
+        if value_type is ValueType.VECTOR:
+            context[field] = (rng.choice(_COMPONENTS), rng.choice(_COMPONENTS))
+        elif value_type is ValueType.SCALAR:
+            context[field] = rng.choice(_COMPONENTS)
+        else:
+            context[field] = rng.random() < 0.5
+        if rng.random() < 0.05:
+            # Values the sensors convert (ints, lists) or reject.
+            context[field] = rng.choice(_IRREGULAR_VALUES)
+    if fields and rng.random() < 0.05:
+        context.pop(fields[0][0])
+    if rng.random() < 0.05:
+        return MappingProxyType(context)
+    return context
+
+
+def _batch_outcome(plan: CompiledBehaviorGraph, contexts: list[object]) -> tuple[str, str]:
+    rows = [context for context in contexts if type(context) is dict]
+    fields = set().union(*rows)
+    rows = [row for row in rows if row.keys() == fields]
+    try:
+        return "value", repr(
+            plan.evaluate_batch({name: [row[name] for row in rows] for name in fields})
+        )
+    except (TypeError, ValueError) as exc:
+        return type(exc).__name__, str(exc)
+
+
+def _assert_equivalent(graph: BehaviorGraph, contexts: list[object]) -> None:
+    interpreted = graph.compile()
+    generated = generate_plan(graph.compile())
+    assert "_evaluate" not in generated.source
+    assert generated.batch_function is not None
+    for context in contexts:
+        assert _outcome(generated, context) == _outcome(interpreted, context), context
+    assert _batch_outcome(generated, contexts) == _batch_outcome(interpreted, contexts)
+
+
+@pytest.mark.parametrize(
+    "definition",
+    [item for item in NODE_REGISTRY.definitions() if item.input_ports],
+    ids=lambda definition: definition.node_type,
+)
+def test_every_registered_node_matches_interpreter(definition: NodeDefinition) -> None:
+    rng = random.Random(definition.node_type)
+    ports = sorted(definition.input_ports.items())
+    nodes = [
+        GraphNode(f"in_{port}", _SENSORS[value_type], {"field": port}) for port, value_type in ports
+    ]
+    connections = tuple(GraphConnection(f"in_{port}", "node", port) for port, _ in ports)
+    for _ in range(10):
+        node = GraphNode("node", definition.node_type, _random_parameters(rng, definition))
+        graph = BehaviorGraph((*nodes, node), connections, "node")
+        _assert_equivalent(graph, [_random_context(rng, ports) for _ in range(60)])
+
+
+def _random_chain(rng: random.Random) -> tuple[BehaviorGraph, list[tuple[str, ValueType]]]:
+    """A random DAG of standard nodes wired to earlier outputs of a matching type."""
+    fields = [(f"f{index}", ValueType.VECTOR) for index in range(3)]
+    fields.append(("energy", ValueType.SCALAR))
+    nodes = [GraphNode(f"s_{field}", _SENSORS[kind], {"field": field}) for field, kind in fields]
+    outputs = {f"s_{field}": kind for field, kind in fields}
+    connections: list[GraphConnection] = []
+    steering = [item for item in NODE_REGISTRY.definitions() if item.input_ports]
+    for index in range(rng.randint(2, 6)):
+        definition = rng.choice(steering)
+        node_id = f"n{index}"
+        for port, expected in sorted(definition.input_ports.items()):
+            sources = [
+                source
+                for source, kind in outputs.items()
+                if kind is expected
+                or (kind is ValueType.UNIT_VECTOR and expected is ValueType.VECTOR)
+            ]
+            connections.append(GraphConnection(rng.choice(sources), node_id, port))
+        nodes.append(GraphNode(node_id, definition.node_type, _random_parameters(rng, definition)))
+        outputs[node_id] = definition.output_type
+    graph = BehaviorGraph(tuple(nodes), tuple(connections), nodes[-1].node_id)
+    return graph, fields
+
+
+def test_random_chains_match_interpreter_including_overflow() -> None:
+    rng = random.Random(21)
+    for _ in range(150):
+        graph, fields = _random_chain(rng)
+        _assert_equivalent(graph, [_random_context(rng, fields) for _ in range(20)])
+
+
+def test_default_graphs_are_fully_inlined_and_match_interpreter() -> None:
+    rng = random.Random(3)
+    foraging_fields = [
+        ("food_vector", ValueType.VECTOR),
+        ("threat_away_vector", ValueType.VECTOR),
+        ("cohesion_vector", ValueType.VECTOR),
+        ("energy_ratio", ValueType.SCALAR),
+        ("has_target", ValueType.BOOL),
+    ]
+    pursuit_fields = [
+        ("target_vector", ValueType.VECTOR),
+        ("target_velocity", ValueType.VECTOR),
+        ("self_velocity", ValueType.VECTOR),
+        ("self_speed", ValueType.SCALAR),
+    ]
+    for graph, fields in (
+        (default_foraging_graph(), foraging_fields),
+        (default_pursuit_module_graph(), pursuit_fields),
+    ):
+        _assert_equivalent(graph, [_random_context(rng, fields) for _ in range(300)])
+        assert isinstance(graph.compile_cached(), GeneratedBehaviorGraph)
+
+
+def test_debug_mode_returns_checked_interpreter(monkeypatch) -> None:
+    graph = BehaviorGraph(
+        (
+            GraphNode("a", "context_vector_sensor", {"field": "a"}),
+            GraphNode("b", "context_vector_sensor", {"field": "b"}),
+            GraphNode("direction", "weighted_vector", {"first_weight": 3.0}),
+        ),
+        (
+            GraphConnection("a", "direction", "first"),
+            GraphConnection("b", "direction", "second"),
+        ),
+        "direction",
+    )
+    checked = graph.compile_cached(debug=True)
+    assert not isinstance(checked, GeneratedBehaviorGraph)
+    assert graph.compile_cached(debug=True) is checked
+
+    # The weighted sum overflows, so normalizing it yields NaN; only the
+    # checked interpreter notices the output is not a unit vector.
+    context = {"a": (1e308, 0.0), "b": (0.0, 1.0)}
+    assert repr(graph.compile_cached(debug=False).evaluate(context)) == "(nan, 0.0)"
+    with pytest.raises(BehaviorGraphError, match="invalid unit_vector output"):
+        checked.evaluate(context)
+
+    monkeypatch.setenv("TANK_BEHAVIOR_GRAPH_DEBUG", "1")
+    fresh = BehaviorGraph(graph.nodes, graph.connections, graph.output_node_id)
+    assert fresh.compile_cached() is checked
+
+
+def test_mutants_sharing_a_topology_share_generated_code() -> None:
+    base = default_pursuit_module_graph()
+    mutant = base.crossed_over(
+        base, weight1=1.0, mutation_rate=1.0, mutation_strength=0.3, rng=random.Random(1)
+    )
+    context = {
+        "target_vector": (40.0, -10.0),
+        "target_velocity": (1.5, 0.5),
+        "self_velocity": (0.0, 3.0),
+        "self_speed": 3.0,
+    }
+    first, second = generate_plan(base.compile()), generate_plan(mutant.compile())
+
+    assert first.source == second.source
+    assert first.function.__code__ is second.function.__code__
+    assert first.evaluate(context) != second.evaluate(context)
+    assert second.evaluate(context) == mutant.compile().evaluate(context)
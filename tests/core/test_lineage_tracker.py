@@ -0,0 +1,133 @@
+"""Lineage store: ancestry-preserving pruning and versioned deltas."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from core import lineage_tracker
+from core.lineage_tracker import LineageTracker
+
+
+def _ancestry(records: dict[str, dict], fish_id: int) -> list[str]:
+    chain, current = [], str(fish_id)
+    while current != "root":
+        chain.append(current)
+        current = records[current]["parent_id"]
+    return chain
+
+
+def _simulate(tracker: LineageTracker, rng: random.Random, births: int, alive: list[int]):
+    next_id = max(alive, default=-1) + 1
+    for frame in range(births):
+        tracker.record_birth(next_id, rng.choice(alive), 1, "algo", "#00ff00", frame)
+        alive.append(next_id)
+        next_id += 1
+        if len(alive) > 12:
+            tracker.record_death(alive.pop(rng.randrange(len(alive))))
+        yield
+
+
+def _seeded(count: int) -> tuple[LineageTracker, list[int]]:
+    tracker = LineageTracker()
+    for fish_id in range(count):
+        tracker.record_birth(fish_id, None, 0, "seed", "#00ff00", 0)
+    return tracker, list(range(count))
+
+
+def test_pruning_keeps_every_living_ancestry_and_drops_oldest_extinct(monkeypatch) -> None:
+    monkeypatch.setattr(lineage_tracker, "MAX_LINEAGE_LOG_SIZE", 60)
+    tracker, alive = _seeded(4)
+    rng = random.Random(5)
+
+    for _ in _simulate(tracker, rng, 600, alive):
+        records = {record["id"]: record for record in tracker.lineage_log}
+        pinned = {rec_id for fish_id in alive for rec_id in _ancestry(records, fish_id)}
+        assert len(records) <= 60 or len(records) == len(pinned)
+        assert all(tracker._pins[rec_id] > 0 for rec_id in pinned)
+        assert all(tracker._pins[rec_id] == 0 for rec_id in records.keys() - pinned)
+
+    # Remaining extinct records are the newest ones; older extinct ones went first.
+    records = tracker.lineage_log
+    order = [record["id"] for record in records]
+    extinct = [rec_id for rec_id in order if tracker._pins[rec_id] == 0]
+    assert extinct == [rec_id for rec_id in order if rec_id in extinct]
+    assert all(record["parent_id"] in {"root", *order} for record in records)
+
+
+def test_update_alive_fish_syncs_deaths_and_revivals() -> None:
+    tracker, _ = _seeded(1)
+    tracker.record_birth(1, 0, 1, "algo", "#00ff00", 1)
+    tracker.record_birth(2, 1, 2, "algo", "#00ff00", 2)
+
+    tracker.update_alive_fish({2})
+    assert [tracker._pins[rec_id] for rec_id in ("0", "1", "2")] == [1, 1, 1]
+    tracker.update_alive_fish({0})
+    assert [tracker._pins[rec_id] for rec_id in ("0", "1", "2")] == [1, 0, 0]
+    assert [record["is_alive"] for record in tracker.get_lineage_data()] == [True, False, False]
+
+
+def test_births_under_missing_parents_are_remapped_to_root(caplog) -> None:
+    tracker = LineageTracker()
+    tracker.record_birth(7, 3, 2, "algo", "#00ff00", 0)
+
+    (record,) = tracker.get_lineage_data()
+    assert record["parent_id"] == "root"
+    assert record["_original_parent_id"] == "3"
+    assert "Orphaned record" in caplog.text
+
+
+def test_restored_log_is_reindexed_with_string_ids() -> None:
+    tracker = LineageTracker()
+    tracker.lineage_log = [
+        {"id": 1, "parent_id": None, "generation": 0},
+        {"id": 3, "parent_id": 2, "generation": 2},
+        {"id": 2, "parent_id": 1, "generation": 1},
+        {"parent_id": 1},
+    ]
+    tracker.update_alive_fish({3})
+
+    assert [record["id"] for record in tracker.lineage_log] == ["1", "3", "2"]
+    assert [record["parent_id"] for record in tracker.lineage_log] == ["root", "2", "1"]
+    assert all(tracker._pins[rec_id] == 1 for rec_id in ("1", "2", "3"))
+
+
+@pytest.mark.parametrize("poll_every", [1, 7, 40])
+def test_applying_deltas_reproduces_full_data(monkeypatch, poll_every: int) -> None:
+    monkeypatch.setattr(lineage_tracker, "MAX_LINEAGE_LOG_SIZE", 50)
+    tracker, alive = _seeded(3)
+    rng = random.Random(poll_every)
+    client: dict[str, dict] = {}
+    epoch, version = None, 0
+
+    for step, _ in enumerate(_simulate(tracker, rng, 400, alive)):
+        if step % poll_every:
+            continue
+        delta = tracker.get_lineage_delta(version, epoch)
+        assert delta["full"] == (epoch is None)
+        if delta["full"]:
+            client.clear()
+        for rec_id in delta["removed"]:
+            client.pop(rec_id, None)
+        client.update({record["id"]: record for record in delta["records"]})
+        epoch, version = delta["epoch"], delta["version"]
+        assert client == {record["id"]: record for record in tracker.get_lineage_data()}
+
+
+def test_stale_versions_get_a_full_reload() -> None:
+    tracker, _ = _seeded(2)
+    delta = tracker.get_lineage_delta()
+    epoch, version = delta["epoch"], delta["version"]
+    assert delta["full"] and len(delta["records"]) == 2
+
+    tracker.record_death(1)
+    delta = tracker.get_lineage_delta(version, epoch)
+    assert not delta["full"]
+    assert [(record["id"], record["is_alive"]) for record in delta["records"]] == [("1", False)]
+
+    assert tracker.get_lineage_delta(version, "another-epoch")["full"]
+    tracker.lineage_log = tracker.lineage_log
+    assert tracker.get_lineage_delta(version, epoch)["full"]
+    tracker.clear()
+    assert tracker.get_lineage_delta(version, tracker.epoch)["full"]
@@ -0,0 +1,46 @@
+"""The NumPy poker proximity graph must equal the per-fish grid-query loop.
+
+Includes fish whose recorded grid cells are stale and dead fish, which the
+per-fish loop handles through ``SpatialGrid.query_fish``.
+"""
+
+import random
+
+import pytest
+
+from core.config.simulation_config import SimulationConfig
+from core.simulation.engine import SimulationEngine
+from core.state_machine import EntityState
+from core.systems import poker_proximity
+from core.systems.poker_proximity import _fish_sort_key
+
+
+@pytest.mark.parametrize("seed", [11, 23])
+def test_vectorized_poker_graph_matches_object_loop(monkeypatch, seed):
+    engine = SimulationEngine(config=SimulationConfig.production(headless=True), seed=seed)
+    engine.setup()
+    for _ in range(3):
+        engine.update()
+    manager = engine.entity_manager
+    fish_list = sorted(manager.get_fish(), key=_fish_sort_key)
+    assert fish_list
+
+    # Crowd the fish so many pairs fall in the poker band, refresh the grid,
+    # then move a few without refreshing so their recorded cells go stale.
+    rng = random.Random(seed)
+    for fish in fish_list:
+        fish.pos.x = rng.uniform(0, 400)
+        fish.pos.y = rng.uniform(0, 400)
+    engine.environment.update_agent_positions(manager.entities_list)
+    for fish in fish_list[::3]:
+        fish.pos.x += 140.0
+    fish_list[1].state.transition(EntityState.DEAD, reason="test")
+
+    system = engine.get_system("PokerProximity")
+    monkeypatch.setattr(poker_proximity, "_VECTORIZED_MIN_FISH", 0)
+    vectorized = system._build_proximity_graph(fish_list)
+    monkeypatch.setattr(poker_proximity, "_VECTORIZED_MIN_FISH", len(fish_list) + 1)
+    reference = system._build_proximity_graph(fish_list)
+
+    assert any(reference.values())
+    assert vectorized == reference
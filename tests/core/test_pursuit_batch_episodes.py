@@ -0,0 +1,89 @@
+"""Batched pursuit episodes must reproduce the scalar episode bit for bit."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from core.behavior.generated_graph import GeneratedBehaviorGraph
+from core.behavior.graph import BehaviorGraph
+from core.behavior.pursuit_nodes import default_pursuit_module_graph
+from core.pursuit import batch_episodes
+from core.pursuit.batch_episodes import evaluate_modules_on_set, run_interception_batch
+from core.pursuit.episodes import (
+    ConstantVelocityInterceptor,
+    run_interception_episode,
+    summarize_results,
+)
+from core.pursuit.transfer_gym import _naive_direct_pursuit_module, generate_scenario_set
+
+
+def _mutants(count: int, seed: int) -> list:
+    base = default_pursuit_module_graph()
+    rng = random.Random(seed)
+    return [
+        base.crossed_over(base, weight1=1.0, mutation_rate=1.0, mutation_strength=0.5, rng=rng)
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("kind", ["train", "validation", "held_out"])
+def test_batch_matches_scalar_episodes_exactly(kind: str) -> None:
+    scenarios = generate_scenario_set(kind, 11)
+    modules = [
+        default_pursuit_module_graph(),
+        ConstantVelocityInterceptor(),
+        *_mutants(3, 5),
+        _naive_direct_pursuit_module(),
+        *_mutants(2, 6),
+    ]
+
+    batched = run_interception_batch(modules, scenarios)
+
+    for module, results in zip(modules, batched, strict=True):
+        expected = [run_interception_episode(module, scenario) for scenario in scenarios]
+        assert [repr(result) for result in results] == [repr(result) for result in expected]
+
+
+def test_checked_plans_match_generated_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    scenarios = generate_scenario_set("held_out", 3)
+    modules = _mutants(4, 9)
+    generated = run_interception_batch(modules, scenarios)
+
+    monkeypatch.setenv("TANK_BEHAVIOR_GRAPH_DEBUG", "1")
+    fresh = [BehaviorGraph(m.nodes, m.connections, m.output_node_id) for m in modules]
+    assert not isinstance(fresh[0].compile_cached(), GeneratedBehaviorGraph)
+    checked = run_interception_batch(fresh, scenarios)
+
+    assert repr(checked) == repr(generated)
+
+
+def test_fitness_memo_skips_repeated_fingerprints(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(batch_episodes, "_FITNESS_MEMO", type(batch_episodes._FITNESS_MEMO)())
+    scenarios = generate_scenario_set("train", 21)
+    first, second = _mutants(2, 13)
+    twin = first.crossed_over(
+        first, weight1=1.0, mutation_rate=0.0, mutation_strength=0.5, rng=random.Random(0)
+    )
+    assert twin.fingerprint() == first.fingerprint()
+
+    simulated: list[int] = []
+    original = batch_episodes.run_interception_batch
+
+    def counting(modules, scenario_set):
+        simulated.append(len(modules))
+        return original(modules, scenario_set)
+
+    monkeypatch.setattr(batch_episodes, "run_interception_batch", counting)
+
+    summaries = evaluate_modules_on_set([first, twin, second], scenarios)
+    again = evaluate_modules_on_set([second, first, ConstantVelocityInterceptor()], scenarios)
+
+    assert simulated == [2, 1]
+    assert summaries[0] is summaries[1]
+    assert again[:2] == [summaries[2], summaries[0]]
+    expected = summarize_results(
+        scenarios, [run_interception_episode(first, scenario) for scenario in scenarios]
+    )
+    assert summaries[0] == expected
@@ -0,0 +1,182 @@
+"""Vector env: array observations, slot bookkeeping, seeding, auto-reset and workers."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from core.worlds.tank.array_observations import (
+    AgentSlots,
+    ArrayObservationSpec,
+    build_array_observations,
+)
+from core.worlds.tank.observation_builder import build_tank_observations
+from core.worlds.vector_env import VectorWorldEnv
+
+WIDE = ArrayObservationSpec(max_agents=128, max_food=64, max_fish=64, max_threats=64)
+
+
+def _run(env: VectorWorldEnv, steps: int, seed: int = 0) -> list:
+    """Step ``env`` with seeded random actions and return every result."""
+    rng = np.random.default_rng(seed)
+    results = []
+    for _ in range(steps):
+        actions = rng.uniform(-2, 2, size=(env.num_worlds, env.spec.max_agents, 2))
+        results.append(env.step(actions))
+    return results
+
+
+def _assert_same(a: dict[str, np.ndarray], b: dict[str, np.ndarray]) -> None:
+    assert a.keys() == b.keys()
+    for key in a:
+        np.testing.assert_array_equal(a[key], b[key], err_msg=key)
+
+
+def test_arrays_match_the_dict_observation_builder() -> None:
+    env = VectorWorldEnv(1, seed=11, spec=WIDE)
+    env.reset()
+    _run(env, 40)
+    world = env._worlds[0].world
+    obs, agents = build_array_observations(world, env._worlds[0].slots, WIDE)
+    expected = build_tank_observations(world)
+
+    assert sorted(map(str, obs["agent_id"][obs["agent_mask"]])) == sorted(expected)
+    for slot in np.flatnonzero(obs["agent_mask"]):
+        ref = expected[str(obs["agent_id"][slot])]
+        assert agents[slot].fish_id == obs["agent_id"][slot]
+        np.testing.assert_allclose(
+            obs["self"][slot],
+            [*ref.position, *ref.velocity, ref.energy, ref.max_energy, ref.age],
+            rtol=1e-6,
+        )
+        for kind, refs, keys in (
+            ("food", ref.nearby_food, ("dx", "dy", "distance", "energy")),
+            ("fish", ref.nearby_fish, ("dx", "dy", "distance", "vx", "vy", "energy")),
+            ("threat", ref.nearby_threats, ("dx", "dy", "distance", "vx", "vy", "size")),
+        ):
+            refs = sorted(refs, key=lambda item: item["distance"])
+            assert obs[f"{kind}_mask"][slot].sum() == len(refs)
+            assert obs[f"{kind}_mask"][slot, : len(refs)].all()
+            want = np.array([[item[k] for k in keys] for item in refs]).reshape(-1, len(keys))
+            got = obs[kind][slot, : len(refs)]
+            np.testing.assert_allclose(got, want, rtol=1e-5, atol=1e-3)
+            assert not obs[kind][slot, len(refs) :].any()
+    assert obs["food_mask"].any() and obs["fish_mask"].any()
+
+
+def test_small_limits_keep_the_nearest_neighbours() -> None:
+    env = VectorWorldEnv(1, seed=4, spec=WIDE)
+    env.reset()
+    _run(env, 30)
+    world = env._worlds[0]
+    narrow = ArrayObservationSpec(max_agents=128, max_food=2, max_fish=1, max_threats=1)
+    wide, _ = build_array_observations(world.world, world.slots, WIDE)
+    small, _ = build_array_observations(world.world, world.slots, narrow)
+
+    np.testing.assert_array_equal(small["food"], wide["food"][:, :2])
+    np.testing.assert_array_equal(small["food_mask"], wide["food_mask"][:, :2])
+    np.testing.assert_array_equal(small["fish"], wide["fish"][:, :1])
+    np.testing.assert_array_equal(small["threat_mask"], wide["threat_mask"][:, :1])
+
+
+def test_agent_slots_are_stable_and_reused() -> None:
+    slots = AgentSlots(3)
+    assert slots.sync([10, 11, 12, 13]) == []
+    assert slots.slot_of == {10: 0, 11: 1, 12: 2}
+
+    assert slots.sync([12, 13, 14]) == [0, 1]
+    assert slots.slot_of == {12: 2, 13: 0, 14: 1}
+
+
+def test_actions_set_slot_velocities_before_the_update(monkeypatch) -> None:
+    env = VectorWorldEnv(1, seed=2)
+    obs = env.reset()
+    world = env._worlds[0]
+    seen: dict[int, tuple[float, float]] = {}
+
+    def record() -> None:
+        seen.update({f.fish_id: (f.vel.x, f.vel.y) for f in world.agents if f is not None})
+
+    monkeypatch.setattr(world.world, "update", record)
+    actions = np.zeros((1, env.spec.max_agents, 2))
+    actions[0, :, 0] = np.arange(env.spec.max_agents)
+    actions[0, :, 1] = -1.5
+    env.step(actions)
+
+    for slot in np.flatnonzero(obs["agent_mask"][0]):
+        assert seen[int(obs["agent_id"][0, slot])] == (float(slot), -1.5)
+
+
+def test_rewards_and_done_follow_each_slot() -> None:
+    env = VectorWorldEnv(2, seed=8)
+    obs = env.reset()
+    for result in _run(env, 60):
+        before = np.where(obs["agent_mask"], obs["self"][..., 4], 0.0)
+        after = result.observations
+        kept = obs["agent_mask"] & ~result.agent_done
+        np.testing.assert_allclose(
+            result.rewards[kept], (after["self"][..., 4] - before)[kept], rtol=1e-5, atol=1e-3
+        )
+        assert (result.agent_done <= obs["agent_mask"]).all()
+        assert not result.rewards[~obs["agent_mask"]].any()
+        obs = after
+
+
+def test_seeding_is_per_world_and_independent_of_batch_size() -> None:
+    batch = VectorWorldEnv(3, seed=5, max_episode_steps=12)
+    single = VectorWorldEnv(1, seed=6, max_episode_steps=12)
+    _assert_same({k: v[1:2] for k, v in batch.reset().items()}, single.reset())
+
+    actions = np.random.default_rng(0).uniform(-1, 1, size=(30, 3, batch.spec.max_agents, 2))
+    for step_actions in actions:
+        a = batch.step(step_actions)
+        b = single.step(step_actions[1:2])
+        _assert_same({k: v[1:2] for k, v in a.observations.items()}, b.observations)
+        np.testing.assert_array_equal(a.rewards[1:2], b.rewards)
+
+
+def test_truncated_worlds_reset_into_their_next_seed() -> None:
+    env = VectorWorldEnv(2, seed=1, max_episode_steps=5)
+    first = env.reset()
+    results = _run(env, 10)
+
+    for index, result in enumerate(results):
+        boundary = index in (4, 9)
+        assert result.truncated.tolist() == [boundary, boundary]
+        assert not result.terminated.any()
+        assert sorted(result.final_observations) == ([0, 1] if boundary else [])
+    assert all(world.world.frame_count == 0 for world in env._worlds)
+
+    # A new episode is a different initial state, and the same again on replay.
+    assert not np.array_equal(results[4].observations["self"], first["self"])
+    replay = VectorWorldEnv(2, seed=1, max_episode_steps=5)
+    replay.reset()
+    _assert_same(_run(replay, 5)[4].observations, results[4].observations)
+
+    # An explicit seed restarts the per-world sequences.
+    _assert_same(env.reset(seed=1), first)
+
+
+def test_worker_processes_match_in_process_worlds() -> None:
+    local = VectorWorldEnv(3, seed=21, max_episode_steps=8)
+    with VectorWorldEnv(3, seed=21, max_episode_steps=8, num_workers=2) as remote:
+        _assert_same(local.reset(), remote.reset())
+        for a, b in zip(_run(local, 12), _run(remote, 12), strict=True):
+            _assert_same(a.observations, b.observations)
+            np.testing.assert_array_equal(a.rewards, b.rewards)
+            np.testing.assert_array_equal(a.agent_done, b.agent_done)
+            np.testing.assert_array_equal(a.truncated, b.truncated)
+            assert a.final_observations.keys() == b.final_observations.keys()
+
+
+def test_petri_worlds_and_action_shape_checks() -> None:
+    env = VectorWorldEnv(2, mode_id="petri", seed=3)
+    obs = env.reset()
+    assert obs["self"].shape == (2, env.spec.max_agents, 7)
+    assert obs["food"].shape == (2, env.spec.max_agents, 8, 4)
+    assert obs["agent_mask"].any(axis=1).all()
+    result = env.step(np.zeros((2, env.spec.max_agents, 2)))
+    assert result.rewards.shape == (2, env.spec.max_agents)
+
+    with pytest.raises(ValueError, match="actions must have shape"):
+        env.step(np.zeros((1, env.spec.max_agents, 2)))
@@ -0,0 +1,129 @@
+"""Binary websocket state frames (backend/state_payloads/binary.py)."""
+
+from __future__ import annotations
+
+import struct
+
+import numpy as np
+import orjson
+import pytest
+
+from backend.broadcast_fanout import BroadcastFanout, encode_frame
+from backend.simulation_runner import SimulationRunner
+from backend.state_payloads import (
+    DeltaStatePayload,
+    EntitySnapshot,
+    FullStatePayload,
+    decode_binary_state,
+    encode_binary_state,
+)
+from backend.state_payloads.binary import is_binary_frame
+
+F4_FIELDS = {"x", "y", "width", "height", "energy"}
+F2_FIELDS = {"vel_x", "vel_y"}
+
+
+def _quantized(records: list[dict]) -> list[dict]:
+    """What the binary columns preserve of a JSON entity list."""
+    out = []
+    for record in records:
+        copy = dict(record)
+        for key in F4_FIELDS & copy.keys():
+            copy[key] = float(np.float32(copy[key]))
+        for key in F2_FIELDS & copy.keys():
+            copy[key] = float(np.float16(copy[key]))
+        out.append(copy)
+    return out
+
+
+def _tank_states() -> tuple[FullStatePayload, DeltaStatePayload]:
+    runner = SimulationRunner(world_type="tank", seed=7)
+    runner.running = True
+    for _ in range(20):
+        runner.world.step()
+    full = runner.get_state()
+    runner.world.step()
+    delta = runner.get_state()
+    runner.running = False
+    assert isinstance(full, FullStatePayload) and isinstance(delta, DeltaStatePayload)
+    return full, delta
+
+
+def test_tank_frames_round_trip_to_the_json_payload():
+    for state in _tank_states():
+        expected = orjson.loads(state.to_json())
+        data = encode_binary_state(state)
+        assert is_binary_frame(data) and not is_binary_frame(state.to_json().encode())
+
+        decoded = decode_binary_state(data)
+        for key in ("entities", "updates", "added"):
+            if key in expected["snapshot"]:
+                expected["snapshot"][key] = _quantized(expected["snapshot"][key])
+        assert decoded == expected
+
+
+def test_delta_effects_and_added_entities_survive():
+    fish = EntitySnapshot(7, "fish", 1.5, 2.5, 10.0, 6.0, vel_x=0.25, energy=42.0)
+    updates = [
+        EntitySnapshot(1, "fish", 3.0, 4.0, 1.0, 1.0).to_delta_dict(),
+        EntitySnapshot(
+            2, "fish", 5.0, 6.0, 1.0, 1.0, birth_effect_timer=12, poker_effect_state={"w": 1}
+        ).to_delta_dict(),
+    ]
+    state = DeltaStatePayload(
+        frame=5,
+        elapsed_time=165,
+        updates=updates,
+        added=[fish.to_full_dict(), EntitySnapshot(8, "food", 0.0, 0.0, 2.0, 2.0).to_full_dict()],
+        removed=[3],
+    )
+
+    decoded = decode_binary_state(encode_binary_state(state))
+
+    assert decoded == orjson.loads(state.to_json())
+    assert "energy" not in decoded["snapshot"]["added"][1]
+
+
+def test_lists_with_non_numeric_fields_stay_json():
+    updates = [{"id": 1, "x": None, "y": 0.0, "vel_x": 0.0, "vel_y": 0.0}]
+    state = DeltaStatePayload(frame=1, elapsed_time=0, updates=updates, added=[], removed=[])
+
+    data = encode_binary_state(state)
+
+    (header_len,) = struct.unpack_from("<I", data, 5)
+    header = orjson.loads(data[9 : 9 + header_len])
+    assert header["snapshot"]["updates"] == updates
+    assert [table["key"] for table in header["binary_tables"]] == ["added"]
+    assert decode_binary_state(data) == orjson.loads(state.to_json())
+
+
+def test_binary_payload_is_only_built_on_request():
+    state = DeltaStatePayload(frame=2, elapsed_time=66, updates=[], added=[], removed=[])
+    json_payload = state.to_json().encode()
+
+    json_only = encode_frame(state, json_payload, 1)
+    both = encode_frame(state, json_payload, 1, binary=True)
+
+    assert json_only.binary_payload is None
+    assert both.binary_payload is not None and is_binary_frame(both.binary_payload)
+
+
+@pytest.mark.asyncio
+async def test_fanout_channels_pick_their_encoding():
+    class _Client:
+        def __init__(self, query_params: dict) -> None:
+            self.query_params = query_params
+
+    json_client, binary_client = _Client({}), _Client({"encoding": "binary"})
+    fanout = BroadcastFanout(
+        broadcast_hz=15.0, send_timeout=1.0, slow_send_strikes=3, slow_send_window=30.0
+    )
+    fanout.sync([json_client, binary_client])
+    state = DeltaStatePayload(frame=2, elapsed_time=66, updates=[], added=[], removed=[])
+    frame = encode_frame(state, state.to_json().encode(), 1, binary=True)
+
+    assert not fanout.channels[json_client].binary
+    assert fanout.channels[binary_client].binary
+    assert frame.payload_for(False) is frame.payload
+    assert frame.payload_for(True) is frame.binary_payload
+    fanout.close()
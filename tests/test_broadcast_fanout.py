@@ -0,0 +1,233 @@
+"""Per-client send queues in the broadcast loop (backend/broadcast_fanout.py).
+
+The fake adapter publishes a delta chain (each delta names its base frame)
+and builds full frames on demand; fake clients decode what they receive and
+check that every delta applies to the frame they already hold.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import orjson
+import pytest
+
+pytest.importorskip("pytest_asyncio")
+
+from starlette.websockets import WebSocketState
+
+from backend.broadcast import broadcast_updates_for_world
+from backend.broadcast_fanout import BroadcastFanout, EncodedFrame
+
+BROADCAST_HZ = 30.0
+FRAME_RATE = 60.0
+
+
+class _State:
+    def __init__(self, frame: int, base_frame: int | None) -> None:
+        self.frame = frame
+        self.base_frame = base_frame
+        self.type = "update" if base_frame is None else "delta"
+
+
+class _FakeClient:
+    """Records received frames and whether each one was applicable."""
+
+    def __init__(self, send_seconds: float = 0.0, query_params: dict | None = None) -> None:
+        self.client_state = WebSocketState.CONNECTED
+        self.query_params = query_params or {}
+        self.send_seconds = send_seconds
+        self.payloads: list[bytes] = []
+        self.frames: list[dict] = []
+        self.received_at: list[float] = []
+        self.held_frame: int | None = None
+        self.broken_chain = 0
+        self.closed = False
+
+    async def send_bytes(self, payload: bytes) -> None:
+        if self.send_seconds:
+            await asyncio.sleep(self.send_seconds)
+        message = orjson.loads(payload)
+        if message["type"] == "delta" and message["base"] != self.held_frame:
+            self.broken_chain += 1
+        self.held_frame = message["frame"]
+        self.payloads.append(payload)
+        self.frames.append(message)
+        self.received_at.append(time.perf_counter())
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeAdapter:
+    """Publisher-like adapter: deltas chain from the previous broadcast build."""
+
+    world_id = "fanout-test"
+    world_type = "tank"
+    mode_id = "tank"
+    view_mode = "side"
+
+    def __init__(self, clients: list[_FakeClient]) -> None:
+        self._clients = set(clients)
+        self._t0 = time.perf_counter()
+        self._baseline: int | None = None
+        self.full_builds = 0
+
+    @property
+    def connected_clients(self):
+        return self._clients
+
+    def add_client(self, websocket) -> None:
+        self._clients.add(websocket)
+
+    def remove_client(self, websocket) -> None:
+        self._clients.discard(websocket)
+
+    def _frame(self) -> int:
+        return int((time.perf_counter() - self._t0) * FRAME_RATE)
+
+    async def get_state_async(self, force_full: bool = False, allow_delta: bool = True):
+        frame = self._frame()
+        if force_full:
+            self.full_builds += 1
+            return _State(frame, None)
+        base, self._baseline = self._baseline, frame
+        return _State(frame, base)
+
+    def serialize_state(self, state) -> bytes:
+        message = {"frame": state.frame, "type": state.type, "base": state.base_frame}
+        return orjson.dumps({**message, "t": time.perf_counter()})
+
+    async def handle_command_async(self, command, data=None):  # pragma: no cover
+        return None
+
+
+async def _broadcast(adapter: _FakeAdapter, seconds: float) -> None:
+    task = asyncio.create_task(broadcast_updates_for_world(adapter, world_id="fanout-test"))
+    await asyncio.sleep(seconds)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.fixture(autouse=True)
+def _broadcast_env(monkeypatch):
+    monkeypatch.setenv("BROADCAST_HZ", str(BROADCAST_HZ))
+    monkeypatch.setenv("BROADCAST_SEND_TIMEOUT", "1.0")
+
+
+async def test_slow_client_gets_latest_frames_without_delaying_others():
+    fast = [_FakeClient() for _ in range(3)]
+    slow = _FakeClient(send_seconds=0.2)
+    adapter = _FakeAdapter([*fast, slow])
+
+    await _broadcast(adapter, 1.0)
+
+    for client in fast:
+        assert len(client.frames) >= BROADCAST_HZ * 0.5
+        assert client.broken_chain == 0
+        # Only the very first frame needs to be full
+        assert [f["type"] for f in client.frames[1:]] == ["delta"] * (len(client.frames) - 1)
+    assert 2 <= len(slow.frames) <= 6
+    assert slow.broken_chain == 0
+    assert slow.frames[-1]["frame"] > slow.frames[0]["frame"] + 3 * FRAME_RATE / BROADCAST_HZ
+    # Encoded once: every fast client was handed the same bytes object
+    assert all(a is b for a, b in zip(fast[0].payloads[1:], fast[1].payloads[1:], strict=False))
+
+
+async def test_joining_client_is_resynced_alone():
+    existing = _FakeClient()
+    adapter = _FakeAdapter([existing])
+    task = asyncio.create_task(broadcast_updates_for_world(adapter, world_id="fanout-test"))
+    await asyncio.sleep(0.25)
+    joiner = _FakeClient()
+    adapter.add_client(joiner)
+    await asyncio.sleep(0.25)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert joiner.frames and joiner.frames[0]["type"] == "update"
+    assert joiner.broken_chain == 0 and existing.broken_chain == 0
+    assert [f["type"] for f in existing.frames].count("update") == 1
+    assert adapter.full_builds == 1  # Built for the joiner only
+
+
+async def test_client_rate_is_capped_by_query_param():
+    normal = _FakeClient()
+    reduced = _FakeClient(query_params={"broadcast_hz": "5"})
+    adapter = _FakeAdapter([normal, reduced])
+
+    await _broadcast(adapter, 1.0)
+
+    assert 3 <= len(reduced.frames) <= 7
+    assert len(normal.frames) >= 2 * len(reduced.frames)
+    assert reduced.broken_chain == 0 and normal.broken_chain == 0
+
+
+async def test_repeatedly_timing_out_client_is_removed(monkeypatch):
+    monkeypatch.setenv("BROADCAST_SEND_TIMEOUT", "0.05")
+    monkeypatch.setenv("BROADCAST_SLOW_SEND_STRIKES", "2")
+    healthy = _FakeClient()
+    stuck = _FakeClient(send_seconds=10.0)
+    adapter = _FakeAdapter([healthy, stuck])
+
+    await _broadcast(adapter, 0.5)
+
+    assert stuck not in adapter.connected_clients
+    assert stuck.closed and not healthy.closed
+    assert healthy.broken_chain == 0
+
+
+async def test_delta_is_not_queued_behind_a_waiting_frame():
+    fanout = BroadcastFanout(
+        broadcast_hz=BROADCAST_HZ, send_timeout=1.0, slow_send_strikes=3, slow_send_window=30.0
+    )
+    client = _FakeClient()
+    fanout.sync([client])
+    channel = fanout.channels[client]
+    full = EncodedFrame(1, b"", is_full=True, base_frame=None, published_at=0.0)
+    delta = EncodedFrame(2, b"", is_full=False, base_frame=1, published_at=0.0)
+
+    assert not channel.accepts(delta)  # Nothing held yet
+    channel.offer(full, now=0.0)
+    assert not channel.accepts(delta)  # Frame 1 not sent yet; 2 would replace it
+    fanout.close()
+
+
+def _percentile(samples: list[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(p / 100 * (len(ordered) - 1)))]
+
+
+@pytest.mark.slow
+async def test_load_100_clients_latency_percentiles():
+    """100 simulated websockets, 10 of them slow: fast-client latency stays flat.
+
+    Latency is serialize-to-received. With sends awaited in the loop, the
+    slow clients used to stretch every tick to their send time.
+    """
+    fast = [_FakeClient(send_seconds=0.002) for _ in range(90)]
+    slow = [_FakeClient(send_seconds=0.25) for _ in range(10)]
+    adapter = _FakeAdapter([*fast, *slow])
+
+    await _broadcast(adapter, 3.0)
+
+    latencies = {"fast": [], "slow": []}
+    for group, clients in (("fast", fast), ("slow", slow)):
+        for client in clients:
+            assert client.broken_chain == 0
+            latencies[group].extend(
+                received - frame["t"]
+                for frame, received in zip(client.frames, client.received_at, strict=True)
+            )
+    report = {
+        group: {p: _percentile(samples, p) * 1000 for p in (50, 95, 99)}
+        for group, samples in latencies.items()
+    }
+    print(f"broadcast latency ms (100 clients): {report}")
+
+    assert min(len(c.frames) for c in fast) >= BROADCAST_HZ * 3 * 0.8
+    assert min(len(c.frames) for c in slow) >= 6
+    assert report["fast"][95] < 25.0
@@ -5,6 +5,7 @@ Verifies:
 - Crossover/inheritance
 - Mutation
 - Serialization
+- CFR learning
 - Decision making
 """
 
@@ -25,6 +26,7 @@ from core.poker.strategy.composable import (
 from core.poker.strategy.composable.cfr_decision import CFR_DECISION_MIN_VISITS
 from core.poker.strategy.composable.definitions import (
     CFR_INHERITANCE_DECAY,
+    CFR_MAX_INFO_SETS,
     CFR_MIN_VISITS_FOR_INHERITANCE,
 )
 from core.poker.strategy.implementations import crossover_poker_strategies
@@ -219,6 +221,94 @@ class TestComposablePokerStrategySerialization:
         assert "parameters" in data
         assert isinstance(data["hand_selection"], int)
 
+    def test_saved_cfr_tables_round_trip(self):
+        """Saved dict-form CFR tables load into the dense tables unchanged."""
+        well_visited = CFR_MIN_VISITS_FOR_INHERITANCE
+        data = ComposablePokerStrategy().to_dict()
+        data["regret"] = {
+            "4:1:IP:0": {"call": 2.0, "fold": -1.0, "raise_big": 0.5, "raise_small": 3.0},
+            "bucket:turn:button": {"fold": 10.0, "call": -2.0, "raise_small": 5.0},
+            "0:0:OOP:0": {"fold": 1.0, "call": 1.0, "raise_small": 1.0, "raise_big": 1.0},
+        }
+        data["strategy_sum"] = {key: dict(actions) for key, actions in data["regret"].items()}
+        data["visit_count"] = {
+            "4:1:IP:0": well_visited,
+            "bucket:turn:button": well_visited + 3,
+            "0:0:OOP:0": well_visited - 1,
+        }
+
+        restored = ComposablePokerStrategy.from_dict(data).to_dict()
+
+        assert list(restored["regret"]) == ["4:1:IP:0", "bucket:turn:button"]
+        assert restored["regret"]["4:1:IP:0"] == data["regret"]["4:1:IP:0"]
+        assert list(restored["regret"]["4:1:IP:0"]) == ["call", "fold", "raise_big", "raise_small"]
+        # Missing actions come back as zero, after the saved ones
+        assert restored["regret"]["bucket:turn:button"] == {
+            "fold": 10.0,
+            "call": -2.0,
+            "raise_small": 5.0,
+            "raise_big": 0.0,
+        }
+        assert restored["visit_count"] == {
+            "4:1:IP:0": well_visited,
+            "bucket:turn:button": well_visited + 3,
+        }
+
+    def test_restored_cfr_tables_are_independent(self):
+        """A deserialized copy does not share CFR state with the original."""
+        original = ComposablePokerStrategy()
+        info_set = original.get_info_set(0.9, 0.5, True)
+        for _ in range(CFR_MIN_VISITS_FOR_INHERITANCE):
+            original.update_regret(info_set, "call", {"fold": -1.0, "call": 2.0})
+
+        copy = ComposablePokerStrategy.from_dict(original.to_dict())
+        copy.update_regret(info_set, "fold", {"fold": -1.0, "call": 2.0})
+
+        assert copy.cfr_tables != original.cfr_tables
+        assert original.visit_count[info_set] == CFR_MIN_VISITS_FOR_INHERITANCE
+
+
+class TestCFRLearning:
+    """Test regret updates and info-set pruning."""
+
+    def test_update_regret_matches_dict_math(self):
+        """Regret and strategy sums follow the regret-matching update."""
+        strategy = ComposablePokerStrategy(learning_rate=0.5)
+        info_set = strategy.get_info_set(0.3, 0.2, False)
+        values = {"fold": -1.0, "call": 3.0, "raise_small": 1.0}
+
+        strategy.update_regret(info_set, "fold", values)
+
+        assert dict(strategy.regret[info_set]) == {
+            "fold": 0.0,
+            "call": 2.0,
+            "raise_small": 1.0,
+            "raise_big": 0.5,
+        }
+        assert strategy.get_regret_strategy(info_set) == pytest.approx(
+            {"fold": 0.0, "call": 2 / 3.5, "raise_small": 1 / 3.5, "raise_big": 0.5 / 3.5}
+        )
+        assert strategy.get_average_strategy(info_set) == strategy.get_regret_strategy(info_set)
+        assert strategy.visit_count[info_set] == 1
+
+    def test_pruning_keeps_most_visited_info_sets(self):
+        """Learning past CFR_MAX_INFO_SETS keeps the most-visited half."""
+        strategy = ComposablePokerStrategy()
+        hot = strategy.get_info_set(0.95, 0.1, True)
+        for _ in range(5):
+            strategy.update_regret(hot, "call", {"call": 1.0})
+        for street in range(4):
+            for hs in range(5):
+                for pr in range(5):
+                    for position in (True, False):
+                        info_set = strategy.get_info_set(hs / 5, pr * 0.4, position, street)
+                        strategy.update_regret(info_set, "fold", {"call": 1.0})
+
+        assert len(strategy.regret) <= CFR_MAX_INFO_SETS
+        assert len(strategy.strategy_sum) == len(strategy.regret)
+        assert hot in strategy.regret
+        assert strategy.visit_count[hot] == 6
+
 
 class TestComposablePokerStrategyDecisions:
     """Test betting decision logic."""
@@ -0,0 +1,107 @@
+"""Tests for the columnar per-frame EnergyLedger."""
+
+import pytest
+
+from core.ecosystem import EcosystemManager
+from core.simulation.energy_ledger import EnergyLedger
+from core.worlds.contracts import EnergyDeltaRecord
+
+
+class _Entity:
+    def __init__(self, stable_id: str) -> None:
+        self.stable_id = stable_id
+
+
+def _recording_identity(calls: list[str]):
+    def get_identity(entity: _Entity) -> tuple[str, str]:
+        calls.append(entity.stable_id)
+        return "fish", entity.stable_id
+
+    return get_identity
+
+
+def _sample_records() -> list[EnergyDeltaRecord]:
+    rows: list[tuple[str, float, str, dict[str, object]]] = [
+        ("1", -0.5, "metabolism", {}),
+        ("2", 3.0, "ate_food", {}),
+        ("1", 2.0, "ate_food", {"food_type": "nectar"}),
+        ("3", -4.0, "poker_loss", {}),
+        ("2", 4.0, "poker_win", {}),
+        ("3", -0.25, "metabolism", {}),
+        ("2", 1.5, "soccer", {}),
+    ]
+    return [
+        EnergyDeltaRecord(
+            entity_id=stable_id,
+            stable_id=stable_id,
+            entity_type="fish",
+            delta=delta,
+            source=source,
+            metadata=meta,
+        )
+        for stable_id, delta, source, meta in rows
+    ]
+
+
+def test_record_resolves_identity_once_per_entity_in_first_call_order():
+    calls: list[str] = []
+    get_identity = _recording_identity(calls)
+    a, b = _Entity("a"), _Entity("b")
+    ledger = EnergyLedger()
+
+    for entity, delta in [(b, -1.0), (a, 2.0), (b, -0.5), (a, 1.0)]:
+        ledger.record(entity, delta, "metabolism", {}, get_identity)
+
+    assert calls == ["b", "a"]
+    assert [(r.stable_id, r.delta) for r in ledger] == [
+        ("b", -1.0),
+        ("a", 2.0),
+        ("b", -0.5),
+        ("a", 1.0),
+    ]
+
+    ledger.clear()
+    ledger.record(a, 1.0, "metabolism", {}, get_identity)
+    assert calls == ["b", "a", "a"]
+    assert len(ledger) == 1
+
+
+def test_ledger_round_trips_records():
+    records = _sample_records()
+    ledger = EnergyLedger()
+    ledger.extend(records)
+
+    assert len(ledger) == len(records)
+    assert list(ledger) == records
+    assert ledger[2] == records[2]
+    assert ledger[-2:] == records[-2:]
+    assert ledger.records_with_metadata() == [records[2]]
+
+
+def test_totals_by_source_skips_metadata_rows():
+    ledger = EnergyLedger()
+    ledger.extend(_sample_records())
+
+    gains, burns = ledger.totals_by_source()
+
+    assert gains == {"ate_food": 3.0, "poker_win": 4.0, "soccer": 1.5}
+    assert burns == {"metabolism": pytest.approx(0.75), "poker_loss": 4.0}
+
+
+def test_ledger_ingest_matches_per_record_ingest():
+    records = _sample_records()
+    ledger = EnergyLedger()
+    ledger.extend(records)
+
+    per_record = EcosystemManager()
+    per_record.ingest_energy_deltas(records)
+    bulk = EcosystemManager()
+    bulk.ingest_energy_deltas(ledger)
+
+    assert dict(bulk.energy_tracker.energy_sources) == pytest.approx(
+        dict(per_record.energy_tracker.energy_sources)
+    )
+    assert dict(bulk.energy_tracker.energy_burn) == pytest.approx(
+        dict(per_record.energy_tracker.energy_burn)
+    )
+    assert bulk.energy_tracker.energy_sources["nectar"] == 2.0
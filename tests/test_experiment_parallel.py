@@ -0,0 +1,92 @@
+"""Parallel (--jobs / warm pool) execution in tools/experiment.py matches the sequential path."""
+
+import json
+
+import pytest
+
+from tools import experiment
+from tools.warm_pool import FORK_SUPPORTED, WarmPool
+
+_BENCHMARK_SOURCE = """
+import random
+
+BENCHMARK_ID = "{bid}"
+
+def run(seed):
+    rng = random.Random(seed * {salt})
+    return {{"benchmark_id": BENCHMARK_ID, "seed": seed, "score": rng.random()}}
+"""
+
+
+@pytest.fixture
+def fake_benchmarks(tmp_path, monkeypatch):
+    known = {}
+    for salt, bid in enumerate(["tank/b_second", "tank/a_first", "tank/c_third"], start=1):
+        path = tmp_path / f"bench_{salt}.py"
+        path.write_text(_BENCHMARK_SOURCE.format(bid=bid, salt=salt), encoding="utf-8")
+        known[bid] = path
+    broken = tmp_path / "bench_broken.py"
+    broken.write_text(
+        'BENCHMARK_ID = "tank/d_broken"\n\ndef run(seed):\n    raise RuntimeError("boom")\n',
+        encoding="utf-8",
+    )
+    known["tank/d_broken"] = broken
+    monkeypatch.setattr(experiment, "KNOWN_BENCHMARKS", known)
+    monkeypatch.setattr(experiment, "CHAMPION_DIR", tmp_path / "no_champions")
+    return known
+
+
+def _comparable(results):
+    results = dict(results)
+    results.pop("timestamp")
+    results.pop("total_runtime_seconds")
+    return json.dumps(results, indent=2)
+
+
+def test_parallel_results_match_sequential(fake_benchmarks):
+    serial = experiment.run_all_benchmarks(42, jobs=1)
+    parallel = experiment.run_all_benchmarks(42, jobs=3)
+
+    assert _comparable(parallel) == _comparable(serial)
+    assert list(parallel["benchmarks"]) == sorted(fake_benchmarks)
+    assert parallel["benchmarks"]["tank/d_broken"] == {
+        "error": "boom",
+        "benchmark_id": "tank/d_broken",
+    }
+    assert parallel["summary"]["benchmarks_run"] == 4
+
+
+def test_unknown_benchmark_is_reported_not_raised(fake_benchmarks):
+    results = experiment.run_all_benchmarks(7, benchmark_ids=["tank/missing"], jobs=2)
+    assert "Unknown benchmark" in results["benchmarks"]["tank/missing"]["error"]
+
+
+@pytest.mark.skipif(not FORK_SUPPORTED, reason="warm pool forks (POSIX only)")
+def test_warm_results_match_sequential(fake_benchmarks, monkeypatch):
+    monkeypatch.setattr(experiment, "_TEMPLATE_MODULES", {})
+    serial = experiment.run_all_benchmarks(42, jobs=1)
+    experiment.warm_benchmark_template(sorted(fake_benchmarks))
+    warm = experiment.run_all_benchmarks(42, pool=WarmPool(jobs=3))
+
+    assert _comparable(warm) == _comparable(serial)
+
+
+def _patch_scores():
+    experiment.load_champion = lambda benchmark_id: {"score": 123.0}
+
+
+@pytest.mark.skipif(not FORK_SUPPORTED, reason="warm pool forks (POSIX only)")
+def test_prepare_runs_only_in_the_forked_worker(fake_benchmarks):
+    original = experiment.load_champion
+    results = experiment.run_all_benchmarks(
+        42, ["tank/a_first"], pool=WarmPool(), prepare=_patch_scores
+    )
+
+    comparison = results["benchmarks"]["tank/a_first"]["champion_comparison"]
+    assert comparison["champion_score"] == 123.0
+    assert experiment.load_champion is original
+
+
+def test_prepare_without_pool_is_rejected(fake_benchmarks):
+    with pytest.raises(ValueError, match="WarmPool"):
+        experiment.run_all_benchmarks(42, prepare=_patch_scores)
@@ -1,8 +1,12 @@
 import json
 from pathlib import Path
 
-from core.replay.fingerprint import fingerprint_snapshot
-from core.replay.fingerprint_stream import FingerprintStreamRecorder, compare_fingerprint_streams
+from core.replay.fingerprint import SnapshotFingerprinter, fingerprint_snapshot
+from core.replay.fingerprint_stream import (
+    FingerprintStreamRecorder,
+    compare_fingerprint_streams,
+    entity_fingerprints,
+)
 from tools.run_bench import second_fingerprint_path
 
 
@@ -101,3 +105,53 @@ def test_compare_rejects_streams_without_checkpoints(tmp_path):
 
     assert comparison["exact"]["reason"] == "no_checkpoints"
     assert comparison["rounded"]["reason"] == "no_checkpoints"
+
+
+def _write_entity_stream(path, fish_x_at_20, frames=(0, 10, 20, 30)):
+    recorder = FingerprintStreamRecorder(
+        path, benchmark_id="test/fake", seed=42, interval=10, entities_every=20
+    )
+    world = FakeWorld({})
+    for frame in frames:
+        x = fish_x_at_20 if frame >= 20 else 1.0
+        world.snapshot = {
+            "frame": frame,
+            "entities": [{"type": "fish", "id": 1, "x": x}, {"type": "fish", "id": 2, "x": 5.0}],
+        }
+        recorder.record(world, frame)
+    recorder.finish({"score": 1.0, "metadata": {}})
+
+
+def test_compare_lists_entities_from_per_entity_fingerprints(tmp_path):
+    left = tmp_path / "left.jsonl"
+    right = tmp_path / "right.jsonl"
+    _write_entity_stream(left, fish_x_at_20=1.0)
+    _write_entity_stream(right, fish_x_at_20=2.0)
+
+    comparison = compare_fingerprint_streams(left, right)
+    checkpoints = [json.loads(line) for line in left.read_text().splitlines()[1:-1]]
+
+    assert comparison["rounded"]["frame"] == 20
+    assert comparison["rounded"]["differing_entities"] == {"fish": ["1"]}
+    assert [c["frame"] for c in checkpoints if "entity_fingerprints" in c["rounded"]] == [0, 20]
+    # Same layout as the "entities" of a replay checkpoint
+    assert checkpoints[2]["rounded"]["entity_fingerprints"] == entity_fingerprints(
+        {"entities": [{"type": "fish", "id": 1, "x": 1.0}, {"type": "fish", "id": 2, "x": 5.0}]},
+        SnapshotFingerprinter(float_precision=6),
+    )
+
+
+def test_end_frame_compares_a_short_run_against_a_longer_one(tmp_path):
+    short = tmp_path / "short.jsonl"
+    long = tmp_path / "long.jsonl"
+    _write_entity_stream(short, fish_x_at_20=1.0, frames=(0, 10))
+    _write_entity_stream(long, fish_x_at_20=1.0)
+
+    assert compare_fingerprint_streams(short, long)["rounded"] == {
+        "frame": 20,
+        "reason": "missing_checkpoint",
+    }
+    assert compare_fingerprint_streams(short, long, end_frame=10) == {
+        "exact": None,
+        "rounded": None,
+    }
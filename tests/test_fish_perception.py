@@ -0,0 +1,60 @@
+"""Tests for per-fish perception records (core/movement/perception.py)."""
+
+from core.movement.perception import perceive, perception_pass
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> int:
+        self.calls += 1
+        return self.calls
+
+
+def test_perceive_without_pass_always_queries():
+    fish = object()
+    query = _Counter()
+
+    assert perceive(fish, "nearest_food", query) == 1
+    assert perceive(fish, "nearest_food", query) == 2
+
+
+def test_pass_memoizes_per_key_for_the_deciding_fish():
+    fish = object()
+    food, threat = _Counter(), _Counter()
+
+    with perception_pass(fish):
+        assert perceive(fish, "nearest_food", food) == 1
+        assert perceive(fish, "nearest_food", food) == 1
+        assert perceive(fish, "nearest_threat", threat) == 1
+        assert perceive(fish, ("nearby_fish", 100.0), threat) == 2
+
+    assert food.calls == 1
+    # The record is closed after the pass.
+    assert perceive(fish, "nearest_food", food) == 2
+
+
+def test_other_fish_are_not_served_from_the_record():
+    fish, other = object(), object()
+    query = _Counter()
+
+    with perception_pass(fish):
+        perceive(fish, "nearest_food", query)
+        assert perceive(other, "nearest_food", query) == 2
+        assert perceive(other, "nearest_food", query) == 3
+
+
+def test_nested_pass_for_same_fish_reuses_record():
+    fish, other = object(), object()
+    query = _Counter()
+
+    with perception_pass(fish) as outer:
+        perceive(fish, "nearest_food", query)
+        with perception_pass(fish) as inner:
+            assert inner is outer
+            assert perceive(fish, "nearest_food", query) == 1
+        with perception_pass(other):
+            assert perceive(other, "nearest_food", query) == 2
+        # Leaving the other fish's pass restores the outer record.
+        assert perceive(fish, "nearest_food", query) == 1
@@ -3,6 +3,8 @@
 from typing import cast
 from unittest.mock import MagicMock
 
+import pytest
+
 from core.entities import Fish
 from core.services.stats.genetic_stats import get_genetic_distribution_stats
 
@@ -101,3 +103,72 @@ def test_composable_strategy_stats():
     assert "poker_betting_style" in keys
     assert "poker_hand_selection" in keys
     assert "poker_bluffing_approach" in keys
+
+
+def _assert_stats_match(expected, got, path="stats"):
+    if isinstance(expected, dict):
+        assert expected.keys() == got.keys(), path
+        for key in expected:
+            _assert_stats_match(expected[key], got[key], f"{path}.{key}")
+    elif isinstance(expected, list):
+        assert len(expected) == len(got), path
+        for index, (a, b) in enumerate(zip(expected, got, strict=True)):
+            _assert_stats_match(a, b, f"{path}[{index}]")
+    elif isinstance(expected, float):
+        assert got == pytest.approx(expected, rel=1e-9, abs=1e-12), path
+    else:
+        assert got == expected, path
+
+
+def test_incremental_stats_match_full_recompute_through_births_and_deaths():
+    import random
+
+    from core.genetics import Genome
+    from core.services.stats.incremental_genetic_stats import IncrementalGeneticStats
+
+    rng = random.Random(3)
+    fish: list[MockFish] = []
+    incremental = IncrementalGeneticStats(resync_interval=4)
+    for _ in range(10):
+        for _ in range(rng.randint(0, 4)):
+            if fish:
+                fish.pop(rng.randrange(len(fish)))
+        for _ in range(rng.randint(1, 6)):
+            newborn = MockFish()
+            newborn.genome = Genome.random(use_algorithm=True, rng=rng)
+            fish.append(newborn)
+        population = cast(list[Fish], fish)
+        _assert_stats_match(
+            get_genetic_distribution_stats(population), incremental.update(population)
+        )
+
+    _assert_stats_match(get_genetic_distribution_stats([]), incremental.update([]))
+
+
+def test_incremental_stats_resync_picks_up_traits_edited_in_place():
+    from core.services.stats.incremental_genetic_stats import IncrementalGeneticStats
+
+    fish = cast(list[Fish], [MockFish(), MockFish()])
+    incremental = IncrementalGeneticStats(resync_interval=2)
+    assert incremental.update(fish)["eye_size_max"] == 1.0
+
+    fish[0].genome.physical.eye_size.value = 1.5
+    incremental.rebuild(fish)
+
+    assert incremental.snapshot()["eye_size_max"] == 1.5
+
+
+def test_running_moments_removal_matches_recomputation():
+    import statistics
+
+    from core.services.stats.incremental_genetic_stats import RunningMoments
+
+    moments = RunningMoments()
+    for value in (0.1, 0.4, 0.25, 0.9, 0.3):
+        moments.add(value)
+    moments.remove(0.9)
+    moments.remove(0.1)
+
+    assert moments.count == 3
+    assert moments.mean == pytest.approx(statistics.mean([0.4, 0.25, 0.3]))
+    assert moments.std == pytest.approx(statistics.stdev([0.4, 0.25, 0.3]))
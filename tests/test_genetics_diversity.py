@@ -1,16 +1,22 @@
 """Tests for genetic diversity metrics, distance, and speciation support."""
 
 import random
+from types import SimpleNamespace
+from typing import cast
 
 import pytest
 
-from core.genetics import Genome
+from core.entities import Fish
+from core.genetics import Genome, GenomeMatrix
 from core.genetics.diversity import (
+    _estimate_niches,
     diversity_bonus,
     genetic_distance,
     population_diversity,
     sharing_factor,
 )
+from core.reproduction.reproduction_service import ReproductionService
+from core.simulation.engine import SimulationEngine
 
 
 @pytest.fixture
@@ -159,3 +165,95 @@ class TestDiversityBonus:
         for g in random_genomes:
             bonus = diversity_bonus(g, random_genomes, sigma=0.5, bonus_weight=0.15)
             assert 0.0 <= bonus <= 0.15
+
+
+class TestGenomeMatrix:
+    @pytest.fixture
+    def mixed_population(self, seeded_rng):
+        """Random genomes plus light-mutation families, with a repeated object."""
+        genomes = [Genome.random(use_algorithm=True, rng=seeded_rng) for _ in range(12)]
+        for parent in genomes[:4]:
+            genomes.extend(
+                Genome.clone_with_mutation(parent, rng=random.Random(i)) for i in range(4)
+            )
+        genomes.append(genomes[0])
+        genomes.append(Genome.random(use_algorithm=False, rng=seeded_rng))
+        return genomes
+
+    def test_distance_matrix_matches_genetic_distance(self, mixed_population):
+        """Every matrix entry should equal the scalar distance exactly."""
+        matrix = GenomeMatrix(mixed_population).distance_matrix()
+        for i, g1 in enumerate(mixed_population):
+            for j, g2 in enumerate(mixed_population):
+                assert matrix[i, j] == genetic_distance(g1, g2)
+
+    def test_sharing_factors_match_scalar(self, mixed_population):
+        """Batched sharing factors and bonuses should match the per-genome functions."""
+        gm = GenomeMatrix(mixed_population)
+        for sigma in (0.01, 0.5, 1.0):
+            factors = gm.sharing_factors(sigma)
+            bonuses = gm.diversity_bonuses(sigma, bonus_weight=0.15)
+            for i, g in enumerate(mixed_population):
+                assert factors[i] == sharing_factor(g, mixed_population, sigma)
+                assert bonuses[i] == diversity_bonus(g, mixed_population, sigma, 0.15)
+
+    def test_niche_leaders_match_unsampled_estimate(self, mixed_population):
+        """Leader clustering over all genomes should match _estimate_niches without sampling."""
+        gm = GenomeMatrix(mixed_population)
+        n = len(mixed_population)
+        for threshold in (0.1, 0.3, 0.6):
+            expected = _estimate_niches(mixed_population, threshold, max_sample=n)
+            assert len(gm.niche_leaders(threshold)) == expected
+
+    def test_empty_population(self):
+        gm = GenomeMatrix([])
+        assert gm.distance_matrix().shape == (0, 0)
+        assert len(gm.sharing_factors()) == 0
+        assert gm.niche_leaders(0.3) == []
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_diverse_parent_selection_matches_per_genome_bonus(self, mixed_population, seed):
+        """Emergency parent selection picks the same fish as the per-genome bonus loop."""
+        rng = random.Random(seed)
+        fish_list = [
+            SimpleNamespace(genome=g, energy=rng.uniform(10, 100), max_energy=100.0)
+            for g in mixed_population
+        ]
+        # Equal scores keep the first fish, so include exact ties as well
+        fish_list[5].energy = fish_list[3].energy
+
+        best_fish, best_score = fish_list[0], -1.0
+        for fish in fish_list:
+            energy_ratio = fish.energy / max(fish.max_energy, 1.0)
+            d_bonus = diversity_bonus(fish.genome, mixed_population, sigma=0.5, bonus_weight=0.15)
+            score = energy_ratio * 0.7 + d_bonus * 0.3 + (energy_ratio * d_bonus)
+            if score > best_score:
+                best_fish, best_score = fish, score
+
+        service = ReproductionService(cast(SimulationEngine, None))
+        assert service._select_diverse_parent(cast(list[Fish], fish_list)) is best_fish
+
+    def test_exact_population_diversity(self, mixed_population, random_genomes):
+        """Exact mode uses every pair, and agrees with the all-pairs path on small populations."""
+        assert population_diversity(random_genomes, exact=True) == population_diversity(
+            random_genomes
+        )
+
+        metrics = population_diversity(mixed_population, exact=True)
+        distances = GenomeMatrix(mixed_population).pairwise_distances()
+        assert len(distances) == len(mixed_population) * (len(mixed_population) - 1) // 2
+        assert metrics["min_distance"] == 0.0  # The repeated genome object
+        assert metrics["max_distance"] == round(float(distances.max()), 4)
+
+
+def test_stats_report_exact_genetic_diversity():
+    """Distribution stats carry population_diversity(exact=True) over the living fish."""
+    from core.config.simulation_config import SimulationConfig
+
+    engine = SimulationEngine(config=SimulationConfig.production(headless=True), seed=7)
+    engine.setup()
+    engine.update()
+    genomes = [fish.genome for fish in engine.entity_manager.get_fish()]
+
+    assert engine.get_stats()["genetic_diversity"] == population_diversity(genomes, exact=True)
+    assert "genetic_diversity" not in engine.get_stats(include_distributions=False)
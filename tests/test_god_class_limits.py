@@ -27,19 +27,25 @@ from pathlib import Path
 LEGACY_MAX_LINES: dict[str, int] = {
     "backend/runner/hooks/entity_details_mixin.py": 577,
     "backend/simulation_runner.py": 732,
-    "backend/startup_manager.py": 626,
-    "backend/world_manager.py": 712,
+    # Process-mode worlds restore their snapshot inside the worker.
+    "backend/startup_manager.py": 635,
+    # Opt-in process-per-world runners (TANK_WORLD_PROCESSES).
+    "backend/world_manager.py": 741,
     # Follow-up PR persists the soccer reconciliation/statistics ledger through
-    # the existing world snapshot boundary.
-    "backend/world_persistence.py": 703,
+    # the existing world snapshot boundary; binary snapshots (format selection
+    # and .tsnap listing) add the rest. Encoding lives in snapshot_codec.py.
+    "backend/world_persistence.py": 713,
     "core/algorithms/base.py": 572,
     "core/algorithms/registry.py": 584,
     "core/behavior/target_memory_transfer_gym.py": 636,
     "core/behavior/target_memory_transfer_scenarios.py": 534,
     "core/code_pool/genome_code_pool.py": 642,
     "core/collision_system.py": 502,
-    "core/ecosystem.py": 640,
-    "core/environment.py": 512,
+    # Energy deltas arrive as an Iterable (the per-frame EnergyLedger); deaths
+    # reach the lineage tracker and lineage deltas are delegated like get_lineage_data.
+    "core/ecosystem.py": 651,
+    # Batched fish/food nearby_* queries, used by the tank observation builder.
+    "core/environment.py": 531,
     "core/evolution_analytics.py": 657,
     "core/entities/fish.py": 810,
     "core/entities/plant.py": 727,
@@ -59,12 +65,14 @@ LEGACY_MAX_LINES: dict[str, int] = {
     "core/poker/simulation/hand_engine.py": 754,
     "core/poker/stats/poker_stats_manager.py": 581,
     "core/poker/strategy/composable/strategy.py": 782,
-    "core/pursuit/transfer_gym.py": 733,
+    "core/pursuit/transfer_gym.py": 556,
     "core/reproduction/reproduction_service.py": 556,
-    "core/simulation/engine.py": 612,
+    # _frame_energy_deltas setter wraps assigned records in an EnergyLedger.
+    "core/simulation/engine.py": 614,
     "core/solutions/benchmark.py": 549,
     "core/solutions/tracker.py": 590,
-    "core/spatial/grid.py": 795,
+    # +28: fish/food batch query fallbacks and the create_spatial_grid backend factory.
+    "core/spatial/grid.py": 823,
     "core/transfer/entity_transfer.py": 800,
     # Curated taxonomy lexicons are intentionally kept together so common and
     # scientific names use the same deterministic salience vocabulary.
@@ -85,7 +93,8 @@ LEGACY_MAX_LINES: dict[str, int] = {
     "frontend/src/types/simulation.ts": 961,
     "frontend/src/utils/plants/nectar.ts": 616,
     "frontend/src/utils/renderer.ts": 824,
-    "tools/evolve.py": 554,
+    # Opt-in --warm-pool mode and the per-candidate overhead report.
+    "tools/evolve.py": 642,
     "tools/validate_improvement.py": 566,
 }
 
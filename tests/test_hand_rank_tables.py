@@ -0,0 +1,122 @@
+"""Equivalence of the rank-table hand evaluator with combination enumeration.
+
+``_best_of_combinations`` is the table-free evaluator (every 5-card
+combination through ``_evaluate_five_cards_core``); the table path must
+return identical ``PokerHand`` objects, cards included.
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+
+from core.poker.core.cards import get_card
+from core.poker.evaluation.hand_evaluator import (
+    _best_of_combinations,
+    evaluate_hand,
+    evaluate_hand_cached,
+)
+from core.poker.evaluation.rank_tables import (
+    TABLE_SIZES,
+    build_rank_tables,
+    get_rank_tables,
+    load_rank_tables,
+    save_rank_tables,
+)
+
+DECK = [(r, s) for r in range(2, 15) for s in range(4)]
+
+
+def _reference(cards):
+    if len(cards) == 5:
+        return _best_of_combinations(sorted(cards, reverse=True))
+    return _best_of_combinations(sorted(cards, key=lambda c: c[0], reverse=True))
+
+
+def _table(cards):
+    keys = tuple((r << 2) | s for r, s in cards)
+    return evaluate_hand_cached.__wrapped__(keys[:2], keys[2:])
+
+
+def _assert_same(cards):
+    assert _table(cards) == _reference(cards), cards
+
+
+def test_tables_cover_every_hand_class():
+    tables = get_rank_tables()
+    assert len(tables.classes) == 7462
+    assert {n: len(tables.rank_tables[n]) for n in TABLE_SIZES} == {5: 6175, 6: 18395, 7: 49205}
+    # Classes are numbered weakest to strongest
+    assert tables.classes[0].description == "High Card 7"
+    assert tables.classes[-1].hand_type == "royal_flush"
+
+
+def test_every_five_card_class_matches():
+    # One non-flush hand per rank multiset plus every suited rank set covers
+    # all 7462 classes.
+    for ranks in combinations(range(2, 15), 5):
+        _assert_same([(r, 3) for r in ranks])
+    rng = random.Random(5)
+    for _ in range(20000):
+        _assert_same(rng.sample(DECK, 5))
+
+
+@pytest.mark.parametrize("n_cards", [6, 7])
+def test_random_deals_match(n_cards):
+    rng = random.Random(n_cards)
+    for _ in range(4000):
+        _assert_same(rng.sample(DECK, n_cards))
+        # Flush-heavy deals: five or more cards of one suit
+        suit = rng.randrange(4)
+        suited = rng.sample([c for c in DECK if c[1] == suit], rng.randint(5, n_cards))
+        rest = rng.sample([c for c in DECK if c[1] != suit], n_cards - len(suited))
+        cards = suited + rest
+        rng.shuffle(cards)
+        _assert_same(cards)
+
+
+def test_evaluate_hand_uses_tables_for_card_objects():
+    hole = [get_card(14, 3), get_card(14, 2)]
+    board = [get_card(14, 1), get_card(9, 0), get_card(9, 3), get_card(2, 2), get_card(5, 1)]
+    hand = evaluate_hand(hole, board)
+    assert hand.description == "Full House, Aces over 9s"
+    assert hand.cards == [get_card(*c) for c in [(14, 3), (14, 2), (14, 1), (9, 0), (9, 3)]]
+
+
+def test_tables_round_trip_through_file(tmp_path):
+    tables = get_rank_tables()
+    path = tmp_path / "poker_ranks.bin"
+    save_rank_tables(tables, path)
+    loaded = load_rank_tables(path)
+    assert loaded.classes == tables.classes
+    assert loaded.rank_tables == tables.rank_tables
+    assert loaded.flush_table == tables.flush_table
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("n_cards", [6, 7])
+def test_every_rank_multiset_and_flush_mask_matches(n_cards):
+    tables = build_rank_tables()
+    assert tables.classes == get_rank_tables().classes
+    # Cycling suits keeps at most two cards per suit: every non-flush multiset
+    for multiset in _multisets(n_cards):
+        _assert_same([(r, i % 4) for i, r in enumerate(multiset)])
+    # Every flush mask, padded with off-suit copies of its top ranks
+    for k in range(5, n_cards + 1):
+        for suited in combinations(range(14, 1, -1), k):
+            padding = [(suited[i], 1 + i) for i in range(n_cards - k)]
+            _assert_same([(r, 0) for r in suited] + padding)
+
+
+@pytest.mark.slow
+def test_every_five_card_hand_matches():
+    for cards in combinations(DECK, 5):
+        _assert_same(list(cards))
+
+
+def _multisets(n_cards):
+    from itertools import combinations_with_replacement
+
+    for multiset in combinations_with_replacement(range(14, 1, -1), n_cards):
+        if all(multiset[i] != multiset[i + 4] for i in range(n_cards - 4)):
+            yield multiset
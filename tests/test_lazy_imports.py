@@ -0,0 +1,93 @@
+"""Import-time regression tests for the lazy (PEP 562) package exports.
+
+``core``, ``core.simulation``, ``core.worlds`` and ``core.minigames.soccer``
+load their exports on first access. These tests run ``python -X importtime``
+in a fresh interpreter so a new eager import in any ``__init__`` shows up as
+a failure instead of a slower cold start.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Cumulative import time (microseconds) allowed for ``core.worlds``. It takes
+# ~10 ms when lazy and ~300 ms when it drags in the engine; the budget leaves
+# headroom for slow CI machines.
+WORLDS_IMPORT_BUDGET_US = 150_000
+
+# Heavy subsystems a tank-only benchmark must not pay for at import time
+HEAVY_PACKAGES = (
+    "core.poker",
+    "core.minigames.soccer",
+    "core.taxonomy",
+    "core.code_pool",
+    "core.simulation.engine",
+    "core.worlds.tank.backend",
+    "core.worlds.petri",
+)
+
+
+def _importtime(code: str) -> dict[str, int]:
+    """Run ``code`` in a fresh interpreter; return cumulative us per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, module = line.split("|")
+        cumulative[module.strip()] = int(cumulative_us)
+    return cumulative
+
+
+def _loaded(modules: dict[str, int], package: str) -> list[str]:
+    return sorted(m for m in modules if m == package or m.startswith(package + "."))
+
+
+def test_world_registry_import_skips_heavy_subsystems():
+    modules = _importtime("from core.worlds import WorldRegistry")
+
+    for package in HEAVY_PACKAGES:
+        assert not _loaded(modules, package), f"{package} imported eagerly"
+    assert modules["core.worlds"] < WORLDS_IMPORT_BUDGET_US
+
+
+def test_core_import_is_lazy():
+    modules = _importtime("import core")
+
+    assert not _loaded(modules, "core.simulation")
+    assert not _loaded(modules, "core.entities")
+
+
+def test_creating_a_tank_world_does_not_import_petri():
+    modules = _importtime(
+        "from core.worlds import WorldRegistry; WorldRegistry.create_world('tank', seed=1)"
+    )
+
+    assert "core.worlds.tank.backend" in modules
+    assert not _loaded(modules, "core.worlds.petri")
+
+
+@pytest.mark.parametrize(
+    "package",
+    ["core", "core.simulation", "core.worlds", "core.minigames.soccer"],
+)
+def test_lazy_exports_resolve(package: str):
+    import importlib
+
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+    with pytest.raises(AttributeError):
+        _ = module.no_such_export
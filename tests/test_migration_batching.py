@@ -0,0 +1,282 @@
+"""Batched migrations: local port batches, a two-server tick, and the log writer."""
+
+from __future__ import annotations
+
+import json
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from backend import migration_batch, transfer_history
+from backend.connection_manager import TankConnection
+from backend.migration_batch import run_migration_tick
+from backend.migration_port import LocalMigrationPort
+from backend.models import ServerInfo
+from backend.routers import remote_transfers
+from backend.server_client import ServerClient
+from backend.world_manager import WorldManager
+from core.entities import Fish
+
+
+class _CountingTransport(httpx.ASGITransport):
+    def __init__(self, app: FastAPI) -> None:
+        super().__init__(app=app)
+        self.requests: list[str] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url.path)
+        return await super().handle_async_request(request)
+
+
+class _Discovery:
+    def __init__(self, server: ServerInfo) -> None:
+        self.server = server
+
+    async def get_server(self, server_id: str) -> ServerInfo | None:
+        return self.server if server_id == self.server.server_id else None
+
+
+def _entity_count(instance) -> int:
+    return len(instance.runner.world.entities_list)
+
+
+@pytest.fixture
+def managers():
+    server_a, server_b = WorldManager(process_worlds=False), WorldManager(process_worlds=False)
+    yield server_a, server_b
+    server_a.stop_all_worlds()
+    server_b.stop_all_worlds()
+
+
+def test_local_port_hands_out_distinct_tickets_once_per_frame(managers) -> None:
+    manager, _ = managers
+    source = manager.create_world("tank", "Source", seed=3, persistent=False)
+    port = LocalMigrationPort(source.runner)
+
+    first = port.take_migrants(3)
+    second = port.take_migrants(3)
+    tokens = [ticket.token for ticket in first + second]
+    assert len(first) == 3
+    assert len(set(tokens)) == len(tokens)
+
+    assert port.commit_migrants([first[0].token, first[1].token], "migration_out") == []
+    port.release_migrants([ticket.token for ticket in first[2:] + second])
+
+    # Committed entities stay in the world until the next update removes them,
+    # but are never handed out again.
+    again = port.take_migrants(1000)
+    assert {first[0].token, first[1].token}.isdisjoint(ticket.token for ticket in again)
+    port.release_migrants([ticket.token for ticket in again])
+
+
+def _entity_for(instance, token: int):
+    return next(e for e in instance.runner.world.entities_list if id(e) == token)
+
+
+def test_commit_skips_a_fish_that_died_after_take(managers, monkeypatch) -> None:
+    manager, _ = managers
+    source = manager.create_world("tank", "Source", seed=3, persistent=False, start_paused=True)
+    port = LocalMigrationPort(source.runner)
+    burns: list[tuple[str, float]] = []
+
+    tickets = port.take_migrants(1000)
+    fish_tickets = [ticket for ticket in tickets if ticket.entity_type == "fish"]
+    dead, alive = fish_tickets[:2]
+    dead_fish, live_fish = _entity_for(source, dead.token), _entity_for(source, alive.token)
+    monkeypatch.setattr(live_fish.ecosystem, "record_energy_burn", lambda *args: burns.append(args))
+    dead_fish.energy = 0.0
+    # The live fish keeps burning energy after its payload was serialized.
+    live_fish.energy = live_fish.energy / 2
+
+    assert port.commit_migrants([dead.token, alive.token], "migration_out") == [dead.token]
+    engine = source.runner.world.engine
+    assert not engine.is_pending_removal(dead_fish)
+    assert engine.is_pending_removal(live_fish)
+    assert burns == [("migration", alive.entity_data["energy"])]
+    port.release_migrants([ticket.token for ticket in tickets])
+
+
+async def test_tick_revokes_the_copy_of_a_fish_that_died_in_flight(managers, monkeypatch) -> None:
+    manager, _ = managers
+    monkeypatch.setattr("backend.transfer_history.log_transfer", lambda **kwargs: None)
+    source = manager.create_world("tank", "Source", seed=3, persistent=False, start_paused=True)
+    dest = manager.create_world("tank", "Dest", seed=4, persistent=False, start_paused=True)
+    monkeypatch.setattr(migration_batch, "_is_paused", lambda instance: False)
+    # Only fish are eligible, so the migrant is a fish.
+    monkeypatch.setattr("backend.migration_port._MIGRATABLE_TYPES", frozenset({"fish"}))
+    dest_port = LocalMigrationPort(dest.runner)
+    dest.runner._migration_port = dest_port
+    accept_migrants = dest_port.accept_migrants
+    admitted: list[int] = []
+
+    def accept_then_kill(entity_data, reason):
+        admissions = accept_migrants(entity_data, reason)
+        admitted.extend(admission.new_id for admission in admissions)
+        for fish in source.runner.world.entities_list:
+            if isinstance(fish, Fish):
+                fish.energy = 0.0
+        return admissions
+
+    monkeypatch.setattr(dest_port, "accept_migrants", accept_then_kill)
+    connection = TankConnection("c", source.world_id, dest.world_id, probability=100)
+
+    result = await run_migration_tick([connection], manager)
+
+    assert (result.migrated, result.failed) == (0, 1)
+    assert len(admitted) == 1
+    with dest.runner.lock:
+        dest.runner.world.update()
+        assert admitted[0] not in {id(e) for e in dest.runner.world.entities_list}
+
+
+async def test_two_server_tick_sends_one_request_per_destination(managers, monkeypatch) -> None:
+    server_a, server_b = managers
+    logged: list[dict] = []
+    monkeypatch.setattr(
+        "backend.transfer_history.log_transfer", lambda **kwargs: logged.append(kwargs)
+    )
+    # Paused sources cannot lose a reserved fish before it is committed.
+    sources = [
+        server_a.create_world(
+            "tank", f"Source {index}", seed=index, persistent=False, start_paused=True
+        )
+        for index in range(2)
+    ]
+    monkeypatch.setattr(migration_batch, "_is_paused", lambda instance: False)
+    dest = server_b.create_world("tank", "Dest", seed=9, persistent=False)
+
+    app = FastAPI()
+    app.include_router(remote_transfers.setup_router(server_b))
+    transport = _CountingTransport(app)
+    client = ServerClient(max_retries=1)
+    client._client = httpx.AsyncClient(transport=transport)
+    server = ServerInfo(
+        server_id="server-b",
+        hostname="b",
+        host="server-b.test",
+        port=8000,
+        status="online",
+        world_count=1,
+        version="test",
+        is_local=False,
+    )
+    connections = [
+        TankConnection(
+            f"c{index}",
+            source.world_id,
+            dest.world_id,
+            probability=100,
+            source_server_id="server-a",
+            destination_server_id="server-b",
+        )
+        for source in sources
+        for index in range(4)
+    ]
+
+    start = time.perf_counter()
+    result = await run_migration_tick(
+        connections,
+        server_a,
+        discovery_service=_Discovery(server),
+        server_client=client,
+        local_server_id="server-a",
+    )
+    elapsed = time.perf_counter() - start
+    await client._client.aclose()
+
+    assert (result.migrated, result.failed) == (8, 0)
+    assert transport.requests == ["/api/remote-transfer/batch"]
+    # Two takes, one HTTP request, two commits.
+    assert result.round_trips == 5
+    assert result.migrated / elapsed > 0
+
+    outgoing = [
+        entry for entry in logged if entry["source_world_id"] in {s.world_id for s in sources}
+    ]
+    incoming = [entry for entry in logged if entry["destination_world_id"] == dest.world_id]
+    assert len(outgoing) == len(incoming) == 8
+    assert all(entry["destination_world_id"] == f"server-b:{dest.world_id}" for entry in outgoing)
+    assert all(entry["source_world_id"].startswith("server-a:") for entry in incoming)
+
+    # Spawns are applied by the destination's next step.
+    with dest.runner.lock:
+        dest.runner.world.update()
+        spawned = {id(entity) for entity in dest.runner.world.entities_list}
+    assert {entry["entity_new_id"] for entry in incoming} <= spawned
+
+
+async def test_paused_remote_world_rejects_batch_silently(managers, monkeypatch) -> None:
+    server_a, server_b = managers
+    logged: list[dict] = []
+    monkeypatch.setattr(
+        "backend.transfer_history.log_transfer", lambda **kwargs: logged.append(kwargs)
+    )
+    # The source stays paused so its entity count cannot drift while the tick
+    # runs; only the scheduler is told it is running.
+    source = server_a.create_world("tank", "Source", seed=1, persistent=False, start_paused=True)
+    dest = server_b.create_world("tank", "Dest", seed=2, persistent=False, start_paused=True)
+    is_paused = migration_batch._is_paused
+    monkeypatch.setattr(
+        migration_batch,
+        "_is_paused",
+        lambda instance: instance is not source and is_paused(instance),
+    )
+    before = _entity_count(source)
+
+    app = FastAPI()
+    app.include_router(remote_transfers.setup_router(server_b))
+    client = ServerClient(max_retries=1)
+    client._client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    server = ServerInfo(
+        server_id="server-b",
+        hostname="b",
+        host="server-b.test",
+        port=8000,
+        status="online",
+        world_count=1,
+        version="test",
+        is_local=False,
+    )
+    connection = TankConnection(
+        "c",
+        source.world_id,
+        dest.world_id,
+        probability=100,
+        source_server_id="server-a",
+        destination_server_id="server-b",
+    )
+
+    result = await run_migration_tick(
+        [connection], server_a, discovery_service=_Discovery(server), server_client=client
+    )
+    await client._client.aclose()
+
+    assert (result.migrated, result.failed) == (0, 1)
+    assert logged == []
+    assert _entity_count(source) == before
+
+
+async def test_buffered_log_writer_keeps_order(tmp_path, monkeypatch) -> None:
+    log_file = tmp_path / "transfers.log"
+    monkeypatch.setattr(transfer_history, "HISTORY_FILE", log_file)
+    monkeypatch.setattr(transfer_history, "LOG_FLUSH_DELAY", 0.0)
+
+    for index in range(5):
+        transfer_history.log_transfer(
+            entity_type="fish",
+            entity_old_id=index,
+            entity_new_id=index + 100,
+            source_world_id="a",
+            source_world_name="A",
+            destination_world_id="b",
+            destination_world_name="B",
+            success=True,
+        )
+    assert not log_file.exists()
+
+    assert transfer_history.flush_transfer_log() == 5
+    assert transfer_history.flush_transfer_log() == 0
+    records = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert [record["entity_old_id"] for record in records] == list(range(5))
@@ -0,0 +1,160 @@
+"""Tests for process-per-world execution (backend/runner/process_runner.py).
+
+One module-scoped WorldManager in process mode hosts two tank worlds, each in
+its own worker process. The tests drive them only through the same surfaces
+the broadcast loop, autosave, migration scheduler and routers use.
+"""
+
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from backend.connection_manager import TankConnection
+from backend.migration_batch import run_migration_tick
+from backend.migration_port import LocalMigrationPort
+from backend.runner.process_runner import EncodedState, ProcessSimulationRunner, RemoteHandle
+from backend.runner.process_worker import HANDLE, WorldWorker, is_shippable
+from backend.simulation_runner import SimulationRunner
+from backend.world_manager import WorldManager
+
+
+@pytest.fixture(scope="module")
+def process_manager():
+    manager = WorldManager(process_worlds=True)
+    source = manager.create_world("tank", "Source", seed=11, persistent=False, start_paused=True)
+    dest = manager.create_world("tank", "Dest", seed=12, persistent=False, start_paused=True)
+    yield manager, source, dest
+    manager.stop_all_worlds()
+
+
+def test_tank_worlds_get_process_runners(process_manager):
+    _, source, _ = process_manager
+    assert isinstance(source.runner, ProcessSimulationRunner)
+    assert source.mode_id == "tank"
+    assert source.runner.get_world_info()["world_type"] == "tank"
+
+
+def test_step_pause_and_stats_cross_the_boundary(process_manager):
+    _, source, _ = process_manager
+    runner = source.runner
+    assert runner.paused
+    before = runner.frame_count
+    runner.step()
+    assert runner.frame_count == before + 1
+    assert runner.paused  # API stepping restores the paused state
+    assert runner.get_stats()["fish_count"] > 0
+
+
+def test_state_frames_arrive_pre_encoded(process_manager):
+    _, source, _ = process_manager
+    state = source.runner.get_state(force_full=True, allow_delta=False)
+    assert isinstance(state, EncodedState)
+    assert not state.is_delta
+    payload = orjson.loads(source.runner.serialize_state(state))
+    assert payload["snapshot"]["frame"] == state.frame
+    assert payload["world_id"] == source.world_id
+    assert state.to_dict()["snapshot"]["entities"]
+
+
+def test_remote_handles_reach_world_and_services(process_manager):
+    _, source, _ = process_manager
+    world = source.runner.world
+    assert isinstance(world, RemoteHandle)
+    assert world.frame_count == source.runner.frame_count
+    assert not hasattr(world, "definitely_not_an_attribute")
+    snapshot = world.capture_state_for_save()
+    assert snapshot["world_id"] == source.world_id
+    assert isinstance(source.runner.metrics_history.to_payload(), dict)
+    fish_types = {getattr(e, "snapshot_type", None) for e in world.entities_list}
+    assert "fish" in fish_types
+
+
+def test_non_plain_call_results_come_back_as_handles(process_manager):
+    _, source, _ = process_manager
+    world = source.runner.world
+    entities = world.get_entities_for_snapshot()
+    assert isinstance(entities, RemoteHandle)
+    assert len(entities) == len(world.entities_list)
+    assert entities[0].snapshot_type == world.entities_list[0].snapshot_type
+
+
+def test_iteration_runs_in_the_worker(process_manager):
+    _, source, _ = process_manager
+    world = source.runner.world
+    fish = [e for e in world.entities_list if getattr(e, "snapshot_type", None) == "fish"]
+    assert fish and all(isinstance(e, RemoteHandle) for e in fish)
+    assert len(fish) == source.runner.get_stats()["fish_count"]
+
+    # Sets and dicts can't be indexed; the worker iterates them itself
+    owner = object()
+    worker = WorldWorker(SimpleNamespace(tags={"a", "b"}, owners={owner: 1}))
+    assert sorted(worker.handle("iter", ("tags",), (), {})) == ["a", "b"]
+    path, count = worker.handle("iter", ("owners",), (), {})
+    assert count == 1
+    assert worker.handle("get", (*path, ("item", 0)), (), {}) == HANDLE
+
+
+def test_commands_round_trip(process_manager):
+    _, source, _ = process_manager
+    runner = source.runner
+    runner.handle_command("resume")
+    assert not runner.paused
+    runner.handle_command("pause")
+    assert runner.paused
+
+
+def test_migration_port_check_then_commit(process_manager):
+    _, source, dest = process_manager
+    ticket = source.runner.take_migrant()
+    assert ticket is not None
+    admission = dest.runner.accept_migrant(ticket.entity_data, "migration_in")
+    assert admission.ok and admission.new_id is not None
+    assert source.runner.commit_migrant(ticket.token, "migration_out")
+    assert not source.runner.commit_migrant(ticket.token, "migration_out")
+
+
+async def test_scheduler_flow_logs_successful_migration(process_manager, monkeypatch):
+    manager, source, dest = process_manager
+    logged = []
+    monkeypatch.setattr(
+        "backend.transfer_history.log_transfer", lambda **kwargs: logged.append(kwargs)
+    )
+    connection = TankConnection("c1", source.world_id, dest.world_id, probability=100)
+    monkeypatch.setattr(source.runner, "paused", False, raising=False)
+    monkeypatch.setattr(dest.runner, "paused", False, raising=False)
+    result = await run_migration_tick([connection, connection], manager)
+    assert (result.migrated, result.round_trips) == (2, 3)
+    assert [entry["success"] for entry in logged] == [True, True]
+    assert logged[0]["entity_type"] in ("fish", "plant")
+    assert logged[0]["entity_old_id"] != logged[1]["entity_old_id"]
+
+
+def test_stop_shuts_worker_down():
+    manager = WorldManager(process_worlds=True)
+    instance = manager.create_world("tank", "Solo", seed=5, persistent=False, start_paused=True)
+    runner = instance.runner
+    manager.stop_all_worlds()
+    assert not runner._process.is_alive()
+    assert not runner.running
+
+
+def test_local_port_reserves_until_commit():
+    runner = SimulationRunner(seed=21)
+    port = LocalMigrationPort(runner)
+    ticket = port.take_migrant()
+    assert ticket is not None
+    assert ticket.entity_type in ("fish", "plant")
+    port.release_migrant(ticket.token)
+    assert not port.commit_migrant(ticket.token, "migration_out")
+
+    ticket = port.take_migrant()
+    assert port.commit_migrant(ticket.token, "migration_out")
+    runner.step()
+    assert all(id(e) != ticket.token for e in runner.world.entities_list)
+
+
+def test_is_shippable_rejects_live_objects():
+    assert is_shippable({"a": [1, 2.0, "x", None], "b": (True,)})
+    assert not is_shippable([object()])
+    assert not is_shippable({"entity": SimulationRunner})
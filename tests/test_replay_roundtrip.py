@@ -1,4 +1,14 @@
-from backend.replay import ReplayPlan, record_file, replay_file
+import json
+
+import pytest
+
+from backend.replay import (
+    ReplayMismatchError,
+    ReplayPlan,
+    diff_replay,
+    record_file,
+    replay_file,
+)
 
 
 def test_replay_record_then_replay_roundtrip(tmp_path) -> None:
@@ -12,3 +22,62 @@ def test_replay_record_then_replay_roundtrip(tmp_path) -> None:
         plan=ReplayPlan({2: "petri", 4: "tank"}),
     )
     replay_file(path)
+
+
+def _tamper_from(path, frame: int) -> None:
+    """Rewrite a recording as if the run had drifted from ``frame`` onwards."""
+    lines = []
+    for line in path.read_text().splitlines():
+        record = json.loads(line)
+        if record.get("frame", -1) >= frame:
+            if record["type"] == "op":
+                record["fingerprint"] = "0" * 32
+            elif record["type"] == "checkpoint":
+                record["entity_types"]["fish"] = "0" * 32
+                fish_id = next(iter(record["entities"]["fish"]))
+                record["entities"]["fish"][fish_id] = "0" * 32
+        lines.append(json.dumps(record))
+    path.write_text("\n".join(lines) + "\n")
+
+
+def test_checkpointed_replay_still_replays(tmp_path) -> None:
+    path = tmp_path / "checkpointed.replay.jsonl"
+    record_file(path, seed=42, initial_mode="tank", steps=6, record_every=4, checkpoint_every=3)
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    checkpoints = [r for r in records if r["type"] == "checkpoint"]
+    assert [r["frame"] for r in checkpoints] == [3, 6]
+    assert "state" not in checkpoints[0]
+    assert checkpoints[0]["entities"]["fish"]
+    replay_file(path)
+    assert diff_replay(path) is None
+
+
+def test_diff_replay_finds_first_divergent_frame_and_entities(tmp_path) -> None:
+    path = tmp_path / "diverged.replay.jsonl"
+    record_file(path, seed=42, initial_mode="tank", steps=12, checkpoint_every=5)
+    _tamper_from(path, 7)
+
+    with pytest.raises(ReplayMismatchError, match="frame=7"):
+        replay_file(path)
+    divergence = diff_replay(path)
+
+    assert divergence is not None
+    assert (divergence.frame, divergence.op, divergence.last_verified_frame) == (7, "step", 6)
+    assert divergence.checkpoint_frame == 10
+    assert divergence.differing_entity_types == ("fish",)
+    assert list(divergence.differing_entities) == ["fish"]
+    assert len(divergence.differing_entities["fish"]) == 1
+
+
+def test_diff_replay_without_a_later_checkpoint_has_no_entity_details(tmp_path) -> None:
+    path = tmp_path / "late.replay.jsonl"
+    record_file(path, seed=42, initial_mode="tank", steps=12, checkpoint_every=5)
+    _tamper_from(path, 11)
+
+    divergence = diff_replay(path)
+
+    assert divergence is not None
+    assert (divergence.frame, divergence.last_verified_frame) == (11, 10)
+    assert divergence.checkpoint_frame is None
+    assert divergence.differing_entities == {}
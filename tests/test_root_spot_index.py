@@ -0,0 +1,90 @@
+"""RootSpotManager's indexed queries match full scans of the spot list."""
+
+import math
+import random
+
+import pytest
+
+from core.root_spots import RootSpotManager
+
+
+def _empty(manager):
+    return [s for s in manager.spots if not s.occupied and not s.blocked]
+
+
+def _scan_nearest(manager, x, y):
+    empty = _empty(manager)
+    if not empty:
+        return None
+    return min(empty, key=lambda s: (s.x - x) ** 2 + (s.y - y) ** 2)
+
+
+def _scan_in_range(manager, x, y, radius, only_empty):
+    return [
+        s
+        for s in manager.spots
+        if not s.blocked
+        and not (only_empty and s.occupied)
+        and (s.x - x) * (s.x - x) + (s.y - y) * (s.y - y) <= radius * radius
+    ]
+
+
+def _scan_sprout_candidates(manager, x, y, max_distance):
+    nearby = _scan_in_range(manager, x, y, max_distance, only_empty=True)
+
+    def score(spot):
+        dist = math.hypot(spot.x - x, spot.y - y)
+        return dist if dist < 50.0 else 50.0 + (max_distance - dist) * 0.5
+
+    nearby.sort(key=score, reverse=True)
+    return nearby[:5]
+
+
+@pytest.mark.parametrize("seed", [1, 7, 42])
+def test_indexed_queries_match_full_scans(seed):
+    rng = random.Random(seed)
+    manager = RootSpotManager(screen_width=1088, screen_height=612, spot_count=60, rng=rng)
+    plant = object()
+
+    for _ in range(400):
+        op = rng.random()
+        spot = rng.choice(manager.spots)
+        if op < 0.35:
+            spot.claim(plant)
+        elif op < 0.6:
+            spot.release()
+        elif op < 0.65:
+            manager.block_spots_in_rect(rng.uniform(0, 1088), 500, rng.uniform(0, 80), 200)
+        elif op < 0.7:
+            spot.occupied = True  # Direct writes (reconcile repairs) stay indexed
+
+        x, y = rng.uniform(-200, 1300), rng.uniform(0, 700)
+        radius = rng.uniform(0, 300)
+        assert manager.get_nearest_empty_spot(x, y) is _scan_nearest(manager, x, y)
+        for only_empty in (False, True):
+            assert manager.get_spots_in_range(x, y, radius, only_empty) == _scan_in_range(
+                manager, x, y, radius, only_empty
+            )
+        assert manager.get_all_empty_spots() == _empty(manager)
+        assert manager.get_all_occupied_spots() == [s for s in manager.spots if s.occupied]
+        assert manager.get_empty_count() == len(_empty(manager))
+
+        # Same spot and same RNG consumption as the unindexed sprouting path
+        state = rng.getstate()
+        sprouted = manager.find_spot_for_sprouting(x, y, rng=rng)
+        after = rng.getstate()
+        rng.setstate(state)
+        candidates = _scan_sprout_candidates(manager, x, y, 200.0)
+        expected = rng.choice(candidates) if candidates else None
+        if expected is None and _empty(manager):
+            expected = rng.choice(_empty(manager))
+        assert sprouted is expected
+        assert rng.getstate() == after
+
+
+def test_block_spots_in_rect_counts_only_new_blocks():
+    manager = RootSpotManager(screen_width=1088, screen_height=612, rng=random.Random(3))
+    first = manager.block_spots_in_rect(0, 0, 600, 612)
+    assert first == sum(1 for s in manager.spots if s.blocked) > 0
+    assert manager.block_spots_in_rect(0, 0, 600, 612) == 0
+    assert manager.get_empty_count() == len(manager.spots) - first
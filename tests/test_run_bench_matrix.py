@@ -211,3 +211,128 @@ class TestRunBenchMatrix:
         # Should fail because candidate is worse on all seeds (14 vs 16, 15 vs 20, 15 vs 30)
         assert compare_res.returncode == 1
         assert "FAILURE: Candidate failed to improve on the champion" in compare_res.stdout
+
+
+def _run_matrix(fake_bench: Path, out_path: Path, ledger: Path, *extra: str):
+    return subprocess.run(
+        [
+            sys.executable,
+            str(RUN_BENCH_MATRIX),
+            str(fake_bench),
+            "--seeds",
+            "42,7,123,5",
+            "--out",
+            str(out_path),
+            *extra,
+        ],
+        cwd=str(REPO_ROOT),
+        env={**os.environ, "ATTEMPT_LEDGER_PATH": str(ledger)},
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestParallelMatrix:
+    """--jobs N must reproduce the sequential matrix exactly."""
+
+    def test_parallel_json_matches_sequential(self, tmp_path):
+        fake_bench = create_fake_benchmark(tmp_path)
+        ledger = tmp_path / "attempts_test.jsonl"
+        serial_path = tmp_path / "serial.json"
+        parallel_path = tmp_path / "parallel.json"
+
+        serial = _run_matrix(fake_bench, serial_path, ledger)
+        parallel = _run_matrix(fake_bench, parallel_path, ledger, "--jobs", "3")
+        assert serial.returncode == 0, serial.stdout + serial.stderr
+        assert parallel.returncode == 0, parallel.stdout + parallel.stderr
+        assert "[4/4] Seed" in parallel.stdout
+
+        # Only wall-clock fields may differ; everything else is byte-identical.
+        def without_wall_clock(path: Path) -> bytes:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            data.pop("runtime_seconds")
+            data.pop("timestamp")
+            return json.dumps(data, indent=2).encode()
+
+        assert without_wall_clock(parallel_path) == without_wall_clock(serial_path)
+        assert list(json.loads(parallel_path.read_text())["per_seed"]) == ["42", "7", "123", "5"]
+
+    def test_verify_determinism_passes_for_pure_benchmark(self, tmp_path):
+        fake_bench = create_fake_benchmark(tmp_path)
+        result = _run_matrix(
+            fake_bench,
+            tmp_path / "out.json",
+            tmp_path / "attempts_test.jsonl",
+            "--jobs",
+            "2",
+            "--verify-determinism",
+        )
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "Determinism verified: 4 seeds" in result.stdout
+
+    def test_verify_determinism_catches_leaked_module_state(self, tmp_path):
+        # Scores depend on how many runs this module object has seen, so the
+        # in-process sequential run diverges from fresh-process workers.
+        bench_path = tmp_path / "stateful_bench.py"
+        bench_path.write_text(
+            """
+BENCHMARK_ID = "tank/survival_5k"
+CONFIG = {"frames": 2, "world_config": {}}
+_RUNS = []
+
+def run(seed, fingerprint_callback=None):
+    _RUNS.append(seed)
+    return {"benchmark_id": BENCHMARK_ID, "seed": seed, "score": float(len(_RUNS)),
+            "runtime_seconds": 0.01, "metadata": {"frames": 2}}
+""",
+            encoding="utf-8",
+        )
+        result = _run_matrix(
+            bench_path,
+            tmp_path / "out.json",
+            tmp_path / "attempts_test.jsonl",
+            "--jobs",
+            "2",
+            "--verify-determinism",
+        )
+        assert result.returncode == 1
+        assert "DETERMINISM FAILURE" in result.stdout
+
+    def test_verify_determinism_pools_a_single_seed(self, tmp_path):
+        # One seed never fans out, so the check must still use a worker process.
+        bench_path = tmp_path / "process_bench.py"
+        bench_path.write_text(
+            """
+import multiprocessing
+
+BENCHMARK_ID = "tank/survival_5k"
+CONFIG = {"frames": 2, "world_config": {}}
+
+def run(seed, fingerprint_callback=None):
+    in_main = multiprocessing.current_process().name == "MainProcess"
+    return {"benchmark_id": BENCHMARK_ID, "seed": seed, "score": float(in_main),
+            "runtime_seconds": 0.01, "metadata": {"frames": 2}}
+""",
+            encoding="utf-8",
+        )
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(RUN_BENCH_MATRIX),
+                str(bench_path),
+                "--seeds",
+                "42",
+                "--out",
+                str(tmp_path / "out.json"),
+                "--jobs",
+                "4",
+                "--verify-determinism",
+            ],
+            cwd=str(REPO_ROOT),
+            env={**os.environ, "ATTEMPT_LEDGER_PATH": str(tmp_path / "attempts_test.jsonl")},
+            capture_output=True,
+            text=True,
+        )
+        assert "against a 1-process re-run" in result.stdout
+        assert result.returncode == 1
+        assert "DETERMINISM FAILURE" in result.stdout
@@ -539,3 +539,67 @@ def test_build_observatory_snapshot_handles_unpicklable_mappingproxy_genome():
     assert snapshot.world_id == "world_1"
     assert len(snapshot.living_fish) == 1
     assert snapshot.living_fish[0].fish_id == 1
+
+
+def test_evaluate_genome_with_cache_reuses_disk_entries_across_processes(tmp_path):
+    """A score written by one process is served to another (an empty LRU)
+    straight from the disk cache, without re-running the gym."""
+    import random
+    from unittest.mock import patch
+
+    import backend.skill_observatory_scoring as skill_observatory_scoring
+    from core.foraging.gym import ForagingGymEvaluation, GymResult
+    from core.genetics.genome import Genome
+
+    cache = skill_observatory_scoring.ObservatoryDiskCache(tmp_path / "cache")
+    genome = Genome.random(rng=random.Random(7))
+    evaluation = ForagingGymEvaluation(
+        oracle_energy=100.0,
+        oracle=GymResult(100.0, 10, 0.0, 0.0),
+        random_walk=GymResult(20.0, 2, 0.0, 0.0),
+        composable=GymResult(50.0, 5, 0.0, 0.0),
+    )
+
+    def score() -> dict:
+        return skill_observatory_scoring.evaluate_genome_with_cache(
+            genome, "hash-a", (1, 2), None, None, cache
+        )
+
+    with patch(
+        "backend.skill_observatory_scoring.evaluate_custom_genome", return_value=evaluation
+    ) as mock_eval:
+        skill_observatory_scoring._OBSERVATORY_EVALUATION_CACHE.clear()
+        first = score()
+        assert mock_eval.call_count == 2
+
+        skill_observatory_scoring._OBSERVATORY_EVALUATION_CACHE.clear()
+        assert score() == first
+        assert mock_eval.call_count == 2
+
+    fingerprint = skill_observatory_scoring.controller_fingerprint(genome)
+    assert (tmp_path / "cache" / "hash-a" / f"{fingerprint}.json").is_file()
+
+
+def test_disk_cache_evicts_least_recently_used_entries(tmp_path):
+    """Writes beyond max_entries drop the stalest entries and emptied config dirs."""
+    import os
+
+    from backend.skill_observatory_scoring import ObservatoryDiskCache
+
+    cache = ObservatoryDiskCache(tmp_path, max_entries=3)
+    cache.put("old", "retired-config", {"score": 0})
+    for index, key in enumerate(("a", "b")):
+        cache.put(key, "config", {"score": index})
+    # Age every entry ("old" most), then touch "a" through a hit so it counts as recent.
+    for path in tmp_path.glob("*/*.json"):
+        age = 1_000 if path.stem == "old" else 2_000
+        os.utime(path, (age, age))
+    assert cache.get("a", "config") == {"score": 0}
+
+    cache.put("c", "config", {"score": 2})
+    assert cache.get("old", "retired-config") is None
+    assert not (tmp_path / "retired-config").exists()
+    assert sorted(p.stem for p in tmp_path.glob("*/*.json")) == ["a", "b", "c"]
+
+    cache.put("d", "config", {"score": 3})
+    assert sorted(p.stem for p in tmp_path.glob("*/*.json")) == ["a", "c", "d"]
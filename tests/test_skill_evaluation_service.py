@@ -1,6 +1,7 @@
 """Tests for the asynchronous observatory evaluation boundary."""
 
 import asyncio
+import os
 from pathlib import Path
 
 import pytest
@@ -41,6 +42,11 @@ async def test_refresh_world_evaluates_outside_request_and_copies_result() -> No
     assert service.get_latest("tank-a")["values"] == [1]  # type: ignore[index]
 
 
+def _evaluate_in_worker(world_id: str) -> dict[str, object]:
+    # Module level so the process pool can pickle it by reference
+    return {"status": "success", "world_id": world_id, "pid": os.getpid()}
+
+
 def threading_name() -> str:
     import threading
 
@@ -170,3 +176,32 @@ async def test_run_loop_refreshes_worlds_sequentially_not_concurrently() -> None
     assert service.get_latest("tank-a") is not None
     assert service.get_latest("tank-b") is not None
     assert service.get_latest("tank-c") is not None
+
+
+@pytest.mark.asyncio
+async def test_process_workers_evaluate_in_a_separate_process() -> None:
+    service = SkillEvaluationService(
+        _WorldManager("tank-a"), _evaluate_in_worker, process_workers=1
+    )
+    try:
+        result = await service.refresh_world("tank-a")
+    finally:
+        await service.stop()
+
+    assert result is not None
+    assert result["world_id"] == "tank-a"
+    assert result["pid"] != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_unpicklable_evaluator_falls_back_to_a_worker_thread() -> None:
+    service = SkillEvaluationService(
+        _WorldManager("tank-a"),
+        lambda world_id: {"status": "success", "thread": threading_name()},
+        process_workers=1,
+    )
+    result = await service.refresh_world("tank-a")
+    await service.stop()
+
+    assert result is not None
+    assert result["thread"] != "MainThread"
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from fastapi.testclient import TestClient
 
-from backend.app_factory import create_app
+from backend.app_factory import AppContext, create_app
 from core.skill.ladder import RungResult, SkillLadderSummary
 from core.skill.snapshots import SkillSnapshot, SkillSnapshotStore
 
@@ -37,9 +37,10 @@ def _make_sample_snapshot(skill_index: float = 50.0) -> SkillSnapshot:
     )
 
 
-def test_get_skill_snapshots_api_endpoint() -> None:
+def test_get_skill_snapshots_api_endpoint(tmp_path) -> None:
     """GET /api/skill/snapshots returns JSON shape matching specs."""
-    app = create_app(production_mode=False)
+    context = AppContext(skill_evaluation_dir=tmp_path / "skill_evaluations")
+    app = create_app(production_mode=False, context=context)
     with TestClient(app) as client:
         # Call endpoint for default world
         res = client.get("/api/skill/snapshots")
@@ -0,0 +1,160 @@
+"""Tests for the binary columnar snapshot format (backend/snapshot_codec.py)."""
+
+from __future__ import annotations
+
+import io
+import json
+import pickle
+
+import pytest
+
+import backend.world_persistence as wp
+from backend.snapshot_codec import (
+    ColumnarEntities,
+    decode_binary_snapshot,
+    encode_binary_snapshot,
+    read_snapshot_metadata,
+    zstandard,
+)
+from core.exceptions import PersistenceError
+from core.worlds import WorldRegistry
+from tools.convert_snapshots import convert_snapshot
+
+CONFIG = {
+    "headless": True,
+    "screen_width": 1000,
+    "screen_height": 1000,
+    "max_population": 100,
+    "auto_food_enabled": False,
+}
+
+
+def _snapshot() -> dict:
+    return {
+        "schema_version": "3.0",
+        "world_id": "abc12345",
+        "frame": 42,
+        "lineage_log": [{"id": 1, "parent_id": None}],
+        "entities": [
+            {"type": "castle", "x": 10.0, "y": 20.0},
+            {
+                "type": "fish",
+                "id": 1,
+                "x": 1.5,
+                "energy": 10,
+                "genome_data": {"behavior": {"type": "C", "params": {"a": 0.1, "b": 2}}},
+                "tags": ["a", "b"],
+                "alive": True,
+            },
+            {
+                "type": "fish",
+                "id": 2,
+                "x": 2.25,
+                "energy": 10.5,
+                "genome_data": {"behavior": None, "extra": {}},
+                "tags": [],
+                "alive": False,
+                "only_here": "x",
+            },
+            {"type": "food", "x": 3.0, "y": 4.0, "energy": 1e-300},
+            {"type": "fish", "id": 3, "x": float("inf"), "energy": -7, "genome_data": {}},
+        ],
+    }
+
+
+def _decode(data: bytes) -> dict:
+    snapshot = decode_binary_snapshot(io.BytesIO(data))
+    assert isinstance(snapshot["entities"], ColumnarEntities)
+    snapshot["entities"] = list(snapshot["entities"])
+    return snapshot
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "zstd"])
+def test_round_trip_preserves_values_types_and_order(compression):
+    if compression == "zstd" and zstandard is None:
+        pytest.skip("zstandard not installed")
+    original = _snapshot()
+    decoded = _decode(encode_binary_snapshot(original, compression))
+
+    assert decoded == original
+    for before, after in zip(original["entities"], decoded["entities"], strict=True):
+        assert list(after) == list(before)  # key order
+        for key, value in before.items():
+            assert type(after[key]) is type(value)
+
+
+def test_entities_sequence_indexing_and_pickle():
+    original = _snapshot()
+    entities = decode_binary_snapshot(io.BytesIO(encode_binary_snapshot(original)))["entities"]
+    assert len(entities) == len(original["entities"])
+    assert entities[-1] == original["entities"][-1]
+    assert entities[1:3] == original["entities"][1:3]
+    assert list(pickle.loads(pickle.dumps(entities))) == original["entities"]
+
+
+def test_rejects_bad_files():
+    data = encode_binary_snapshot(_snapshot())
+    with pytest.raises(PersistenceError):
+        decode_binary_snapshot(io.BytesIO(b"NOTASNAP" + data[8:]))
+    with pytest.raises(PersistenceError):
+        decode_binary_snapshot(io.BytesIO(data[:8] + b"\x63\x00" + data[10:]))
+    with pytest.raises(PersistenceError):
+        decode_binary_snapshot(io.BytesIO(encode_binary_snapshot(_snapshot(), "none")[:-5]))
+    with pytest.raises(ValueError):
+        encode_binary_snapshot(_snapshot(), "lz4")
+
+
+def test_binary_save_list_and_restore(mock_data_dir):
+    adapter = WorldRegistry.create_world("tank", seed=42, config=CONFIG)
+    adapter.reset(seed=42, config=CONFIG)
+    for _ in range(30):
+        adapter.step()
+    snapshot = adapter.capture_state_for_save()
+    expected = json.loads(json.dumps(snapshot))
+
+    json_path = wp.save_snapshot_data("world-1", dict(snapshot), snapshot_format="json")
+    snapshot["saved_at"] = "2030-01-01T00:00:00+00:00"  # Newer than the JSON save
+    binary_path = wp.save_snapshot_data("world-1", snapshot, snapshot_format="binary")
+    assert json_path is not None and json_path.endswith(".json")
+    assert binary_path is not None and binary_path.endswith(".tsnap")
+
+    listed = wp.list_world_snapshots("world-1")
+    assert [entry["filepath"] for entry in listed] == [binary_path, json_path]
+    assert listed[0]["entity_count"] == len(expected["entities"])
+    assert listed[0]["frame"] == expected["frame"]
+    assert listed[0]["size_bytes"] < listed[1]["size_bytes"]
+    assert read_snapshot_metadata(binary_path)["saved_at"] == "2030-01-01T00:00:00+00:00"
+
+    loaded = wp.load_snapshot(binary_path)
+    assert loaded is not None
+    assert list(loaded["entities"]) == expected["entities"]
+
+    dest = WorldRegistry.create_world("tank", seed=43, config=CONFIG)
+    dest.reset(seed=43, config=CONFIG)
+    assert wp.restore_world_from_snapshot(loaded, dest)
+    assert dest.engine.frame_count == expected["frame"]
+    restored_fish = sorted(
+        e.fish_id for e in dest.entities_list if getattr(e, "snapshot_type", None) == "fish"
+    )
+    assert restored_fish == sorted(e["id"] for e in expected["entities"] if e["type"] == "fish")
+
+
+def test_load_snapshot_returns_none_for_corrupt_binary(mock_data_dir):
+    path = mock_data_dir / "broken.tsnap"
+    path.write_bytes(encode_binary_snapshot(_snapshot())[:20])
+    assert wp.load_snapshot(str(path)) is None
+
+
+def test_convert_snapshot_round_trips(tmp_path):
+    source = tmp_path / "snapshot_20260101_000000.json"
+    source.write_text(json.dumps(_snapshot()))
+
+    converted = convert_snapshot(source, "binary")
+    assert converted is not None
+    target, source_bytes, target_bytes = converted
+    assert target.suffix == ".tsnap" and target_bytes > 0 and source_bytes > 0
+    assert convert_snapshot(target, "binary") is None  # Already binary
+
+    target_json = convert_snapshot(target, "json")
+    assert target_json is not None
+    assert json.loads(target_json[0].read_text()) == json.loads(source.read_text())
@@ -0,0 +1,134 @@
+"""BatchRCSSLiteEngine must step every match exactly like RCSSLiteEngine."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import numpy as np
+
+from core.minigames.soccer.batch_engine import (
+    COMMAND_CODES,
+    FAST_MODE_TOLERANCE,
+    NO_COMMAND,
+    BatchRCSSLiteEngine,
+)
+from core.minigames.soccer.engine import CommandType, RCSSCommand, RCSSLiteEngine, RCSSVector
+from core.minigames.soccer.formation import build_default_formation
+from core.minigames.soccer.params import NOISY_RCSS_PARAMS, SOCCER_CANONICAL_PARAMS, RCSSParams
+
+
+def _chaser_commands(snapshot: dict, rng: random.Random) -> list[tuple[str, RCSSCommand]]:
+    """Crowd the ball and shoot at goal, so kicks, collisions and goals all happen."""
+    ball = snapshot["ball"]
+    commands = []
+    for player in snapshot["players"]:
+        dx, dy = ball["x"] - player["x"], ball["y"] - player["y"]
+        if math.hypot(dx, dy) < 1.0:
+            goal_x = 50.0 if player["team"] == "left" else -50.0
+            aim = math.atan2(-player["y"], goal_x - player["x"]) - player["body_angle"]
+            command = RCSSCommand.kick(
+                60 + 40 * rng.random(), math.degrees(aim) + rng.uniform(-20, 20)
+            )
+        elif rng.random() < 0.05:
+            command = RCSSCommand.turn_neck(rng.uniform(-200, 200))
+        else:
+            relative = (math.degrees(math.atan2(dy, dx) - player["body_angle"]) + 180) % 360 - 180
+            if abs(relative) > 15:
+                command = RCSSCommand.turn(relative)
+            else:
+                command = RCSSCommand.dash(rng.uniform(-20, 120), rng.uniform(-30, 30))
+        commands.append((player["id"], command))
+    rng.shuffle(commands)  # Queue order decides simultaneous kicks
+    return commands
+
+
+def _engines(params: RCSSParams, matches: int, strict: bool = True):
+    scalar = [RCSSLiteEngine(params=params, seed=seed) for seed in range(matches)]
+    batch = BatchRCSSLiteEngine(list(range(matches)), params=params, strict=strict)
+    for spec in build_default_formation(team_size=3, params=params):
+        for engine in (*scalar, batch):
+            engine.add_player(
+                spec.player_id, spec.team, RCSSVector(spec.x, spec.y), spec.body_angle
+            )
+    for match in range(1, matches, 2):
+        scalar[match].set_swapped_sides(True)
+        batch.set_swapped_sides(True, match=match)
+    return scalar, batch
+
+
+def _run_lockstep(params: RCSSParams, matches: int, cycles: int, strict: bool = True):
+    """Yield (scalar results, batch results, scalar engines, batch) every cycle."""
+    scalar, batch = _engines(params, matches, strict)
+    rngs = [random.Random(100 + match) for match in range(matches)]
+    for _ in range(cycles):
+        for match, engine in enumerate(scalar):
+            for player_id, command in _chaser_commands(engine.get_snapshot(), rngs[match]):
+                engine.queue_command(player_id, command)
+                batch.queue_command(match, player_id, command)
+        yield [engine.step_cycle() for engine in scalar], batch.step_cycle(), scalar, batch
+
+
+def test_strict_batch_matches_scalar_engine_exactly():
+    goals = 0
+    for expected, results, scalar, batch in _run_lockstep(SOCCER_CANONICAL_PARAMS, 4, 400):
+        assert results == expected
+        for match, engine in enumerate(scalar):
+            assert batch.get_snapshot(match) == engine.get_snapshot()
+            assert batch.last_touch_info(match) == engine.last_touch_info()
+        goals += sum(len(result["events"]) for result in results)
+    assert goals > 0
+
+
+def test_noise_draws_follow_the_scalar_engine():
+    for expected, results, scalar, batch in _run_lockstep(NOISY_RCSS_PARAMS, 2, 150):
+        assert results == expected
+    for match, engine in enumerate(scalar):
+        assert batch.get_snapshot(match) == engine.get_snapshot()
+
+
+def test_fast_mode_stays_within_tolerance():
+    for _, _, scalar, batch in _run_lockstep(SOCCER_CANONICAL_PARAMS, 2, 100, strict=False):
+        for match, engine in enumerate(scalar):
+            players = zip(
+                batch.get_snapshot(match)["players"], engine.get_snapshot()["players"], strict=True
+            )
+            for got, want in players:
+                assert abs(got["x"] - want["x"]) <= FAST_MODE_TOLERANCE
+                assert abs(got["y"] - want["y"]) <= FAST_MODE_TOLERANCE
+
+
+def test_simultaneous_kicks_sum_in_queue_order():
+    batch = BatchRCSSLiteEngine([0, 1])
+    batch.add_player("left_1", "left", RCSSVector(-0.3, 0.0))
+    batch.add_player("left_2", "left", RCSSVector(0.0, 0.3), body_angle=-math.pi / 2)
+    for match, order in enumerate((("left_1", "left_2"), ("left_2", "left_1"))):
+        for player_id in order:
+            batch.queue_command(match, player_id, RCSSCommand.kick(100, 0))
+
+    batch.step_cycle()
+
+    assert batch.last_touch_info(0)["player_id"] == "left_2"
+    assert batch.last_touch_info(0)["prev_player_id"] == "left_1"
+    assert batch.last_touch_info(1)["player_id"] == "left_1"
+    assert batch.last_touch_info(1)["prev_player_id"] == "left_2"
+
+
+def test_queue_commands_arrays_match_per_player_queueing():
+    dash, turn = COMMAND_CODES[CommandType.DASH], COMMAND_CODES[CommandType.TURN]
+    kinds = np.array([[dash, turn], [NO_COMMAND, dash]])
+    powers = np.array([[80.0, 0.0], [0.0, 40.0]])
+    directions = np.array([[10.0, 45.0], [0.0, -20.0]])
+    by_array, by_command = BatchRCSSLiteEngine([0, 1]), BatchRCSSLiteEngine([0, 1])
+    for batch in (by_array, by_command):
+        batch.add_player("left_1", "left", RCSSVector(-10.0, 0.0))
+        batch.add_player("right_1", "right", RCSSVector(10.0, 0.0), body_angle=math.pi)
+
+    by_array.queue_commands(kinds, powers, directions)
+    by_command.queue_command(0, "left_1", RCSSCommand.dash(80.0, 10.0))
+    by_command.queue_command(0, "right_1", RCSSCommand.turn(45.0))
+    by_command.queue_command(1, "right_1", RCSSCommand.dash(40.0, -20.0))
+
+    assert by_array.step_cycle() == by_command.step_cycle()
+    for match in range(2):
+        assert by_array.get_snapshot(match) == by_command.get_snapshot(match)
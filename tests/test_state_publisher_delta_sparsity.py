@@ -142,3 +142,37 @@ def test_cached_full_state_is_still_reused_for_the_same_frame():
 
     assert publisher.get_state(runner, force_full=True, allow_delta=False) is cached_full
     assert publisher.get_state(runner) is cached_full
+
+
+def test_client_requested_full_state_keeps_the_broadcast_delta_chain():
+    """A connecting client's full frame must not rebase everyone else's deltas.
+
+    Broadcast clients apply each delta on top of the previous broadcast frame.
+    If the full state built for a new client became the delta baseline, every
+    already-connected client would silently miss whatever changed in between.
+    """
+    publisher = _publisher()
+    runner = _runner()
+    runner.running = True
+    runner.world.get_stats.return_value = {}
+    fish = EntitySnapshot(1, "fish", 10.0, 20.0, 4.0, 4.0)
+    food = EntitySnapshot(2, "food", 3.0, 4.0, 2.0, 2.0)
+
+    runner.world.frame_count = 1
+    runner._collect_entities.return_value = [fish]
+    assert isinstance(publisher.get_state(runner), FullStatePayload)
+
+    runner.world.frame_count = 2
+    runner._collect_entities.return_value = [fish, food]
+    connect_full = publisher.get_state(runner, force_full=True, allow_delta=False)
+    assert isinstance(connect_full, FullStatePayload)
+    assert publisher.get_state(runner, force_full=True, allow_delta=False) is connect_full
+
+    delta = publisher.get_state(runner)
+    assert isinstance(delta, DeltaStatePayload)
+    assert delta.base_frame == 1
+    assert [entity["id"] for entity in delta.added] == [2]
+    assert "base_frame" not in delta.to_dict()["snapshot"]
+
+    runner.world.frame_count = 3
+    assert publisher.get_state(runner).base_frame == 2
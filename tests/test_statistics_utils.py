@@ -12,6 +12,8 @@ from core.statistics_utils import (
     compute_meta_stats,
     create_histogram,
     descriptive_stats,
+    histogram_bin,
+    histogram_edges,
     pearson_correlation,
     population_variance,
     safe_mean_std,
@@ -210,6 +212,17 @@ class TestCreateHistogram:
         assert bins == [5]
         assert len(edges) == 2
 
+    def test_bin_helpers_match_create_histogram(self):
+        """histogram_bin/histogram_edges bin exactly like create_histogram."""
+        values = [-1.0, 0.0, 0.5, 1.0, 1.25, 1.9999, 2.0, 3.0]
+        for range_min, range_max, num_bins in ((0.5, 2.0, 10), (0, 3, 4), (1.0, 1.0, 3)):
+            bins, edges = create_histogram(values, range_min, range_max, num_bins=num_bins)
+            counts = [0] * num_bins
+            for value in values:
+                counts[histogram_bin(value, range_min, range_max, num_bins)] += 1
+            assert counts == bins
+            assert histogram_edges(range_min, range_max, num_bins) == edges
+
 
 class TestPopulationVariance:
     """Tests for population_variance function."""
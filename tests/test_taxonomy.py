@@ -457,3 +457,86 @@ def test_prune_interval_zero_disables_pruning():
     system.update(environment, frame=1_000_000)
 
     assert "dead" in system.registry.species
+
+
+def _brute_force_medoid(members: dict[int, TaxonomyProfile]) -> TaxonomyProfile:
+    """The original O(k^2) medoid: first profile with the smallest summed distance."""
+    profiles = list(members.values())
+    best, best_total = profiles[0], float("inf")
+    for p in profiles:
+        total = sum(p.distance(other) for other in profiles)
+        if total < best_total:
+            best, best_total = p, total
+    return best
+
+
+def _random_profile(rng: random.Random, is_microbe: bool = False) -> TaxonomyProfile:
+    from core.taxonomy.profile import _FISH_TRAIT_WEIGHTS, _MICROBE_TRAIT_WEIGHTS
+
+    table = _MICROBE_TRAIT_WEIGHTS if is_microbe else _FISH_TRAIT_WEIGHTS
+    # Values on a coarse grid make exact ties between members common
+    return TaxonomyProfile({t: rng.randrange(5) / 4 for t, _, _ in table}, is_microbe)
+
+
+def test_distance_row_matches_profile_distance_bitwise():
+    import numpy as np
+
+    from core.taxonomy.profile import distance_row, profile_vector
+
+    rng = random.Random(11)
+    profiles = [
+        TaxonomyProfile(
+            {t: rng.random() for t in ("color_hue", "fin_size", "pigment_hue", "cell_size")},
+            rng.random() < 0.3,
+        )
+        for _ in range(40)
+    ] + [_random_profile(rng, is_microbe=rng.random() < 0.3) for _ in range(40)]
+    vectors = np.array([profile_vector(p) for p in profiles])
+    is_microbe = np.array([p.is_microbe for p in profiles])
+    for p in profiles:
+        row = distance_row(p, vectors, is_microbe).tolist()
+        assert row == [p.distance(other) for other in profiles]
+
+
+def test_incremental_medoid_matches_brute_force_through_births_and_deaths():
+    rng = random.Random(2024)
+    record = SpeciesRecord(
+        taxon_id="taxon_x",
+        type_profile=_random_profile(rng),
+        current_medoid_profile=_random_profile(rng),
+    )
+    next_id = 0
+    for step in range(250):
+        cache = record.member_profiles_cache
+        action = rng.random()
+        if cache and action < 0.4:
+            del cache[rng.choice(list(cache))]
+        elif cache and action < 0.45:
+            # Re-registering a member replaces its profile in place
+            cache[rng.choice(list(cache))] = _random_profile(rng)
+        else:
+            parent = rng.choice(list(cache.values())) if cache and action < 0.7 else None
+            cache[next_id] = parent if parent is not None else _random_profile(rng)
+            next_id += 1
+        if not cache:
+            continue
+        record.update_medoid()
+        assert record.current_medoid_profile is _brute_force_medoid(cache), step
+
+
+def test_medoid_tracker_survives_serialization_round_trip():
+    rng = random.Random(5)
+    record = SpeciesRecord(
+        taxon_id="taxon_y",
+        type_profile=_random_profile(rng),
+        current_medoid_profile=_random_profile(rng),
+    )
+    for eid in range(30):
+        record.member_profiles_cache[eid] = _random_profile(rng)
+        record.update_medoid()
+
+    restored = SpeciesRecord.from_dict(record.to_dict())
+    del restored.member_profiles_cache[3]
+    restored.update_medoid()
+    expected = _brute_force_medoid(restored.member_profiles_cache)
+    assert restored.current_medoid_profile is expected
@@ -0,0 +1,44 @@
+"""Warm fork pool (tools/warm_pool.py) runs every task from a pristine template."""
+
+import os
+
+import pytest
+
+from tools.warm_pool import FORK_SUPPORTED, WarmPool
+
+pytestmark = pytest.mark.skipif(not FORK_SUPPORTED, reason="warm pool forks (POSIX only)")
+
+_TEMPLATE_STATE = {"value": 0}
+
+
+def _mutate_and_read(delta):
+    _TEMPLATE_STATE["value"] += delta
+    return _TEMPLATE_STATE["value"], os.getpid()
+
+
+def test_each_task_forks_from_the_untouched_template():
+    _TEMPLATE_STATE["value"] = 10
+    pool = WarmPool(jobs=2)
+    seen = []
+
+    results = pool.run(_mutate_and_read, [(1,), (2,), (3,)], on_result=lambda i, r: seen.append(i))
+
+    assert [value for value, _ in results] == [11, 12, 13]
+    assert len({pid for _, pid in results} | {os.getpid()}) == 4
+    assert _TEMPLATE_STATE["value"] == 10
+    assert sorted(seen) == [0, 1, 2]
+    assert len(pool.task_overheads) == 3
+
+
+def _explode():
+    raise RuntimeError("candidate blew up")
+
+
+def test_worker_exception_is_raised_in_the_template():
+    with pytest.raises(RuntimeError, match="candidate blew up"):
+        WarmPool().run(_explode, [()])
+
+
+def test_crashed_worker_is_reported():
+    with pytest.raises(RuntimeError, match="exited with code 3"):
+        WarmPool().run(os._exit, [(3,)])
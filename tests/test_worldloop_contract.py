@@ -9,6 +9,8 @@ These tests verify that all world backends conform to the world loop contract:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import pytest
 
 from core.worlds.contracts import (
@@ -254,7 +256,7 @@ class TestStepResultContractConformance:
         # Extended fields (world loop contract)
         assert isinstance(result.spawns, list), "spawns must be list"
         assert isinstance(result.removals, list), "removals must be list"
-        assert isinstance(result.energy_deltas, list), "energy_deltas must be list"
+        assert isinstance(result.energy_deltas, Sequence), "energy_deltas must be a sequence"
         # render_hint can be None or dict
         if result.render_hint is not None:
             assert isinstance(result.render_hint, dict), "render_hint must be dict or None"
@@ -275,7 +277,8 @@ class TestStepResultContractConformance:
         # Extended fields
         assert isinstance(result.spawns, list), "spawns must be list"
         assert isinstance(result.removals, list), "removals must be list"
-        assert isinstance(result.energy_deltas, list), "energy_deltas must be list"
+        assert isinstance(result.energy_deltas, Sequence), "energy_deltas must be a sequence"
+        assert all(isinstance(delta, EnergyDeltaRecord) for delta in result.energy_deltas)
 
         # render_hint should be present after step
         assert result.render_hint is not None, "render_hint should be populated after step"
@@ -297,7 +300,7 @@ class TestStepResultContractConformance:
         # Extended fields
         assert isinstance(result.spawns, list), "spawns must be list"
         assert isinstance(result.removals, list), "removals must be list"
-        assert isinstance(result.energy_deltas, list), "energy_deltas must be list"
+        assert isinstance(result.energy_deltas, Sequence), "energy_deltas must be a sequence"
 
     def test_step_result_contract_petri_step(self) -> None:
         """Petri step() StepResult has all required fields with correct types."""
@@ -315,7 +318,7 @@ class TestStepResultContractConformance:
         # Extended fields
         assert isinstance(result.spawns, list), "spawns must be list"
         assert isinstance(result.removals, list), "removals must be list"
-        assert isinstance(result.energy_deltas, list), "energy_deltas must be list"
+        assert isinstance(result.energy_deltas, Sequence), "energy_deltas must be a sequence"
 
         # render_hint should be present
         assert result.render_hint is not None, "render_hint should be populated"
@@ -27,8 +27,9 @@ Usage:
     python tools/benchmark_algorithms.py --out results.json
     python tools/benchmark_algorithms.py --algorithms greedy_food_seeker --seeds 42 --frames 2000
 
-Determinism: each (algorithm, seed) run executes in a fresh worker process
-with a fixed world seed and a dedicated parameter RNG, so results are exactly
+Determinism: each (algorithm, seed) run executes in a worker forked from a
+warm template process (``core`` imported, one pristine world built) with a
+fixed world seed and a dedicated parameter RNG, so results are exactly
 reproducible run-to-run.
 """
 
@@ -40,9 +41,14 @@ import random
 import statistics
 import sys
 import time
-from multiprocessing import Pool
+from pathlib import Path
 from typing import Any, cast
 
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tools.warm_pool import WarmPool
+
 # Frames per run. ~2000 frames is enough for starvation/reproduction dynamics
 # to differentiate algorithms while keeping 45 runs under ~15 minutes.
 DEFAULT_FRAMES = 2000
@@ -189,6 +195,20 @@ def run_single(algorithm_id: str, seed: int, frames: int) -> dict[str, Any]:
     }
 
 
+def _warm_template() -> None:
+    """Import the simulation and build one throwaway world before forking."""
+    from core.worlds import WorldRegistry
+
+    rng_state = random.getstate()
+    try:
+        _food_seeker_classes()
+        config = dict(WORLD_CONFIG)
+        world = WorldRegistry.create_world("tank", seed=0, config=config)
+        world.reset(seed=0, config=config)
+    finally:
+        random.setstate(rng_state)
+
+
 def _run_single_star(args: tuple[str, int, int]) -> dict[str, Any]:
     return run_single(*args)
 
@@ -252,10 +272,10 @@ def main() -> int:
 
     start = time.time()
     if args.jobs > 1:
-        # maxtasksperchild=1 gives every run a pristine process for exact
-        # reproducibility (no cross-run module state).
-        with Pool(processes=args.jobs, maxtasksperchild=1) as pool:
-            runs = pool.map(_run_single_star, tasks)
+        # Every run forks from the warmed template, so each gets a pristine
+        # process (no cross-run module state) without re-importing core.
+        _warm_template()
+        runs = WarmPool(args.jobs).run(run_single, tasks)
     else:
         runs = [_run_single_star(task) for task in tasks]
 
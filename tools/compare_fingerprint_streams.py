@@ -1,4 +1,11 @@
-"""Compare two benchmark fingerprint JSONL artifacts."""
+"""Compare two benchmark fingerprint JSONL artifacts.
+
+Use --end-frame to compare a shorter run against the same frames of a longer
+one, e.g. a 2000-frame local run against a full CI artifact; otherwise the
+first checkpoint past the shorter run is reported as missing. Streams
+recorded with --fingerprint-entities-every also report the entities that
+differ.
+"""
 
 import argparse
 import json
@@ -12,12 +19,13 @@ from core.replay.fingerprint_stream import compare_fingerprint_streams
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description=__doc__)
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
     parser.add_argument("left")
     parser.add_argument("right")
+    parser.add_argument("--end-frame", type=int, default=None, help="Last frame to compare")
     args = parser.parse_args()
 
-    comparison = compare_fingerprint_streams(args.left, args.right)
+    comparison = compare_fingerprint_streams(args.left, args.right, end_frame=args.end_frame)
     print(json.dumps(comparison, indent=2))
     if comparison["rounded"] is not None:
         sys.exit(1)
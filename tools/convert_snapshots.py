@@ -0,0 +1,123 @@
+"""Convert world snapshots between the JSON and binary formats.
+
+Each input file (or every ``snapshot_*`` file under an input directory) is
+written next to itself with the target format's suffix, then read back and
+compared with the source so a conversion never silently loses data.
+
+Usage
+-----
+    python tools/convert_snapshots.py data/worlds --to binary
+    python tools/convert_snapshots.py data/worlds/<id>/snapshots/snapshot_X.tsnap --to json
+    python tools/convert_snapshots.py data/worlds --to binary --compression none --delete-source
+
+Without ``--delete-source`` both files are kept; the world then lists both
+(same timestamp), and either restores to the same state.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from backend.snapshot_codec import (
+    COMPRESSIONS,
+    SNAPSHOT_FORMATS,
+    SNAPSHOT_SUFFIXES,
+    read_snapshot_file,
+    snapshot_format_for,
+    write_snapshot_file,
+)
+
+
+def find_snapshots(paths: list[Path]) -> list[Path]:
+    """Expand directories into their snapshot files (any supported suffix)."""
+    found: list[Path] = []
+    for path in paths:
+        if path.is_dir():
+            for suffix in SNAPSHOT_SUFFIXES.values():
+                found.extend(path.rglob(f"snapshot_*{suffix}"))
+        else:
+            found.append(path)
+    return sorted(found)
+
+
+def _materialized(snapshot: dict[str, Any]) -> dict[str, Any]:
+    return {**snapshot, "entities": list(snapshot.get("entities", []))}
+
+
+def convert_snapshot(
+    source: Path, target_format: str, compression: str = "gzip"
+) -> tuple[Path, int, int] | None:
+    """Convert one file; returns (output path, source bytes, output bytes).
+
+    Returns None if the file is already in ``target_format``.
+    """
+    if snapshot_format_for(source) == target_format:
+        return None
+    snapshot = read_snapshot_file(source)
+    if snapshot is None:
+        raise ValueError(f"{source} is not a snapshot object")
+    snapshot = _materialized(snapshot)
+
+    target = source.with_suffix(SNAPSHOT_SUFFIXES[target_format])
+    write_snapshot_file(target, snapshot, target_format, compression)
+
+    restored = read_snapshot_file(target)
+    if restored is None or _materialized(restored) != snapshot:
+        target.unlink()
+        raise ValueError(f"{target} does not round-trip to {source}; removed it")
+    return target, source.stat().st_size, target.stat().st_size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("paths", nargs="+", type=Path, help="Snapshot files or directories")
+    parser.add_argument("--to", dest="target_format", choices=SNAPSHOT_FORMATS, required=True)
+    parser.add_argument("--compression", choices=COMPRESSIONS, default="gzip")
+    parser.add_argument(
+        "--delete-source", action="store_true", help="Remove each source after a verified copy"
+    )
+    args = parser.parse_args()
+
+    snapshots = find_snapshots(args.paths)
+    if not snapshots:
+        print("No snapshot files found")
+        return 1
+
+    failures = 0
+    total_source = total_target = 0
+    for source in snapshots:
+        try:
+            converted = convert_snapshot(source, args.target_format, args.compression)
+        except Exception as e:
+            print(f"FAILED {source}: {e}")
+            failures += 1
+            continue
+        if converted is None:
+            print(f"skip   {source} (already {args.target_format})")
+            continue
+        target, source_bytes, target_bytes = converted
+        total_source += source_bytes
+        total_target += target_bytes
+        print(
+            f"ok     {source} -> {target.name}: "
+            f"{source_bytes / 1024:.1f} KB -> {target_bytes / 1024:.1f} KB"
+        )
+        if args.delete_source:
+            source.unlink()
+
+    if total_target:
+        print(
+            f"Total: {total_source / 1024:.1f} KB -> {total_target / 1024:.1f} KB "
+            f"({total_source / total_target:.1f}x)"
+        )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,13 +19,21 @@ Usage:
 
     # Aggressive exploration
     python tools/evolve.py --generations 20 --mutation-rate 0.5 --mutation-strength 0.25
+
+    # Evaluate each candidate in workers forked from a warm template
+    python tools/evolve.py --generations 10 --warm-pool --jobs 4
 """
 
 import argparse
+import contextlib
 import copy
+import functools
 import json
+import statistics
 import sys
 import textwrap
+import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -33,11 +41,38 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 
-def _run_benchmarks(seed: int, benchmark_ids: list[str] | None = None) -> dict[str, Any]:
+def _run_benchmarks(
+    seed: int, benchmark_ids: list[str] | None = None, pool: Any = None, prepare: Any = None
+) -> dict[str, Any]:
     """Run benchmarks and return results. Imports lazily to allow patching first."""
     from tools.experiment import run_all_benchmarks
 
-    return run_all_benchmarks(seed, benchmark_ids)
+    return run_all_benchmarks(seed, benchmark_ids, pool=pool, prepare=prepare)
+
+
+@contextlib.contextmanager
+def _candidate_params(
+    composable_defaults: dict[str, float],
+    algo_overrides: dict[str, dict[str, tuple[float, float]]],
+    pool: Any = None,
+) -> Iterator[Any]:
+    """Make one mutation candidate's parameters active while the block runs.
+
+    With a warm pool the parameter patch is applied inside each forked worker,
+    so the template process never sees it: the block receives the patch to
+    pass as ``prepare``. Otherwise it is monkey-patched here (the block gets
+    None) and restored afterwards.
+    """
+    if pool is not None:
+        yield functools.partial(_apply_param_patch, composable_defaults, algo_overrides)
+        return
+
+    orig_sub, orig_algo = _apply_param_patch(composable_defaults, algo_overrides)
+    try:
+        yield None
+    finally:
+        # Always restore original params
+        _restore_params(orig_sub, orig_algo)
 
 
 def _compute_fitness(results: dict[str, Any]) -> float:
@@ -210,6 +245,8 @@ def evolve(
     benchmark_ids: list[str] | None = None,
     dry_run: bool = False,
     log_dir: str | None = None,
+    warm_pool: bool = False,
+    jobs: int = 1,
 ) -> dict[str, Any]:
     """Run the evolution loop.
 
@@ -222,6 +259,8 @@ def evolve(
         benchmark_ids: Which benchmarks to run (default: all tank)
         dry_run: If True, don't write changes to source files
         log_dir: Directory to write per-generation logs
+        warm_pool: Fork every benchmark run from a warm template process
+        jobs: Concurrent forked workers when ``warm_pool`` is set
 
     Returns:
         Summary dict with evolution history and final results
@@ -246,11 +285,38 @@ def evolve(
     print(f"  Mutation strength: {mutation_strength}", file=sys.stderr)
     print(f"  Base seed: {seed}", file=sys.stderr)
     print(f"  Dry run: {dry_run}", file=sys.stderr)
+    print(f"  Warm pool: {warm_pool} (jobs={jobs})", file=sys.stderr)
     print("=" * 70, file=sys.stderr)
 
+    pool = None
+    cold_start_seconds = template_seconds = 0.0
+    candidate_overheads: list[float] = []
+    if warm_pool:
+        from tools.experiment import measure_cold_start, warm_benchmark_template
+        from tools.warm_pool import WarmPool
+
+        print("\n[Warm pool] Measuring cold worker start...", file=sys.stderr)
+        cold_start_seconds = measure_cold_start(benchmark_ids)
+        start = time.perf_counter()
+        warm_benchmark_template(benchmark_ids)
+        template_seconds = time.perf_counter() - start
+        pool = WarmPool(jobs)
+        print(
+            f"[Warm pool] Cold start {cold_start_seconds:.2f}s per candidate, "
+            f"template built in {template_seconds:.2f}s",
+            file=sys.stderr,
+        )
+
+    def evaluate(prepare: Any = None) -> dict[str, Any]:
+        seen = len(pool.task_overheads) if pool is not None else 0
+        results = _run_benchmarks(seed, benchmark_ids, pool=pool, prepare=prepare)
+        if pool is not None:
+            candidate_overheads.append(sum(pool.task_overheads[seen:]))
+        return results
+
     # Step 1: Establish baseline
     print("\n[Baseline] Running benchmarks...", file=sys.stderr)
-    baseline_results = _run_benchmarks(seed, benchmark_ids)
+    baseline_results = evaluate()
     baseline_fitness = _compute_fitness(baseline_results)
     print(f"[Baseline] Fitness: {baseline_fitness:.6f}", file=sys.stderr)
 
@@ -325,16 +391,13 @@ def evolve(
         print(f"[Gen {gen}] {len(plan.mutations)} mutations:", file=sys.stderr)
         print(textwrap.indent(plan.summary(), "  "), file=sys.stderr)
 
-        # Apply mutations (monkey-patch)
         composable_defaults = apply_mutations_to_definitions(plan)
         algo_overrides = apply_mutations_to_algorithm_bounds(plan)
 
-        orig_sub, orig_algo = _apply_param_patch(composable_defaults, algo_overrides)
-
-        try:
+        with _candidate_params(composable_defaults, algo_overrides, pool) as prepare:
             # Run benchmarks with mutated parameters
             print(f"[Gen {gen}] Running benchmarks...", file=sys.stderr)
-            gen_results = _run_benchmarks(seed, benchmark_ids)
+            gen_results = evaluate(prepare)
             gen_fitness = _compute_fitness(gen_results)
 
             diff = gen_fitness - best_fitness
@@ -382,10 +445,6 @@ def evolve(
 
             history.append(gen_record)
 
-        finally:
-            # Always restore original params
-            _restore_params(orig_sub, orig_algo)
-
         # Log per-generation results
         if log_dir:
             gen_log_path = Path(log_dir) / f"gen_{gen:04d}.json"
@@ -447,6 +506,20 @@ def evolve(
     print(f"  Total improvement: {improvement:+.2f}%", file=sys.stderr)
     if source_changes:
         print(f"  Source changes: {len(source_changes)}", file=sys.stderr)
+    candidate_overhead: dict[str, Any] | None = None
+    if pool is not None:
+        warm_seconds = statistics.mean(candidate_overheads) if candidate_overheads else 0.0
+        candidate_overhead = {
+            "cold_start_seconds": round(cold_start_seconds, 4),
+            "warm_seconds": round(warm_seconds, 4),
+            "template_seconds": round(template_seconds, 4),
+            "candidates": len(candidate_overheads),
+        }
+        print(
+            f"  Per-candidate overhead: {cold_start_seconds:.3f}s cold -> "
+            f"{warm_seconds:.3f}s warm",
+            file=sys.stderr,
+        )
     print(f"{'='*70}", file=sys.stderr)
 
     result = {
@@ -464,6 +537,8 @@ def evolve(
             bid: res.get("score", 0) for bid, res in best_results.get("benchmarks", {}).items()
         },
     }
+    if candidate_overhead is not None:
+        result["candidate_overhead"] = candidate_overhead
 
     if log_dir:
         summary_path = Path(log_dir) / "evolution_summary.json"
@@ -495,6 +570,9 @@ def main():
 
               # Target a specific algorithm
               python tools/evolve.py --generations 10 --target greedy_food_seeker
+
+              # Warm fork pool: pay import/world-build once, not per candidate
+              python tools/evolve.py --generations 10 --warm-pool --jobs 4
         """
         ),
     )
@@ -527,6 +605,14 @@ def main():
         "--dry-run", action="store_true", help="Don't write changes to source files"
     )
     parser.add_argument("--log-dir", help="Directory for per-generation logs")
+    parser.add_argument(
+        "--warm-pool",
+        action="store_true",
+        help="Fork each benchmark run from a warm template process (POSIX)",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Concurrent warm-pool workers (default: 1)"
+    )
     parser.add_argument("--out", help="Output summary JSON path")
 
     args = parser.parse_args()
@@ -540,6 +626,8 @@ def main():
         benchmark_ids=args.benchmarks,
         dry_run=args.dry_run,
         log_dir=args.log_dir,
+        warm_pool=args.warm_pool,
+        jobs=args.jobs,
     )
 
     if args.out:
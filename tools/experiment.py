@@ -4,25 +4,46 @@ Usage:
     python tools/experiment.py --seed 42
     python tools/experiment.py --seed 42 --benchmarks tank/survival_5k tank/ecosystem_health_10k
     python tools/experiment.py --seed 42 --out results.json
+    python tools/experiment.py --seed 42 --jobs 4
+
+``--jobs N`` runs each benchmark in its own worker process (recycled after
+every run) and reports results as they finish; the returned structure is
+assembled in benchmark order, identical to a sequential run apart from the
+wall-clock fields.
+
+Callers that evaluate many candidates (``tools/evolve.py --warm-pool``) can
+instead warm this process once with ``warm_benchmark_template`` and pass a
+``tools.warm_pool.WarmPool``: each benchmark then runs in a child forked from
+the warm template, skipping interpreter start and the ``core`` import.
 """
 
 import argparse
 import importlib.util
 import json
+import random
+import subprocess
 import sys
 import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
+from tools.parallel_runs import run_tasks
+from tools.warm_pool import WarmPool
+
 BENCHMARK_DIR = ROOT / "benchmarks"
 CHAMPION_DIR = ROOT / "champions"
 
 # All known benchmarks (benchmark_id -> file path)
 KNOWN_BENCHMARKS: dict[str, Path] = {}
 
+# Warm template state inherited by forked workers (see warm_benchmark_template)
+_TEMPLATE_MODULES: dict[Path, Any] = {}
+_TEMPLATE_WORLDS: dict[str, Any] = {}
+
 
 def _discover_benchmarks() -> dict[str, Path]:
     """Discover all benchmark files under benchmarks/."""
@@ -83,8 +104,15 @@ def run_benchmark(benchmark_id: str, seed: int) -> dict[str, Any]:
     path = KNOWN_BENCHMARKS.get(benchmark_id)
     if path is None:
         raise ValueError(f"Unknown benchmark: {benchmark_id}. Known: {list(KNOWN_BENCHMARKS)}")
+    return _run_benchmark_at(benchmark_id, path, seed)
+
 
-    module = _load_benchmark(path)
+def _run_benchmark_at(
+    benchmark_id: str, path: Path, seed: int, module: Any = None
+) -> dict[str, Any]:
+    """Run the benchmark file at ``path`` and attach the champion comparison."""
+    if module is None:
+        module = _load_benchmark(path)
     result = module.run(seed)
 
     # Add champion comparison
@@ -109,12 +137,119 @@ def run_benchmark(benchmark_id: str, seed: int) -> dict[str, Any]:
     return dict(result)
 
 
-def run_all_benchmarks(seed: int, benchmark_ids: list[str] | None = None) -> dict[str, Any]:
+def _timed_benchmark_task(benchmark_id: str, path: Path | None, seed: int) -> dict[str, Any]:
+    """Worker entry point: run one benchmark, capturing errors and elapsed time."""
+    start = time.time()
+    try:
+        if path is None:
+            raise ValueError(f"Unknown benchmark: {benchmark_id}. Known: {list(KNOWN_BENCHMARKS)}")
+        result = _run_benchmark_at(benchmark_id, path, seed)
+    except Exception as e:
+        return {"error": str(e), "elapsed": time.time() - start}
+    return {"result": result, "elapsed": time.time() - start}
+
+
+def _warm_benchmark_task(
+    benchmark_id: str, path: Path | None, seed: int, prepare: Callable[[], object] | None
+) -> dict[str, Any]:
+    """Forked-worker entry point: apply ``prepare`` then run the template module."""
+    if prepare is not None:
+        prepare()
+    start = time.time()
+    try:
+        if path is None:
+            raise ValueError(f"Unknown benchmark: {benchmark_id}. Known: {list(KNOWN_BENCHMARKS)}")
+        result = _run_benchmark_at(benchmark_id, path, seed, _TEMPLATE_MODULES.get(path))
+    except Exception as e:
+        return {"error": str(e), "elapsed": time.time() - start}
+    return {"result": result, "elapsed": time.time() - start}
+
+
+def _default_benchmark_ids() -> list[str]:
+    """Discover benchmarks if needed and return the default (tank) IDs."""
+    global KNOWN_BENCHMARKS
+    if not KNOWN_BENCHMARKS:
+        KNOWN_BENCHMARKS = _discover_benchmarks()
+    return [bid for bid in KNOWN_BENCHMARKS if bid.startswith("tank/")]
+
+
+def warm_benchmark_template(benchmark_ids: list[str] | None = None) -> None:
+    """Turn this process into a warm template for ``WarmPool`` workers.
+
+    Loads every benchmark module once and builds one pristine world per
+    benchmark ``WORLD_CONFIG``, so lazily imported modules and class-level
+    caches are resident before any candidate forks. The global ``random``
+    state is restored afterwards so forked runs match fresh-process runs.
+    """
+    default_ids = _default_benchmark_ids()
+    ids = benchmark_ids if benchmark_ids is not None else default_ids
+    rng_state = random.getstate()
+    try:
+        for bid in sorted(ids):
+            path = KNOWN_BENCHMARKS.get(bid)
+            if path is None or path in _TEMPLATE_MODULES:
+                continue
+            module = _load_benchmark(path)
+            _TEMPLATE_MODULES[path] = module
+            world_config = getattr(module, "WORLD_CONFIG", None)
+            if world_config is not None:
+                from core.worlds import WorldRegistry
+
+                config = dict(world_config)
+                world = WorldRegistry.create_world("tank", seed=0, config=config)
+                world.reset(seed=0, config=config)
+                _TEMPLATE_WORLDS[bid] = world
+    finally:
+        random.setstate(rng_state)
+
+
+def measure_cold_start(benchmark_ids: list[str] | None = None) -> float:
+    """Seconds a recycled worker spends before its first benchmark frame.
+
+    Starts a fresh interpreter per benchmark and warms it the way one
+    recycled worker would (interpreter start, ``core`` import, module load,
+    world build); the sum is the per-candidate startup cost the warm pool
+    removes.
+    """
+    default_ids = _default_benchmark_ids()
+    ids = benchmark_ids if benchmark_ids is not None else default_ids
+    code = (
+        "import sys; sys.path.insert(0, sys.argv[1]); "
+        "from pathlib import Path; from tools import experiment; "
+        "experiment.KNOWN_BENCHMARKS[sys.argv[2]] = Path(sys.argv[3]); "
+        "experiment.warm_benchmark_template([sys.argv[2]])"
+    )
+    total = 0.0
+    for bid in ids:
+        path = KNOWN_BENCHMARKS.get(bid)
+        if path is None:
+            continue
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code, str(ROOT), bid, str(path)],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        total += time.perf_counter() - start
+    return total
+
+
+def run_all_benchmarks(
+    seed: int,
+    benchmark_ids: list[str] | None = None,
+    jobs: int = 1,
+    pool: WarmPool | None = None,
+    prepare: Callable[[], object] | None = None,
+) -> dict[str, Any]:
     """Run all (or specified) benchmarks and return structured results.
 
     Args:
         seed: Random seed
         benchmark_ids: Optional list of specific benchmarks to run
+        jobs: Worker processes (1 runs every benchmark in this process)
+        pool: Warm pool to fork each benchmark from (overrides ``jobs``)
+        prepare: Called in each forked worker before its benchmark runs,
+            e.g. to apply a parameter patch; requires ``pool``
 
     Returns:
         Dict with overall summary and per-benchmark results
@@ -122,6 +257,8 @@ def run_all_benchmarks(seed: int, benchmark_ids: list[str] | None = None) -> dic
     global KNOWN_BENCHMARKS
     if not KNOWN_BENCHMARKS:
         KNOWN_BENCHMARKS = _discover_benchmarks()
+    if prepare is not None and pool is None:
+        raise ValueError("prepare requires a WarmPool; it must not run in the caller")
 
     if benchmark_ids is None:
         # Default: run all tank benchmarks
@@ -132,40 +269,47 @@ def run_all_benchmarks(seed: int, benchmark_ids: list[str] | None = None) -> dic
     improvements = 0
     regressions = 0
 
-    for bid in sorted(benchmark_ids):
+    ordered_ids = sorted(benchmark_ids)
+
+    def report(index: int, outcome: dict[str, Any]) -> None:
+        bid = ordered_ids[index]
         print(f"\n{'='*60}", file=sys.stderr)
-        print(f"Running: {bid} (seed={seed})", file=sys.stderr)
+        print(f"{bid} (seed={seed})", file=sys.stderr)
         print(f"{'='*60}", file=sys.stderr)
-
-        start = time.time()
-        try:
-            result = run_benchmark(bid, seed)
-            elapsed = time.time() - start
-            total_time += elapsed
-            results[bid] = result
-
-            # Report
-            score = result["score"]
-            print(f"  Score: {score:.6f} ({elapsed:.1f}s)", file=sys.stderr)
-
-            comp = result.get("champion_comparison")
-            if comp:
-                sign = "+" if comp["diff"] > 0 else ""
-                print(
-                    f"  vs Champion: {comp['champion_score']:.6f} "
-                    f"({sign}{comp['diff']:.6f}, {sign}{comp['pct_change']:.2f}%)",
-                    file=sys.stderr,
-                )
-                if comp["is_improvement"]:
-                    improvements += 1
-                elif comp["diff"] < -1e-9:
-                    regressions += 1
-
-        except Exception as e:
-            elapsed = time.time() - start
-            total_time += elapsed
-            results[bid] = {"error": str(e), "benchmark_id": bid}
-            print(f"  ERROR: {e}", file=sys.stderr)
+        if "error" in outcome:
+            print(f"  ERROR: {outcome['error']}", file=sys.stderr)
+            return
+        result = outcome["result"]
+        print(f"  Score: {result['score']:.6f} ({outcome['elapsed']:.1f}s)", file=sys.stderr)
+        comp = result.get("champion_comparison")
+        if comp:
+            sign = "+" if comp["diff"] > 0 else ""
+            print(
+                f"  vs Champion: {comp['champion_score']:.6f} "
+                f"({sign}{comp['diff']:.6f}, {sign}{comp['pct_change']:.2f}%)",
+                file=sys.stderr,
+            )
+
+    if pool is not None:
+        warm_tasks = [(bid, KNOWN_BENCHMARKS.get(bid), seed, prepare) for bid in ordered_ids]
+        outcomes = pool.run(_warm_benchmark_task, warm_tasks, on_result=report)
+    else:
+        tasks = [(bid, KNOWN_BENCHMARKS.get(bid), seed) for bid in ordered_ids]
+        outcomes = run_tasks(_timed_benchmark_task, tasks, jobs=jobs, on_result=report)
+
+    # Assemble in benchmark order so output does not depend on completion order
+    for bid, outcome in zip(ordered_ids, outcomes, strict=True):
+        total_time += outcome["elapsed"]
+        if "error" in outcome:
+            results[bid] = {"error": outcome["error"], "benchmark_id": bid}
+            continue
+        results[bid] = outcome["result"]
+        comp = outcome["result"].get("champion_comparison")
+        if comp:
+            if comp["is_improvement"]:
+                improvements += 1
+            elif comp["diff"] < -1e-9:
+                regressions += 1
 
     return {
         "seed": seed,
@@ -187,10 +331,16 @@ def main():
         "--benchmarks", nargs="*", help="Specific benchmark IDs to run (default: all tank)"
     )
     parser.add_argument("--out", help="Output JSON path")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes; each benchmark runs in a fresh process (default: 1)",
+    )
 
     args = parser.parse_args()
 
-    results = run_all_benchmarks(args.seed, args.benchmarks)
+    results = run_all_benchmarks(args.seed, args.benchmarks, jobs=args.jobs)
 
     # Print summary
     s = results["summary"]
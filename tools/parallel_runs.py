@@ -0,0 +1,66 @@
+"""Process-pool fan-out shared by the benchmark runners.
+
+``run_tasks`` runs ``worker(*task)`` for every task, either sequentially in
+this process (``jobs <= 1`` or a single task) or in a ``multiprocessing.Pool``
+whose workers are recycled after every task (``maxtasksperchild=1``), so no
+module-level state can leak from one benchmark run into the next.
+``force_pool`` uses the pool even then, for determinism checks that must
+compare the two modes.
+
+Results are handed to ``on_result`` as soon as they finish (completion
+order) and returned in task order, so callers assemble exactly the output the
+sequential loop would have produced.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from multiprocessing import Pool
+from typing import Any, TypeVar
+
+R = TypeVar("R")
+
+
+class _IndexedCall:
+    """Picklable wrapper that tags a worker result with its task index."""
+
+    def __init__(self, worker: Callable[..., Any]) -> None:
+        self.worker = worker
+
+    def __call__(self, indexed_task: tuple[int, tuple[Any, ...]]) -> tuple[int, Any]:
+        index, task = indexed_task
+        return index, self.worker(*task)
+
+
+def run_tasks(
+    worker: Callable[..., R],
+    tasks: Sequence[tuple[Any, ...]],
+    jobs: int = 1,
+    on_result: Callable[[int, R], None] | None = None,
+    force_pool: bool = False,
+) -> list[R]:
+    """Run ``worker(*task)`` for each task and return results in task order.
+
+    Args:
+        worker: Module-level function (must be picklable when ``jobs > 1``)
+        tasks: Positional-argument tuples, one per run
+        jobs: Worker processes; 1 runs everything in this process
+        on_result: Called with ``(task_index, result)`` as each run finishes
+        force_pool: Use worker processes even for ``jobs <= 1`` or one task
+    """
+    if not tasks or (not force_pool and (jobs <= 1 or len(tasks) <= 1)):
+        results: list[R] = []
+        for index, task in enumerate(tasks):
+            result = worker(*task)
+            if on_result is not None:
+                on_result(index, result)
+            results.append(result)
+        return results
+
+    ordered: list[Any] = [None] * len(tasks)
+    with Pool(processes=max(1, min(jobs, len(tasks))), maxtasksperchild=1) as pool:
+        for index, result in pool.imap_unordered(_IndexedCall(worker), enumerate(tasks)):
+            ordered[index] = result
+            if on_result is not None:
+                on_result(index, result)
+    return ordered
@@ -63,7 +63,9 @@ def format_runtime_summary(elapsed_seconds: float | None, budget_seconds: float
     return f"Runtime: {elapsed_seconds:.1f}s (budget ~{budget_seconds:g}s)"
 
 
-def create_fingerprint_recorder(path: str, bench_module, seed: int, interval: int):
+def create_fingerprint_recorder(
+    path: str, bench_module, seed: int, interval: int, entities_every: int | None = None
+):
     from core.replay.fingerprint_stream import FingerprintStreamRecorder
 
     return FingerprintStreamRecorder(
@@ -71,6 +73,7 @@ def create_fingerprint_recorder(path: str, bench_module, seed: int, interval: in
         benchmark_id=bench_module.BENCHMARK_ID,
         seed=seed,
         interval=interval,
+        entities_every=entities_every,
     )
 
 
@@ -94,6 +97,12 @@ def main():
         default=100,
         help="Fingerprint interval in frames (default: 100)",
     )
+    parser.add_argument(
+        "--fingerprint-entities-every",
+        type=int,
+        default=None,
+        help="Also fingerprint each entity every N frames (a multiple of the interval)",
+    )
     parser.add_argument(
         "--record-skill",
         action="store_true",
@@ -130,6 +139,7 @@ def main():
                     bench_module,
                     args.seed,
                     args.fingerprint_every,
+                    args.fingerprint_entities_every,
                 )
             try:
                 result1 = run_benchmark(bench_module, args.seed, recorder)
@@ -160,6 +170,8 @@ def main():
                     "--fingerprint-every",
                     str(args.fingerprint_every),
                 ]
+                if args.fingerprint_entities_every is not None:
+                    cmd1 += ["--fingerprint-entities-every", str(args.fingerprint_entities_every)]
             print("Running determinism check: Run 1...", flush=True)
             try:
                 res1 = subprocess.run(
@@ -187,6 +199,8 @@ def main():
                     "--fingerprint-every",
                     str(args.fingerprint_every),
                 ]
+                if args.fingerprint_entities_every is not None:
+                    cmd2 += ["--fingerprint-entities-every", str(args.fingerprint_entities_every)]
             print("Running determinism check: Run 2...", flush=True)
             try:
                 res2 = subprocess.run(
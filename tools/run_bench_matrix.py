@@ -3,6 +3,14 @@
 
 Usage:
     python tools/run_bench_matrix.py path/to/benchmark.py --seeds 42,7,123 --out result.json
+    python tools/run_bench_matrix.py path/to/benchmark.py --seeds 42,7,123 --jobs 3
+
+With ``--jobs N`` every seed runs in its own worker process (recycled after
+each run) and results are printed as they finish; the result JSON is built in
+seed order, so it matches the sequential output apart from wall-clock fields.
+``--verify-determinism`` re-runs the seeds in the other mode (sequential vs
+pooled) and fails if any per-seed score differs. A sequential primary run
+(``--jobs 1`` or a single seed) is always checked against worker processes.
 """
 
 import argparse
@@ -10,7 +18,9 @@ import json
 import statistics
 import sys
 import time
+import traceback
 from pathlib import Path
+from typing import Any
 
 # Add repo root to sys.path so we can import tools and core
 ROOT = Path(__file__).resolve().parents[1]
@@ -20,6 +30,7 @@ if str(ROOT) not in sys.path:
 from core.research.attempt_ledger import log_attempt
 from core.solutions.config_hash import compute_config_hash
 from tools.champion_eligibility import result_eligibility_error
+from tools.parallel_runs import run_tasks
 from tools.run_bench import expected_runtime_seconds, load_benchmark_module, run_benchmark
 from tools.validate_improvement import (
     check_config_compatibility,
@@ -27,6 +38,78 @@ from tools.validate_improvement import (
     is_improvement,
 )
 
+# Benchmark modules loaded in this process, keyed by path (one load per worker)
+_BENCH_MODULES: dict[str, Any] = {}
+
+
+def _benchmark_module(benchmark_path: str):
+    module = _BENCH_MODULES.get(benchmark_path)
+    if module is None:
+        module = load_benchmark_module(benchmark_path)
+        _BENCH_MODULES[benchmark_path] = module
+    return module
+
+
+def run_seed(benchmark_path: str, seed: int) -> dict[str, Any]:
+    """Run one seed; returns ``{"result": ...}`` or ``{"error": ..., "traceback": ...}``."""
+    start_run = time.time()
+    try:
+        res = run_benchmark(_benchmark_module(benchmark_path), seed)
+    except Exception as e:
+        return {"error": str(e), "traceback": traceback.format_exc()}
+    if "runtime_seconds" not in res:
+        res["runtime_seconds"] = time.time() - start_run
+    return {"result": res}
+
+
+def run_seeds(
+    benchmark_path: str,
+    seeds: list[int],
+    jobs: int = 1,
+    verbose: bool = True,
+    force_pool: bool = False,
+) -> dict[str, dict[str, Any]]:
+    """Run every seed (optionally in a process pool) and return outcomes by seed string."""
+    done = 0
+
+    def report(index: int, outcome: dict[str, Any]) -> None:
+        nonlocal done
+        done += 1
+        if not verbose:
+            return
+        seed = seeds[index]
+        if "error" in outcome:
+            print(f"[{done}/{len(seeds)}] Seed {seed} failed: {outcome['error']}")
+        else:
+            res = outcome["result"]
+            print(
+                f"[{done}/{len(seeds)}] Seed {seed}: score={res['score']:.6f} "
+                f"({res['runtime_seconds']:.1f}s)"
+            )
+
+    outcomes = run_tasks(
+        run_seed,
+        [(benchmark_path, seed) for seed in seeds],
+        jobs=jobs,
+        on_result=report,
+        force_pool=force_pool,
+    )
+    return {str(seed): outcome for seed, outcome in zip(seeds, outcomes, strict=True)}
+
+
+def score_mismatches(
+    per_seed: dict[str, dict[str, Any]], other_per_seed: dict[str, dict[str, Any]]
+) -> list[str]:
+    """Describe every seed whose score differs (exactly) between two runs."""
+    mismatches = []
+    for seed, res in per_seed.items():
+        other = other_per_seed.get(seed)
+        if other is None:
+            mismatches.append(f"seed {seed}: missing from comparison run")
+        elif res["score"] != other["score"]:
+            mismatches.append(f"seed {seed}: {res['score']!r} != {other['score']!r}")
+    return mismatches
+
 
 def main():
     parser = argparse.ArgumentParser(description="Run a benchmark matrix")
@@ -53,6 +136,17 @@ def main():
         default=0.10,
         help="Maximum relative drop allowed for any individual seed before it is considered a catastrophic regression (default: 0.10)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes; each seed runs in a fresh process (default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--verify-determinism",
+        action="store_true",
+        help="Re-run the seeds in the other mode (sequential vs pooled) and assert identical scores",
+    )
 
     args = parser.parse_args()
 
@@ -67,7 +161,7 @@ def main():
         sys.exit(1)
 
     try:
-        bench_module = load_benchmark_module(args.benchmark_path)
+        bench_module = _benchmark_module(args.benchmark_path)
     except Exception as e:
         print(f"Error loading benchmark: {e}")
         sys.exit(1)
@@ -81,29 +175,19 @@ def main():
     benchmark_id = bench_module.BENCHMARK_ID
     print(f"Running benchmark matrix: {benchmark_id}")
     print(f"Seeds to evaluate: {seeds}")
+    pooled = args.jobs > 1 and len(seeds) > 1
+    if pooled:
+        print(f"Running with {min(args.jobs, len(seeds))} worker processes")
 
-    per_seed = {}
-    scores = []
-    runtimes = []
     start_total = time.time()
-
-    for idx, seed in enumerate(seeds):
-        print(f"[{idx+1}/{len(seeds)}] Running seed {seed}...")
-        start_run = time.time()
-        try:
-            res = run_benchmark(bench_module, seed)
-            run_elapsed = time.time() - start_run
-            if "runtime_seconds" not in res:
-                res["runtime_seconds"] = run_elapsed
-            scores.append(res["score"])
-            runtimes.append(res["runtime_seconds"])
-            per_seed[str(seed)] = res
-        except Exception as e:
-            print(f"Seed {seed} failed: {e}")
-            import traceback
-
-            traceback.print_exc()
+    outcomes = run_seeds(args.benchmark_path, seeds, jobs=args.jobs)
+    for seed_str, outcome in outcomes.items():
+        if "error" in outcome:
+            print(f"Seed {seed_str} failed: {outcome['error']}")
+            print(outcome["traceback"], file=sys.stderr, end="")
             sys.exit(1)
+    per_seed = {seed_str: outcome["result"] for seed_str, outcome in outcomes.items()}
+    scores = [per_seed[str(seed)]["score"] for seed in seeds]
 
     total_elapsed = time.time() - start_total
     n = len(seeds)
@@ -121,6 +205,34 @@ def main():
     print(f"  Stdev:  {stdev_score:.6f}")
     print(f"  Total Runtime: {total_elapsed:.1f}s")
 
+    if args.verify_determinism:
+        # Compare against the other execution mode: pooled vs in-process.
+        check_jobs = 1 if pooled else len(seeds)
+        mode = "sequential" if pooled else f"{check_jobs}-process"
+        print(f"\nVerifying determinism against a {mode} re-run...")
+        check = run_seeds(
+            args.benchmark_path, seeds, jobs=check_jobs, verbose=False, force_pool=not pooled
+        )
+        mismatches = [
+            f"seed {seed_str}: re-run failed ({outcome['error']})"
+            for seed_str, outcome in check.items()
+            if "error" in outcome
+        ]
+        mismatches += score_mismatches(
+            per_seed,
+            {
+                seed_str: outcome["result"]
+                for seed_str, outcome in check.items()
+                if "result" in outcome
+            },
+        )
+        if mismatches:
+            print("DETERMINISM FAILURE: parallel and sequential scores differ:")
+            for line in mismatches:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"Determinism verified: {len(seeds)} seeds produced identical scores.")
+
     primary_seed = seeds[0]
     config_hash = compute_config_hash(
         benchmark_id, primary_seed, getattr(bench_module, "CONFIG", None)
@@ -0,0 +1,130 @@
+"""Fork-server warm pool shared by the benchmark and evolution runners.
+
+``tools/parallel_runs.run_tasks`` recycles its workers after every task
+(``maxtasksperchild=1``), so each run pays interpreter start, the full
+``core`` import and benchmark loading again. ``WarmPool`` keeps the isolation
+guarantee without the startup cost: the calling process is the template.
+Callers warm it once (import ``core``, load benchmark modules, build one
+pristine world per benchmark config) and every task then runs in a child
+``fork()``-ed from that template. A child never returns its state to the
+template, so each task still starts from the same clean memory image and
+results match a fresh-process run.
+
+The template must stay pristine: apply per-candidate changes (such as an
+evolve parameter patch) inside the task, never in the template process.
+
+``fork`` is POSIX-only; elsewhere ``WarmPool`` falls back to ``run_tasks``,
+which needs a picklable module-level worker.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+import traceback
+from collections.abc import Callable, Sequence
+from multiprocessing.connection import Connection, wait
+from typing import Any, TypeVar
+
+from tools.parallel_runs import run_tasks
+
+R = TypeVar("R")
+
+FORK_SUPPORTED = hasattr(os, "fork")
+
+
+def _run_forked(conn: Connection, worker: Callable[..., Any], task: tuple[Any, ...]) -> None:
+    """Child entry point: run one task and send ``(ok, payload, run_seconds)``."""
+    start = time.perf_counter()
+    try:
+        result = worker(*task)
+    except BaseException:
+        conn.send((False, traceback.format_exc(), time.perf_counter() - start))
+    else:
+        conn.send((True, result, time.perf_counter() - start))
+    finally:
+        conn.close()
+
+
+class WarmPool:
+    """Run tasks in children forked from this (pre-warmed) process.
+
+    Args:
+        jobs: Maximum number of forked children in flight at once
+
+    Attributes:
+        task_overheads: Seconds each finished task spent outside ``worker``
+            (fork, result transfer, reaping), in completion order
+    """
+
+    def __init__(self, jobs: int = 1) -> None:
+        self.jobs = max(1, jobs)
+        self.task_overheads: list[float] = []
+
+    def run(
+        self,
+        worker: Callable[..., R],
+        tasks: Sequence[tuple[Any, ...]],
+        on_result: Callable[[int, R], None] | None = None,
+    ) -> list[R]:
+        """Run ``worker(*task)`` in a fresh fork per task; results in task order.
+
+        Args:
+            worker: Callable run inside the child (any callable when forking)
+            tasks: Positional-argument tuples, one per run
+            on_result: Called with ``(task_index, result)`` as each run finishes
+
+        Raises:
+            RuntimeError: If a task raises or its child dies without a result
+        """
+        if not FORK_SUPPORTED:
+            return run_tasks(worker, tasks, jobs=self.jobs, on_result=on_result)
+
+        ctx = multiprocessing.get_context("fork")
+        ordered: list[Any] = [None] * len(tasks)
+        pending = list(enumerate(tasks))
+        pending.reverse()
+        in_flight: dict[Connection, tuple[int, Any, float]] = {}
+
+        while pending or in_flight:
+            while pending and len(in_flight) < self.jobs:
+                index, task = pending.pop()
+                reader, writer = ctx.Pipe(duplex=False)
+                started = time.perf_counter()
+                process = ctx.Process(target=_run_forked, args=(writer, worker, task))
+                process.start()
+                writer.close()
+                in_flight[reader] = (index, process, started)
+
+            for reader in wait(list(in_flight)):
+                index, process, started = in_flight.pop(reader)  # type: ignore[index]
+                try:
+                    ok, payload, run_seconds = reader.recv()
+                except EOFError:
+                    process.join()
+                    self._abort(in_flight)
+                    raise RuntimeError(
+                        f"warm worker for task {index} exited with code {process.exitcode} "
+                        "before returning a result"
+                    ) from None
+                finally:
+                    reader.close()
+                process.join()
+                if not ok:
+                    self._abort(in_flight)
+                    raise RuntimeError(f"warm worker for task {index} failed:\n{payload}")
+                self.task_overheads.append(time.perf_counter() - started - run_seconds)
+                ordered[index] = payload
+                if on_result is not None:
+                    on_result(index, payload)
+        return ordered
+
+    @staticmethod
+    def _abort(in_flight: dict[Connection, tuple[int, Any, float]]) -> None:
+        """Terminate and reap the children still running after a failure."""
+        for reader, (_, process, _) in in_flight.items():
+            process.terminate()
+            process.join()
+            reader.close()
+        in_flight.clear()